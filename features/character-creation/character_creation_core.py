@@ -1,27 +1,24 @@
 #!/usr/bin/env python3
 """
 Character Creation Core - Simple request wrapper for D&D 5e API
-Just makes requests and returns JSON. Nothing fancy.
+Just makes requests and returns JSON. Responses are cached on disk and can be
+served offline from a local SRD mirror (lib/srd_cache.py).
 """
 
 import json
 import sys
-import urllib.request
-import urllib.error
+from pathlib import Path
+
+# Add lib directory to path for the shared SRD cache
+sys.path.append(str(Path(__file__).parent.parent.parent / "lib"))
+
+import srd_cache
 
 BASE_URL = "https://www.dnd5eapi.co/api/2014"
 
 def fetch(endpoint):
-    """Fetch data from API and return as dict"""
-    url = f"{BASE_URL}{endpoint}"
-    
-    try:
-        with urllib.request.urlopen(url, timeout=10) as response:
-            return json.loads(response.read().decode())
-    except urllib.error.HTTPError as e:
-        return {"error": f"HTTP {e.code}", "message": e.reason}
-    except Exception as e:
-        return {"error": "Request failed", "message": str(e)}
+    """Fetch data from API and return as dict (cached; see lib/srd_cache.py)"""
+    return srd_cache.fetch(f"{srd_cache.API_PREFIX}{endpoint}")
 
 def output(data):
     """Output data as JSON to stdout"""
@@ -1,88 +1,100 @@
 #!/usr/bin/env python3
 """
-Quick D&D encounter helper using API CR filtering
+Quick D&D encounter helper, answered from the local monster catalog
 Usage: uv run python dnd_encounter_v2.py --cr <CR> [--count <number>]
+       uv run python dnd_encounter_v2.py --party-level <L> --party-size <N> [--difficulty hard]
 Example: uv run python dnd_encounter_v2.py --cr 2 --count 3
+         uv run python dnd_encounter_v2.py --party-level 5 --party-size 4 --difficulty hard --seed 7
+
+Monster lists and stats come from monster_catalog.py, so picking monsters
+costs no network round trips once the catalog is built. --party-level
+builds an XP-budget encounter instead (encounter_builder.py).
 """
 
 import sys
 import argparse
 import random
-import json
-import urllib.request
-import urllib.error
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent))
 
-from dnd_api_core import fetch, output, error_output
-
-BASE_URL = "https://www.dnd5eapi.co"
+from dnd_api_core import output, error_output
+from monster_catalog import MonsterCatalog
+from encounter_builder import DIFFICULTIES, XP_THRESHOLDS, build_encounter
 
-def get_monsters_by_cr(target_cr):
-    """Get all monsters of a specific CR using API filtering"""
-    url = f"{BASE_URL}/api/2014/monsters?challenge_rating={target_cr}"
-    
+def load_catalog():
     try:
-        with urllib.request.urlopen(url, timeout=10) as response:
-            data = json.loads(response.read().decode())
-            if "results" in data:
-                # Extract monster indices from URLs
-                return [m["url"].split("/")[-1] for m in data["results"]]
-            return []
-    except urllib.error.HTTPError as e:
-        if e.code == 429:
-            error_output("Rate limited. Please wait a moment and try again.")
-        else:
-            error_output(f"HTTP {e.code}: {e.reason}")
-    except Exception as e:
-        error_output(str(e))
-    
-    return []
+        return MonsterCatalog.load()
+    except RuntimeError as e:
+        error_output(f"Failed to fetch monsters: {e}")
+
+def matching_monsters(catalog, args, cr=None):
+    """Catalog rows for a CR (if given) and the --type/--size/--alignment filters"""
+    return catalog.matching(cr=cr, type=args.type, size=args.size, alignment=args.alignment)
 
 def main():
     parser = argparse.ArgumentParser(description='Quick D&D encounter helper')
-    parser.add_argument('--cr', type=float, required=True, help='Challenge rating')
-    parser.add_argument('--count', type=int, default=1, help='Number of monsters')
-    parser.add_argument('--quick', action='store_true', help='Just return monster names')
-    
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--cr', type=float, help='Challenge rating')
+    mode.add_argument('--party-level', type=int, choices=sorted(XP_THRESHOLDS),
+                      help='Build an XP-budget encounter for a party of this level')
+    parser.add_argument('--count', type=int, default=1, help='Number of monsters (--cr)')
+    parser.add_argument('--quick', action='store_true', help='Just return monster names (--cr)')
+    parser.add_argument('--party-size', type=int, default=4, help='Characters in the party (default: 4)')
+    parser.add_argument('--difficulty', choices=DIFFICULTIES, default='medium',
+                        help='Encounter difficulty (default: medium)')
+    parser.add_argument('--max-monsters', type=int, default=8,
+                        help='Most monsters in a built encounter (default: 8)')
+    parser.add_argument('--type', help='Only this creature type (e.g. undead, humanoid)')
+    parser.add_argument('--size', help='Only this size (e.g. medium, large)')
+    parser.add_argument('--alignment', help='Only this alignment (e.g. "chaotic evil")')
+    parser.add_argument('--seed', type=int, help='Seed for a repeatable pick')
+
     args = parser.parse_args()
-    
+    catalog = load_catalog()
+
+    if args.party_level is not None:
+        encounter = build_encounter(matching_monsters(catalog, args), args.party_level,
+                                    args.party_size, args.difficulty, seed=args.seed,
+                                    max_monsters=args.max_monsters)
+        if encounter is None:
+            error_output(f"No {args.difficulty} encounter fits a party of {args.party_size} "
+                         f"at level {args.party_level} with these filters")
+        output(encounter)
+        return
+
     # Get available monsters for this CR
-    available = get_monsters_by_cr(args.cr)
-    
+    available = matching_monsters(catalog, args, cr=args.cr)
+
     if not available:
         error_output(f"No monsters found for CR {args.cr}")
-    
+
     # Select random monsters
+    rng = random.Random(args.seed)
     if args.count > len(available):
         # If we need more than available, allow duplicates
-        selected = [random.choice(available) for _ in range(args.count)]
+        selected = [rng.choice(available) for _ in range(args.count)]
     else:
         # Otherwise, select unique monsters
-        selected = random.sample(available, args.count)
-    
+        selected = rng.sample(available, args.count)
+
     if args.quick:
         # Just output the names
         output({
             "cr": args.cr,
             "count": args.count,
-            "monsters": selected
+            "monsters": [m["index"] for m in selected]
         })
     else:
-        # Fetch full details
-        monsters = []
-        for monster_index in selected:
-            data = fetch(f"/monsters/{monster_index}")
-            if "error" not in data:
-                # Extract combat info
-                monsters.append({
-                    "name": data.get("name"),
-                    "hp": data.get("hit_points"),
-                    "ac": data.get("armor_class", [{}])[0].get("value", 10),
-                    "cr": data.get("challenge_rating"),
-                    "xp": data.get("xp")
-                })
-        
+        # Combat info straight from the catalog rows
+        monsters = [{
+            "name": m["name"],
+            "hp": m["hp"],
+            "ac": m["ac"],
+            "cr": m["cr"],
+            "xp": m["xp"]
+        } for m in selected]
+
         output({
             "cr": args.cr,
             "count": args.count,
@@ -91,4 +103,4 @@ def main():
         })
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,74 +1,60 @@
 #!/usr/bin/env python3
 """
-List monsters using API's built-in challenge_rating query parameter for efficient filtering.
-This replaces the slow local filtering approach.
+List monsters, filtered by challenge rating, type, size, alignment and name.
+Answered from the local monster catalog (monster_catalog.py): no list download
+or client-side scan per call once the catalog is built.
 """
 
 import argparse
 import json
 import sys
+from pathlib import Path
 from typing import List, Dict, Any, Optional
-import urllib.parse
-import urllib.request
-import urllib.error
 
-BASE_URL = "https://www.dnd5eapi.co"
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent))
+
+from monster_catalog import MonsterCatalog
 
 
 def fetch_monsters(
     challenge_ratings: Optional[List[float]] = None,
     limit: Optional[int] = None,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    monster_type: Optional[str] = None,
+    size: Optional[str] = None,
+    alignment: Optional[str] = None
 ) -> Dict[str, Any]:
     """
-    Fetch monsters from the API with optional filtering.
+    Monsters from the local catalog with optional filtering.
     
     Args:
         challenge_ratings: List of CR values to filter by
         limit: Maximum number of results to return
         search: Search term for monster names
+        monster_type: Creature type (e.g. "undead")
+        size: Size (e.g. "large")
+        alignment: Alignment (e.g. "chaotic evil")
     
     Returns:
-        API response containing monster list
+        {"count", "results"} in the API's list shape
     """
-    url = f"{BASE_URL}/api/2014/monsters"
-    params = []
-    
-    # Add challenge_rating query parameter
-    if challenge_ratings:
-        # API expects comma-separated values
-        cr_param = ",".join(str(cr) for cr in challenge_ratings)
-        params.append(f"challenge_rating={cr_param}")
-    
-    # Build final URL with parameters
-    if params:
-        url += "?" + "&".join(params)
-    
     try:
-        with urllib.request.urlopen(url, timeout=10) as response:
-            data = json.loads(response.read().decode())
-
-            # Apply search filter if provided
-            if search and "results" in data:
-                search_lower = search.lower()
-                data["results"] = [
-                    m for m in data["results"]
-                    if search_lower in m["name"].lower()
-                ]
-                data["count"] = len(data["results"])
-            
-            # Apply limit if provided
-            if limit and "results" in data:
-                data["results"] = data["results"][:limit]
-            
-            return data
-    except urllib.error.HTTPError as e:
-        if e.code == 429:
-            return {"error": "Rate limited. Please wait a moment and try again."}
-        return {"error": f"HTTP {e.code}: {e.reason}"}
-    except Exception as e:
+        catalog = MonsterCatalog.load()
+    except RuntimeError as e:
         return {"error": str(e)}
 
+    rows = catalog.matching(search=search, cr=challenge_ratings, type=monster_type,
+                            size=size, alignment=alignment)
+    results = [{"index": r["index"], "name": r["name"], "url": r["url"]} for r in rows]
+    data = {"count": len(results), "results": results}
+
+    # Apply limit if provided
+    if limit:
+        data["results"] = data["results"][:limit]
+
+    return data
+
 
 def format_monster_list(monsters: List[Dict[str, Any]]) -> None:
     """Format and print monster list."""
@@ -87,7 +73,7 @@ def format_monster_list(monsters: List[Dict[str, Any]]) -> None:
 
 def main():
     parser = argparse.ArgumentParser(
-        description="List D&D 5e monsters with efficient API filtering"
+        description="List D&D 5e monsters from the local monster catalog"
     )
     parser.add_argument(
         "--cr",
@@ -100,6 +86,19 @@ def main():
         type=str,
         help="Search for monsters by name"
     )
+    parser.add_argument(
+        "--type",
+        dest="monster_type",
+        help="Filter by creature type (e.g. undead, humanoid)"
+    )
+    parser.add_argument(
+        "--size",
+        help="Filter by size (e.g. medium, large)"
+    )
+    parser.add_argument(
+        "--alignment",
+        help='Filter by alignment (e.g. "chaotic evil")'
+    )
     parser.add_argument(
         "--limit",
         type=int,
@@ -117,7 +116,10 @@ def main():
     result = fetch_monsters(
         challenge_ratings=args.cr,
         limit=args.limit,
-        search=args.search
+        search=args.search,
+        monster_type=args.monster_type,
+        size=args.size,
+        alignment=args.alignment
     )
     
     # Handle errors
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+XP-budget encounter building (D&D 5e DMG, chapter 3), over monster catalog rows.
+
+The party's XP thresholds set a target band for the chosen difficulty,
+from that difficulty's threshold up to the next one's. An encounter's
+adjusted XP is its monsters' total XP times the multiplier for how many
+there are, shifted one step up for parties under three and one step down
+for parties of six or more. The builder enumerates every combination of
+one or two XP tiers whose adjusted XP lands in the band. A few dozen tiers
+make that a few thousand sums. It then picks a combination, and monsters
+for it, with a seeded RNG, so the same seed and catalog give the same
+encounter.
+"""
+
+import random
+from typing import Any, Dict, List, Optional
+
+DIFFICULTIES = ("easy", "medium", "hard", "deadly")
+
+# Per-character XP thresholds by level: easy, medium, hard, deadly.
+XP_THRESHOLDS = {
+    1: (25, 50, 75, 100), 2: (50, 100, 150, 200), 3: (75, 150, 225, 400),
+    4: (125, 250, 375, 500), 5: (250, 500, 750, 1100), 6: (300, 600, 900, 1400),
+    7: (350, 750, 1100, 1700), 8: (450, 900, 1400, 2100), 9: (550, 1100, 1600, 2400),
+    10: (600, 1200, 1900, 2800), 11: (800, 1600, 2400, 3600), 12: (1000, 2000, 3000, 4500),
+    13: (1100, 2200, 3400, 5100), 14: (1250, 2500, 3800, 5700), 15: (1400, 2800, 4300, 6400),
+    16: (1600, 3200, 4800, 7200), 17: (2000, 3900, 5900, 8800), 18: (2100, 4200, 6300, 9500),
+    19: (2400, 4900, 7300, 10900), 20: (2800, 5700, 8500, 12700),
+}
+
+# The multiplier ladder, and the rung a monster count lands on (before party-size shifts).
+MULTIPLIERS = (0.5, 1, 1.5, 2, 2.5, 3, 4, 5)
+COUNT_RUNGS = ((1, 1), (2, 2), (6, 3), (10, 4), (14, 5))  # (up to this many, rung); more: 6
+
+# A deadly encounter has no next threshold; its band tops out at this multiple of it.
+DEADLY_CEILING = 1.5
+
+
+def party_thresholds(party_level: int, party_size: int) -> Dict[str, int]:
+    per_character = XP_THRESHOLDS[party_level]
+    return {name: xp * party_size for name, xp in zip(DIFFICULTIES, per_character)}
+
+
+def multiplier(count: int, party_size: int) -> float:
+    rung = next((r for most, r in COUNT_RUNGS if count <= most), 6)
+    if party_size < 3:
+        rung += 1
+    elif party_size >= 6:
+        rung -= 1
+    return MULTIPLIERS[rung]
+
+
+def rating(adjusted_xp: float, thresholds: Dict[str, int]) -> str:
+    """The hardest difficulty whose threshold `adjusted_xp` reaches ("trivial" below easy)."""
+    reached = [name for name in DIFFICULTIES if adjusted_xp >= thresholds[name]]
+    return reached[-1] if reached else "trivial"
+
+
+def build_encounter(rows: List[Dict[str, Any]], party_level: int, party_size: int,
+                    difficulty: str = "medium", seed: Optional[int] = None,
+                    max_monsters: int = 8) -> Optional[Dict[str, Any]]:
+    """An encounter of one or two monster kinds for the party, or None if nothing fits.
+
+    `rows` are monster catalog rows (already filtered by type, size and so
+    on); each needs index, name, xp, cr, hp and ac.
+    """
+    thresholds = party_thresholds(party_level, party_size)
+    low = thresholds[difficulty]
+    step = DIFFICULTIES.index(difficulty)
+    high = thresholds[DIFFICULTIES[step + 1]] if step + 1 < len(DIFFICULTIES) \
+        else low * DEADLY_CEILING
+
+    tiers: Dict[int, List[Dict[str, Any]]] = {}
+    for row in rows:
+        if row.get("xp"):
+            tiers.setdefault(row["xp"], []).append(row)
+    xps = sorted(tiers)
+
+    mult = [0] + [multiplier(n, party_size) for n in range(1, max_monsters + 1)]
+
+    def fits(total_xp, count):
+        return low <= total_xp * mult[count] < high
+
+    # Adjusted XP only grows with count, so each loop stops at the first overshoot.
+    single, pairs = [], []
+    for xp in xps:
+        for n in range(1, max_monsters + 1):
+            if xp * n * mult[n] >= high:
+                break
+            if fits(xp * n, n):
+                single.append(((xp, n),))
+    for i, xp_a in enumerate(xps):
+        for xp_b in xps[i + 1:]:
+            for n_a in range(1, max_monsters):
+                if (xp_a * n_a + xp_b) * mult[n_a + 1] >= high:
+                    break
+                for n_b in range(1, max_monsters - n_a + 1):
+                    total = xp_a * n_a + xp_b * n_b
+                    if total * mult[n_a + n_b] >= high:
+                        break
+                    if fits(total, n_a + n_b):
+                        pairs.append(((xp_b, n_b), (xp_a, n_a)))  # the bigger threat first
+    shapes = [combos for combos in (single, pairs) if combos]
+    if not shapes:
+        return None
+
+    rng = random.Random(seed)
+    combo = rng.choice(rng.choice(shapes))
+    groups = []
+    for xp, count in combo:
+        monster = rng.choice(tiers[xp])
+        groups.append({"index": monster["index"], "name": monster["name"], "cr": monster["cr"],
+                       "xp": xp, "hp": monster.get("hp"), "ac": monster.get("ac"),
+                       "count": count})
+    base_xp = sum(g["xp"] * g["count"] for g in groups)
+    count = sum(g["count"] for g in groups)
+    adjusted = base_xp * multiplier(count, party_size)
+    return {
+        "party": {"level": party_level, "size": party_size},
+        "difficulty": difficulty,
+        "thresholds": thresholds,
+        "target": [low, high],
+        "base_xp": base_xp,
+        "multiplier": multiplier(count, party_size),
+        "adjusted_xp": adjusted,
+        "rating": rating(adjusted, thresholds),
+        "groups": groups,
+    }
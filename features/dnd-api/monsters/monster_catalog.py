@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Indexed local table of every SRD monster (lib/srd_catalog.py).
+
+The monster scripts used to download the monster list on every call and
+then fetch chosen monsters' records one at a time. The catalog reads each
+record once (from the SRD mirror, or concurrently through the cache). It
+then answers CR, type, size and alignment filters and name searches from
+its indexes. Each row also carries the XP, HP and AC that an encounter
+needs, so building one never touches the network.
+
+Usage: uv run python monster_catalog.py [--rebuild]   # build it and print what it holds
+"""
+
+import sys
+import argparse
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from dnd_api_core import output, error_output
+from srd_catalog import SrdCatalog
+
+
+def armor_class(record):
+    """AC from either API shape: [{"type": ..., "value": 15}] or a bare 15"""
+    ac = record.get("armor_class", 10)
+    if isinstance(ac, list):
+        return ac[0].get("value", 10) if ac else 10
+    return ac
+
+
+class MonsterCatalog(SrdCatalog):
+    NAME = "monsters"
+    RESOURCE = "/monsters"
+    INDEXED = ("cr", "type", "size", "alignment")
+
+    @staticmethod
+    def row(record):
+        return {
+            "cr": record.get("challenge_rating", 0),
+            "xp": record.get("xp", 0),
+            "type": (record.get("type") or "").lower(),
+            "subtype": record.get("subtype"),
+            "size": (record.get("size") or "").lower(),
+            "alignment": (record.get("alignment") or "").lower(),
+            "hp": record.get("hit_points"),
+            "ac": armor_class(record),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the local monster catalog')
+    parser.add_argument('--rebuild', action='store_true',
+                       help='Refetch every monster record instead of reusing the table')
+    args = parser.parse_args()
+
+    try:
+        catalog = MonsterCatalog.load(rebuild=args.rebuild)
+    except RuntimeError as e:
+        error_output(f"Failed to fetch monsters: {e}")
+
+    output({
+        "monsters": len(catalog.rows),
+        "missing": catalog.missing,
+        "types": catalog.values("type"),
+        "sizes": catalog.values("size"),
+        "path": str(MonsterCatalog.path()),
+    })
+
+if __name__ == "__main__":
+    main()
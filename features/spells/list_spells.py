@@ -8,6 +8,7 @@ Examples:
     uv run python list_spells.py --level 3          # Show 3rd level spells
     uv run python list_spells.py --school evocation # Show evocation spells
     uv run python list_spells.py --class wizard     # Show wizard spells
+    uv run python list_spells.py --damage-type fire # Show spells that deal fire damage
 """
 
 import sys
@@ -16,71 +17,54 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 
 from spell_api_core import fetch, output, error_output
+from spell_catalog import SpellCatalog
 
-def fetch_spell_details(spell_index):
-    """Fetch full details for a spell"""
-    return fetch(f"/api/2014/spells/{spell_index}")
+def needs_details(args):
+    """True when a filter reads a field the spell list itself doesn't carry"""
+    return (args.level is not None or args.school or args.spell_class or args.ritual
+            or args.concentration or args.damage_type)
 
 def filter_spells(spells, args):
-    """Apply filters to spell list"""
+    """Apply filters to spell list
+
+    Name search alone runs over the list. Any other filter is answered by
+    the local spell catalog (spell_catalog.py), which holds every spell's
+    level, school, classes, flags and damage type, so no per-spell fetch
+    happens at query time.
+    """
+    if not needs_details(args):
+        needle = args.search.lower()
+        return [spell for spell in spells if needle in spell.get("name", "").lower()]
+
+    try:
+        catalog = SpellCatalog.load()
+    except RuntimeError as e:
+        error_output(f"Failed to fetch spells: {e}")
+
+    rows = catalog.matching(
+        search=args.search,
+        level=args.level,
+        school=args.school,
+        classes=args.spell_class,
+        ritual=True if args.ritual else None,
+        concentration=True if args.concentration else None,
+        damage_type=args.damage_type,
+    )
+
     results = []
-    
-    for spell in spells:
-        # For filtering, we need full spell details
-        if args.level is not None or args.school or args.spell_class or args.ritual or args.concentration:
-            spell_data = fetch_spell_details(spell["index"])
-            if "error" in spell_data:
-                continue
-        else:
-            spell_data = spell
-        
-        # Search filter (works on basic data)
-        if args.search:
-            if args.search.lower() not in spell.get("name", "").lower():
-                continue
-        
-        # Level filter
-        if args.level is not None:
-            if spell_data.get("level", -1) != args.level:
-                continue
-        
-        # School filter
-        if args.school:
-            school_name = spell_data.get("school", {}).get("index", "")
-            if school_name != args.school.lower():
-                continue
-        
-        # Class filter
-        if args.spell_class:
-            classes = [c.get("index", "") for c in spell_data.get("classes", [])]
-            if args.spell_class.lower() not in classes:
-                continue
-        
-        # Ritual filter
-        if args.ritual and not spell_data.get("ritual", False):
-            continue
-        
-        # Concentration filter
-        if args.concentration and not spell_data.get("concentration", False):
-            continue
-        
-        # Build result entry
+    for row in rows:
         result = {
-            "index": spell.get("index"),
-            "name": spell.get("name"),
-            "url": spell.get("url")
+            "index": row["index"],
+            "name": row["name"],
+            "url": row["url"],
+            "level": row["level"],
+            "school": row["school_name"],
         }
-        
-        # Add extra info if we fetched full details
-        if "level" in spell_data:
-            result["level"] = spell_data["level"]
-            result["school"] = spell_data.get("school", {}).get("name", "Unknown")
-            if args.ritual or args.concentration:
-                result["ritual"] = spell_data.get("ritual", False)
-                result["concentration"] = spell_data.get("concentration", False)
-        
+        if args.ritual or args.concentration:
+            result["ritual"] = row["ritual"]
+            result["concentration"] = row["concentration"]
         results.append(result)
-    
+
     return results
 
 def format_spell_list(spells):
@@ -125,6 +109,8 @@ def main():
                        help='Show only ritual spells')
     parser.add_argument('--concentration', action='store_true',
                        help='Show only concentration spells')
+    parser.add_argument('--damage-type', dest='damage_type',
+                       help='Filter by damage type (e.g. fire, necrotic)')
     parser.add_argument('--limit', type=int, default=20,
                        help='Maximum results (default: 20)')
     
@@ -140,7 +126,7 @@ def main():
     
     # Apply filters
     if any([args.search, args.level is not None, args.school, 
-            args.spell_class, args.ritual, args.concentration]):
+            args.spell_class, args.ritual, args.concentration, args.damage_type]):
         spells = filter_spells(spells, args)
     
     # Apply limit
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Indexed local table of every SRD spell (lib/srd_catalog.py).
+
+Filtering by level, school, class, ritual, concentration or damage type
+used to fetch all ~320 spell records, one at a time, for each query. The
+catalog fetches them once (or reads them from the SRD mirror), then
+answers those filters from its indexes in milliseconds.
+
+Usage: uv run python spell_catalog.py [--rebuild]   # build it and print what it holds
+"""
+
+import sys
+import argparse
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from spell_api_core import output, error_output
+from srd_catalog import SrdCatalog
+
+
+class SpellCatalog(SrdCatalog):
+    NAME = "spells"
+    RESOURCE = "/spells"
+    INDEXED = ("level", "school", "classes", "ritual", "concentration", "damage_type")
+
+    @staticmethod
+    def row(record):
+        damage = (record.get("damage") or {}).get("damage_type") or {}
+        return {
+            "level": record.get("level"),
+            "school": (record.get("school") or {}).get("index"),
+            "school_name": (record.get("school") or {}).get("name", "Unknown"),
+            "classes": [c.get("index") for c in record.get("classes", [])],
+            "ritual": bool(record.get("ritual")),
+            "concentration": bool(record.get("concentration")),
+            "damage_type": damage.get("index"),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the local spell catalog')
+    parser.add_argument('--rebuild', action='store_true',
+                       help='Refetch every spell record instead of reusing the table')
+    args = parser.parse_args()
+
+    try:
+        catalog = SpellCatalog.load(rebuild=args.rebuild)
+    except RuntimeError as e:
+        error_output(f"Failed to fetch spells: {e}")
+
+    output({
+        "spells": len(catalog.rows),
+        "missing": catalog.missing,
+        "schools": catalog.values("school"),
+        "damage_types": [v for v in catalog.values("damage_type") if v != "none"],
+        "path": str(SpellCatalog.path()),
+    })
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Autosave off the turn path — a coalescing background worker.
+
+The Stop hook used to run a full `save autosave` and then a campaign-memory
+refresh (which may re-embed) before the player saw the next prompt, so turn-end
+latency grew with the campaign. `save autosave --async` instead:
+
+1. bumps a durable dirty marker (saves/autosave.dirty: fsync'd, atomic rename)
+   recording that live state is ahead of the newest autosave, and
+2. spawns a detached worker unless one already holds saves/autosave.lock.
+
+The worker drains the marker: snapshot + memory refresh, then clear the marker
+only if nobody bumped it meanwhile — otherwise go round again. Any number of
+requests that land during one save collapse into a single follow-up save of the
+latest state. A crash at any point leaves the marker behind; the next request,
+`save --wait`, or `session start` drains it. The campaign files themselves are
+always written synchronously (persist before narrate) — only the snapshot lags.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+try:
+    import fcntl
+except ImportError:  # no flock (Windows): every request saves synchronously
+    fcntl = None
+
+
+class AutosaveQueue:
+    """The dirty marker, worker lock, and drain loop for one campaign's autosaves."""
+
+    DIRTY = "autosave.dirty"
+    LOCK = "autosave.lock"
+    MARKER_LOCK = "autosave.dirty.lock"
+
+    def __init__(self, world_state_dir: str = None):
+        # Lazy: session_manager imports this module from its own main(). A top-level
+        # import there would load a second session_manager beside the running __main__.
+        from session_manager import SessionManager
+        self._wsd = world_state_dir
+        self.session = SessionManager(world_state_dir)
+        self.saves_dir = self.session.saves_dir
+        self.dirty_file = self.saves_dir / self.DIRTY
+
+    # ---------------------------------------------------------------- locks
+
+    def _flock(self, name: str, blocking: bool = True):
+        """An open, flock'ed handle on saves/<name>, or None if it is held elsewhere."""
+        handle = open(self.saves_dir / name, "a")
+        if fcntl is None:
+            return handle
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except OSError:
+            handle.close()
+            return None
+        return handle
+
+    def worker_running(self) -> bool:
+        """True while some process holds the worker lock."""
+        if fcntl is None:
+            return False
+        handle = self._flock(self.LOCK, blocking=False)
+        if handle is None:
+            return True
+        handle.close()
+        return False
+
+    # ---------------------------------------------------------------- marker
+
+    def pending(self) -> Optional[Dict[str, Any]]:
+        """The dirty marker, if an autosave is owed."""
+        try:
+            return json.loads(self.dirty_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {"seq": 0} if self.dirty_file.exists() else None
+
+    def _write_marker(self, marker: Dict[str, Any]) -> None:
+        tmp = self.dirty_file.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(marker, f)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp.replace(self.dirty_file)
+        try:
+            dir_fd = os.open(self.saves_dir, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+    def mark_dirty(self) -> int:
+        """Record that an autosave is owed; returns the marker's new sequence."""
+        with self._flock(self.MARKER_LOCK):
+            marker = self.pending() or {"seq": 0}
+            marker["seq"] = int(marker.get("seq", 0)) + 1
+            marker.setdefault("since", datetime.now(timezone.utc).isoformat())
+            marker["requested"] = datetime.now(timezone.utc).isoformat()
+            self._write_marker(marker)
+            return marker["seq"]
+
+    def _clear_if(self, seq: int) -> bool:
+        """Drop the marker only if no request arrived since `seq` was read."""
+        with self._flock(self.MARKER_LOCK):
+            marker = self.pending()
+            if marker is None or int(marker.get("seq", 0)) == seq:
+                self.dirty_file.unlink(missing_ok=True)
+                return True
+            return False
+
+    # ---------------------------------------------------------------- work
+
+    def request(self, spawn: bool = True) -> int:
+        """Queue an autosave and return at once; a running worker picks it up."""
+        seq = self.mark_dirty()
+        if spawn:
+            if fcntl is None:
+                self.drain()
+            elif not self.worker_running():
+                self._spawn()
+        return seq
+
+    def _spawn(self) -> None:
+        env = dict(os.environ, GM_WORLD_STATE_BASE=str(self.session.campaign_mgr.world_state_dir))
+        subprocess.Popen([sys.executable, str(Path(__file__).resolve()), "drain"],
+                         env=env, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, start_new_session=True)
+
+    def _save_once(self) -> bool:
+        """One autosave plus memory refresh; False if no save was written."""
+        if not self.session.create_save("autosave"):
+            return False
+        try:
+            from campaign_memory import CampaignMemory
+            CampaignMemory(self._wsd, context=self.session.context).refresh()
+        except Exception:
+            pass  # best-effort, as it always was on the save path
+        return True
+
+    def drain(self) -> int:
+        """Run pending autosaves until the marker stays clear; returns saves made.
+
+        Returns 0 immediately when another worker already holds the lock.
+        """
+        lock = self._flock(self.LOCK, blocking=False)
+        if lock is None:
+            return 0
+        saves = 0
+        try:
+            while True:
+                marker = self.pending()
+                if marker is None:
+                    break
+                if not self._save_once():
+                    break  # nothing written: the marker stays for the next attempt
+                saves += 1
+                if self._clear_if(int(marker.get("seq", 0))):
+                    break
+        finally:
+            lock.close()
+        return saves
+
+    def wait(self, timeout: float = 120.0) -> bool:
+        """Block until no autosave is owed (`save --wait`); True once clean.
+
+        With no live worker the pending save runs here, in the foreground.
+        False on timeout, or when that save wrote nothing (the marker stays);
+        a save that raises propagates.
+        """
+        deadline = time.monotonic() + timeout
+        while self.pending() is not None:
+            if not self.worker_running():
+                if self.drain() == 0 and not self.worker_running():
+                    return self.pending() is None
+                continue
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Background autosave worker")
+    sub = parser.add_subparsers(dest="action")
+    sub.add_parser("request", help="Mark an autosave owed and start the worker")
+    sub.add_parser("drain", help="Run owed autosaves (the worker itself)")
+    wait_parser = sub.add_parser("wait", help="Block until no autosave is owed")
+    wait_parser.add_argument("--timeout", type=float, default=120.0)
+    sub.add_parser("status", help="Show the dirty marker and worker state")
+    args = parser.parse_args()
+
+    try:
+        queue = AutosaveQueue()
+    except RuntimeError:
+        return  # no active campaign: nothing to autosave
+    if args.action == "request":
+        queue.request()
+        print("[SUCCESS] Autosave queued")
+    elif args.action == "drain":
+        queue.drain()
+    elif args.action == "wait":
+        if not queue.wait(args.timeout):
+            print("[ERROR] Autosave still pending after timeout")
+            sys.exit(1)
+        print("[SUCCESS] Autosave up to date")
+    elif args.action == "status":
+        print(json.dumps({"pending": queue.pending(), "worker_running": queue.worker_running()},
+                         indent=2))
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    import profiling
+    profiling.run(main)
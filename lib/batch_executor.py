@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Run a beat's GM operations in one process and one transaction (gm-batch.sh).
+
+Persist-before-narrate means a typical beat is four to eight wrapper calls —
+gm-player.sh hp, gm-npc.sh update, gm-note.sh, gm-consequence.sh add,
+gm-time.sh — each spawning Python, resolving the campaign, and loading and
+rewriting its files. And when the fifth call fails, the first four have
+already landed.
+
+A batch is JSON lines (or one JSON array), one operation per line:
+
+    {"op": "player.hp", "name": "Tandy", "amount": -7}
+    {"op": "npc.event", "name": "Mordecai", "event": "Patched Tandy up"}
+    {"op": "note.add", "category": "session_events", "fact": "..."}
+    {"op": "consequence.add", "description": "...", "trigger": "...",
+     "trigger_type": "on_location", "match": "Floor 4"}
+    {"op": "time.set", "time_of_day": "Dusk", "date": "Day 5"}
+
+Each op names an existing manager method (`OPS`); its other fields are that
+method's keyword arguments. Every manager is built from one buffered
+CampaignContext, so later operations read what earlier ones wrote and each
+file is loaded once. All operations succeed and every write commits
+together, or the first failure stops the batch and nothing is written.
+"""
+
+import contextlib
+import io
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from campaign_context import CampaignContext
+import hud
+import profiling
+
+# op -> (manager, method, required fields, optional fields). Fields are the
+# method's own parameter names.
+OPS = {
+    "player.hp": ("player", "modify_hp", ("name", "amount"), ()),
+    "player.xp": ("player", "award_xp", ("name", "amount"), ()),
+    "player.gold": ("player", "modify_gold", ("name", "amount"), ()),
+    "player.condition": ("player", "modify_condition", ("name", "action", "condition"), ()),
+    "player.inventory": ("player", "modify_inventory", ("name", "action", "item"), ()),
+    "player.loot": ("player", "apply_loot", ("name", "items"), ("gold",)),
+    "npc.create": ("npc", "create_npc", ("name", "description", "attitude"), ()),
+    "npc.event": ("npc", "update_npc", ("name", "event"), ()),
+    "npc.mood": ("npc", "shift_mood", ("name", "mood"), ()),
+    "npc.hp": ("npc", "update_npc_hp", ("name", "amount"), ()),
+    "npc.condition": ("npc", "update_npc_condition", ("name", "action", "condition"), ()),
+    "note.add": ("note", "add_fact", ("category", "fact"), ()),
+    "consequence.add": ("consequence", "add_consequence", ("description", "trigger"),
+                        ("trigger_type", "match", "expiry")),
+    "consequence.resolve": ("consequence", "resolve", ("consequence_id",), ()),
+    "plot.update": ("plot", "update_plot", ("name", "event"), ()),
+    "plot.complete": ("plot", "complete_plot", ("name",), ("outcome",)),
+    "time.set": ("time", "update_time", ("time_of_day", "date"), ()),
+    "session.move": ("session", "move_party", ("location",), ()),
+}
+
+
+def build_manager(kind: str, context: CampaignContext):
+    """Build one manager over a shared context (imports stay lazy)."""
+    if kind == "player":
+        from player_manager import PlayerManager
+        return PlayerManager(context=context)
+    if kind == "npc":
+        from npc_manager import NPCManager
+        return NPCManager(context=context)
+    if kind == "note":
+        from note_manager import NoteManager
+        return NoteManager(context=context)
+    if kind == "consequence":
+        from consequence_manager import ConsequenceManager
+        return ConsequenceManager(context=context)
+    if kind == "plot":
+        from plot_manager import PlotManager
+        return PlotManager(context=context)
+    if kind == "time":
+        from time_manager import TimeManager
+        return TimeManager(context=context)
+    if kind == "session":
+        from session_manager import SessionManager
+        return SessionManager(context=context)
+    if kind == "memory":
+        from campaign_memory import CampaignMemory
+        return CampaignMemory(context=context)
+    if kind == "enhancer":
+        from entity_enhancer import EntityEnhancer
+        return EntityEnhancer(context=context)
+    raise ValueError(f"unknown manager: {kind}")
+
+
+def parse_ops(text: str) -> List[Dict[str, Any]]:
+    """JSON lines (blank and # lines skipped) or one JSON array; ValueError names the line."""
+    stripped = text.strip()
+    if stripped.startswith("["):
+        ops = json.loads(stripped)
+        if not isinstance(ops, list):
+            raise ValueError("a batch array must be a JSON list")
+    else:
+        ops = []
+        for lineno, line in enumerate(text.splitlines(), 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                ops.append(json.loads(line))
+            except ValueError as e:
+                raise ValueError(f"line {lineno}: {e}") from None
+    for i, op in enumerate(ops, 1):
+        check_op(op, f"operation {i}")
+    return ops
+
+
+def check_op(op: Any, label: str, table: Dict[str, tuple] = OPS) -> None:
+    """ValueError (prefixed with `label`) unless `op` names an op in `table` with its fields."""
+    if not isinstance(op, dict):
+        raise ValueError(f"{label}: expected an object")
+    if op.get("op") not in table:
+        raise ValueError(f"{label}: unknown op {op.get('op')!r} "
+                         f"(known: {', '.join(sorted(table))})")
+    _, _, required, optional = table[op["op"]]
+    missing = [f for f in required if f not in op]
+    unknown = sorted(set(op) - set(required) - set(optional) - {"op"})
+    if missing or unknown:
+        bits = ([f"missing {', '.join(missing)}"] if missing else []) + \
+               ([f"unknown {', '.join(unknown)}"] if unknown else [])
+        raise ValueError(f"{label} ({op['op']}): {'; '.join(bits)}")
+
+
+def succeeded(result: Any) -> bool:
+    """The managers signal failure as False, None, "" or {'success': False}."""
+    if isinstance(result, dict):
+        return result.get("success") is not False and not result.get("error")
+    return bool(result)
+
+
+def failure_reason(result: Any, output: str) -> str:
+    """The manager's own words for a failure: its error field, else its last [ERROR] line."""
+    if isinstance(result, dict) and result.get("error"):
+        return str(result["error"])
+    errors = [line[len("[ERROR]"):].strip() for line in output.splitlines()
+              if line.startswith("[ERROR]")]
+    return errors[-1] if errors else "operation reported failure"
+
+
+def run_batch(ops: List[Dict[str, Any]], world_state_dir: str = None,
+              dry_run: bool = False) -> Dict[str, Any]:
+    """Run `ops` in order over one buffered context; commit only if all succeed.
+
+    Returns {"committed", "failed" (index or None), "error", "results",
+    "files"}. Each result carries the op, ok, the manager's printed output,
+    and its return value.
+    """
+    context = CampaignContext(world_state_dir, buffered=True)
+    context.require()
+    managers: Dict[str, Any] = {}
+    results: List[Dict[str, Any]] = []
+    failed: Optional[int] = None
+    error: Optional[str] = None
+
+    with hud.deferred():
+        for i, op in enumerate(ops):
+            kind, method, _required, _optional = OPS[op["op"]]
+            kwargs = {k: v for k, v in op.items() if k != "op"}
+            output = io.StringIO()
+            result = None
+            try:
+                with profiling.phase(f"batch.{op['op']}"), contextlib.redirect_stdout(output):
+                    if kind not in managers:
+                        managers[kind] = build_manager(kind, context)
+                    result = getattr(managers[kind], method)(**kwargs)
+                ok = succeeded(result)
+                reason = None if ok else failure_reason(result, output.getvalue())
+            except Exception as e:
+                ok, reason = False, f"{type(e).__name__}: {e}"
+            results.append({"op": op["op"], "ok": ok, "output": output.getvalue().strip(),
+                            "result": result})
+            if not ok:
+                failed, error = i, reason
+                break
+
+    files: List[str] = []
+    if failed is None and not dry_run:
+        with profiling.phase("batch.commit"):
+            files = [str(p.relative_to(context.campaign_dir)) for p in context.json_ops.commit()]
+        hud.refresh(context.campaign_dir)
+    else:
+        files = [str(p.relative_to(context.campaign_dir)) for p in context.json_ops.pending]
+        context.json_ops.discard()
+    return {"committed": failed is None and not dry_run, "dry_run": dry_run,
+            "failed": failed, "error": error, "results": results, "files": sorted(files)}
+
+
+def main():
+    import argparse
+    from cli_output import wants_json, strip_json_flag, emit, emit_error
+
+    json_mode = wants_json()
+    parser = argparse.ArgumentParser(
+        description="Run GM operations in one transaction (JSON lines on stdin or in a file)")
+    parser.add_argument("file", nargs="?", default="-", help="batch file, or - for stdin")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="run every operation, report, and write nothing")
+    parser.add_argument("--list-ops", action="store_true", help="show the supported operations")
+    args = parser.parse_args(strip_json_flag()[1:])
+
+    if args.list_ops:
+        table = {name: {"method": f"{kind}.{method}", "required": list(req),
+                        "optional": list(opt)} for name, (kind, method, req, opt) in OPS.items()}
+        lines = [f"{name:<22} {', '.join(req)}" + (f"  [{', '.join(opt)}]" if opt else "")
+                 for name, (_k, _m, req, opt) in OPS.items()]
+        emit(table, "\n".join(lines), json_mode)
+        return
+
+    try:
+        text = sys.stdin.read() if args.file == "-" else Path(args.file).read_text(encoding="utf-8")
+        ops = parse_ops(text)
+    except (OSError, ValueError) as e:
+        sys.exit(emit_error(f"Bad batch: {e}", json_mode, code="bad_batch"))
+    if not ops:
+        sys.exit(emit_error("Empty batch: no operations given", json_mode, code="bad_batch"))
+
+    try:
+        report = run_batch(ops, dry_run=args.dry_run)
+    except RuntimeError as e:
+        sys.exit(emit_error(str(e), json_mode))
+
+    if report["failed"] is not None:
+        i = report["failed"]
+        message = (f"Operation {i + 1}/{len(ops)} ({ops[i]['op']}) failed: {report['error']} "
+                   f"— rolled back, nothing written")
+        if not json_mode:
+            for n, r in enumerate(report["results"][:-1], 1):
+                print(f"[{n}/{len(ops)}] {r['op']}: ok")
+        sys.exit(emit_error(message, json_mode, code="rolled_back"))
+
+    lines = [f"[{n}/{len(ops)}] {r['op']}: {r['output'] or 'ok'}"
+             for n, r in enumerate(report["results"], 1)]
+    if report["dry_run"]:
+        lines.append(f"[SUCCESS] Dry run: {len(ops)} operation(s) would write "
+                     f"{', '.join(report['files']) or 'nothing'}")
+    else:
+        lines.append(f"[SUCCESS] Committed {len(ops)} operation(s): "
+                     f"{', '.join(report['files']) or 'no files changed'}")
+    emit(json.loads(json.dumps(report, default=str)), "\n".join(lines), json_mode)
+
+
+if __name__ == "__main__":
+    profiling.run(main)
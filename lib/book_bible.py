@@ -370,4 +370,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
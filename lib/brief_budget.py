@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Token-budgeted session brief.
+
+The compact brief cuts every list at a hard-coded size (three summaries, six
+threads, four voice lines …) whatever the campaign looks like, which wastes
+tokens on a small campaign and still overflows a big one. `context --budget N`
+instead renders every section in full, splits each into candidate items with
+a priority and a token cost, and fills N tokens with the most valuable mix.
+
+A section's rendered lines split into:
+
+  head   — the leading blank line and its "--- HEADING ---" (paid once, if any
+           item of the section is kept);
+  items  — lines matching the section's item pattern, each with the indented
+           or blank lines under it;
+  tail   — other unindented lines (WHERE WE PAUSED, OPEN DEBT, …), kept
+           whenever the section is.
+
+Items keep their print order; priority decays with rank, counted from the end
+for newest-last lists such as PREVIOUSLY ON. Each section is a group whose
+options are "its top-k items" for k = 0…n, including the cost of the
+"+N more …" line k < n needs, and a group knapsack picks one option per
+section. Disclosures are written from what was actually dropped: a remainder
+line per trimmed section and one closing line naming sections left out
+entirely. Mandatory sections (weight None) are always printed whole and come
+off the top of the budget.
+
+Costs are the brief's usual estimate, ~4 characters per token, rounded up per
+part, so the printed brief never estimates above N unless the mandatory
+sections alone do.
+"""
+
+import math
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Priority of an item = section weight × DECAY ** rank.
+DECAY = 0.6
+# Knapsack capacity resolution: costs are bucketed so the table stays this wide.
+SLOTS = 512
+
+
+def estimate_tokens(lines: List[str]) -> int:
+    """~4 chars per token, counting the newline each printed line adds."""
+    if not lines:
+        return 0
+    return math.ceil(sum(len(line) + 1 for line in lines) / 4)
+
+
+def remainder_line(hidden: int, noun: str, hint: str) -> str:
+    return f"+{hidden} more {noun} — {hint}"
+
+
+def omitted_line(names: List[str]) -> str:
+    return ("Left out for budget: " + ", ".join(n.replace("_", " ") for n in names)
+            + " — raise --budget or use --full")
+
+
+def split_section(lines: List[str], item_pattern: Optional[str]) -> List[Any]:
+    """Owner of each line: "head", "tail", or the index of the item it belongs to.
+
+    No pattern means the whole section is a single item.
+    """
+    if item_pattern is None:
+        return [0] * len(lines)
+    owners: List[Any] = []
+    i = 0
+    while i < len(lines) and not lines[i].strip():
+        owners.append("head")
+        i += 1
+    if i < len(lines) and lines[i].startswith(("---", "===")):
+        owners.append("head")
+        i += 1
+    item_re = re.compile(item_pattern)
+    current: Any = "head"
+    count = 0
+    for line in lines[i:]:
+        if line and not line[0].isspace() and item_re.match(line):
+            current = count
+            count += 1
+        elif line and not line[0].isspace():
+            owners.append("tail" if count else "head")
+            continue
+        owners.append(current)
+    return owners
+
+
+class _Candidate:
+    """One section's decomposition and its top-k options."""
+
+    def __init__(self, name: str, lines: List[str], spec: Tuple):
+        weight, pattern, noun, hint, newest_last = spec
+        self.name, self.lines, self.weight = name, lines, weight
+        self.noun, self.hint = noun, hint
+        self.owners = split_section(lines, pattern)
+        n = 1 + max((o for o in self.owners if isinstance(o, int)), default=-1)
+        if n == 0:  # nothing matched the pattern: the section is one item
+            self.owners, n = [0] * len(lines), 1
+        self.n = n
+        item_lines: List[List[str]] = [[] for _ in range(n)]
+        fixed: List[str] = []
+        for line, owner in zip(lines, self.owners):
+            (item_lines[owner] if isinstance(owner, int) else fixed).append(line)
+        self.fixed_cost = estimate_tokens(fixed)
+        self.costs = [estimate_tokens(ls) for ls in item_lines]
+        ranks = range(n - 1, -1, -1) if newest_last else range(n)
+        self.values = [(weight or 0) * DECAY ** r for r in ranks]
+        # Best items first: highest value, ties to print order.
+        self.by_value = sorted(range(n), key=lambda j: (-self.values[j], j))
+        # Prefix sums over by_value: the top-k cost and value are one lookup each.
+        self.cost_upto, self.value_upto = [0], [0.0]
+        for j in self.by_value:
+            self.cost_upto.append(self.cost_upto[-1] + self.costs[j])
+            self.value_upto.append(self.value_upto[-1] + self.values[j])
+
+    def option(self, k: int) -> Tuple[int, float]:
+        """(cost, value) of keeping the top-k items (k=0: leave the section out)."""
+        if k == 0 or self.n == 0:
+            return 0, 0.0
+        cost = self.fixed_cost + self.cost_upto[k]
+        if k < self.n and self.noun:
+            cost += estimate_tokens([remainder_line(self.n - k, self.noun, self.hint)])
+        return cost, self.value_upto[k]
+
+    def render(self, k: int) -> List[str]:
+        keep = set(self.by_value[:k])
+        out: List[str] = []
+        last_item_at = None
+        for line, owner in zip(self.lines, self.owners):
+            if isinstance(owner, int):
+                if owner not in keep:
+                    continue
+                last_item_at = len(out)
+            out.append(line)
+        if k < self.n and self.noun and last_item_at is not None:
+            # After the last kept item's block, before the tail lines.
+            at = last_item_at + 1
+            while at < len(out) and (not out[at] or out[at][0].isspace()):
+                at += 1
+            out.insert(at, remainder_line(self.n - k, self.noun, self.hint))
+        return out
+
+
+def fit_brief(sections: List[Tuple[str, List[str]]], budget: int,
+              specs: Dict[str, Tuple]) -> List[Tuple[str, List[str]]]:
+    """Choose what of each fully rendered section fits `budget` tokens.
+
+    `specs` maps section name -> (weight, item pattern, remainder noun, hint,
+    newest_last); weight None makes the section mandatory. Returns the kept
+    [(name, lines)] in print order, plus a closing ("budget", [...]) section
+    naming anything left out. Sections without a spec are mandatory.
+    """
+    mandatory_cost = 0
+    candidates: List[_Candidate] = []
+    for name, lines in sections:
+        spec = specs.get(name) or (None, None, None, None, False)
+        if not lines or spec[0] is None:
+            mandatory_cost += estimate_tokens(lines)
+            continue
+        candidates.append(_Candidate(name, lines, spec))
+
+    # Reserve the worst-case closing line up front so it always fits too.
+    reserve = estimate_tokens(["", omitted_line([c.name for c in candidates])]) if candidates else 0
+    room = max(0, budget - mandatory_cost - reserve)
+    unit = max(1, math.ceil(room / SLOTS))
+    capacity = room // unit
+
+    # Group knapsack: best[c] = max value within c units; picks[s][c] = k chosen.
+    # Of the options that cost the same units only the most valuable (first on
+    # ties) can be picked, so each section brings at most capacity + 1 of them.
+    best = [0.0] * (capacity + 1)
+    picks: List[List[int]] = []
+    units_of: List[Dict[int, int]] = []
+    for cand in candidates:
+        top: Dict[int, Tuple[float, int]] = {}
+        for k in range(cand.n + 1):
+            cost, value = cand.option(k)
+            units = math.ceil(cost / unit)
+            if units <= capacity and (units not in top or value > top[units][0]):
+                top[units] = (value, k)
+        options = sorted(((units, value, k) for units, (value, k) in top.items()),
+                         key=lambda o: o[2])
+        units_of.append({k: units for units, _value, k in options})
+        nxt = [0.0] * (capacity + 1)
+        pick = [0] * (capacity + 1)
+        for c in range(capacity + 1):
+            for units, value, k in options:
+                if units <= c and best[c - units] + value > nxt[c] + 1e-12:
+                    nxt[c], pick[c] = best[c - units] + value, k
+        best = nxt
+        picks.append(pick)
+
+    chosen: Dict[str, int] = {}
+    c = capacity
+    for cand, pick, units in zip(reversed(candidates), reversed(picks), reversed(units_of)):
+        k = pick[c]
+        chosen[cand.name] = k
+        c -= units[k]
+
+    by_name = {cand.name: cand for cand in candidates}
+    out: List[Tuple[str, List[str]]] = []
+    left_out: List[str] = []
+    for name, lines in sections:
+        cand = by_name.get(name)
+        if cand is None:
+            out.append((name, lines))
+        elif chosen.get(name):
+            out.append((name, cand.render(chosen[name])))
+        else:
+            out.append((name, []))
+            left_out.append(name)
+    out.append(("budget", ["", omitted_line(left_out)] if left_out else []))
+    return out
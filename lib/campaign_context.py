@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+One resolution of "which campaign", shared by every manager built from it.
+
+Every `EntityManager` used to resolve the active campaign on its own: build
+a `CampaignManager` (mkdir of campaigns/), read active-campaign.txt, check
+the folder, then build a fresh `JsonOperations` (another mkdir). `World`
+builds up to six managers, and managers build siblings (a clock tick builds
+a ConsequenceManager), so one command resolved the campaign many times —
+and could in principle see two different answers if active-campaign.txt
+changed in between.
+
+A `CampaignContext` does that once and owns the one `JsonOperations` for
+the campaign. Pass it as `context=` to any manager; the old
+`Manager(world_state_dir)` form still works and simply builds its own.
+"""
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from campaign_manager import CampaignManager, DEFAULT_WORLD_STATE
+from json_ops import BufferedJsonOperations, CachedJsonOperations, JsonOperations
+
+
+class CampaignContext:
+    """The active campaign, resolved once: its name, directory and JsonOperations."""
+
+    def __init__(self, world_state_dir: str = None, campaign_name: str = None,
+                 buffered: bool = False, pin: bool = False, cached: bool = False):
+        """Resolve the campaign under `world_state_dir` (default "world-state").
+
+        `campaign_name` makes that campaign active first, as `World("conan")`
+        always did. No active campaign is not an error here: `campaign_dir`
+        is None and `require()` raises for callers that need one.
+        `buffered` shares a `BufferedJsonOperations` instead: every manager's
+        writes wait for `json_ops.commit()` (gm-batch.sh).
+        `pin` serves `campaign_name` without activating it: active-campaign.txt
+        is neither read nor written, so one process can hold several tables
+        (campaign_service.py). `cached` shares a `CachedJsonOperations`.
+        """
+        if buffered and cached:
+            raise ValueError("a CampaignContext is buffered or cached, not both")
+        self.campaign_mgr = CampaignManager(world_state_dir or DEFAULT_WORLD_STATE)
+        if pin:
+            if not campaign_name:
+                raise ValueError("pin=True needs a campaign_name")
+            path = self.campaign_mgr.get_campaign_path(campaign_name)
+            self.campaign_name: Optional[str] = path.name if path else None
+        else:
+            if campaign_name:
+                self.campaign_mgr.set_active(campaign_name)
+            self.campaign_name = self.campaign_mgr.get_active()
+        self.campaign_dir: Optional[Path] = (
+            self.campaign_mgr.campaigns_dir / self.campaign_name if self.campaign_name else None)
+        self._ops_class = (BufferedJsonOperations if buffered else
+                           CachedJsonOperations if cached else JsonOperations)
+        self._json_ops: Optional[JsonOperations] = None
+
+    @property
+    def world_state_dir(self) -> str:
+        """The base directory (parent of campaigns/), for managers that take one."""
+        return str(self.campaign_mgr.world_state_dir)
+
+    @property
+    def json_ops(self) -> JsonOperations:
+        """The campaign's JsonOperations, built on first use and then shared."""
+        if self._json_ops is None:
+            self._json_ops = self._ops_class(str(self.require()))
+        return self._json_ops
+
+    def require(self) -> Path:
+        """The campaign directory, or RuntimeError when no campaign is active."""
+        if self.campaign_dir is None:
+            raise RuntimeError("No active campaign. Run /new-game or /import first.")
+        return self.campaign_dir
@@ -7,12 +7,9 @@ Handles multi-campaign support with CRUD operations
 import os
 import re
 import sys
-import hashlib
 import json
-import shutil
 from typing import Dict, List, Optional, Any
 from pathlib import Path
-from datetime import datetime, timezone
 
 sys.path.insert(0, str(Path(__file__).parent))
 from character_schema import to_flat
@@ -34,6 +31,197 @@ def resolve_world_state_base(world_state_dir):
     return world_state_dir
 
 
+def _file_stamp(path: Path) -> Optional[List[int]]:
+    """[mtime_ns, size] of `path`, or None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _overview_fields(overview: Any) -> Dict[str, Any]:
+    position = overview.get("player_position") or {}
+    return {"campaign_name": overview.get("campaign_name", "Unnamed"),
+            "current_location": position.get("current_location"),
+            "session_count": overview.get("session_count", 0)}
+
+
+def _character_fields(raw: Any) -> Dict[str, Any]:
+    char = to_flat(raw)
+    return {"character": {"name": char.get("name", "Unknown"), "race": char.get("race", "?"),
+                          "class": char.get("class", "?"), "level": char.get("level", 1)}}
+
+
+def _count_fields(key: str):
+    def fields(data: Any) -> Dict[str, Any]:
+        return {key: len(data)} if isinstance(data, (dict, list)) else {}
+    return fields
+
+
+class CampaignCatalog:
+    """campaigns/index.json — each campaign's listing summary, kept beside the campaigns.
+
+    Listing campaigns used to parse every campaign's overview and character,
+    and get_info parsed npcs.json only to count it. The catalog keeps those
+    summaries. Each one is stored with the [mtime_ns, size] of the file it
+    came from, and only a file whose stamp changed is parsed again. So no
+    command has to keep the catalog current: whoever reads a stale summary
+    refreshes it.
+
+    The folder list is trusted while the index's mtime equals the campaigns
+    directory's. Every write sets it so, and creating, deleting or copying
+    in a campaign moves the directory's mtime. A mismatch rebuilds the list
+    from one directory scan and keeps every summary whose folder is still
+    there. It is not a campaign: it is a file, and listings take folders.
+    """
+
+    FILENAME = "index.json"
+    VERSION = 1
+    # source file -> the summary fields it yields
+    SOURCES = {
+        "campaign-overview.json": _overview_fields,
+        "character.json": _character_fields,
+        "npcs.json": _count_fields("npcs_count"),
+        "locations.json": _count_fields("locations_count"),
+        "facts.json": _count_fields("facts_count"),
+    }
+    LISTING = ("campaign-overview.json", "character.json")
+
+    def __init__(self, campaigns_dir: Path):
+        self.campaigns_dir = Path(campaigns_dir)
+        self.path = self.campaigns_dir / self.FILENAME
+        self.rescanned = False
+        self._data: Optional[Dict[str, Any]] = None
+
+    # ---------------------------------------------------------------- storage
+
+    def _load(self) -> Dict[str, Any]:
+        if self._data is None:
+            index, folder = _file_stamp(self.path), _file_stamp(self.campaigns_dir)
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (ValueError, OSError):
+                data = None
+            valid = (isinstance(data, dict) and data.get("version") == self.VERSION
+                     and isinstance(data.get("campaigns"), dict))
+            if valid and index is not None and folder is not None and index[0] == folder[0]:
+                self._data = data
+            else:
+                self._rescan(data if valid else None)
+        return self._data
+
+    def _rescan(self, old: Any = None) -> Dict[str, Any]:
+        """The folder list from disk, keeping summaries of folders still present."""
+        kept = old.get("campaigns") if isinstance(old, dict) else None
+        kept = kept if isinstance(kept, dict) else {}
+        folders = sorted(p.name for p in self.campaigns_dir.iterdir() if p.is_dir())
+        self._data = {"version": self.VERSION, "campaigns": {
+            name: kept[name] if isinstance(kept.get(name), dict)
+            and isinstance(kept[name].get("sources"), dict)
+            else {"slug": CampaignManager._slugify(name), "sources": {}}
+            for name in folders}}
+        self.rescanned = True
+        self._save()
+        return self._data
+
+    def _save(self) -> None:
+        """Atomic write, then stamp the index with the directory's mtime (see class doc)."""
+        tmp = self.campaigns_dir / f".{self.FILENAME}.tmp"
+        try:
+            tmp.write_text(json.dumps(self._data, indent=2, ensure_ascii=False),
+                           encoding="utf-8")
+            os.replace(tmp, self.path)
+            folder = os.stat(self.campaigns_dir)
+            os.utime(self.path, ns=(folder.st_atime_ns, folder.st_mtime_ns))
+        except OSError:
+            # A read-only tree still lists correctly; it just rescans every time.
+            tmp.unlink(missing_ok=True)
+
+    # ---------------------------------------------------------------- reads
+
+    def folders(self, rescan: bool = False) -> Dict[str, str]:
+        """Campaign folder name -> its slug, sorted by folder name."""
+        if rescan and not self.rescanned:
+            self._rescan(self._load())
+        return {name: entry["slug"] for name, entry in self._load()["campaigns"].items()}
+
+    def summary(self, name: str, sources=LISTING):
+        """(fields, warnings) for campaign `name`, re-reading only stale `sources`.
+
+        Returns None for a folder that does not exist. A missing source file
+        contributes nothing; an unreadable one a warning (the overview: the
+        fallback name "Unknown", as listings always showed).
+        """
+        entry = self._load()["campaigns"].get(name)
+        if entry is None and not self.rescanned:
+            entry = self._rescan(self._data)["campaigns"].get(name)
+        if entry is None:
+            return None
+        changed = self._refresh(name, entry, sources)
+        if changed:
+            self._save()
+        return self._merge(entry, sources)
+
+    def summaries(self, sources=LISTING) -> List[tuple]:
+        """[(name, fields, warnings)] for every campaign, with one write at most."""
+        campaigns = self._load()["campaigns"]
+        changed = False
+        for name, entry in campaigns.items():
+            changed = self._refresh(name, entry, sources) or changed
+        if changed:
+            self._save()
+        return [(name, *self._merge(entry, sources)) for name, entry in campaigns.items()]
+
+    def _refresh(self, name: str, entry: Dict[str, Any], sources) -> bool:
+        changed = False
+        for filename in sources:
+            path = self.campaigns_dir / name / filename
+            stamp = _file_stamp(path)
+            known = entry["sources"].get(filename)
+            if known is not None and known["stamp"] == stamp:
+                continue
+            record: Dict[str, Any] = {"stamp": stamp, "fields": {}}
+            if stamp is not None:
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        record["fields"] = self.SOURCES[filename](json.load(f))
+                except (json.JSONDecodeError, IOError, AttributeError, TypeError) as e:
+                    if filename == "campaign-overview.json":
+                        record["fields"] = {"campaign_name": "Unknown"}
+                    else:
+                        record["warning"] = f"Could not read {filename} for {name}: {e}"
+            entry["sources"][filename] = record
+            changed = True
+        return changed
+
+    @staticmethod
+    def _merge(entry: Dict[str, Any], sources):
+        fields: Dict[str, Any] = {}
+        warnings: List[str] = []
+        for filename in sources:
+            record = entry["sources"].get(filename) or {}
+            fields.update(record.get("fields", {}))
+            if record.get("warning"):
+                warnings.append(record["warning"])
+        return fields, warnings
+
+    # ---------------------------------------------------------------- updates
+
+    def add(self, name: str) -> None:
+        """Record a campaign folder just created."""
+        campaigns = self._load()["campaigns"]
+        if name not in campaigns:
+            campaigns[name] = {"slug": CampaignManager._slugify(name), "sources": {}}
+            self._data["campaigns"] = dict(sorted(campaigns.items()))
+        self._save()
+
+    def discard(self, name: str) -> None:
+        """Forget a campaign folder just deleted."""
+        self._load()["campaigns"].pop(name, None)
+        self._save()
+
+
 class CampaignManager:
     """Manage multiple D&D campaigns"""
 
@@ -63,6 +251,7 @@ class CampaignManager:
         slug = re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
         if slug:
             return slug
+        import hashlib  # rare path: keep it off every manager's startup
         digest = hashlib.sha1(name.encode('utf-8')).hexdigest()[:8]
         return f'campaign-{digest}'
 
@@ -84,72 +273,79 @@ class CampaignManager:
         on a case-insensitive filesystem (macOS) is_dir() says yes to "Conan"
         when only "conan" exists, and that wrong spelling then leaks into env
         vars and case-sensitive comparisons. Case variants fall through to the
-        slug branch, which lowercases, and land on the canonical folder."""
+        slug branch, which lowercases, and land on the canonical folder.
+
+        Every manager built for a named campaign resolves it, so the common
+        case costs a few stats, not a directory scan: `_on_disk` settles the
+        exact name and the slug directly. Only a case-insensitive filesystem,
+        a legacy folder or a miss consults the listing, which comes from the
+        campaign catalog."""
         name = name.rstrip("/")
-        listing = sorted(p.name for p in campaigns_dir.iterdir() if p.is_dir()) \
-            if campaigns_dir.is_dir() else []
+        slug = cls._slugify(name)
+        if not campaigns_dir.is_dir():
+            return slug
+        exact = "/" not in name and cls._on_disk(campaigns_dir, name)
+        if exact and (campaigns_dir / name).resolve().parent == campaigns_dir.resolve():
+            return name
+        if exact is False and cls._on_disk(campaigns_dir, slug):
+            return slug
+        catalog = CampaignCatalog(campaigns_dir)
+        for rescan in (False, True):
+            found = cls._match_listing(campaigns_dir, name, slug, catalog.folders(rescan))
+            if found or catalog.rescanned:
+                break
+        return found or slug
+
+    @staticmethod
+    def _on_disk(campaigns_dir: Path, name: str) -> Optional[bool]:
+        """Is `name`, spelled exactly so, a campaign folder? None when a stat can't tell.
+
+        A missing directory is a definite no. A present one is a definite yes
+        unless its case-swapped spelling is present too: that is a
+        case-insensitive filesystem (or two folders differing only in case),
+        where only the listing knows the real spelling.
+        """
+        if not name or name in (".", "..") or not (campaigns_dir / name).is_dir():
+            return False
+        swapped = name.swapcase()
+        if swapped == name or not (campaigns_dir / swapped).is_dir():
+            return True
+        return None
+
+    @classmethod
+    def _match_listing(cls, campaigns_dir: Path, name: str, slug: str,
+                       listing: Dict[str, str]) -> Optional[str]:
         if name in listing and (campaigns_dir / name).resolve().parent == campaigns_dir.resolve():
             return name
-        slug = cls._slugify(name)
         if slug in listing:
             return slug
         # Folders created under the OLD slug rule kept apostrophes, dots and
         # underscores ("baldur's-gate"), so the current rule no longer points at
         # them and a real campaign reads as "does not exist". Match by comparing
         # slugified folder names — resolves legacy dirs without renaming on disk.
-        for existing in listing:
-            if cls._slugify(existing) == slug:
+        for existing, existing_slug in listing.items():
+            if existing_slug == slug:
                 return existing
-        return slug
+        return None
 
     def _resolve_name(self, name: str) -> str:
         return self._resolve_in(self.campaigns_dir, name)
 
+    @property
+    def catalog(self) -> CampaignCatalog:
+        return CampaignCatalog(self.campaigns_dir)
+
     def list_campaigns(self) -> List[Dict[str, Any]]:
         """
         List all campaigns with their metadata
         Returns list of dicts with name, path, character info
+        (from the campaign catalog: only files changed since the last listing are read)
         """
         campaigns = []
-
-        for campaign_dir in sorted(self.campaigns_dir.iterdir()):
-            if not campaign_dir.is_dir():
-                continue
-
-            campaign_info = {
-                "name": campaign_dir.name,
-                "path": str(campaign_dir),
-            }
-
-            # Try to read campaign overview for more info
-            overview_file = campaign_dir / "campaign-overview.json"
-            if overview_file.exists():
-                try:
-                    with open(overview_file, 'r', encoding='utf-8') as f:
-                        overview = json.load(f)
-                    campaign_info["campaign_name"] = overview.get("campaign_name", "Unnamed")
-                    campaign_info["current_location"] = overview.get("player_position", {}).get("current_location")
-                    campaign_info["session_count"] = overview.get("session_count", 0)
-                except (json.JSONDecodeError, IOError):
-                    campaign_info["campaign_name"] = "Unknown"
-
-            # Try to read character info
-            char_file = campaign_dir / "character.json"
-            if char_file.exists():
-                try:
-                    with open(char_file, 'r', encoding='utf-8') as f:
-                        char = to_flat(json.load(f))
-                    campaign_info["character"] = {
-                        "name": char.get("name", "Unknown"),
-                        "race": char.get("race", "?"),
-                        "class": char.get("class", "?"),
-                        "level": char.get("level", 1)
-                    }
-                except (json.JSONDecodeError, IOError) as e:
-                    print(f"[WARNING] Could not read character for {campaign_dir.name}: {e}", file=sys.stderr)
-
-            campaigns.append(campaign_info)
-
+        for name, fields, warnings in self.catalog.summaries():
+            for warning in warnings:
+                print(f"[WARNING] {warning}", file=sys.stderr)
+            campaigns.append({"name": name, "path": str(self.campaigns_dir / name), **fields})
         return campaigns
 
     def get_active(self) -> Optional[str]:
@@ -213,12 +409,14 @@ class CampaignManager:
             # Initialize empty state files
             self._init_empty_files(campaign_path, campaign_name or f"{name}'s Adventure")
 
+            self.catalog.add(safe_name)
             print(f"[SUCCESS] Created campaign: {safe_name}")
             return campaign_path
         except IOError as e:
             print(f"[ERROR] Failed to create campaign: {e}")
             # Clean up on failure
             if campaign_path.exists():
+                import shutil
                 shutil.rmtree(campaign_path)
             return None
 
@@ -246,7 +444,9 @@ class CampaignManager:
             if self.get_active() == name:
                 self.active_file.unlink(missing_ok=True)
 
+            import shutil
             shutil.rmtree(campaign_path)
+            self.catalog.discard(name)
             print(f"[SUCCESS] Deleted campaign: {name}")
             return True
         except IOError as e:
@@ -323,24 +523,20 @@ class CampaignManager:
             except (json.JSONDecodeError, IOError) as e:
                 print(f"[WARNING] Could not read character for {name}: {e}", file=sys.stderr)
 
-        # Count NPCs, locations, etc.
-        for filename in ["npcs.json", "locations.json", "facts.json"]:
-            filepath = campaign_path / filename
-            if filepath.exists():
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    if isinstance(data, dict):
-                        info[filename.replace('.json', '_count')] = len(data)
-                    elif isinstance(data, list):
-                        info[filename.replace('.json', '_count')] = len(data)
-                except (json.JSONDecodeError, IOError) as e:
-                    print(f"[WARNING] Could not read {filename} for {name}: {e}", file=sys.stderr)
+        # Count NPCs, locations, etc. (from the catalog: npcs.json is parsed
+        # only when it changed since the last count)
+        counted = self.catalog.summary(name, ("npcs.json", "locations.json", "facts.json"))
+        if counted is not None:
+            counts, warnings = counted
+            info.update(counts)
+            for warning in warnings:
+                print(f"[WARNING] {warning}", file=sys.stderr)
 
         # Count saves
         saves_dir = campaign_path / "saves"
         if saves_dir.exists():
-            info["saves_count"] = len(list(saves_dir.glob("*.json")))
+            info["saves_count"] = len([p for p in saves_dir.glob("*.json")
+                                       if p.name != "index.json"])
 
         return info
 
@@ -410,7 +606,7 @@ class CampaignManager:
         consequences_path = campaign_path / "consequences.json"
         if not preserve_existing or not consequences_path.exists():
             with open(consequences_path, 'w', encoding='utf-8') as f:
-                json.dump({"active": [], "resolved": []}, f, indent=2)
+                json.dump({"active": []}, f, indent=2)
 
         # session-log.md - ALWAYS preserve if exists (append only)
         session_log_path = campaign_path / "session-log.md"
@@ -554,4 +750,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
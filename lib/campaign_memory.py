@@ -19,36 +19,25 @@ from typing import Any, Dict, List
 sys.path.insert(0, str(Path(__file__).parent))
 
 from entity_manager import EntityManager
+from campaign_context import CampaignContext
+from session_log_index import SessionLogIndex
 
 _CANON_CATEGORIES = {"plot_world", "world_building"}
 
 
 class CampaignMemory(EntityManager):
-    def __init__(self, world_state_dir: str = None):
-        super().__init__(world_state_dir)
+    def __init__(self, world_state_dir: str = None, context: CampaignContext = None):
+        super().__init__(world_state_dir, context)
         self.memory_file = "campaign-memory.json"
 
     def gather(self) -> List[Dict[str, Any]]:
         """Collect memory entries from the campaign's own history (read-only)."""
         entries: List[Dict[str, Any]] = []
 
-        log_path = self.campaign_dir / "session-log.md"
-        if log_path.exists():
-            text = log_path.read_text(encoding="utf-8")
-            for block in text.split("## Session Started:"):
-                if "### Session Ended:" not in block:
-                    continue
-                after = block.split("### Session Ended:", 1)[1]
-                body = []
-                for ln in after.splitlines()[1:]:
-                    s = ln.strip()
-                    if s == "---":
-                        break
-                    if s and not s.startswith("**"):  # skip the structured footer lines
-                        body.append(s)
-                if body:
-                    entries.append({"text": " ".join(body), "provenance": "our-story",
-                                    "source": "session-log", "tier": "recent"})
+        for session in SessionLogIndex(self.campaign_dir).ended_sessions():
+            if session["summary"]:  # the prose only, without the structured footer lines
+                entries.append({"text": session["summary"], "provenance": "our-story",
+                                "source": "session-log", "tier": "recent"})
 
         facts = self.json_ops.load_json("facts.json") or {}
         if isinstance(facts, dict):
@@ -245,4 +234,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
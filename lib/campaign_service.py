@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Serve several tables from one process, each request naming its campaign.
+
+Every CLI call resolves world-state/active-campaign.txt. That file is a single
+global pointer, so one machine can serve one table at a time: two tables
+switching it back and forth race each other. `campaign_service.py serve`
+instead reads JSON-lines requests that name their campaign explicitly:
+
+    {"id": 1, "campaign": "table-7", "op": "player.hp", "name": "Tandy", "amount": -7}
+    {"id": 2, "campaign": "conan", "op": "session.context"}
+
+It writes one JSON line per request, tagged with the request's id.
+Responses can arrive out of order, because different tables run in parallel:
+
+    {"id": 1, "campaign": "table-7", "ok": true, "result": {...}, "output": "..."}
+
+The ops are gm-batch.sh's writers (`batch_executor.OPS`) plus the reads in
+`READ_OPS`. `service.stats` reports the tables held and their cost. The
+service never reads or writes active-campaign.txt: each table is a pinned
+CampaignContext. The CLI keeps defaulting to the active campaign as before.
+
+A table that is in play holds:
+
+- its own lock. Requests for one table run one at a time, and a flock on
+  saves/service.lock extends that to other hosts serving the same campaign.
+  Different tables never wait on each other.
+- warm state. A CachedJsonOperations keeps the parsed files, and the managers
+  built over it are kept too, with their indexes and vector-store handles.
+
+Tables live in an LRU under a memory budget (`--memory-mb`). A table costs its
+cached parse state plus an estimate for each heavy handle (the vector store is
+charged at its size on disk). Past the budget, the least recently used idle
+tables are dropped. Nothing is loaded for a campaign until a request names
+it, so memory follows the tables in play, not the campaigns on disk.
+"""
+
+import contextlib
+import io
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, TextIO
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from batch_executor import OPS, build_manager, check_op, failure_reason, succeeded
+from campaign_context import CampaignContext
+from campaign_manager import CampaignManager, DEFAULT_WORLD_STATE
+from cli_output import ThreadLocalStdout
+import profiling
+
+try:
+    import fcntl
+except ImportError:  # no flock (Windows): tables are isolated within this process only
+    fcntl = None
+
+# Reads a table serves besides the batch writers; same shape as OPS.
+READ_OPS = {
+    "session.status": ("session", "get_status", (), ()),
+    "session.context": ("session", "get_full_context", (), ("full", "budget")),
+    "player.show": ("player", "get_player", ("name",), ()),
+    "npc.status": ("npc", "get_npc_status", ("name",), ()),
+    "consequence.check": ("consequence", "check_pending", (), ()),
+    "consequence.tick": ("consequence", "tick_from_session", (), ()),
+    "memory.recall": ("memory", "recall", ("query",), ("top_k", "provenance")),
+    "scene.context": ("enhancer", "get_scene_context", ("location_name",), ()),
+}
+
+SERVICE_OPS = {**OPS, **READ_OPS}
+
+DEFAULT_MEMORY_MB = 256
+
+# Reads whose None means "nothing here" (no vector store) rather than "not found".
+_NONE_OK = {"scene.context"}
+
+
+def _disk_bytes(path: Path) -> int:
+    """Total size of the files under `path` (0 if absent)."""
+    if not path.is_dir():
+        return 0
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+class Table:
+    """One campaign in play: its pinned context, warm managers, and its locks."""
+
+    LOCK_FILE = "service.lock"
+
+    def __init__(self, world_state_dir: str, campaign: str):
+        self.context = CampaignContext(world_state_dir, campaign, pin=True, cached=True)
+        self.name = self.context.require().name
+        self.lock = threading.RLock()
+        self.busy = 0
+        self.requests = 0
+        self._managers: Dict[str, Any] = {}
+        self._handle_costs: Dict[str, int] = {}
+        self._lock_file: Optional[TextIO] = None
+
+    def manager(self, kind: str):
+        """The table's manager of `kind`, built on first use and then kept warm."""
+        if kind not in self._managers:
+            self._managers[kind] = build_manager(kind, self.context)
+            if kind in ("memory", "enhancer"):  # embeddings / vector-store handles
+                self._handle_costs[kind] = _disk_bytes(self.context.campaign_dir / "vectors")
+        return self._managers[kind]
+
+    @property
+    def cost(self) -> int:
+        """Bytes charged against the host's budget."""
+        return self.context.json_ops.cached_bytes + sum(self._handle_costs.values())
+
+    @contextlib.contextmanager
+    def locked(self):
+        """Exclusive use of this campaign: in this process, and across hosts via flock."""
+        with self.lock:
+            if fcntl is None:
+                yield
+                return
+            if self._lock_file is None:
+                saves = self.context.campaign_dir / "saves"
+                saves.mkdir(parents=True, exist_ok=True)
+                self._lock_file = open(saves / self.LOCK_FILE, "a")
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """Drop everything warm; the next request for this campaign starts cold."""
+        self._managers.clear()
+        self._handle_costs.clear()
+        self.context.json_ops.clear()
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+
+class CampaignHost:
+    """The tables in play, in least-recently-used order, under one memory budget."""
+
+    def __init__(self, world_state_dir: str = None, memory_mb: int = DEFAULT_MEMORY_MB,
+                 max_tables: int = None):
+        self.campaign_mgr = CampaignManager(world_state_dir or DEFAULT_WORLD_STATE)
+        self.world_state_dir = str(self.campaign_mgr.world_state_dir)
+        self.budget = memory_mb * 1024 * 1024
+        self.max_tables = max_tables
+        self.evictions = 0
+        self._tables: "OrderedDict[str, Table]" = OrderedDict()
+        self._lock = threading.Lock()  # guards _tables and the busy counts
+
+    # ---------------------------------------------------------------- tables
+
+    def _claim(self, name: str, built: Table = None) -> Optional[Table]:
+        """Mark the table `name` busy and most recently used (adding `built` if absent).
+
+        Lookup and claim happen under one lock hold, so eviction can never
+        close a table between a request finding it and using it.
+        """
+        with self._lock:
+            table = self._tables.get(name)
+            if table is None and built is not None:
+                table = self._tables[name] = built
+            if table is not None:
+                table.busy += 1
+                self._tables.move_to_end(name)
+            return table
+
+    def _checkout(self, campaign: str) -> Table:
+        """The table for `campaign` (folder or display name), claimed for one request."""
+        table = self._claim(campaign)
+        if table is not None:
+            return table
+        path = self.campaign_mgr.get_campaign_path(campaign)
+        if path is None:
+            raise LookupError(f"Campaign '{campaign}' does not exist")
+        return self._claim(path.name) or self._claim(path.name, Table(self.world_state_dir,
+                                                                       path.name))
+
+    def _checkin(self, table: Table) -> None:
+        with self._lock:
+            table.busy -= 1
+            table.requests += 1
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop idle tables, oldest first, until the cost and count fit (caller holds _lock)."""
+        def over() -> bool:
+            total = sum(t.cost for t in self._tables.values())
+            too_many = self.max_tables is not None and len(self._tables) > self.max_tables
+            return total > self.budget or too_many
+
+        for name in list(self._tables):
+            if not over():
+                return
+            table = self._tables[name]
+            if table.busy:
+                continue  # in use: never pulled out from under a request
+            del self._tables[name]
+            table.close()
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            tables = [{"campaign": t.name, "cost_bytes": t.cost, "requests": t.requests,
+                       "busy": bool(t.busy)} for t in reversed(self._tables.values())]
+        return {"tables": tables, "cost_bytes": sum(t["cost_bytes"] for t in tables),
+                "budget_bytes": self.budget, "evictions": self.evictions}
+
+    # ---------------------------------------------------------------- requests
+
+    def call(self, campaign: str, op: str, **args: Any) -> Dict[str, Any]:
+        """Run one op against `campaign`; {"ok", "result", "output"[, "error"]}."""
+        check_op(dict(args, op=op), "request", SERVICE_OPS)
+        kind, method, _required, _optional = SERVICE_OPS[op]
+        table = self._checkout(campaign)
+        try:
+            with table.locked(), profiling.phase(f"service.{op}"):
+                with _captured() as output:
+                    result = getattr(table.manager(kind), method)(**args)
+        finally:
+            self._checkin(table)
+        printed = output.getvalue().strip()
+        if op in READ_OPS:
+            ok = result is not None or op in _NONE_OK
+        else:
+            ok = succeeded(result)
+        response = {"campaign": table.name, "ok": ok,
+                    "result": json.loads(json.dumps(result, default=str)), "output": printed}
+        if not ok:
+            response["error"] = failure_reason(result, printed)
+        return response
+
+    def handle(self, request: Any) -> Dict[str, Any]:
+        """One request dict in, one response dict out; never raises."""
+        rid = request.get("id") if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict):
+                raise ValueError("request: expected an object")
+            if request.get("op") == "service.stats":
+                return {"id": rid, "ok": True, "result": self.stats()}
+            args = {k: v for k, v in request.items() if k not in ("id", "campaign", "op")}
+            campaign = request.get("campaign")
+            if not campaign:
+                raise ValueError("request: a campaign is required")
+            return dict(self.call(campaign, request.get("op"), **args), id=rid)
+        except (LookupError, ValueError) as e:
+            campaign = request.get("campaign") if isinstance(request, dict) else None
+            return {"id": rid, "campaign": campaign, "ok": False, "error": str(e)}
+        except Exception as e:
+            return {"id": rid, "ok": False, "error": f"{type(e).__name__}: {e}"}
+
+    def serve(self, lines: Iterable[str], out: TextIO, workers: int = 4) -> None:
+        """Answer JSON-lines requests from `lines` on `out`, tables in parallel."""
+        write_lock = threading.Lock()
+
+        def write(response: Dict[str, Any]) -> None:
+            text = json.dumps(response, ensure_ascii=False)
+            with write_lock:
+                out.write(text + "\n")
+                out.flush()
+
+        with ThreadLocalStdout.installed(), \
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix="table") as pool:
+            for line in lines:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                try:
+                    request = json.loads(line)
+                except ValueError as e:
+                    write({"id": None, "ok": False, "error": f"bad request: {e}"})
+                    continue
+                pool.submit(lambda r: write(self.handle(r)), request)
+
+
+@contextlib.contextmanager
+def _captured():
+    """Capture what the manager prints: per thread while serving, else redirected."""
+    if isinstance(sys.stdout, ThreadLocalStdout):
+        buffer = sys.stdout.capture()
+        try:
+            yield buffer
+        finally:
+            sys.stdout.release()
+    else:
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            yield buffer
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Serve many campaigns from one process (JSON lines: stdin -> stdout)")
+    sub = parser.add_subparsers(dest="action")
+    serve = sub.add_parser("serve", help="answer requests until stdin closes")
+    serve.add_argument("--memory-mb", type=int, default=DEFAULT_MEMORY_MB,
+                       help=f"warm-state budget across tables (default {DEFAULT_MEMORY_MB})")
+    serve.add_argument("--max-tables", type=int, help="also cap the number of warm tables")
+    serve.add_argument("--workers", type=int, default=4, help="requests run at once (default 4)")
+    sub.add_parser("ops", help="list the ops a request can name")
+    args = parser.parse_args()
+
+    if args.action == "serve":
+        host = CampaignHost(memory_mb=args.memory_mb, max_tables=args.max_tables)
+        host.serve(sys.stdin, sys.stdout, workers=args.workers)
+    elif args.action == "ops":
+        for name, (_kind, _method, required, optional) in sorted(SERVICE_OPS.items()):
+            extra = f"  [{', '.join(optional)}]" if optional else ""
+            print(f"{name:<22} {', '.join(required)}{extra}")
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    profiling.run(main)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Load-once campaign state for one session-brief build.
+
+`get_full_context` used to let every section and helper load its own copy of
+campaign-overview.json, npcs.json, plots.json, facts.json, threat-clocks.json
+and session-log.md — preferences alone were re-read three or four times — so a
+brief cost data size × section count. A `CampaignSnapshot` is created once per
+build and handed to every section renderer: each file is read and parsed at
+most once, and derived views (session summaries, preferences, the world kit)
+are computed once and shared.
+
+The snapshot is a read-only view of the campaign as it stood when each file
+was first touched. Read-only is a convention, not enforced: `json()` hands
+every caller the same parsed dict, because the renderers test for `dict`
+and a deep frozen copy per file would cost what the snapshot saves.
+Renderers must not mutate what it returns (copy before sorting or editing
+in place), and tests/test_campaign_snapshot.py checks that a brief build
+leaves every file as loaded. Writers keep using the managers and
+`JsonOperations`; the snapshot has no `save_json`, so a manager pointed at
+it for reads raises AttributeError if it tries to write.
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from json_ops import JsonOperations
+from presence_index import PresenceIndex
+from session_log_index import SessionLogIndex
+
+
+class CampaignSnapshot:
+    """Memoized, read-only parsed views of one campaign's files."""
+
+    def __init__(self, campaign_dir, json_ops: JsonOperations = None):
+        self.campaign_dir = Path(campaign_dir)
+        self._json_ops = json_ops or JsonOperations(str(self.campaign_dir))
+        self._files: Dict[str, Any] = {}
+        self._derived: Dict[str, Any] = {}
+        self.loads: Dict[str, int] = {}  # filename -> reads (each stays at 1)
+
+    def json(self, filename: str) -> Any:
+        """Parsed JSON file; {} when missing or invalid (as `load_json`). Shared: don't mutate."""
+        if filename not in self._files:
+            self.loads[filename] = self.loads.get(filename, 0) + 1
+            self._files[filename] = self._json_ops.load_json(filename) or {}
+        return self._files[filename]
+
+    def load_json(self, filename: str, default: Any = None) -> Any:
+        """`JsonOperations.load_json` shape, so a read-only sibling manager
+        (CampaignMemory in the brief) can read through the snapshot."""
+        return self.json(filename) or ({} if default is None else default)
+
+    def text(self, filename: str) -> str:
+        """Text file contents; "" when missing or unreadable."""
+        if filename not in self._files:
+            self.loads[filename] = self.loads.get(filename, 0) + 1
+            try:
+                self._files[filename] = (self.campaign_dir / filename).read_text(encoding="utf-8")
+            except (OSError, ValueError):
+                self._files[filename] = ""
+        return self._files[filename]
+
+    def exists(self, filename: str) -> bool:
+        return (self.campaign_dir / filename).is_file()
+
+    def derive(self, key: str, build: Callable[[], Any]) -> Any:
+        """Compute a derived view once per snapshot (summaries, prefs, kit)."""
+        if key not in self._derived:
+            self._derived[key] = build()
+        return self._derived[key]
+
+    # ---------------------------------------------------------------- views
+
+    @property
+    def campaign(self) -> Dict[str, Any]:
+        return self.json("campaign-overview.json")
+
+    @property
+    def npcs(self) -> Dict[str, Any]:
+        return self.json("npcs.json")
+
+    @property
+    def plots(self) -> Dict[str, Any]:
+        return self.json("plots.json")
+
+    @property
+    def facts(self) -> Dict[str, Any]:
+        return self.json("facts.json")
+
+    @property
+    def clocks(self) -> Dict[str, Any]:
+        """Threat clocks as of the scheduler's current tick (time clocks derive `current`)."""
+        def build():
+            clocks = self.json("threat-clocks.json")
+            if not any(isinstance(c, dict) and "since" in c for c in clocks.values()):
+                return clocks
+            from threat_clocks import clocks_at
+            return clocks_at(clocks, self.json("time-schedule.json").get("now", 0))
+        return self.derive("clocks", build)
+
+    @property
+    def consequences(self) -> Any:
+        return self.json("consequences.json")
+
+    @property
+    def bible(self) -> Dict[str, Any]:
+        return self.json("world-bible.json")
+
+    @property
+    def session_log(self) -> str:
+        return self.text("session-log.md")
+
+    @property
+    def session_index(self) -> Dict[str, Any]:
+        """session-log.idx.json, rebuilt first if the log changed out of band."""
+        name = SessionLogIndex.FILENAME
+        if name not in self._files:
+            self.loads[name] = self.loads.get(name, 0) + 1
+            self._files[name] = SessionLogIndex(self.campaign_dir).load()
+        return self._files[name]
+
+    @property
+    def presence(self) -> Dict[str, Any]:
+        """npcs.presence.json (location -> NPCs), rebuilt first if npcs.json moved."""
+        name = PresenceIndex.FILENAME
+        if name not in self._files:
+            self.loads[name] = self.loads.get(name, 0) + 1
+            self._files[name] = PresenceIndex(self.campaign_dir).load()
+        return self._files[name]
+
+    @property
+    def location(self) -> str:
+        return self.campaign.get('player_position', {}).get('current_location', 'Unknown')
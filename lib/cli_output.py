@@ -11,9 +11,11 @@ process. Wire incrementally: detect mode with wants_json(), strip the flag befor
 argparse with strip_json_flag(), and route results through emit()/emit_error().
 """
 
+import io
 import json
 import os
 import sys
+from contextlib import contextmanager
 
 
 def wants_json(argv=None) -> bool:
@@ -36,6 +38,54 @@ def emit(data=None, message=None, json_mode=False):
         print(message)
 
 
+class ThreadLocalStdout:
+    """A sys.stdout stand-in that gives each capturing thread its own buffer.
+
+    The managers report by printing. Running several of them on a thread pool
+    (scene_effects, campaign_service) needs each one's lines kept apart, and
+    contextlib.redirect_stdout swaps the one global stream. Threads that never
+    call capture() write through to the real stdout.
+    """
+
+    def __init__(self, fallback):
+        import threading  # only the concurrent paths need it
+        self._fallback = fallback
+        self._local = threading.local()
+
+    @classmethod
+    @contextmanager
+    def installed(cls):
+        """Route sys.stdout through a new instance for the duration of the block."""
+        original = sys.stdout
+        router = cls(original)
+        sys.stdout = router
+        try:
+            yield router
+        finally:
+            sys.stdout = original
+
+    def capture(self) -> io.StringIO:
+        """Start a fresh buffer for the calling thread; returns it."""
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+
+    def release(self) -> None:
+        self._local.buffer = None
+
+    def _target(self):
+        buffer = getattr(self._local, "buffer", None)
+        return self._fallback if buffer is None else buffer
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._fallback, name)
+
+
 def emit_error(message, json_mode=False, code=None) -> int:
     """Emit an error. Returns 1 so callers can `sys.exit(emit_error(...))`."""
     if json_mode:
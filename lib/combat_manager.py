@@ -18,12 +18,13 @@ from typing import Any, Dict, List, Optional
 sys.path.insert(0, str(Path(__file__).parent))
 
 from entity_manager import EntityManager
+from campaign_context import CampaignContext
 from game_core import apply_harm, heal, add_condition, remove_condition
 
 
 class CombatManager(EntityManager):
-    def __init__(self, world_state_dir: str = None):
-        super().__init__(world_state_dir)
+    def __init__(self, world_state_dir: str = None, context: CampaignContext = None):
+        super().__init__(world_state_dir, context)
         self.combat_file = "combat_state.json"
 
     def _load(self) -> Dict[str, Any]:
@@ -167,4 +168,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
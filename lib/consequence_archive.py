@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Append-only archive for consequence history.
+
+consequences.json used to carry every resolved/expired consequence and the
+whole firing provenance log inline, so each tick that fired rewrote the
+campaign's entire history. The archive keeps those two streams in rotated JSONL
+segments under consequences-archive/, next to a small manifest that records each
+segment's record count and byte length. An append touches only the tail
+segment, and the manifest is the commit point: lines past a segment's recorded
+length (a torn append) are truncated away by the next write, never read back.
+
+The hot file keeps `active` (plus any extra sections) and a compact `_undo`
+record; `ConsequenceManager` owns both.
+"""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from json_ops import JsonOperations
+
+ARCHIVE_DIR = "consequences-archive"
+STREAMS = ("resolved", "provenance")
+
+
+class ConsequenceArchive:
+    """Rotated, append-only `resolved` and `provenance` streams for one campaign."""
+
+    SEGMENT_RECORDS = 500
+    MANIFEST = f"{ARCHIVE_DIR}/manifest.json"
+
+    def __init__(self, campaign_dir, json_ops: JsonOperations = None):
+        """`json_ops` is the owner's, so the manifest commits with its writes
+        (a discarded batch leaves segment bytes the manifest never counted)."""
+        self.campaign_dir = Path(campaign_dir)
+        self.dir = self.campaign_dir / ARCHIVE_DIR
+        self.json_ops = json_ops or JsonOperations(str(self.campaign_dir))
+
+    # ---------------------------------------------------------------- manifest
+
+    def _manifest(self) -> Dict[str, Any]:
+        manifest = self.json_ops.load_json(self.MANIFEST) or {}
+        manifest.setdefault("version", 1)
+        streams = manifest.setdefault("streams", {})
+        for stream in STREAMS:
+            streams.setdefault(stream, {"segments": []})
+        return manifest
+
+    def _segments(self, stream: str, manifest: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        if stream not in STREAMS:
+            raise ValueError(f"unknown archive stream: {stream}")
+        manifest = manifest or self._manifest()
+        return manifest["streams"][stream]["segments"]
+
+    # ---------------------------------------------------------------- writes
+
+    def append(self, stream: str, records: Iterable[Dict[str, Any]]) -> int:
+        """Append records to `stream`; returns the stream's record count before them."""
+        records = list(records)
+        manifest = self._manifest()
+        segments = self._segments(stream, manifest)
+        before = sum(int(s.get("count", 0)) for s in segments)
+        if not records:
+            return before
+        self.dir.mkdir(parents=True, exist_ok=True)
+        pending = records
+        while pending:
+            if not segments or int(segments[-1].get("count", 0)) >= self.SEGMENT_RECORDS:
+                segments.append({"file": f"{stream}-{len(segments) + 1:04d}.jsonl",
+                                 "count": 0, "bytes": 0})
+            seg = segments[-1]
+            room = self.SEGMENT_RECORDS - int(seg["count"])
+            batch, pending = pending[:room], pending[room:]
+            payload = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in batch)
+            path = self.dir / seg["file"]
+            with open(path, "ab") as f:
+                f.truncate(int(seg["bytes"]))  # drop a torn tail the manifest never saw
+                f.write(payload.encode("utf-8"))
+            seg["count"] = int(seg["count"]) + len(batch)
+            seg["bytes"] = int(seg["bytes"]) + len(payload.encode("utf-8"))
+        self.json_ops.save_json(self.MANIFEST, manifest)
+        return before
+
+    def remove(self, stream: str, ids: Iterable[str], since: int = 0) -> List[Dict[str, Any]]:
+        """Drop records whose `id` is in `ids` from position `since` on; returns them.
+
+        Only segments at or after `since` are rewritten — the undo path uses it to
+        take back what the last tick archived without touching older history.
+        """
+        ids = set(ids)
+        manifest = self._manifest()
+        segments = self._segments(stream, manifest)
+        removed: List[Dict[str, Any]] = []
+        offset = 0
+        for seg in segments:
+            count = int(seg.get("count", 0))
+            if offset + count <= since or not ids:
+                offset += count
+                continue
+            records = self._read_segment(seg)
+            keep = []
+            for i, rec in enumerate(records):
+                if offset + i >= since and rec.get("id") in ids:
+                    removed.append(rec)
+                else:
+                    keep.append(rec)
+            offset += count
+            if len(keep) != len(records):
+                payload = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in keep)
+                data = payload.encode("utf-8")
+                (self.dir / seg["file"]).write_bytes(data)
+                seg["count"], seg["bytes"] = len(keep), len(data)
+        if removed:
+            self.json_ops.save_json(self.MANIFEST, manifest)
+        return removed
+
+    def clear(self) -> None:
+        """Forget the whole archive (restore and reset replace history wholesale)."""
+        if self.dir.is_dir():
+            shutil.rmtree(self.dir)
+
+    # ---------------------------------------------------------------- reads
+
+    def _read_segment(self, seg: Dict[str, Any]) -> List[Dict[str, Any]]:
+        path = self.dir / seg["file"]
+        if not path.is_file():
+            return []
+        with open(path, "rb") as f:
+            raw = f.read(int(seg.get("bytes", 0)))
+        out = []
+        for line in raw.decode("utf-8", errors="replace").splitlines():
+            if not line.strip():
+                continue
+            try:
+                out.append(json.loads(line))
+            except ValueError:
+                continue
+        return out
+
+    def read(self, stream: str) -> List[Dict[str, Any]]:
+        """Every record in `stream`, oldest first, across all segments."""
+        out: List[Dict[str, Any]] = []
+        for seg in self._segments(stream):
+            out.extend(self._read_segment(seg))
+        return out
+
+    def count(self, stream: str) -> int:
+        """Record count from the manifest alone — no segment is opened."""
+        return sum(int(s.get("count", 0)) for s in self._segments(stream))
+
+    # ---------------------------------------------------------------- hot file
+
+    def absorb(self, data: Dict[str, Any]) -> bool:
+        """Move inline `resolved`/`provenance` lists out of a hot-file dict.
+
+        Mutates `data`; returns True when it changed (the caller saves). Legacy
+        files, gm-reset and restored saves all carry the streams inline.
+        """
+        changed = False
+        for stream in STREAMS:
+            if stream in data:
+                items = data.pop(stream)
+                if isinstance(items, list):
+                    self.append(stream, [r for r in items if isinstance(r, dict)])
+                changed = True
+        if "_snapshot" in data:
+            data.pop("_snapshot")  # pre-archive rollback buffer; no inverse delta to recover
+            changed = True
+        return changed
+
+    def expand(self, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """The hot file with both streams folded back inline (saves / full exports)."""
+        out = dict(data) if isinstance(data, dict) else {"active": []}
+        for stream in STREAMS:
+            inline = out.get(stream) if isinstance(out.get(stream), list) else []
+            out[stream] = self.read(stream) + inline
+        return out
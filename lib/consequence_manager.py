@@ -13,25 +13,39 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from entity_manager import EntityManager, npcs_present
+from campaign_context import CampaignContext
+from consequence_archive import ConsequenceArchive
+from presence_index import PresenceIndex
 
 
 class ConsequenceManager(EntityManager):
-    """Manage consequence/event tracking. Inherits from EntityManager for common functionality."""
+    """Manage consequence/event tracking. Inherits from EntityManager for common functionality.
 
-    def __init__(self, world_state_dir: str = None):
-        super().__init__(world_state_dir)
+    consequences.json is the hot file: `active` plus a compact `_undo` record.
+    Resolved/expired consequences and the firing provenance log live in the
+    append-only ConsequenceArchive, so a tick rewrites only what is live.
+    """
+
+    def __init__(self, world_state_dir: str = None, context: CampaignContext = None):
+        super().__init__(world_state_dir, context)
+        self._wsd = world_state_dir
         self.consequences_file = "consequences.json"
+        self.archive = ConsequenceArchive(self.campaign_dir, self.json_ops)
         self._ensure_file()
 
     def _ensure_file(self):
-        """Ensure consequences file has proper structure"""
+        """Ensure consequences file has proper structure; archive inline history."""
         data = self.json_ops.load_json(self.consequences_file)
         if not isinstance(data, dict) or 'active' not in data:
-            data = {'active': [], 'resolved': []}
+            data = {'active': []}
+            self.json_ops.save_json(self.consequences_file, data)
+        elif self.archive.absorb(data):
             self.json_ops.save_json(self.consequences_file, data)
 
     # Structured trigger types the reactivity engine can evaluate automatically.
-    TRIGGER_TYPES = ('on_location', 'on_npc', 'on_time', 'on_event')
+    # on_elapsed matches once its game-time delay (a tick count or a duration
+    # like "3 days") has passed — the TimeScheduler marks it due.
+    TRIGGER_TYPES = ('on_location', 'on_npc', 'on_time', 'on_event', 'on_elapsed')
     # Fuzzy bands: >= FIRE_SCORE fires / discloses; NEAR_MISS_SCORE..FIRE_SCORE is advisory.
     FIRE_SCORE = 0.5
     NEAR_MISS_SCORE = 0.3
@@ -44,8 +58,9 @@ class ConsequenceManager(EntityManager):
 
         Free-text `trigger` is always kept (human-readable + fuzzy fallback).
         Optionally attach a STRUCTURED trigger the engine can fire/expire on:
-          trigger_type: one of TRIGGER_TYPES (on_location/on_npc/on_time/on_event)
-          match:        value compared against world state (location/npc/time/event keyword)
+          trigger_type: one of TRIGGER_TYPES (on_location/on_npc/on_time/on_event/on_elapsed)
+          match:        value compared against world state (location/npc/time/event keyword);
+                        for on_elapsed, the delay in ticks or a duration ("3 days")
           expiry:       optional date or condition after which the consequence ages out
         Structured fields are additive; legacy consequences omit them.
 
@@ -72,10 +87,41 @@ class ConsequenceManager(EntityManager):
         data['active'].append(consequence)
 
         if self.json_ops.save_json(self.consequences_file, data):
+            if trigger_type == 'on_elapsed':
+                self._schedule_elapsed(consequence)
             print(f"[SUCCESS] Added consequence [{consequence_id}]: {description} (triggers: {trigger})")
             return consequence_id
         return ""
 
+    def _schedule_elapsed(self, consequence: Dict[str, Any]) -> None:
+        """Register an on_elapsed consequence's due tick with the TimeScheduler."""
+        from time_manager import ticks_from_duration
+        from time_scheduler import TimeScheduler
+        match = str(consequence.get('match') or '').strip()
+        delay = int(match) if match.isdigit() else ticks_from_duration(match)
+        TimeScheduler(self._wsd, context=self.context).schedule(
+            'consequence', consequence['id'], delay=delay,
+            label=consequence.get('consequence', ''))
+
+    def mark_due(self, due: Dict[str, int]) -> List[str]:
+        """Stamp on_elapsed consequences whose scheduled tick has arrived.
+
+        `due` maps consequence id -> the tick it came due, as popped from the
+        TimeScheduler; the next tick()/check then matches them. Returns the ids
+        that were still active.
+        """
+        if not due:
+            return []
+        data = self.json_ops.load_json(self.consequences_file)
+        hit = []
+        for c in data.get('active', []):
+            if c.get('id') in due and c.get('due_reached') is None:
+                c['due_reached'] = due[c['id']]
+                hit.append(c['id'])
+        if hit:
+            self.json_ops.save_json(self.consequences_file, data)
+        return hit
+
     def check_pending(self, world_state: Dict[str, Any] = None,
                       limit: int = 2) -> List[Dict[str, Any]]:
         """
@@ -119,7 +165,7 @@ class ConsequenceManager(EntityManager):
 
         if expired:
             data['active'] = survivors
-            data.setdefault('resolved', []).extend(expired)
+            self.archive.append('resolved', expired)
             self.json_ops.save_json(self.consequences_file, data)
 
         matched.sort(key=lambda t: t[0], reverse=True)
@@ -169,6 +215,8 @@ class ConsequenceManager(EntityManager):
                 events = ' '.join(str(x) for x in world_state.get('events', []) or []).lower()
                 if match in events:
                     return 1.0, f"event matching '{consequence['match']}'"
+            if ttype == 'on_elapsed' and consequence.get('due_reached') is not None:
+                return 1.0, f"'{consequence['match']}' elapsed (tick {consequence['due_reached']})"
             return 0.0, ''
 
         # Legacy free-text: score word overlap between the trigger phrase and world.
@@ -199,22 +247,20 @@ class ConsequenceManager(EntityManager):
         """
         data = self.json_ops.load_json(self.consequences_file)
         active = data.get('active', [])
-        # Pre-fire snapshot for one-beat rollback (shallow copies; fields are scalar).
-        pre_active = [dict(c) for c in active]
-        pre_resolved = [dict(c) for c in data.get('resolved', [])]
         ctx_key = "|".join([
             str(world_state.get('location', '')),
             str(world_state.get('time', '')),
             str(world_state.get('date', '')),
         ]).lower()
 
-        survivors, expired = [], []
+        survivors, expired, expired_at = [], [], []
         matches, near_misses = [], []
-        for c in active:
+        for i, c in enumerate(active):
             if self._is_expired(c, world_state):
                 aged = dict(c)
                 aged['expired'] = self.json_ops.get_timestamp()
                 expired.append(aged)
+                expired_at.append({'id': c.get('id'), 'index': i})
                 continue
             survivors.append(c)
             score, reason = self._evaluate_trigger(c, world_state)
@@ -239,8 +285,10 @@ class ConsequenceManager(EntityManager):
                 new_matches.append((c, reason, hit))
 
         fired, disclosed = [], []
+        stamped_prev = {}
         for i, (c, reason, hit) in enumerate(new_matches):
             if i < limit:
+                stamped_prev[c['id']] = c.get('last_fired_key')
                 c['last_fired_key'] = ctx_key  # stamp the live object (in survivors)
                 stamped = dict(c)
                 stamped['match_reason'] = reason
@@ -250,20 +298,24 @@ class ConsequenceManager(EntityManager):
 
         if expired or fired:
             data['active'] = survivors
-            if expired:
-                data.setdefault('resolved', []).extend(expired)
-            # Provenance ("why did this fire") + one-beat rollback snapshot.
-            data['_snapshot'] = {'active': pre_active, 'resolved': pre_resolved}
+            archived_at = self.archive.append('resolved', expired)
+            # One-beat rollback as an inverse delta: the stamps this tick overwrote
+            # and where each expired consequence sat, not a copy of the world.
+            data['_undo'] = {
+                'op': 'tick',
+                'stamped': stamped_prev,
+                'expired': expired_at,
+                'archived_at': archived_at,
+            }
+            # Provenance ("why did this fire") goes to the archive, not the hot file.
             now = self.json_ops.get_timestamp()
-            prov = data.setdefault('provenance', [])
-            for hit in fired:
-                prov.append({
-                    'id': hit['id'],
-                    'consequence': hit['consequence'],
-                    'reason': hit['match_reason'],
-                    'ctx_key': ctx_key,
-                    'fired_at': now,
-                })
+            self.archive.append('provenance', [{
+                'id': hit['id'],
+                'consequence': hit['consequence'],
+                'reason': hit['match_reason'],
+                'ctx_key': ctx_key,
+                'fired_at': now,
+            } for hit in fired])
             self.json_ops.save_json(self.consequences_file, data)
         return {
             'fired': fired,
@@ -273,20 +325,45 @@ class ConsequenceManager(EntityManager):
         }
 
     def get_provenance(self) -> List[Dict[str, Any]]:
-        """Return the 'why did this fire' log (newest last)."""
-        data = self.json_ops.load_json(self.consequences_file)
-        return data.get('provenance', [])
+        """Return the 'why did this fire' log (newest last), across archive segments."""
+        return self.archive.read('provenance')
 
     def rollback_last(self) -> bool:
-        """Undo the most recent reactive beat (restore active/resolved to pre-fire)."""
+        """Undo the most recent reactive beat (restore active/resolved to pre-fire).
+
+        Applies the tick's `_undo` inverse delta: fire stamps go back to what
+        they were, and consequences the tick expired leave the archive and
+        return to their old slots in `active`. Anything resolved since is kept.
+        """
         data = self.json_ops.load_json(self.consequences_file)
-        snap = data.get('_snapshot')
-        if not snap:
+        undo = data.get('_undo')
+        if not undo:
             print("[ERROR] No reactive beat to roll back")
             return False
-        data['active'] = snap.get('active', data.get('active', []))
-        data['resolved'] = snap.get('resolved', data.get('resolved', []))
-        data['_snapshot'] = None
+        active = data.get('active', [])
+        stamped = undo.get('stamped') or {}
+        for c in active:
+            if c.get('id') in stamped:
+                prev = stamped[c['id']]
+                if prev is None:
+                    c.pop('last_fired_key', None)
+                else:
+                    c['last_fired_key'] = prev
+        slots = undo.get('expired') or []
+        if slots:
+            back = self.archive.remove('resolved', [s['id'] for s in slots],
+                                       since=int(undo.get('archived_at', 0)))
+            by_id = {}
+            for rec in back:
+                rec = dict(rec)
+                rec.pop('expired', None)
+                by_id[rec.get('id')] = rec
+            for slot in sorted(slots, key=lambda s: s.get('index', 0)):
+                rec = by_id.get(slot['id'])
+                if rec is not None:
+                    active.insert(min(int(slot.get('index', 0)), len(active)), rec)
+        data['active'] = active
+        data['_undo'] = None
         if self.json_ops.save_json(self.consequences_file, data):
             print("[SUCCESS] Rolled back the last reactive beat")
             return True
@@ -298,7 +375,8 @@ class ConsequenceManager(EntityManager):
         pos = overview.get("player_position", {})
         location = pos.get("current_location", "") if isinstance(pos, dict) else ""
         npcs = self.json_ops.load_json("npcs.json") or {}
-        present = list(npcs_present(npcs, location).keys())
+        presence = PresenceIndex(self.campaign_dir).load()
+        present = list(npcs_present(npcs, location, presence).keys())
         world_state = {
             "location": location,
             "time": overview.get("time_of_day", ""),
@@ -321,14 +399,15 @@ class ConsequenceManager(EntityManager):
             if c['id'] == consequence_id:
                 resolved = c
                 resolved['resolved'] = self.json_ops.get_timestamp()
-                if 'resolved' not in data:
-                    data['resolved'] = []
-                data['resolved'].append(resolved)
             else:
                 remaining.append(c)
 
         if resolved:
             data['active'] = remaining
+            self.archive.append('resolved', [resolved])
+            if resolved.get('trigger_type') == 'on_elapsed':
+                from time_scheduler import TimeScheduler
+                TimeScheduler(self._wsd, context=self.context).cancel('consequence', consequence_id)
             if self.json_ops.save_json(self.consequences_file, data):
                 print(f"[SUCCESS] Resolved: {resolved['consequence']}")
                 return True
@@ -339,10 +418,9 @@ class ConsequenceManager(EntityManager):
 
     def list_resolved(self) -> List[Dict[str, Any]]:
         """
-        Get all resolved consequences
+        Get all resolved consequences (oldest first, across archive segments)
         """
-        data = self.json_ops.load_json(self.consequences_file)
-        return data.get('resolved', [])
+        return self.archive.read('resolved')
 
 
 def _print_tick_report(result: Dict[str, List[Dict[str, Any]]]) -> None:
@@ -379,6 +457,16 @@ def _print_tick_report(result: Dict[str, List[Dict[str, Any]]]) -> None:
             print(f"      ↳ {c.get('match_reason', '')}")
 
 
+def _print_pending(pending: List[Dict[str, Any]]) -> None:
+    """Human CLI for check_pending()."""
+    if not pending:
+        print("No pending consequences")
+        return
+    print(f"{len(pending)} pending consequences:")
+    for c in pending:
+        print(f"  [{c['id']}] {c['consequence']} (triggers: {c['trigger']})")
+
+
 def main():
     """CLI interface for consequence management"""
     import argparse
@@ -450,13 +538,7 @@ def main():
             sys.exit(1)
 
     elif args.action == 'check':
-        pending = manager.check_pending()
-        if not pending:
-            print("No pending consequences")
-        else:
-            print(f"{len(pending)} pending consequences:")
-            for c in pending:
-                print(f"  [{c['id']}] {c['consequence']} (triggers: {c['trigger']})")
+        _print_pending(manager.check_pending())
 
     elif args.action == 'tick':
         _print_tick_report(manager.tick_from_session())
@@ -488,4 +570,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
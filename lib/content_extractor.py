@@ -292,4 +292,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import profiling
+    profiling.run(main)
\ No newline at end of file
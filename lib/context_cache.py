@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Sectioned render cache for the session brief.
+
+Most of `get_full_context` — KIT, NARRATIVE VOICE, WORLD INDEX, PREVIOUSLY ON,
+story threads — does not change between turns, yet `gm-session.sh context`
+rebuilt all of it every call. Each brief section now declares the files it
+reads (`SessionManager.CONTEXT_SECTIONS`); its rendered lines are cached in
+context-cache.json against those files' signatures, and only sections whose
+inputs changed are re-rendered. The cache is derived state: deleting it only
+costs one cold build.
+
+A file's signature is its (mtime_ns, size). A file modified within
+`RACY_NS` of being cached could change again without moving either, so —
+as git does for its index — such "racily clean" entries also record a
+content hash that is checked on the next lookup.
+"""
+
+import hashlib
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from json_ops import JsonOperations
+
+
+class ContextCache:
+    """Rendered brief sections keyed by their input files' signatures, plus hit stats."""
+
+    FILENAME = "context-cache.json"
+    VERSION = 1
+    RACY_NS = 2_000_000_000
+
+    def __init__(self, campaign_dir):
+        self.campaign_dir = Path(campaign_dir)
+        self.json_ops = JsonOperations(str(self.campaign_dir))
+        data = self.json_ops.load_json(self.FILENAME)
+        if not (isinstance(data, dict) and data.get("version") == self.VERSION):
+            data = {"version": self.VERSION, "sections": {},
+                    "stats": {"hits": 0, "misses": 0, "sections": {}}}
+        self._data = data
+        self._dirty = False
+        self.last_build: Dict[str, str] = {}  # section key -> "hit" | "miss"
+
+    # ---------------------------------------------------------------- signatures
+
+    @staticmethod
+    def _digest(path: Path) -> Optional[str]:
+        try:
+            return hashlib.sha1(path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    def signature(self, paths: Iterable[Path], extra: Any = None) -> List[Any]:
+        """[[path, mtime_ns, size(, sha1)], ...] for the inputs; take it BEFORE reading them.
+
+        Missing files sign as [path, None, None]. A file modified within
+        RACY_NS of now also carries its content hash.
+        """
+        now = time.time_ns()
+        sig: List[Any] = []
+        for p in paths:
+            try:
+                st = os.stat(p)
+            except OSError:
+                sig.append([str(p), None, None])
+                continue
+            entry = [str(p), st.st_mtime_ns, st.st_size]
+            if now - st.st_mtime_ns < self.RACY_NS:
+                entry.append(self._digest(Path(p)))
+            sig.append(entry)
+        if extra is not None:
+            sig.append(["extra", extra])
+        return sig
+
+    def _matches(self, stored: List[Any], sig: List[Any]) -> bool:
+        if len(stored) != len(sig):
+            return False
+        for old, new in zip(stored, sig):
+            if old[:3] != new[:3]:
+                return False
+            if len(old) > 3:
+                # Racily clean when cached: stat alone cannot vouch for it.
+                current = new[3] if len(new) > 3 else self._digest(Path(old[0]))
+                if current != old[3]:
+                    return False
+        return True
+
+    # ---------------------------------------------------------------- lookups
+
+    def _count(self, key: str, outcome: str) -> None:
+        stats = self._data["stats"]
+        stats["hits" if outcome == "hit" else "misses"] += 1
+        per = stats["sections"].setdefault(key, {"hits": 0, "misses": 0})
+        per["hits" if outcome == "hit" else "misses"] += 1
+        self.last_build[key] = outcome
+        self._dirty = True
+
+    def get(self, key: str, sig: List[Any]) -> Optional[List[str]]:
+        """Cached lines for `key` if its inputs still match `sig`; counts the hit or miss."""
+        entry = self._data["sections"].get(key)
+        if entry is not None and self._matches(entry.get("sig", []), sig):
+            self._count(key, "hit")
+            if entry["sig"] != sig:
+                entry["sig"] = sig  # verified by hash; only still-racy files keep one
+            return list(entry["lines"])
+        self._count(key, "miss")
+        return None
+
+    def put(self, key: str, sig: List[Any], lines: List[str]) -> None:
+        self._data["sections"][key] = {"sig": sig, "lines": list(lines)}
+        self._dirty = True
+
+    def flush(self) -> None:
+        if self._dirty:
+            self.json_ops.save_json(self.FILENAME, self._data)
+            self._dirty = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Lifetime hit/miss totals, per section, and the hit rate."""
+        stats = self._data["stats"]
+        total = stats["hits"] + stats["misses"]
+        return {
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "hit_rate": round(stats["hits"] / total, 3) if total else None,
+            "sections": stats["sections"],
+            "cached_sections": sorted(self._data["sections"]),
+        }
+
+    def clear(self) -> None:
+        """Drop cached renders and stats."""
+        path = self.campaign_dir / self.FILENAME
+        if path.exists():
+            path.unlink()
+
+
+class BriefLedger:
+    """Per-section fingerprints of recent briefs, addressed by an opaque token.
+
+    `context --since <token>` diffs the brief it is about to print against the
+    one that token names and prints only the sections that changed. Tokens are
+    content hashes, so two identical briefs share one; the ledger keeps the last
+    KEEP. An unknown or expired token simply means a full brief.
+    """
+
+    FILENAME = "context-briefs.json"
+    KEEP = 16
+
+    def __init__(self, campaign_dir):
+        self.json_ops = JsonOperations(str(campaign_dir))
+
+    @staticmethod
+    def fingerprint(lines: List[str]) -> str:
+        return hashlib.sha1("\n".join(lines).encode("utf-8")).hexdigest()[:16]
+
+    def _briefs(self) -> List[Dict[str, Any]]:
+        data = self.json_ops.load_json(self.FILENAME)
+        briefs = data.get("briefs") if isinstance(data, dict) else None
+        return briefs if isinstance(briefs, list) else []
+
+    def record(self, mode: str, fingerprints: Dict[str, str]) -> str:
+        """Remember this brief's section fingerprints; returns its token."""
+        body = "|".join(f"{k}={fingerprints[k]}" for k in sorted(fingerprints))
+        token = f"{mode[0]}{hashlib.sha1(body.encode('utf-8')).hexdigest()[:11]}"
+        briefs = [b for b in self._briefs() if b.get("token") != token]
+        briefs.append({"token": token, "mode": mode, "sections": fingerprints})
+        self.json_ops.save_json(self.FILENAME, {"briefs": briefs[-self.KEEP:]})
+        return token
+
+    def get(self, token: str, mode: str) -> Optional[Dict[str, str]]:
+        """The section fingerprints `token` names, if it is known and of this mode."""
+        for brief in self._briefs():
+            if brief.get("token") == token and brief.get("mode") == mode:
+                return brief.get("sections") or {}
+        return None
@@ -18,6 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from json_ops import JsonOperations
 from campaign_manager import CampaignManager
+from campaign_context import CampaignContext
 
 
 # Query templates for each entity type
@@ -69,19 +70,25 @@ class EntityEnhancer:
     then provides suggested enhancements based on the source material.
     """
 
-    def __init__(self, world_state_dir: str = None):
+    def __init__(self, world_state_dir: str = None, context: CampaignContext = None):
         """
         Initialize the entity enhancer for the active campaign.
 
         Args:
             world_state_dir: Base world state directory (defaults to "world-state")
+            context: A shared CampaignContext (the campaign is then not re-resolved)
         """
-        base_dir = world_state_dir or "world-state"
-        self.campaign_mgr = CampaignManager(base_dir)
+        if context is not None:
+            self.campaign_mgr = context.campaign_mgr
+            self.campaign_dir = context.campaign_dir
+            self.json_ops = context.json_ops
+        else:
+            base_dir = world_state_dir or "world-state"
+            self.campaign_mgr = CampaignManager(base_dir)
 
-        # Get active campaign directory
-        self.campaign_dir = self.campaign_mgr.get_active_campaign_dir()
-        self.json_ops = JsonOperations(str(self.campaign_dir))
+            # Get active campaign directory
+            self.campaign_dir = self.campaign_mgr.get_active_campaign_dir()
+            self.json_ops = JsonOperations(str(self.campaign_dir))
 
         # Lazy-load RAG components
         self._vector_store = None
@@ -800,6 +807,23 @@ class EntityEnhancer:
         }
 
 
+def print_scene_context(result: Optional[Dict[str, Any]], location_name: str) -> None:
+    """The GM-internal `scene` lines: silent when the campaign has no RAG."""
+    if result is None:
+        return
+    if result["source"] == "stored":
+        print(f"[GM Context: {result['location']}]")
+        for ctx in result["context"]:
+            # Show first 100 chars of each context passage
+            print(f"  • {ctx[:100]}...")
+    else:
+        # From RAG query
+        loc_name = result.get("location", location_name)
+        print(f"[GM Context: {loc_name} (from source)]")
+        for p in result["passages"][:3]:
+            print(f"  • {p['text'][:100]}...")
+
+
 def main():
     """CLI interface for entity enhancement."""
     import argparse
@@ -988,22 +1012,7 @@ def main():
 
     elif args.action == 'scene':
         # GM-internal scene context (minimal output)
-        result = enhancer.get_scene_context(args.name)
-
-        if result is None:
-            # Silent - no RAG available for this campaign
-            pass
-        elif result["source"] == "stored":
-            print(f"[GM Context: {result['location']}]")
-            for ctx in result["context"]:
-                # Show first 100 chars of each context passage
-                print(f"  • {ctx[:100]}...")
-        else:
-            # From RAG query
-            loc_name = result.get("location", args.name)
-            print(f"[GM Context: {loc_name} (from source)]")
-            for p in result["passages"][:3]:
-                print(f"  • {p['text'][:100]}...")
+        print_scene_context(enhancer.get_scene_context(args.name), args.name)
 
     elif args.action == 'batch':
         print("Batch Enhancement")
@@ -1022,4 +1031,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
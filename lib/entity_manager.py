@@ -13,21 +13,30 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from json_ops import JsonOperations
 from validators import Validators
-from campaign_manager import CampaignManager
+from campaign_context import CampaignContext
 from entity_aliases import resolve_entity_name
 
 
-def npcs_present(npcs, location):
+def npcs_present(npcs, location, index=None):
     """Who is in this scene.
 
     Present = `is_party_member` OR case-insensitive exact equality of
     `location` against a `tags.locations` entry. Substring matching is
     search (CLI `--tag-location`), not presence — "The Inn" must not
     match "The Inner Sanctum".
+
+    `index` is a loaded `PresenceIndex` for the npcs.json `npcs` came from:
+    presence is then looked up rather than scanned, in the same order.
     """
     if not isinstance(npcs, dict):
         return {}
     loc_l = (location or "").lower()
+    if index is not None:
+        found = {name: pos for pos, name in index.get("party", [])}
+        if loc_l:
+            found.update((name, pos) for pos, name in index.get("locations", {}).get(loc_l, []))
+        return {name: npcs[name] for name in sorted(found, key=found.get)
+                if isinstance(npcs.get(name), dict)}
     out = {}
     for name, data in npcs.items():
         if not isinstance(data, dict):
@@ -52,26 +61,25 @@ class EntityManager:
     to ensure consistent campaign directory handling and JSON operations.
     """
 
-    def __init__(self, world_state_dir: str = None):
+    def __init__(self, world_state_dir: str = None, context: CampaignContext = None):
         """Initialize the entity manager with campaign context.
 
         Args:
             world_state_dir: Base world state directory. Defaults to "world-state".
+            context: A resolved CampaignContext to share (campaign directory and
+                JsonOperations). Without one, the manager resolves its own.
 
         Raises:
             RuntimeError: If no active campaign is set.
         """
-        base_dir = world_state_dir or "world-state"
-        self.campaign_mgr = CampaignManager(base_dir)
+        if context is None:
+            context = CampaignContext(world_state_dir or "world-state")
+        self.context = context
+        self.campaign_mgr = context.campaign_mgr
 
         # Get the active campaign directory
-        active_dir = self.campaign_mgr.get_active_campaign_dir()
-
-        if active_dir is None:
-            raise RuntimeError("No active campaign. Run /new-game or /import first.")
-
-        self.campaign_dir = active_dir
-        self.json_ops = JsonOperations(str(active_dir))
+        self.campaign_dir = context.require()
+        self.json_ops = context.json_ops
         self.validators = Validators()
 
     def _load_entities(self, filename: str) -> dict:
@@ -184,5 +192,5 @@ class EntityManager:
 
     @property
     def campaign_name(self) -> Optional[str]:
-        """Get the name of the active campaign."""
-        return self.campaign_mgr.get_active()
+        """The campaign this manager was resolved for (a pinned one in a host)."""
+        return self.context.campaign_name
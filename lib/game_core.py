@@ -20,9 +20,17 @@ from typing import Any, Dict, List, Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from dice import DiceRoller
+_roller = None
 
-_roller = DiceRoller()
+
+def _dice():
+    """The module DiceRoller, built on first roll: a WorldKit that only reads
+    its config (the session brief, `status`) should not import dice/random."""
+    global _roller
+    if _roller is None:
+        from dice import DiceRoller
+        _roller = DiceRoller()
+    return _roller
 
 _ADV_NOTATION = {'advantage': '2d20kh1', 'disadvantage': '2d20kl1', None: '1d20'}
 _2D6_NOTATION = {'advantage': '3d6kh2', 'disadvantage': '3d6kl2', None: '2d6'}
@@ -88,7 +96,7 @@ def _result(die: int, modifier: int, total: int, dc: int, critical: Optional[str
 
 
 def _resolve_d20(modifier: int, dc: int, advantage: Optional[str]) -> Dict[str, Any]:
-    r = _roller.roll(_ADV_NOTATION.get(advantage, '1d20'))
+    r = _dice().roll(_ADV_NOTATION.get(advantage, '1d20'))
     kept = r.get('kept', r.get('rolls', []))
     die = kept[0] if kept else r['total']
     return _result(die, modifier, r['total'] + modifier, dc,
@@ -97,7 +105,7 @@ def _resolve_d20(modifier: int, dc: int, advantage: Optional[str]) -> Dict[str,
 
 def _resolve_2d6(modifier: int, dc: int, advantage: Optional[str]) -> Dict[str, Any]:
     """PbtA-flavored 2d6 + mod. Advantage rolls 3d6 and keeps the best two."""
-    r = _roller.roll(_2D6_NOTATION.get(advantage, '2d6'))
+    r = _dice().roll(_2D6_NOTATION.get(advantage, '2d6'))
     kept = r.get('kept', r.get('rolls', []))
     die = sum(kept) if kept else r['total']
     return _result(die, modifier, die + modifier, dc,
@@ -107,7 +115,7 @@ def _resolve_2d6(modifier: int, dc: int, advantage: Optional[str]) -> Dict[str,
 def _resolve_pool(modifier: int, dc: int, advantage: Optional[str], target: int) -> Dict[str, Any]:
     """Success-counting pool: the modifier IS the dice pool, the DC is successes needed."""
     pool = max(1, modifier + (1 if advantage == 'advantage' else -1 if advantage == 'disadvantage' else 0))
-    rolls = _roller.roll(f"{pool}d6")['rolls']
+    rolls = _dice().roll(f"{pool}d6")['rolls']
     successes = sum(1 for face in rolls if face >= target)
     critical = 'hit' if successes == pool else 'miss' if successes == 0 else None
     return _result(successes, pool, successes, dc, critical)
@@ -344,7 +352,7 @@ def _roll_total(notation: str, rng: Any = None) -> int:
     Config dice here are bare 'NdM' (1d20, 2d6); the modifier travels separately.
     """
     if rng is None:
-        return _roller.roll(notation)['total']
+        return _dice().roll(notation)['total']
     count_s, _, sides_s = (notation or '').strip().lower().partition('d')
     count, sides = int(count_s or 1), int(sides_s)
     return sum(rng.randint(1, sides) for _ in range(count))
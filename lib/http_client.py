@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+One shared HTTP client for every outbound call (the SRD API, image generation).
+
+Each caller used to build its own `urllib.request.urlopen`. Every lookup
+opened a new socket and paid a TLS handshake, and a 429 became a "please
+wait" error instead of a retry. So bulk agent lookups (a mirror sync, a
+catalog build, eight spell cards in one reply) were slow and failed under
+the API's rate limit. The `HttpClient` here fixes that:
+
+- Keep-alive: idle connections are pooled per origin and reused. A pooled
+  socket that the server closed while idle is retried once on a new one.
+- Bounded concurrency: at most `max_connections` requests are in flight
+  across all threads.
+- Rate limiting: a token bucket (`rate` per second, bursts of `burst`)
+  spaces requests out before the server has to refuse them.
+- Retries: a 429 or 5xx is retried with jittered exponential backoff,
+  honouring Retry-After. The last response comes back once retries run
+  out, so callers still see the real status. A POST is retried only on a
+  429, and it always goes out on a new socket: neither kind of resend can
+  repeat work the server may already have done.
+- Coalescing: identical GETs that are in flight together share one
+  request, and all callers get its response.
+
+Network failures raise `HttpClientError` (an OSError). `client()` is the
+per-process instance, configured by `GM_HTTP_CONNECTIONS` and
+`GM_HTTP_RATE`.
+"""
+
+import http.client
+import json
+import os
+import random
+import socket
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_CONNECTIONS = 8
+DEFAULT_RATE = 50.0  # requests per second; 0 disables the limit
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Only these methods are safe to resend after the server may have acted on them.
+IDEMPOTENT = frozenset({"GET", "HEAD"})
+# A 429 means the request was refused unprocessed, so even a POST can be resent.
+# A 5xx on a POST (an image generation, say) may come after the work was done and billed.
+UNSAFE_RETRY_STATUSES = frozenset({429})
+
+
+class HttpClientError(OSError):
+    """The request never got an HTTP response (refused, reset, timed out, bad TLS)."""
+
+
+class Response:
+    """A fully read response. The body is bytes; coalesced callers share one instance."""
+
+    __slots__ = ("status", "reason", "headers", "body")
+
+    def __init__(self, status: int, reason: str, headers, body: bytes):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8"))
+
+
+class TokenBucket:
+    """`rate` tokens per second, holding at most `burst`; acquire() blocks for one."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.stamp) * self.rate)
+                self.stamp = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class _Pending:
+    """One in-flight GET that later identical GETs wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response: Optional[Response] = None
+        self.error: Optional[BaseException] = None
+
+
+class HttpClient:
+    def __init__(self, max_connections: int = DEFAULT_CONNECTIONS, rate: float = DEFAULT_RATE,
+                 burst: Optional[int] = None, retries: int = 4, backoff: float = 0.5,
+                 max_backoff: float = 30.0, timeout: float = 10):
+        self.max_connections = max(1, max_connections)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.stats: Counter = Counter()  # requests, connections, reused, retries, coalesced
+        self._slots = threading.BoundedSemaphore(self.max_connections)
+        self._bucket = TokenBucket(rate, burst if burst is not None else max(1, int(rate)))
+        self._idle: Dict[Tuple[str, str, Optional[int]], List[http.client.HTTPConnection]] = {}
+        self._inflight: Dict[tuple, _Pending] = {}
+        self._lock = threading.Lock()
+
+    def request(self, method: str, url: str, body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None,
+                retries: Optional[int] = None) -> Response:
+        """The response to `method url`, after any retries. Raises HttpClientError."""
+        headers = dict(headers or {})
+        if method != "GET":
+            return self._with_retries(method, url, body, headers, timeout, retries)
+        key = (url, tuple(sorted(headers.items())))
+        with self._lock:
+            pending = self._inflight.get(key)
+            leader = pending is None
+            if leader:
+                pending = self._inflight[key] = _Pending()
+            else:
+                self.stats["coalesced"] += 1
+        if not leader:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.response
+        try:
+            pending.response = self._with_retries(method, url, body, headers, timeout, retries)
+            return pending.response
+        except BaseException as e:
+            pending.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            pending.done.set()
+
+    def get_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> Any:
+        return self.request("GET", url, headers=headers).json()
+
+    def _with_retries(self, method, url, body, headers, timeout, retries) -> Response:
+        retries = self.retries if retries is None else retries
+        retryable = RETRY_STATUSES if method in IDEMPOTENT else UNSAFE_RETRY_STATUSES
+        attempt = 0
+        while True:
+            self._bucket.acquire()
+            response = self._send(method, url, body, headers, timeout or self.timeout)
+            if response.status not in retryable or attempt >= retries:
+                return response
+            delay = self._delay(attempt, response.headers.get("Retry-After"))
+            attempt += 1
+            self.stats["retries"] += 1
+            time.sleep(delay)
+
+    def _delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Retry-After when the server gives seconds, else equal-jitter exponential backoff."""
+        try:
+            return min(self.max_backoff, max(0.0, float(retry_after)))
+        except (TypeError, ValueError):
+            ceiling = min(self.max_backoff, self.backoff * 2 ** attempt)
+            return random.uniform(ceiling / 2, ceiling)
+
+    def _send(self, method, url, body, headers, timeout) -> Response:
+        parts = urlsplit(url)
+        origin = (parts.scheme, parts.hostname, parts.port)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        # A pooled socket the server closed while idle only shows up when it is
+        # used. Resending is safe for an idempotent request, and for any request
+        # that failed before it was written. A non-idempotent request therefore
+        # always takes a new socket, so a dead pooled one can't leave it in doubt.
+        attempts = (False, True) if method in IDEMPOTENT else (True,)
+        with self._slots:
+            for fresh in attempts:
+                conn, reused = self._checkout(origin, timeout, fresh)
+                self.stats["requests"] += 1
+                sent = False
+                try:
+                    conn.request(method, path, body=body, headers=headers)
+                    sent = True
+                    raw = conn.getresponse()
+                    data = raw.read()
+                except (OSError, http.client.HTTPException) as e:
+                    conn.close()
+                    if reused and not fresh and self._stale(e, sent):
+                        continue
+                    raise HttpClientError(f"{type(e).__name__}: {e}") from e
+                if raw.will_close:
+                    conn.close()
+                else:
+                    self._checkin(origin, conn)
+                return Response(raw.status, raw.reason, raw.headers, data)
+
+    @staticmethod
+    def _stale(error: BaseException, sent: bool) -> bool:
+        """Did a reused socket fail because the server had closed it, not because of this request?
+
+        True when the write itself failed, or when the server hung up with no
+        status line at all (RemoteDisconnected). A timeout is never staleness:
+        the server may be slowly working on the request.
+        """
+        if isinstance(error, socket.timeout):
+            return False
+        return not sent or isinstance(error, http.client.RemoteDisconnected)
+
+    def _checkout(self, origin, timeout, fresh):
+        """(connection, reused?) for `origin`: an idle pooled one unless `fresh`."""
+        if not fresh:
+            with self._lock:
+                idle = self._idle.get(origin)
+                conn = idle.pop() if idle else None
+            if conn is not None:
+                self.stats["reused"] += 1
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        scheme, host, port = origin
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        self.stats["connections"] += 1
+        return cls(host, port, timeout=timeout), False
+
+    def _checkin(self, origin, conn) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(origin, [])
+            if len(idle) < self.max_connections:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for conns in pools.values():
+            for conn in conns:
+                conn.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+def client() -> HttpClient:
+    """The process's shared client."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient(
+                max_connections=int(_env_number("GM_HTTP_CONNECTIONS", DEFAULT_CONNECTIONS)),
+                rate=_env_number("GM_HTTP_RATE", DEFAULT_RATE))
+        return _client
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Precomputed status-line HUD: hud.txt beside character.json.
+
+gm-statusline.sh runs after every assistant message. Deriving the HUD there
+costs three jq spawns over character.json and campaign-overview.json plus the
+bash arithmetic, every time, whether or not anything changed. The Python
+writers that change what the HUD shows — character saves (HP, vitals,
+conditions, XP, gold), party moves, time updates, save restores — call
+`refresh()` afterwards, which renders the same lines once and writes them
+atomically. The status line then only checks that hud.txt is newer than both
+source files and prints it.
+
+hud.txt is the frame level (normal / wounded / critical, which colors the
+rules the script draws at terminal width) followed by the pre-rendered lines.
+
+The script's own derivation stays as the fallback, and it is the reference:
+anything the renderer cannot reproduce byte for byte — a float level, a
+string that jq's @tsv would escape, a shape jq would choke on — removes
+hud.txt instead, and the script renders as it always did. An agent that edits
+character.json directly simply makes hud.txt stale until the next refresh.
+"""
+
+import json
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, List, Optional
+
+FILENAME = "hud.txt"
+
+_deferred = 0
+
+# The palette gm-statusline.sh uses.
+GREEN = "\033[38;5;42m"
+AMBER = "\033[38;5;214m"
+RED = "\033[38;5;203m"
+TEAL = "\033[38;5;51m"
+GOLD = "\033[38;5;220m"
+DIM = "\033[38;5;244m"
+FAINT = "\033[38;5;238m"
+BOLD = "\033[1m"
+RESET = "\033[0m"
+SEP = f"{DIM}·{RESET}"
+SEPV = f"{FAINT}│{RESET}"
+BAR_W = 10
+
+
+class _Unrenderable(Exception):
+    """The script would render this differently (or fail); leave it to the script."""
+
+
+def _get(data: Any, *keys: str) -> Any:
+    """jq path `.a.b`: null through null, an error through anything but an object."""
+    for key in keys:
+        if data is None:
+            return None
+        if not isinstance(data, dict):
+            raise _Unrenderable(key)
+        data = data.get(key)
+    return data
+
+
+def _alt(*values: Any) -> Any:
+    """jq `a // b // …`: the first value that is neither null nor false."""
+    for value in values:
+        if value is not None and value is not False:
+            return value
+    return values[-1]
+
+
+def _tsv(value: Any) -> str:
+    """One `@tsv` field as `jq -r` prints it, where that is unambiguous."""
+    if value is True:
+        return "true"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, str) and not any(c in value for c in "\t\n\r\\"):
+        return value
+    raise _Unrenderable(repr(value))  # floats print differently across jq versions
+
+
+def _read_fields(fields: List[str], count: int) -> List[str]:
+    """`IFS=$'\\t' read -r a b c`: tab is IFS whitespace, so empty fields collapse."""
+    kept = [f for f in fields if f != ""]
+    return kept + [""] * (count - len(kept))
+
+
+def _int(text: str) -> Optional[int]:
+    """A plain decimal integer as bash reads one (no octal "08", no "1_0"), or None."""
+    return int(text) if re.fullmatch(r"-?(0|[1-9][0-9]*)", text) else None
+
+
+def _tdiv(a: int, b: int) -> int:
+    """Bash `$(( a / b ))`: integer division truncating toward zero."""
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b > 0) else -q
+
+
+def _ascii_lower(text: str) -> str:
+    return "".join(chr(ord(c) + 32) if "A" <= c <= "Z" else c for c in text)
+
+
+def _load(path: Path) -> Any:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        raise _Unrenderable(path.name)
+
+
+def render(campaign_dir) -> Optional[List[str]]:
+    """[frame level, line, line(, line)] exactly as gm-statusline.sh draws them.
+
+    None when there is no character sheet or the script's output cannot be
+    reproduced here.
+    """
+    campaign_dir = Path(campaign_dir)
+    char_file = campaign_dir / "character.json"
+    if not char_file.is_file():
+        return None
+    try:
+        char = _load(char_file)
+        fields = [_tsv(v) for v in (
+            _alt(_get(char, "name"), _get(char, "identity", "name"), "?"),
+            _alt(_get(char, "race"), _get(char, "identity", "race"), "?"),
+            _alt(_get(char, "class"), _get(char, "identity", "class"), "?"),
+            _alt(_get(char, "level"), _get(char, "progression", "level"), 1),
+            _alt(_get(char, "ac"), _get(char, "vitals", "ac"), "?"),
+            _alt(_get(char, "gold"), _get(char, "inventory", "gold"), 0),
+            _alt(_get(char, "hp", "current"), _get(char, "vitals", "hp", "current"),
+                 _get(char, "hp"), 0),
+            _alt(_get(char, "hp", "max"), _get(char, "vitals", "hp", "max"), _get(char, "hp"), 0),
+            _alt(_get(char, "xp", "current"), _get(char, "progression", "xp", "current"),
+                 _get(char, "xp"), 0),
+            _alt(_get(char, "xp", "next_level"), _get(char, "progression", "xp", "next_level"), 0),
+            _alt(_get(char, "current_location"), _get(char, "details", "current_location"), "?"),
+        )]
+        (name, race, klass, level, ac, gp, hp_cur, hp_max,
+         xp_cur, xp_next, loc) = _read_fields(fields, 11)
+
+        conds = _alt(_get(char, "conditions"), [])
+        if not isinstance(conds, list) or not all(isinstance(c, str) for c in conds):
+            raise _Unrenderable("conditions")
+        conds = ", ".join(_ascii_lower(c) for c in conds)
+
+        date = tod = oloc = ""
+        over_file = campaign_dir / "campaign-overview.json"
+        if over_file.is_file():
+            over = _load(over_file)
+            date, tod, oloc = _read_fields([_tsv(v) for v in (
+                _alt(_get(over, "current_date"), ""),
+                _alt(_get(over, "time_of_day"), ""),
+                _alt(_get(over, "player_position", "current_location"), ""),
+            )], 3)
+    except _Unrenderable:
+        return None
+    if oloc:
+        loc = oloc
+
+    cur, mx = _int(hp_cur), _int(hp_max)
+    if mx is not None and mx > 0:
+        if cur is None:
+            return None
+        pct = _tdiv(cur * 100, mx)
+        filled = _tdiv(cur * BAR_W, mx)
+    else:
+        pct = filled = 0
+    filled = max(0, min(BAR_W, filled))
+    empty = BAR_W - filled
+
+    if pct >= 50:
+        hpc, state, level_name, statec = GREEN, "Normal", "normal", DIM
+    elif pct >= 25:
+        hpc, state, level_name, statec = AMBER, "Wounded", "wounded", AMBER
+    else:
+        hpc, state, level_name, statec = RED, "Critical", "critical", f"{BOLD}{RED}"
+    if conds:
+        state = conds
+        if pct >= 50:
+            statec = AMBER
+    bar = "█" * filled + "░" * empty
+
+    lines = [
+        level_name,
+        f"{TEAL}⚔ {BOLD}{name}{RESET}  {DIM}Lv{level} {race} {klass}{RESET}  {SEP}  {AMBER}{loc}{RESET}",
+        f"  HP {hpc}{bar}{RESET} {hp_cur}/{hp_max} {SEPV} {DIM}AC{RESET} {ac} {SEPV} "
+        f"{GOLD}{gp}gp{RESET} {SEPV} {DIM}XP{RESET} {xp_cur}/{xp_next} {SEPV} {statec}{state}{RESET}",
+    ]
+    if date or tod:
+        lines.append(f"  {DIM}{date} {SEP} {tod}{RESET}")
+    return lines
+
+
+@contextmanager
+def deferred():
+    """Skip refreshes inside the block; the caller refreshes once at the end.
+
+    A batch buffers its writes until commit, so a refresh from a writer
+    mid-batch would render the files as they were before it.
+    """
+    global _deferred
+    _deferred += 1
+    try:
+        yield
+    finally:
+        _deferred -= 1
+
+
+def refresh(campaign_dir) -> None:
+    """Rewrite hud.txt for the campaign's current files (atomically), or remove it.
+
+    Best-effort: a HUD problem must never fail the write that triggered it.
+    """
+    if _deferred:
+        return
+    path = Path(campaign_dir) / FILENAME
+    try:
+        lines = render(campaign_dir)
+        if lines is None:
+            path.unlink(missing_ok=True)
+            return
+        tmp = path.with_name(f".{FILENAME}.{os.getpid()}.tmp")
+        tmp.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
@@ -21,6 +21,7 @@ from typing import Any, Dict, Optional
 sys.path.insert(0, str(Path(__file__).parent))
 
 from entity_manager import EntityManager
+from campaign_context import CampaignContext
 from character_schema import to_flat
 
 
@@ -30,8 +31,8 @@ def _default_vitals() -> Dict[str, Any]:
 
 
 class IdentityOnboarding(EntityManager):
-    def __init__(self, world_state_dir: str = None):
-        super().__init__(world_state_dir)
+    def __init__(self, world_state_dir: str = None, context: CampaignContext = None):
+        super().__init__(world_state_dir, context)
 
     def from_canon(self, npc_name: str) -> Optional[Dict[str, Any]]:
         """Lift a canon character from npcs.json (stats from a sheet if present, voice from context).
@@ -223,4 +224,5 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    import profiling
+    profiling.run(main)
@@ -10,8 +10,11 @@ Display path: we DON'T try to render pixels in the terminal. We save a PNG and
 return its path; the VS Code terminal linkifies the path so the player clicks to
 open it.
 
-No third-party SDK — the request is a single JSON POST, done with stdlib urllib
-so the project gains no new dependency.
+No third-party SDK — the request is a single JSON POST, sent through the shared
+stdlib client in http_client.py (retries a 429/5xx with backoff), so the project
+gains no new dependency. http_client (http.client, email, ssl) is imported
+inside `generate_image`: appearance lookups and the chronicler commands never
+touch the network and should not pay for it.
 """
 
 from __future__ import annotations
@@ -22,8 +25,6 @@ import re
 import sys
 import time
 import base64
-import urllib.error
-import urllib.request
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
@@ -282,23 +283,30 @@ def generate_image(prompt: str, *, title: str = "", quality: str = DEFAULT_QUALI
         "n": 1,
     }).encode("utf-8")
 
-    req = urllib.request.Request(
-        API_URL,
-        data=payload,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        },
-        method="POST",
-    )
+    import http_client
 
+    # A POST is retried only on 429 (refused, nothing generated or billed); two at most,
+    # since each try can take minutes.
     try:
-        with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as resp:
-            body = json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as e:
-        raise ImageGenError(_format_http_error(e)) from e
-    except urllib.error.URLError as e:
-        raise ImageGenError(f"Network error reaching OpenAI: {e.reason}") from e
+        resp = http_client.client().request(
+            "POST",
+            API_URL,
+            body=payload,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            timeout=REQUEST_TIMEOUT,
+            retries=2,
+        )
+    except OSError as e:
+        raise ImageGenError(f"Network error reaching OpenAI: {e}") from e
+    if not resp.ok:
+        raise ImageGenError(_format_http_error(resp))
+    try:
+        body = resp.json()
+    except ValueError as e:
+        raise ImageGenError("Unexpected response from image API (not JSON).") from e
 
     try:
         b64 = body["data"][0]["b64_json"]
@@ -337,10 +345,10 @@ def generate_image(prompt: str, *, title: str = "", quality: str = DEFAULT_QUALI
     }
 
 
-def _format_http_error(e: "urllib.error.HTTPError") -> str:
+def _format_http_error(resp: "http_client.Response") -> str:
     """Turn an OpenAI HTTP error into an actionable one-line message."""
     try:
-        err = json.loads(e.read().decode("utf-8")).get("error", {})
+        err = resp.json().get("error", {})
     except Exception:
         err = {}
     code = err.get("code")
@@ -348,11 +356,11 @@ def _format_http_error(e: "urllib.error.HTTPError") -> str:
     if code == "moderation_blocked":
         stage = (err.get("moderation_details") or {}).get("moderation_stage", "input")
         return f"Image blocked by content moderation ({stage}). Revise the prompt and retry."
-    if e.code == 401:
+    if resp.status == 401:
         return "OpenAI rejected the API key (401). Check OPENAI_API_KEY in .env."
-    if e.code == 429:
+    if resp.status == 429:
         return "OpenAI rate limit / quota hit (429). Wait and retry, or check billing."
-    return f"OpenAI error {e.code}: {msg or 'request failed'}"
+    return f"OpenAI error {resp.status}: {msg or 'request failed'}"
 
 
 def main() -> None:
@@ -437,4 +445,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
@@ -6,10 +6,16 @@ Provides safe JSON read/write/update operations with proper error handling
 
 import json
 import os
+import sys
+import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime, timezone
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+import profiling
+
 
 class JsonOperations:
     """Safe JSON file operations for world state management"""
@@ -36,7 +42,10 @@ class JsonOperations:
 
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                data = json.load(f)
+                if profiling.ENABLED:
+                    profiling.count("json.read", bytes=os.fstat(f.fileno()).st_size)
+                return data
         except json.JSONDecodeError as e:
             print(f"[ERROR] Invalid JSON in {filename}: {e}")
             return default if default is not None else {}
@@ -56,6 +65,8 @@ class JsonOperations:
             temp_path = filepath.with_suffix('.tmp')
             with open(temp_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=indent, ensure_ascii=False)
+                if profiling.ENABLED:
+                    profiling.count("json.write", bytes=f.tell())
 
             # Atomic rename
             temp_path.replace(filepath)
@@ -211,10 +222,160 @@ class JsonOperations:
         return datetime.now(timezone.utc).isoformat()
 
 
+class BufferedJsonOperations(JsonOperations):
+    """JsonOperations whose writes stay in memory until `commit()`.
+
+    A beat persisted through separate wrapper calls can stop half-way (the
+    HP landed, the NPC event did not). gm-batch.sh runs the whole beat over
+    one of these instead: every manager built from the same CampaignContext
+    reads what the earlier operations wrote, each file is read from disk at
+    most once, and nothing reaches disk until the batch has succeeded.
+
+    `commit()` writes every pending file to a temp sibling first and renames
+    them into place only once all of them are written, so a failure while
+    writing leaves the campaign exactly as it was. `discard()` drops them.
+    """
+
+    def __init__(self, world_state_dir: str = "world-state"):
+        super().__init__(world_state_dir)
+        self._pending: Dict[Path, str] = {}
+        self._read: Dict[Path, str] = {}
+
+    def load_json(self, filename: str, default: Any = None) -> Any:
+        filepath = self._resolve_path(filename)
+        text = self._pending.get(filepath, self._read.get(filepath))
+        if text is None:
+            if not filepath.exists():
+                return {} if default is None else default
+            try:
+                text = filepath.read_text(encoding='utf-8')
+            except Exception as e:
+                print(f"[ERROR] Failed to read {filename}: {e}")
+                return default if default is not None else {}
+            if profiling.ENABLED:
+                profiling.count("json.read", bytes=len(text.encode('utf-8')))
+            self._read[filepath] = text
+        try:
+            return json.loads(text)  # a fresh copy per read, as from disk
+        except json.JSONDecodeError as e:
+            print(f"[ERROR] Invalid JSON in {filename}: {e}")
+            return default if default is not None else {}
+
+    def save_json(self, filename: str, data: Any, indent: int = 2) -> bool:
+        try:
+            text = json.dumps(data, indent=indent, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            print(f"[ERROR] Failed to save {filename}: {e}")
+            return False
+        self._pending[self._resolve_path(filename)] = text
+        return True
+
+    @property
+    def pending(self) -> List[Path]:
+        """Files written since the last commit/discard, in first-write order."""
+        return list(self._pending)
+
+    def commit(self) -> List[Path]:
+        """Write every pending file (all temp files first, then the renames)."""
+        staged = []
+        try:
+            for filepath, text in self._pending.items():
+                filepath.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = filepath.with_name(f".{filepath.name}.batch.tmp")
+                staged.append((temp_path, filepath))
+                temp_path.write_text(text, encoding='utf-8')
+                if profiling.ENABLED:
+                    profiling.count("json.write", bytes=len(text.encode('utf-8')))
+        except Exception:
+            for temp_path, _ in staged:
+                temp_path.unlink(missing_ok=True)
+            raise
+        for temp_path, filepath in staged:
+            temp_path.replace(filepath)
+            self._read[filepath] = self._pending[filepath]
+        self._pending.clear()
+        return [filepath for _, filepath in staged]
+
+    def discard(self) -> None:
+        """Forget every pending write."""
+        self._pending.clear()
+
+
+class CachedJsonOperations(JsonOperations):
+    """JsonOperations that keeps each file's parsed state warm between calls.
+
+    A long-running host (campaign_service.py) serves many requests against
+    the same table, and every manager call re-reads and re-parses npcs.json,
+    locations.json and the rest. This keeps a pickle of each parsed file:
+    unpickling is roughly twice as fast as reading and parsing the JSON, and
+    every caller still gets a fresh copy it can mutate.
+
+    An entry is trusted only while the file's (mtime_ns, size, inode) are
+    unchanged. Every write here is a rename, which replaces the inode, so a
+    CLI call or another host writing the same campaign simply misses the
+    cache. A save drops the entry; the next read re-parses what is on disk.
+    A file modified within `RACY_NS` of the read could be rewritten in the
+    same mtime tick, at the same size, on a reused inode, so — as SaveStore
+    and ContextCache do — such a racily clean file is not cached; it is
+    re-parsed until it ages out of the window. `cached_bytes` is what the
+    service charges against its memory budget.
+    """
+
+    RACY_NS = 2_000_000_000
+
+    def __init__(self, world_state_dir: str = "world-state"):
+        import threading  # only hosts build these: keep it off every CLI's startup
+        super().__init__(world_state_dir)
+        self._blobs: Dict[Path, tuple] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _stamp(filepath: Path) -> Optional[tuple]:
+        try:
+            st = filepath.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def load_json(self, filename: str, default: Any = None) -> Any:
+        filepath = self._resolve_path(filename)
+        stamp = self._stamp(filepath)
+        if stamp is None:
+            return {} if default is None else default
+        with self._lock:
+            hit = self._blobs.get(filepath)
+        import pickle
+        if hit is not None and hit[0] == stamp:
+            return pickle.loads(hit[1])
+        data = super().load_json(filename, default)
+        # Cache only a clean parse of the file as stamped (not a default, not a
+        # file replaced mid-read, not one still racily clean).
+        if (self._stamp(filepath) == stamp and data is not default
+                and time.time_ns() - stamp[0] >= self.RACY_NS):
+            with self._lock:
+                self._blobs[filepath] = (stamp, pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+        return data
+
+    def save_json(self, filename: str, data: Any, indent: int = 2) -> bool:
+        filepath = self._resolve_path(filename)
+        with self._lock:
+            self._blobs.pop(filepath, None)
+        return super().save_json(filename, data, indent)
+
+    @property
+    def cached_bytes(self) -> int:
+        """Size of every cached pickle: the memory this cache is holding."""
+        with self._lock:
+            return sum(len(blob) for _stamp, blob in self._blobs.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._blobs.clear()
+
+
 # Convenience functions for command-line usage
 def main():
     """CLI interface for JSON operations"""
-    import sys
     import argparse
 
     parser = argparse.ArgumentParser(description='JSON file operations')
@@ -286,4 +447,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    profiling.run(main)
\ No newline at end of file
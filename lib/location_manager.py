@@ -12,13 +12,14 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from entity_manager import EntityManager
+from campaign_context import CampaignContext
 
 
 class LocationManager(EntityManager):
     """Manage location operations. Inherits from EntityManager for common functionality."""
 
-    def __init__(self, world_state_dir: str = None):
-        super().__init__(world_state_dir)
+    def __init__(self, world_state_dir: str = None, context: CampaignContext = None):
+        super().__init__(world_state_dir, context)
         self.locations_file = "locations.json"
 
     def add_location(self, name: str, position: str) -> bool:
@@ -307,4 +308,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
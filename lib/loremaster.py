@@ -17,13 +17,18 @@ from typing import Any, Dict, Optional
 sys.path.insert(0, str(Path(__file__).parent))
 
 from entity_manager import EntityManager
+from campaign_context import CampaignContext
 from book_bible import log_token_estimate
 from rag.coarse_index import CoarseIndex
 
+# Where an import leaves the retained book text, in order of preference.
+BOOK_TEXT_FILES = ("source/current-document.txt", "current-document.txt", "book-text.txt")
+
 
 class Loremaster(EntityManager):
-    def __init__(self, world_state_dir: str = None, book_text: Optional[str] = None):
-        super().__init__(world_state_dir)
+    def __init__(self, world_state_dir: str = None, book_text: Optional[str] = None,
+                 context: CampaignContext = None):
+        super().__init__(world_state_dir, context)
         self.cache_file = "loremaster-cache.json"
         self.index = CoarseIndex()
         text = book_text if book_text is not None else self._load_book_text()
@@ -31,7 +36,7 @@ class Loremaster(EntityManager):
             self.index.build(text)
 
     def _load_book_text(self) -> str:
-        for candidate in ("source/current-document.txt", "current-document.txt", "book-text.txt"):
+        for candidate in BOOK_TEXT_FILES:
             p = self.campaign_dir / candidate
             if p.exists():
                 try:
@@ -128,4 +133,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+One-pass NPC mention matching over the fact corpus.
+
+The NPC VOICES block re-attaches facts that name a present NPC. It used to do
+that NPC by NPC: flatten facts.json, compile a regex per name and alias, scan
+every fact — so a crowded scene cost (present NPCs × facts) regex scans.
+`MentionAutomaton` is an Aho-Corasick automaton over every present NPC's
+needles (full key plus explicit aliases); one pass over each fact finds all
+of them. Matches are case-insensitive and post-checked for word boundaries,
+exactly what `\\b<needle>\\b` with re.IGNORECASE accepted: "Ana" still
+matches "Ana" and never "Banana".
+
+`scan_mentions` caches its result per (facts.json version, needle set) for
+the life of the process, so the same scene is not rescanned until a fact is
+written or someone arrives or leaves.
+"""
+
+from collections import OrderedDict, deque
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+
+def _fold(text: str) -> str:
+    """Lowercase char by char, keeping offsets aligned (e.g. 'İ' stays put)."""
+    out = []
+    for c in text:
+        low = c.lower()
+        out.append(low if len(low) == 1 else c)
+    return "".join(out)
+
+
+def _is_word(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+class MentionAutomaton:
+    """Aho-Corasick over needles, each owned by a key (an NPC name)."""
+
+    def __init__(self, needles: Iterable[Tuple[str, str]]):
+        """`needles`: (owner key, needle text) pairs; empty needles are ignored."""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[str, int]]] = [[]]  # (owner, needle length)
+        for owner, needle in needles:
+            if needle:
+                self._add(owner, _fold(needle))
+        self._link()
+
+    def _add(self, owner: str, needle: str) -> None:
+        node = 0
+        for c in needle:
+            nxt = self._goto[node].get(c)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][c] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        if (owner, len(needle)) not in self._out[node]:
+            self._out[node].append((owner, len(needle)))
+
+    def _link(self) -> None:
+        """Breadth-first failure links; each node also inherits its fail node's outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for c, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and c not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(c, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def owners_in(self, text: str) -> set:
+        """Owners with at least one needle in `text` on word boundaries."""
+        folded = _fold(text)
+        found = set()
+        node = 0
+        for end, c in enumerate(folded, 1):
+            while node and c not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(c, 0)
+            for owner, length in self._out[node]:
+                if owner in found:
+                    continue
+                start = end - length
+                if (_boundary(folded, start) and _boundary(folded, end)):
+                    found.add(owner)
+        return found
+
+
+def _boundary(text: str, pos: int) -> bool:
+    """True where regex `\\b` would match: word-ness differs across `pos`."""
+    before = pos > 0 and _is_word(text[pos - 1])
+    after = pos < len(text) and _is_word(text[pos])
+    return before != after
+
+
+_CACHE: "OrderedDict[Any, Dict[str, List[int]]]" = OrderedDict()
+_CACHE_SIZE = 32
+
+
+def scan_mentions(needles: Dict[str, Sequence[str]], texts: Sequence[str],
+                  version: Any = None) -> Dict[str, List[int]]:
+    """{owner: [indexes of texts naming it]} in one pass over `texts`.
+
+    `version` identifies the corpus (facts.json's stat); when given, results
+    are cached per (version, needles) for this process.
+    """
+    key = None
+    if version is not None:
+        key = (version, tuple(sorted((o, tuple(ns)) for o, ns in needles.items())))
+        hit = _CACHE.get(key)
+        if hit is not None:
+            _CACHE.move_to_end(key)
+            return hit
+    automaton = MentionAutomaton((o, n) for o, ns in needles.items() for n in ns)
+    result: Dict[str, List[int]] = {o: [] for o in needles}
+    for i, text in enumerate(texts):
+        for owner in automaton.owners_in(text):
+            result[owner].append(i)
+    if key is not None:
+        _CACHE[key] = result
+        while len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return result
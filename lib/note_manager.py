@@ -10,20 +10,26 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from campaign_manager import CampaignManager
+from campaign_context import CampaignContext
 from json_ops import JsonOperations
 
 
 class NoteManager:
     """Manage campaign facts and notes."""
 
-    def __init__(self, world_state_dir: str = "world-state"):
-        self.campaign_mgr = CampaignManager(world_state_dir)
-        self.campaign_dir = self.campaign_mgr.get_active_campaign_dir()
+    def __init__(self, world_state_dir: str = "world-state", context: CampaignContext = None):
+        if context is not None:
+            self.campaign_mgr = context.campaign_mgr
+            self.campaign_dir = context.require()
+            self.json_ops = context.json_ops
+        else:
+            self.campaign_mgr = CampaignManager(world_state_dir)
+            self.campaign_dir = self.campaign_mgr.get_active_campaign_dir()
 
-        if self.campaign_dir is None:
-            raise RuntimeError("No active campaign. Run /new-game or /import first.")
+            if self.campaign_dir is None:
+                raise RuntimeError("No active campaign. Run /new-game or /import first.")
 
-        self.json_ops = JsonOperations(str(self.campaign_dir))
+            self.json_ops = JsonOperations(str(self.campaign_dir))
 
         # Ensure facts file exists
         facts_path = self.campaign_dir / "facts.json"
@@ -105,4 +111,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
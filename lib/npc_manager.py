@@ -4,7 +4,6 @@ NPC management module for GM tools
 Handles NPC creation, updates, and tagging operations
 """
 
-import copy
 import sys
 from typing import Dict, List, Optional, Any
 from pathlib import Path
@@ -13,6 +12,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from entity_manager import EntityManager
+from campaign_context import CampaignContext
+from presence_index import PresenceIndex
 import visual_appearance as va_mod
 
 
@@ -47,6 +48,7 @@ def _positive_int(value):
 
 def _party_sheet_for_npc(npc: dict):
     """First-time party sheet + source label. Copies hp/ac from npc.stats when real."""
+    import copy
     sheet = copy.deepcopy(PARTY_MEMBER_DEFAULTS)
     stats = npc.get("stats") if isinstance(npc.get("stats"), dict) else {}
     hp = _positive_int(stats.get("hp"))
@@ -68,8 +70,8 @@ def _party_sheet_for_npc(npc: dict):
 class NPCManager(EntityManager):
     """Manage NPC operations. Inherits from EntityManager for common functionality."""
 
-    def __init__(self, world_state_dir: str = None):
-        super().__init__(world_state_dir)
+    def __init__(self, world_state_dir: str = None, context: CampaignContext = None):
+        super().__init__(world_state_dir, context)
         self.npcs_file = "npcs.json"
 
     def create_npc(self, name: str, description: str, attitude: str) -> bool:
@@ -412,6 +414,20 @@ class NPCManager(EntityManager):
         merged = va_mod.merge(npc.get('visual_appearance'), fields)
         return self._update_entity(self.npcs_file, name, {'visual_appearance': merged})
 
+    def _save_npcs(self, npcs: Dict[str, Any], changed: List[str]) -> bool:
+        """Save npcs.json and re-index presence for just the NPCs in `changed`.
+
+        Used by the writers that move NPCs in or out of a scene (location tags,
+        promote/demote, unify-tags). Other writers leave the presence index's
+        stamp stale, and the next reader rebuilds it.
+        """
+        presence = PresenceIndex(self.campaign_dir)
+        before = presence.stamp(digest=True)
+        if not self._save_entities(self.npcs_file, npcs):
+            return False
+        presence.record(npcs, changed, before)
+        return True
+
     def _manage_tags(self, name: str, tag_type: str, tags: tuple, action: str) -> bool:
         """
         Internal method to manage tags
@@ -445,7 +461,7 @@ class NPCManager(EntityManager):
 
         npcs[name]['tags'][tag_type] = list(current_tags)
 
-        if self._save_entities(self.npcs_file, npcs):
+        if self._save_npcs(npcs, [name]):
             print(f"[SUCCESS] {action_word} {tag_type} tags for {name}: {', '.join(tags)}")
             return True
         return False
@@ -508,13 +524,13 @@ class NPCManager(EntityManager):
             # Restore existing character sheet (NPC was previously demoted)
             hp = existing_sheet.get('hp', {'current': 10, 'max': 10})
             ac = existing_sheet.get('ac', 10)
-            if self._save_entities(self.npcs_file, npcs):
+            if self._save_npcs(npcs, [name]):
                 print(f"[SUCCESS] {name} rejoined the party (HP: {hp['current']}/{hp['max']}, AC: {ac})")
                 return True
         else:
             sheet, source = _party_sheet_for_npc(npcs[name])
             npcs[name]['character_sheet'] = sheet
-            if self._save_entities(self.npcs_file, npcs):
+            if self._save_npcs(npcs, [name]):
                 hp = sheet['hp']
                 print(
                     f"[SUCCESS] {name} is now a party member "
@@ -544,7 +560,7 @@ class NPCManager(EntityManager):
 
         npcs[name]['is_party_member'] = False
 
-        if self._save_entities(self.npcs_file, npcs):
+        if self._save_npcs(npcs, [name]):
             print(f"[SUCCESS] {name} is no longer a party member")
             return True
         return False
@@ -1102,7 +1118,7 @@ def main():
         npcs = manager.json_ops.load_json(manager.npcs_file) or {}
         report = unify_location_tags(npcs)
         if report['migrated']:
-            manager.json_ops.save_json(manager.npcs_file, npcs)
+            manager._save_npcs(npcs, report['migrated'])
             print(f"[SUCCESS] Unified location_tags -> tags.locations for "
                   f"{len(report['migrated'])} NPC(s), {report['tags_added']} tag(s) merged: "
                   f"{', '.join(report['migrated'])}")
@@ -1232,4 +1248,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import profiling
+    profiling.run(main)
\ No newline at end of file
@@ -13,7 +13,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from entity_manager import EntityManager
+from campaign_context import CampaignContext
 from character_schema import to_flat, is_open_schema
+import hud
 
 
 class PlayerManager(EntityManager):
@@ -45,12 +47,9 @@ class PlayerManager(EntityManager):
         355000,  # Level 20
     ]
 
-    def __init__(self, world_state_dir: str = None):
-        super().__init__(world_state_dir)
+    def __init__(self, world_state_dir: str = None, context: CampaignContext = None):
+        super().__init__(world_state_dir, context)
 
-        # Base dir the kit is loaded from (self.world_state_dir below is a legacy
-        # alias for the CAMPAIGN dir, so the real base has to be kept separately).
-        self._kit_base = world_state_dir
         self._kit = None
 
         # Additional paths specific to player management
@@ -68,12 +67,10 @@ class PlayerManager(EntityManager):
         """Load the active PC from character.json (name is ignored)."""
         if not self.character_file.exists():
             return None
-        try:
-            with open(self.character_file, 'r', encoding='utf-8') as f:
-                raw = json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"[ERROR] Failed to load character: {e}")
-            return None
+        # Through json_ops, so a batch sees the sheet an earlier operation wrote.
+        raw = self.json_ops.load_json("character.json")
+        if not raw:
+            return None  # unreadable (json_ops reported why)
         return self._normalize_loaded(raw, "character.json")
 
     def _normalize_loaded(self, raw: Dict, save_path: str) -> Dict:
@@ -89,7 +86,9 @@ class PlayerManager(EntityManager):
         """Save character data to file using atomic writes via json_ops"""
         # Persist in canonical flat shape (no-op if already flat).
         data = to_flat(data)
-        return self.json_ops.save_json("character.json", data)
+        saved = self.json_ops.save_json("character.json", data)
+        hud.refresh(self.campaign_dir)  # HP, vitals, conditions, XP, gold all land here
+        return saved
 
     def world_kit(self):
         """The active campaign's World Kit (cached). The single source of truth for
@@ -97,7 +96,7 @@ class PlayerManager(EntityManager):
         own defaults instead of a second, disagreeing fallback here."""
         if self._kit is None:
             from world_kit import WorldKit
-            self._kit = WorldKit(self._kit_base)
+            self._kit = WorldKit(context=self.context)
         return self._kit
 
     def _xp_thresholds(self):
@@ -760,6 +759,7 @@ class PlayerManager(EntityManager):
 
         # Update current_character on the campaign overview.
         self.json_ops.update_json(self.campaign_file, {'current_character': npc_name})
+        hud.refresh(self.campaign_dir)
 
         # Remove the promoted NPC from the party so they aren't double-tracked.
         npcs = self.json_ops.load_json("npcs.json") or {}
@@ -1363,4 +1363,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
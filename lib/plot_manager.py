@@ -12,6 +12,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from entity_manager import EntityManager
+from campaign_context import CampaignContext
 from schemas import PLOT_TYPES, PLOT_TYPE_SORT, VALID_PLOT_STATUSES
 
 # Canonical types in display order, with friendlier headings where one reads better
@@ -29,8 +30,8 @@ def _plot_type_label(plot_type: str) -> str:
 class PlotManager(EntityManager):
     """Manage plot operations. Inherits from EntityManager for common functionality."""
 
-    def __init__(self, world_state_dir: str = None):
-        super().__init__(world_state_dir)
+    def __init__(self, world_state_dir: str = None, context: CampaignContext = None):
+        super().__init__(world_state_dir, context)
         self.plots_file = "plots.json"
 
     def list_plots(self, plot_type: Optional[str] = None,
@@ -412,7 +413,7 @@ class PlotManager(EntityManager):
         # Try to get session count for staleness
         try:
             from session_manager import SessionManager
-            sm = SessionManager()
+            sm = SessionManager(context=self.context)
             current_session = sm._get_session_number()
         except Exception as e:
             print(f"[WARNING] Could not determine session number for plot staleness: {e}", file=sys.stderr)
@@ -623,4 +624,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Location -> NPC presence index, kept beside npcs.json.
+
+`npcs_present` answered "who is here?" by walking every NPC and lowercasing
+its `tags.locations` — fine for a hand-built cast, not for an imported book
+with a thousand NPCs, and the brief, ready threads, world-remembers, scene
+context and the consequence tick each ask it every turn. npcs.presence.json
+maps each lowercased location tag to the NPCs tagged there, plus the party
+list, so presence is a lookup over who is actually present. It holds nothing
+per NPC beyond those lists, each name paired with its position in npcs.json
+for output order, so a reader parses only the tags, not a second cast list.
+
+The index carries a stamp of the npcs.json it was built from — (mtime_ns,
+size), plus a content hash while the file is racily fresh — and is only
+trusted while that stamp matches. `NPCManager` updates it in place for the
+NPCs a tag, promote/demote or unify write touched; any other writer simply
+leaves the stamp stale and the next reader rebuilds it. A process keeps the
+index it loaded for as long as the stamp matches, so the several presence
+checks of one turn in a long-lived host cost a stat each; callers must not
+mutate it.
+"""
+
+import bisect
+import hashlib
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from json_ops import JsonOperations
+
+# npcs.json path -> (stamp, index): the index this process last loaded or wrote.
+_loaded: Dict[str, tuple] = {}
+
+
+def _places(data: Any) -> Optional[List[str]]:
+    """The index lists an NPC record belongs in: its lowercased location tags,
+    plus "" for the party (None: never present)."""
+    if not isinstance(data, dict):
+        return None
+    tags = data.get("tags", {})
+    locs = {str(x).lower() for x in tags.get("locations", [])} if isinstance(tags, dict) else set()
+    return sorted(locs) + ([""] if data.get("is_party_member") else [])
+
+
+class PresenceIndex:
+    """npcs.presence.json: lowercased location tag -> [[position, name], ...].
+
+    Stamped to the npcs.json it was built from.
+    """
+
+    FILENAME = "npcs.presence.json"
+    SOURCE = "npcs.json"
+    VERSION = 2
+    RACY_NS = 2_000_000_000
+
+    def __init__(self, campaign_dir):
+        self.campaign_dir = Path(campaign_dir)
+        self.source = self.campaign_dir / self.SOURCE
+        self.json_ops = JsonOperations(str(self.campaign_dir))
+
+    # ---------------------------------------------------------------- stamps
+
+    def stamp(self, digest: bool = False) -> Optional[Dict[str, Any]]:
+        """npcs.json's current stamp, or None when it does not exist.
+
+        The content hash is included while the file is racily fresh, or always
+        with `digest` (writers stamp the file they are about to replace).
+        """
+        try:
+            st = os.stat(self.source)
+        except OSError:
+            return None
+        stamp = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+        if digest or time.time_ns() - st.st_mtime_ns < self.RACY_NS:
+            try:
+                stamp["sha1"] = hashlib.sha1(self.source.read_bytes()).hexdigest()
+            except OSError:
+                return None
+        return stamp
+
+    def _matches(self, stored: Optional[Dict[str, Any]], current: Optional[Dict[str, Any]]) -> bool:
+        """Does the index's stamp still describe the file `current` stamps?"""
+        if not stored or not current:
+            return False
+        if ((stored.get("mtime_ns"), stored.get("size"))
+                != (current.get("mtime_ns"), current.get("size"))):
+            return False
+        if "sha1" in stored:
+            # Racily clean when stamped: stat alone cannot vouch for it.
+            now = current.get("sha1")
+            if now is None:
+                try:
+                    now = hashlib.sha1(self.source.read_bytes()).hexdigest()
+                except OSError:
+                    return False
+            return now == stored["sha1"]
+        return True
+
+    # ---------------------------------------------------------------- build
+
+    @staticmethod
+    def build(npcs: Dict[str, Any]) -> Dict[str, Any]:
+        """Index for an npcs.json dict (no stamp)."""
+        index = {"version": PresenceIndex.VERSION, "stamp": None, "locations": {}, "party": []}
+        if isinstance(npcs, dict):
+            for pos, (name, data) in enumerate(npcs.items()):
+                PresenceIndex._add(index, pos, name, _places(data))
+        return index
+
+    @staticmethod
+    def _add(index: Dict[str, Any], pos: int, name: str, places: Optional[List[str]]) -> None:
+        """File `name` (at npcs.json position `pos`) under each of `places`, in position order."""
+        for place in places or ():
+            bucket = index["party"] if place == "" else index["locations"].setdefault(place, [])
+            bisect.insort(bucket, [pos, name])
+
+    # ---------------------------------------------------------------- load / record
+
+    def load(self) -> Dict[str, Any]:
+        """The index, rebuilt from npcs.json first if its stamp no longer matches."""
+        stamp = self.stamp()
+        if stamp is None:
+            return self.build({})
+        held = _loaded.get(str(self.source))
+        if held is not None and held[0] == stamp:
+            return held[1]
+        index = self.json_ops.load_json(self.FILENAME)
+        if not (isinstance(index, dict) and index.get("version") == self.VERSION
+                and self._matches(index.get("stamp"), stamp)):
+            # Stamp taken before the read: a write racing this rebuild re-indexes next time.
+            index = self.build(self.json_ops.load_json(self.SOURCE) or {})
+            index["stamp"] = stamp
+            self.json_ops.save_json(self.FILENAME, index, indent=None)
+        _loaded[str(self.source)] = (stamp, index)
+        return index
+
+    def record(self, npcs: Dict[str, Any], changed: Iterable[str],
+               before: Optional[Dict[str, Any]]) -> None:
+        """After a writer saved `npcs`: update the entries for `changed` names.
+
+        `before` is npcs.json's `stamp(digest=True)` taken just before that
+        save. If the index matched it, only the changed NPCs are re-indexed;
+        otherwise it is rebuilt from `npcs`.
+        """
+        index = self.json_ops.load_json(self.FILENAME)
+        if (isinstance(index, dict) and index.get("version") == self.VERSION
+                and self._matches(index.get("stamp"), before)):
+            # The writer has the whole dict in hand: renumber positions from it
+            # (adds and removals shift them), then re-file just the changed names.
+            changed = set(changed)
+            pos = {name: i for i, name in enumerate(npcs)}
+
+            def keep(bucket):
+                return [[pos[n], n] for _p, n in bucket if n in pos and n not in changed]
+
+            index["party"] = keep(index["party"])
+            locations = {loc: keep(bucket) for loc, bucket in index["locations"].items()}
+            index["locations"] = {loc: bucket for loc, bucket in locations.items() if bucket}
+            for name in changed & pos.keys():
+                self._add(index, pos[name], name, _places(npcs[name]))
+        else:
+            index = self.build(npcs)
+        index["stamp"] = self.stamp()
+        self.json_ops.save_json(self.FILENAME, index, indent=None)
+        _loaded[str(self.source)] = (index["stamp"], index)
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Opt-in profiling for the CLI entry points (GM_PROFILE=1).
+
+`log_token_usage` in tools/common.sh records how big a command's output was
+and nothing else, so a slow turn left us guessing: was it the brief's NPC
+section, thirty re-reads of facts.json, or an embedder batch? With
+GM_PROFILE=1 every `lib/*.py` main() runs through `run()`, which appends one
+JSONL record per process to world-state/usage/profile.jsonl:
+
+    {"ts": ..., "command": "session_manager context", "campaign": "...",
+     "exit": 0, "wall_ms": 41.2, "cpu_ms": 88.0,
+     "phases":   {"context.npcs": {"ms": 6.1, "calls": 1}, ...},
+     "counters": {"json.read": {"calls": 14, "bytes": 182311}, ...}}
+
+Phases are named spans (`with profiling.phase("context.npcs"):`); counters
+are tallies the instrumented layers keep — JsonOperations reads and writes
+(`json.read` / `json.write`, with bytes), embedder calls (`embed.single`,
+`embed.batch` with `items` = texts in the batch), and vector-store queries
+(`vector.query`, `items` = results asked for). Embedding and vector queries
+are also phases (`embed`, `vector.query`), as is each brief section
+(`context.<section>`).
+
+Off (the default) every hook is one module-level flag test, so the
+instrumentation stays in the hot paths permanently. `gm-profile.sh report`
+summarizes the log: p50/p95 wall time per command, and the phases and
+counters behind it.
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+ENABLED = os.environ.get("GM_PROFILE", "") not in ("", "0")
+
+FILENAME = "profile.jsonl"
+
+_phases: Dict[str, Dict[str, float]] = {}
+_counters: Dict[str, Dict[str, int]] = {}
+
+_VERB = re.compile(r"[a-z][a-z0-9_-]*")
+
+
+@contextmanager
+def phase(name: str):
+    """Time a named span; repeated spans of one name accumulate."""
+    if not ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        slot = _phases.setdefault(name, {"ms": 0.0, "calls": 0})
+        slot["ms"] += (time.perf_counter() - start) * 1000
+        slot["calls"] += 1
+
+
+def count(name: str, **amounts: int) -> None:
+    """Tally one call of `name`, summing any amounts (bytes=, items=) alongside."""
+    if not ENABLED:
+        return
+    slot = _counters.setdefault(name, {"calls": 0})
+    slot["calls"] += 1
+    for key, value in amounts.items():
+        slot[key] = slot.get(key, 0) + value
+
+
+def command_name(argv: List[str]) -> str:
+    """"session_manager context": the script plus its verb, never user text.
+
+    The verb is the first non-flag argument when it looks like one (lowercase
+    word); names, dice expressions and paths are left out so records group.
+    """
+    name = Path(argv[0]).stem if argv else "?"
+    args = [a for a in argv[1:] if not a.startswith("-")]
+    if args and _VERB.fullmatch(args[0]):
+        name += f" {args[0]}"
+    return name
+
+
+def usage_dir() -> Path:
+    """world-state/usage, wherever GM_WORLD_STATE_BASE points the default tree."""
+    from campaign_manager import DEFAULT_WORLD_STATE, resolve_world_state_base
+    return Path(resolve_world_state_base(DEFAULT_WORLD_STATE)) / "usage"
+
+
+def _record(command: str, wall_ms: float, exit_code: int) -> Dict[str, Any]:
+    base = usage_dir().parent
+    try:
+        campaign = (base / "active-campaign.txt").read_text().strip() or None
+    except OSError:
+        campaign = None
+    return {
+        "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "command": command,
+        "campaign": campaign,
+        "exit": exit_code,
+        "wall_ms": round(wall_ms, 3),
+        # Whole-process CPU: unlike wall_ms (main() only) it includes startup
+        # and module imports, which a cold CLI call pays every time.
+        "cpu_ms": round(time.process_time() * 1000, 3),
+        "phases": {k: {"ms": round(v["ms"], 3), "calls": v["calls"]}
+                   for k, v in sorted(_phases.items())},
+        "counters": {k: dict(v) for k, v in sorted(_counters.items())},
+    }
+
+
+def _append(command: str, wall_ms: float, exit_code: int) -> None:
+    """One line, one write: concurrent commands appending never interleave."""
+    try:
+        record = _record(command, wall_ms, exit_code)
+        path = usage_dir() / FILENAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except Exception:
+        pass  # profiling must never fail the command it measures
+
+
+def run(main: Callable[[], Any]) -> Any:
+    """Run a CLI main(); with GM_PROFILE on, record it whatever way it exits."""
+    if not ENABLED:
+        return main()
+    start = time.perf_counter()
+    exit_code = 0
+    try:
+        return main()
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        raise
+    except BaseException:
+        exit_code = 1
+        raise
+    finally:
+        _append(command_name(sys.argv), (time.perf_counter() - start) * 1000, exit_code)
+
+
+# ---- report ----
+
+def load_records(path: Path = None) -> List[Dict[str, Any]]:
+    """Every parseable record in the log (a torn last line is skipped)."""
+    path = path or usage_dir() / FILENAME
+    records = []
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return records
+    for line in lines:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue
+    return records
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of `values` (non-empty)."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def _spread(values: List[float], runs: int) -> Dict[str, float]:
+    """p50/p95 over `runs` runs; a phase or counter absent from a run was zero in it."""
+    values = values + [0] * (runs - len(values))
+    return {"p50": percentile(values, 50), "p95": percentile(values, 95)}
+
+
+def summarize(records: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Per command: runs, wall p50/p95, and p50/p95 of each phase and counter."""
+    by_command: Dict[str, List[Dict[str, Any]]] = {}
+    for r in records:
+        by_command.setdefault(r.get("command", "?"), []).append(r)
+
+    summary = {}
+    for command, runs in sorted(by_command.items()):
+        walls = [r.get("wall_ms", 0.0) for r in runs]
+        cpus = [r.get("cpu_ms", 0.0) for r in runs]
+        phases: Dict[str, List[float]] = {}
+        counters: Dict[str, Dict[str, List[int]]] = {}
+        for r in runs:
+            for name, p in r.get("phases", {}).items():
+                phases.setdefault(name, []).append(p.get("ms", 0.0))
+            for name, c in r.get("counters", {}).items():
+                for key, value in c.items():
+                    counters.setdefault(name, {}).setdefault(key, []).append(value)
+        n = len(runs)
+        summary[command] = {
+            "runs": n,
+            "failed": sum(1 for r in runs if r.get("exit")),
+            "wall_ms": _spread(walls, n),
+            "cpu_ms": _spread(cpus, n),
+            "phases": dict(sorted(((name, _spread(v, n)) for name, v in phases.items()),
+                                  key=lambda kv: -kv[1]["p50"])),
+            "counters": {name: {key: _spread(v, n) for key, v in sorted(keys.items())}
+                         for name, keys in sorted(counters.items())},
+        }
+    return summary
+
+
+def format_report(summary: Dict[str, Dict[str, Any]], top: int = 5) -> str:
+    if not summary:
+        return "No profile records yet. Run commands with GM_PROFILE=1 first."
+    lines = []
+    for command, s in sorted(summary.items(), key=lambda kv: -kv[1]["wall_ms"]["p95"]):
+        failed = f", {s['failed']} failed" if s["failed"] else ""
+        lines.append(f"{command}  ({s['runs']} run{'s' if s['runs'] != 1 else ''}{failed})  "
+                     f"wall p50 {s['wall_ms']['p50']:.1f} ms  p95 {s['wall_ms']['p95']:.1f} ms  "
+                     f"(process cpu p50 {s['cpu_ms']['p50']:.1f} ms)")
+        for name, p in list(s["phases"].items())[:top]:
+            lines.append(f"    {name:<32} p50 {p['p50']:8.1f} ms  p95 {p['p95']:8.1f} ms")
+        for name, keys in s["counters"].items():
+            bits = "  ".join(f"{key} p50 {v['p50']:g} / p95 {v['p95']:g}" for key, v in keys.items())
+            lines.append(f"    {name:<32} {bits}")
+    return "\n".join(lines)
+
+
+def main():
+    import argparse
+    from cli_output import wants_json, strip_json_flag, emit
+
+    json_mode = wants_json()
+    parser = argparse.ArgumentParser(description="GM_PROFILE=1 records and their summary")
+    sub = parser.add_subparsers(dest="action")
+    rep = sub.add_parser("report", help="p50/p95 per command from usage/profile.jsonl")
+    rep.add_argument("--command", help="only commands starting with this")
+    rep.add_argument("--last", type=int, help="only the most recent N records")
+    rep.add_argument("--top", type=int, default=5, help="phases shown per command")
+    sub.add_parser("clear", help="delete the profile log")
+    args = parser.parse_args(strip_json_flag()[1:])
+
+    if args.action == "report":
+        records = load_records()
+        if args.command:
+            records = [r for r in records if r.get("command", "").startswith(args.command)]
+        if args.last:
+            records = records[-args.last:]
+        summary = summarize(records)
+        emit(summary, format_report(summary, args.top), json_mode)
+    elif args.action == "clear":
+        (usage_dir() / FILENAME).unlink(missing_ok=True)
+        emit({"cleared": True}, "[SUCCESS] Profile log cleared", json_mode)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,19 +7,15 @@ It's designed to be siloed and modular - can be excluded without affecting core
 Install dependencies: pip install -e ".[rag]" or uv pip install -e ".[rag]"
 """
 
-# Check for RAG dependencies availability
-RAG_AVAILABLE = False
-_MISSING_DEPS = []
+# Check for RAG dependencies availability without importing them: importing
+# sentence-transformers pulls in torch (seconds), and every `rag.*` import —
+# even the dependency-free coarse index the Loremaster uses — runs this file.
+import importlib
+import importlib.util
 
-try:
-    import sentence_transformers
-except ImportError:
-    _MISSING_DEPS.append("sentence-transformers")
-
-try:
-    import chromadb
-except ImportError:
-    _MISSING_DEPS.append("chromadb")
+_MISSING_DEPS = [dist for dist, module in (("sentence-transformers", "sentence_transformers"),
+                                           ("chromadb", "chromadb"))
+                 if importlib.util.find_spec(module) is None]
 
 # Only mark available if all deps present
 RAG_AVAILABLE = len(_MISSING_DEPS) == 0
@@ -45,32 +41,28 @@ def require_rag():
         )
 
 
-# Conditional exports - only import classes if deps available
+# Conditional exports, resolved on first access (PEP 562) so that
+# `from lib.rag import check_rag_available` does not load the embedder.
+_LAZY_EXPORTS = {
+    'LocalEmbedder': 'embedder',
+    'CampaignVectorStore': 'vector_store',
+    'SemanticChunker': 'semantic_chunker',
+    'RAGExtractor': 'rag_extractor',
+    'EXTRACTION_QUERIES': 'extraction_queries',
+    'get_queries_for_type': 'extraction_queries',
+    'QuoteExtractor': 'quote_extractor',
+}
+
+
+def __getattr__(name):
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None or not RAG_AVAILABLE:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = ['RAG_AVAILABLE', 'check_rag_available', 'get_missing_deps', 'require_rag']
 if RAG_AVAILABLE:
-    from lib.rag.embedder import LocalEmbedder
-    from lib.rag.vector_store import CampaignVectorStore
-    from lib.rag.semantic_chunker import SemanticChunker
-    from lib.rag.rag_extractor import RAGExtractor
-    from lib.rag.extraction_queries import EXTRACTION_QUERIES, get_queries_for_type
-    from lib.rag.quote_extractor import QuoteExtractor
-
-    __all__ = [
-        'RAG_AVAILABLE',
-        'check_rag_available',
-        'get_missing_deps',
-        'require_rag',
-        'LocalEmbedder',
-        'CampaignVectorStore',
-        'SemanticChunker',
-        'RAGExtractor',
-        'EXTRACTION_QUERIES',
-        'get_queries_for_type',
-        'QuoteExtractor',
-    ]
-else:
-    __all__ = [
-        'RAG_AVAILABLE',
-        'check_rag_available',
-        'get_missing_deps',
-        'require_rag',
-    ]
+    __all__ += list(_LAZY_EXPORTS)
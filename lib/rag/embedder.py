@@ -9,9 +9,14 @@ import os
 import sys
 import warnings
 import logging
+from pathlib import Path
 from typing import List, Optional
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import profiling
+
 # Suppress HuggingFace and transformers warnings
 os.environ["HF_HUB_DISABLE_PROGRESS_BARS"] = "1"
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
@@ -70,7 +75,9 @@ class LocalEmbedder:
             Embedding vector as numpy array.
         """
         self._ensure_model()
-        return self._model.encode(text, convert_to_numpy=True)
+        profiling.count("embed.single")
+        with profiling.phase("embed"):
+            return self._model.encode(text, convert_to_numpy=True)
 
     def embed_batch(self, texts: List[str], batch_size: int = 32, show_progress: bool = False) -> np.ndarray:
         """
@@ -85,12 +92,14 @@ class LocalEmbedder:
             Array of embedding vectors (n_texts x embedding_dim).
         """
         self._ensure_model()
-        return self._model.encode(
-            texts,
-            batch_size=batch_size,
-            show_progress_bar=show_progress,
-            convert_to_numpy=True
-        )
+        profiling.count("embed.batch", items=len(texts))
+        with profiling.phase("embed"):
+            return self._model.encode(
+                texts,
+                batch_size=batch_size,
+                show_progress_bar=show_progress,
+                convert_to_numpy=True
+            )
 
     def similarity(self, embedding1: np.ndarray, embedding2: np.ndarray) -> float:
         """
@@ -6,10 +6,15 @@ Uses ChromaDB with persistent storage per campaign.
 """
 
 import os
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import json
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import profiling
+
 
 class CampaignVectorStore:
     """ChromaDB wrapper with campaign-specific persistence."""
@@ -141,13 +146,15 @@ class CampaignVectorStore:
         if hasattr(query_embedding, 'tolist'):
             query_embedding = query_embedding.tolist()
 
-        results = self._collection.query(
-            query_embeddings=[query_embedding],
-            n_results=n_results,
-            where=where,
-            where_document=where_document,
-            include=["documents", "metadatas", "distances"]
-        )
+        profiling.count("vector.query", items=n_results)
+        with profiling.phase("vector.query"):
+            results = self._collection.query(
+                query_embeddings=[query_embedding],
+                n_results=n_results,
+                where=where,
+                where_document=where_document,
+                include=["documents", "metadatas", "distances"]
+            )
 
         # Flatten results (query returns nested lists for batch queries)
         return {
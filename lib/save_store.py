@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Content-addressed blob store behind SessionManager saves.
+
+A save used to be one indented JSON file holding a full copy of every contract
+file, and the Stop hook writes one every turn — so each autosave duplicated the
+whole campaign even though a turn changes two or three files. Saves are now
+small manifests mapping each snapshot key to the SHA-256 of its serialized
+value; the values live once each under saves/blobs/<aa>/<hash>.json.gz.
+
+A stat cache (saves/blobs/stat-cache.json) remembers which digest a source
+file's (mtime, size) produced last time, so an unchanged file costs a stat, not
+a read + serialize + hash. A file modified within `RACY_NS` of the save could
+change again without moving either, so — as git does for its index — such a
+"racily clean" signature is not remembered, and the next save reads it.
+Blobs no manifest references are garbage-collected when autosaves rotate or a
+save is deleted.
+
+saves/index.json (`SaveIndex`) holds each save's listing metadata, size and
+checksum plus a reference count per blob, so listing, lookup, rotation and
+garbage collection never open the save files themselves.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from json_ops import JsonOperations
+
+
+class SaveStore:
+    """Deduplicated, compressed snapshot values keyed by content hash."""
+
+    BLOB_DIR = "blobs"
+    STAT_CACHE = "blobs/stat-cache.json"
+    RACY_NS = 2_000_000_000
+
+    def __init__(self, saves_dir):
+        self.saves_dir = Path(saves_dir)
+        self.blobs_dir = self.saves_dir / self.BLOB_DIR
+        self.json_ops = JsonOperations(str(self.saves_dir))
+        self._stat_cache: Optional[Dict[str, Any]] = None
+
+    # ---------------------------------------------------------------- blobs
+
+    @staticmethod
+    def encode(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blobs_dir / digest[:2] / f"{digest}.json.gz"
+
+    def has(self, digest: str) -> bool:
+        return self._blob_path(digest).is_file()
+
+    def put(self, value: Any) -> str:
+        """Store `value` once; returns its digest. An existing blob is never rewritten."""
+        data = self.encode(value)
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if not path.is_file():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(gzip.compress(data, mtime=0))
+            tmp.replace(path)
+        return digest
+
+    def get(self, digest: str) -> Any:
+        """The value stored under `digest`; raises FileNotFoundError if it is gone."""
+        return json.loads(gzip.decompress(self._blob_path(digest).read_bytes()).decode("utf-8"))
+
+    # ---------------------------------------------------------------- stat cache
+
+    @staticmethod
+    def signature(paths: Iterable[Path]) -> Optional[list]:
+        """(mtime_ns, size) for each source path; None if any is missing."""
+        sig = []
+        for p in paths:
+            try:
+                st = os.stat(p)
+            except OSError:
+                return None
+            sig.append([st.st_mtime_ns, st.st_size])
+        return sig
+
+    def _cache(self) -> Dict[str, Any]:
+        if self._stat_cache is None:
+            self._stat_cache = self.json_ops.load_json(self.STAT_CACHE) or {}
+        return self._stat_cache
+
+    def cached(self, key: str, sig: Optional[list]) -> Optional[str]:
+        """Digest recorded for `key` when its sources had signature `sig`, if still stored."""
+        if sig is None:
+            return None
+        hit = self._cache().get(key)
+        if hit and hit.get("sig") == sig and self.has(hit.get("digest", "")):
+            return hit["digest"]
+        return None
+
+    def remember(self, key: str, sig: Optional[list], digest: str) -> None:
+        """Record `digest` for `key` at `sig`, unless a source is still racily clean."""
+        if sig is None:
+            return
+        now = time.time_ns()
+        if any(now - mtime_ns < self.RACY_NS for mtime_ns, _size in sig):
+            self._cache().pop(key, None)
+            return
+        self._cache()[key] = {"sig": sig, "digest": digest}
+
+    def flush(self) -> None:
+        if self._stat_cache is not None:
+            self.blobs_dir.mkdir(parents=True, exist_ok=True)
+            self.json_ops.save_json(self.STAT_CACHE, self._stat_cache)
+
+    # ---------------------------------------------------------------- gc
+
+    def drop(self, digests: Iterable[str]) -> int:
+        """Delete exactly these blobs (their last reference just went); returns how many."""
+        dead = set(digests)
+        removed = 0
+        for digest in dead:
+            path = self._blob_path(digest)
+            if path.is_file():
+                path.unlink()
+                removed += 1
+        if dead:
+            cache = self._cache()
+            for key in [k for k, v in cache.items() if v.get("digest") in dead]:
+                del cache[key]
+            self.flush()
+        return removed
+
+    def gc(self, live: Set[str]) -> int:
+        """Delete every blob whose digest is not in `live`; returns how many went."""
+        removed = 0
+        if not self.blobs_dir.is_dir():
+            return 0
+        for path in self.blobs_dir.glob("*/*.json.gz"):
+            if path.name[:-len(".json.gz")] not in live:
+                path.unlink()
+                removed += 1
+        cache = self._cache()
+        for key in [k for k, v in cache.items() if v.get("digest") not in live]:
+            del cache[key]
+        self.flush()
+        return removed
+
+
+class SaveIndex:
+    """saves/index.json — save metadata and blob refcounts, kept beside the saves.
+
+    Every create/delete/rotation updates it with one atomic write. It is rebuilt
+    from the save files when missing or unreadable, and `reconcile` picks up
+    saves copied in (or removed) by hand by comparing directory names only.
+    """
+
+    FILENAME = "index.json"
+    VERSION = 1
+
+    def __init__(self, saves_dir, order_key: Callable[[Path], Any] = None):
+        self.saves_dir = Path(saves_dir)
+        self.json_ops = JsonOperations(str(self.saves_dir))
+        # Rebuild order for files the index never saw (default: mtime, name).
+        self.order_key = order_key or (lambda p: (p.stat().st_mtime, p.name))
+        self._data: Optional[Dict[str, Any]] = None
+
+    # ---------------------------------------------------------------- storage
+
+    def _load(self) -> Dict[str, Any]:
+        if self._data is None:
+            data = self.json_ops.load_json(self.FILENAME)
+            if not (isinstance(data, dict) and data.get("version") == self.VERSION
+                    and isinstance(data.get("saves"), dict)):
+                data = self._rebuild()
+            self._data = data
+        return self._data
+
+    def _save(self) -> None:
+        self.saves_dir.mkdir(parents=True, exist_ok=True)
+        self.json_ops.save_json(self.FILENAME, self._data)
+
+    def _save_files(self) -> List[Path]:
+        return [p for p in self.saves_dir.glob("*.json") if p.name != self.FILENAME]
+
+    @staticmethod
+    def _entry(raw: bytes) -> Optional[Dict[str, Any]]:
+        try:
+            save = json.loads(raw.decode("utf-8"))
+        except (ValueError, UnicodeDecodeError):
+            return None
+        if not isinstance(save, dict):
+            return None
+        files = save.get("files")
+        return {
+            "name": save.get("name", "Unknown"),
+            "created": save.get("created", "Unknown"),
+            "session_number": save.get("session_number", "?"),
+            "save_version": save.get("save_version"),
+            "bytes": len(raw),
+            "sha256": hashlib.sha256(raw).hexdigest(),
+            "blobs": sorted(set(files.values())) if isinstance(files, dict) else [],
+        }
+
+    def _insert(self, filename: str, entry: Dict[str, Any]) -> None:
+        data = self._data
+        data["seq"] += 1
+        entry["seq"] = data["seq"]
+        data["saves"][filename] = entry
+        for digest in entry["blobs"]:
+            data["refs"][digest] = data["refs"].get(digest, 0) + 1
+
+    def _rebuild(self) -> Dict[str, Any]:
+        self._data = {"version": self.VERSION, "seq": 0, "saves": {}, "refs": {}}
+        for path in sorted(self._save_files(), key=self.order_key):
+            entry = self._entry(path.read_bytes())
+            if entry is not None:
+                self._insert(path.name, entry)
+        self._save()
+        # A full rescan is also the moment to sweep blobs orphaned by a crash.
+        SaveStore(self.saves_dir).gc(set(self._data["refs"]))
+        return self._data
+
+    # ---------------------------------------------------------------- updates
+
+    def add(self, filename: str, raw: bytes) -> None:
+        """Record a save file just written with contents `raw`."""
+        self._load()
+        self.discard(filename, persist=False)
+        entry = self._entry(raw)
+        if entry is not None:
+            self._insert(filename, entry)
+        self._save()
+
+    def discard(self, filename: str, persist: bool = True) -> List[str]:
+        """Forget a save; returns the blob digests it held the last reference to."""
+        data = self._load()
+        entry = data["saves"].pop(filename, None)
+        dead = []
+        for digest in (entry or {}).get("blobs", []):
+            left = data["refs"].get(digest, 0) - 1
+            if left > 0:
+                data["refs"][digest] = left
+            else:
+                data["refs"].pop(digest, None)
+                dead.append(digest)
+        if entry is not None and persist:
+            self._save()
+        return dead
+
+    def reconcile(self) -> bool:
+        """Sync with the directory listing (names only); True if anything changed.
+
+        Blobs whose only references were hand-removed saves are dropped too.
+        """
+        data = self._load()
+        on_disk = {p.name: p for p in self._save_files()}
+        gone = [f for f in data["saves"] if f not in on_disk]
+        new = sorted((p for f, p in on_disk.items() if f not in data["saves"]), key=self.order_key)
+        dead = []
+        for filename in gone:
+            dead.extend(self.discard(filename, persist=False))
+        for path in new:
+            entry = self._entry(path.read_bytes())
+            if entry is not None:
+                self._insert(path.name, entry)
+        if gone or new:
+            self._save()
+        SaveStore(self.saves_dir).drop(d for d in dead if d not in data["refs"])
+        return bool(gone or new)
+
+    # ---------------------------------------------------------------- reads
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Indexed saves, oldest first, each with its `filename`."""
+        saves = self._load()["saves"]
+        return [dict(e, filename=f) for f, e in sorted(saves.items(), key=lambda kv: kv[1]["seq"])]
+
+    def live_blobs(self) -> Set[str]:
+        return set(self._load()["refs"])
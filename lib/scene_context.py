@@ -17,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from search import WorldSearcher
 from entity_manager import npcs_present
+from presence_index import PresenceIndex
 from cli_output import emit, emit_error
 
 
@@ -42,7 +43,9 @@ class SceneContext:
             "location": location,
             "world": {
                 "location": self.searcher.get_location(location),
-                "npcs_present": npcs_present(npcs, location),
+                "npcs_present": npcs_present(
+                    npcs, location,
+                    PresenceIndex(self.searcher.json_ops.world_state_dir).load()),
             },
             "entities": {},
             "passages": [],
@@ -101,4 +104,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
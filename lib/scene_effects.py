@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Arrival side effects, run concurrently in one process (`move/start --with-effects`).
+
+After a move, gm-session.sh used to run three more processes one after the
+other: the consequence tick, the loremaster's first-visit brief and the RAG
+scene lookup. Each one started Python and resolved the campaign again. All
+three only read the committed move, and each writes a file of its own
+(consequences.json, loremaster-cache.json, locations.json). So they can run
+on a thread pool over one CampaignContext, and a move costs the slowest
+effect instead of the sum of all three.
+
+Each effect's printed lines are captured separately: `sys.stdout` is routed
+per thread while the pool runs. `run_effects` then prints them in the
+wrapper's old order, so the output reads exactly as the sequential version
+did.
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from campaign_context import CampaignContext
+from cli_output import ThreadLocalStdout
+import profiling
+
+
+# ---- effects: (context, location) -> data for --json; human lines are printed ----
+
+def _tick(context: CampaignContext, location: str) -> Dict[str, Any]:
+    """Fire consequences whose triggers match the new scene (gm-consequence.sh tick)."""
+    from consequence_manager import ConsequenceManager, _print_tick_report
+    report = ConsequenceManager(context=context).tick_from_session()
+    print()
+    _print_tick_report(report)
+    return report
+
+
+def _pending(context: CampaignContext, location: str) -> List[Dict[str, Any]]:
+    """The session-start consequence summary (gm-consequence.sh check)."""
+    from consequence_manager import ConsequenceManager, _print_pending
+    pending = ConsequenceManager(context=context).check_pending()
+    print()
+    print("Pending Consequences:")
+    _print_pending(pending)
+    return pending
+
+
+def _lore(context: CampaignContext, location: str) -> Optional[Dict[str, Any]]:
+    """Grounded brief on the first visit to a place the source book covers.
+
+    The loremaster cache gates it, so revisits stay silent and the deep
+    read runs once per location.
+    """
+    from loremaster import BOOK_TEXT_FILES, Loremaster
+    if not any((context.campaign_dir / f).is_file() for f in BOOK_TEXT_FILES):
+        return None
+    if location in (context.json_ops.load_json("loremaster-cache.json") or {}):
+        return None
+    import json
+    brief = Loremaster(context=context).brief_for(location)
+    print()
+    print(f'First visit — grounding in the source (gm-lore.sh "{location}" --full '
+          f'for the whole chapter):')
+    print(json.dumps(brief, indent=2))
+    return brief
+
+
+def _scene(context: CampaignContext, location: str) -> Optional[Dict[str, Any]]:
+    """GM-internal RAG context for the scene (gm-enhance.sh scene); quiet without vectors."""
+    if not location or not (context.campaign_dir / "vectors").is_dir():
+        return None
+    from entity_enhancer import EntityEnhancer, print_scene_context
+    result = EntityEnhancer(context=context).get_scene_context(location)
+    print()
+    print_scene_context(result, location)
+    return result
+
+
+# (name, effect, quiet): a quiet effect's failure is dropped, as the wrapper's
+# `2>/dev/null || true` did for the loremaster.
+Effect = Tuple[str, Callable[[CampaignContext, str], Any], bool]
+
+MOVE_EFFECTS: List[Effect] = [("tick", _tick, False), ("lore", _lore, True),
+                              ("scene", _scene, False)]
+START_EFFECTS: List[Effect] = [("pending", _pending, False), ("scene", _scene, False)]
+
+
+def _run_one(stdout: ThreadLocalStdout, name: str, effect, quiet: bool,
+             context: CampaignContext, location: str) -> Tuple[str, Any]:
+    buffer = stdout.capture()
+    try:
+        with profiling.phase(f"effect.{name}"):
+            data = effect(context, location)
+        return buffer.getvalue(), data
+    except Exception as e:
+        if quiet:
+            return "", None
+        return buffer.getvalue() + f"[ERROR] {name} failed: {e}\n", None
+    finally:
+        stdout.release()
+
+
+def run_effects(effects: List[Effect], context: CampaignContext,
+                location: str) -> List[Tuple[str, str, Any]]:
+    """Run `effects` concurrently; [(name, printed output, data)] in `effects` order."""
+    with ThreadLocalStdout.installed() as stdout:
+        with ThreadPoolExecutor(max_workers=len(effects) or 1,
+                                thread_name_prefix="effect") as pool:
+            futures = [pool.submit(_run_one, stdout, name, effect, quiet, context, location)
+                       for name, effect, quiet in effects]
+            outcomes = [f.result() for f in futures]
+    return [(name, text, data) for (name, _e, _q), (text, data) in zip(effects, outcomes)]
+
+
+def print_effects(outcomes: List[Tuple[str, str, Any]]) -> None:
+    for _name, text, _data in outcomes:
+        sys.stdout.write(text)
+    sys.stdout.flush()
@@ -396,7 +396,9 @@ def validate_world_state(campaign_dir: str) -> Dict[str, List[str]]:
             with open(consequences_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             errors = []
-            for consequence in data.get('active', []) + data.get('resolved', []):
+            from consequence_archive import ConsequenceArchive
+            resolved = data.get('resolved', []) + ConsequenceArchive(campaign_path).read('resolved')
+            for consequence in data.get('active', []) + resolved:
                 valid, errs = validate_consequence(consequence)
                 errors.extend(errs)
             results['consequences.json'] = errors
@@ -486,4 +488,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
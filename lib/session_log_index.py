@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Structured sidecar index for session-log.md.
+
+session-log.md is the canonical, human-edited ledger, but the brief, the
+history command, campaign memory and world stats each re-read the whole log
+and re-split it on "## Session Started:" to answer small questions — how many
+sessions, what the last three summaries were, where we paused. The log only
+grows, so every turn paid for the campaign's entire history.
+
+session-log.idx.json holds one entry per session block: its byte offsets, the
+start and end timestamps, the parsed summary, the cliffhanger and open
+threads, plus running start/end counts. `start_session`/`end_session` append
+through `SessionLogIndex.append`, which re-parses only the last block. Any
+other change to the log (a hand edit, the opening seed, a restore) moves its
+mtime or size, and the next reader rebuilds the index from scratch. As with
+context-cache.json, a log written within RACY_NS of being indexed also
+records a content hash, so a same-size rewrite inside the mtime granularity
+is still caught.
+
+The parsing rules are the ones the readers always used: a block runs from one
+"## Session Started:" marker to the next; its summary is the text after its
+first "### Session Ended:" line up to "---"; the footer lines
+(**Cliffhanger:**, **Open threads:**) are read after its last end marker.
+"""
+
+import hashlib
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from json_ops import JsonOperations
+
+START = "## Session Started:"
+END = "### Session Ended:"
+
+
+def _marker_value(text: str) -> str:
+    """The rest of a marker's line, e.g. the timestamp after 'Session Ended:'."""
+    return text.split("\n", 1)[0].strip()
+
+
+def parse_block(block: str, start: int, end: int, opened: bool) -> Dict[str, Any]:
+    """Index entry for one log block (text after a START marker, or the preamble)."""
+    entry: Dict[str, Any] = {
+        "start": start, "end": end,
+        "started": _marker_value(block) if opened else None,
+        "ended": None, "ends": block.count(END),
+        "summary": "", "recap": "", "cliffhanger": "", "open_threads": "",
+    }
+    if not entry["ends"]:
+        return entry
+    after = block.split(END, 1)[1]
+    entry["ended"] = _marker_value(after)
+    recap, summary = [], []
+    for ln in after.splitlines()[1:]:  # skip the 'Session Ended' timestamp line
+        s = ln.strip()
+        if s == "---":
+            break
+        if s:
+            recap.append(s)
+            if not s.startswith("**"):  # the structured footer lines
+                summary.append(s)
+    entry["recap"] = " ".join(recap)
+    entry["summary"] = " ".join(summary)
+    for ln in block.rsplit(END, 1)[1].splitlines():
+        s = ln.strip()
+        if s.startswith("**Cliffhanger:**"):
+            entry["cliffhanger"] = s.split("**Cliffhanger:**", 1)[1].strip()
+        elif s.startswith("**Open threads:**"):
+            entry["open_threads"] = s.split("**Open threads:**", 1)[1].strip()
+    return entry
+
+
+def parse_log(data: bytes, base: int = 0) -> List[Dict[str, Any]]:
+    """Entries for every block in `data` (which begins at byte `base` of the log).
+
+    The preamble before the first START marker only gets an entry when it
+    holds an end marker, as the old split-based readers counted it.
+    """
+    marker = START.encode("utf-8")
+    cuts = []
+    pos = data.find(marker)
+    while pos != -1:
+        cuts.append(pos)
+        pos = data.find(marker, pos + len(marker))
+    entries = []
+    bounds = [0] + cuts + [len(data)]
+    for i in range(len(bounds) - 1):
+        lo, hi = bounds[i], bounds[i + 1]
+        opened = i > 0
+        body = data[lo + len(marker) if opened else lo:hi].decode("utf-8", errors="replace")
+        if not opened and (lo == hi or END not in body):
+            continue
+        entries.append(parse_block(body, base + lo, base + hi, opened))
+    return entries
+
+
+class SessionLogIndex:
+    """session-log.idx.json: per-session offsets, timestamps and parsed footer."""
+
+    FILENAME = "session-log.idx.json"
+    LOG = "session-log.md"
+    VERSION = 1
+    RACY_NS = 2_000_000_000
+
+    def __init__(self, campaign_dir):
+        self.campaign_dir = Path(campaign_dir)
+        self.log_path = self.campaign_dir / self.LOG
+        self.json_ops = JsonOperations(str(self.campaign_dir))
+
+    # ---------------------------------------------------------------- freshness
+
+    def _stat(self) -> Optional[os.stat_result]:
+        try:
+            return os.stat(self.log_path)
+        except OSError:
+            return None
+
+    def _signature(self, st: os.stat_result, data: bytes = None) -> Dict[str, Any]:
+        now = time.time_ns()
+        sig = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "indexed_ns": now}
+        if now - st.st_mtime_ns < self.RACY_NS:
+            if data is None:
+                data = self.log_path.read_bytes()
+            sig["sha1"] = hashlib.sha1(data).hexdigest()
+        return sig
+
+    def _fresh(self, index: Dict[str, Any], st: os.stat_result) -> bool:
+        if not (isinstance(index, dict) and index.get("version") == self.VERSION):
+            return False
+        sig = index.get("log") or {}
+        if sig.get("mtime_ns") != st.st_mtime_ns or sig.get("size") != st.st_size:
+            return False
+        if "sha1" in sig:
+            # Racily clean when indexed: stat alone cannot vouch for it.
+            try:
+                return hashlib.sha1(self.log_path.read_bytes()).hexdigest() == sig["sha1"]
+            except OSError:
+                return False
+        return True
+
+    @staticmethod
+    def _empty() -> Dict[str, Any]:
+        return {"counts": {"started": 0, "ended": 0}, "sessions": []}
+
+    def _store(self, sessions: List[Dict[str, Any]], sig: Dict[str, Any],
+               persist: bool = True) -> Dict[str, Any]:
+        index = {
+            "version": self.VERSION,
+            "log": sig,
+            "counts": {
+                "started": sum(1 for s in sessions if s["started"] is not None),
+                "ended": sum(s["ends"] for s in sessions),
+            },
+            "sessions": sessions,
+        }
+        if persist:
+            self.json_ops.save_json(self.FILENAME, index)
+        return index
+
+    def rebuild(self, persist: bool = True) -> Dict[str, Any]:
+        """Re-index the whole log (after an out-of-band edit, or on first use)."""
+        st = self._stat()
+        if st is None:
+            return self._empty()
+        data = self.log_path.read_bytes()  # stat first: a racing write re-indexes next time
+        return self._store(parse_log(data), self._signature(st, data), persist)
+
+    def load(self, persist: bool = True) -> Dict[str, Any]:
+        """The index, rebuilt first if session-log.md changed behind its back.
+
+        Read-only callers (world stats, which gm-reset's preview runs) pass
+        persist=False: a stale index is rebuilt in memory but not written.
+        """
+        st = self._stat()
+        if st is None:
+            return self._empty()
+        index = self.json_ops.load_json(self.FILENAME)
+        if self._fresh(index, st):
+            return index
+        return self.rebuild(persist)
+
+    # ---------------------------------------------------------------- writes
+
+    def append(self, text: str) -> Dict[str, Any]:
+        """Append `text` to the log and re-index only the block it lands in."""
+        index = self.load()
+        sessions = list(index["sessions"])
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(text)
+        # Only the last block can have changed; earlier ones are untouched.
+        tail = sessions.pop()["start"] if sessions and sessions[-1]["started"] is not None else 0
+        if tail == 0:
+            sessions = []
+        st = os.stat(self.log_path)
+        with open(self.log_path, "rb") as f:
+            f.seek(tail)
+            data = f.read()
+        return self._store(sessions + parse_log(data, base=tail), self._signature(st))
+
+    # ---------------------------------------------------------------- reads
+
+    def session_number(self, index: Dict[str, Any] = None) -> int:
+        """Completed sessions, plus 1 if one is open now."""
+        counts = (index or self.load())["counts"]
+        return counts["ended"] + (1 if counts["started"] > counts["ended"] else 0)
+
+    def ended_sessions(self, index: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Entries of blocks with an end marker and a non-empty recap, oldest first."""
+        return [s for s in (index or self.load())["sessions"] if s["ends"] and s["recap"]]
+
+    def latest_meta(self, index: Dict[str, Any] = None) -> Dict[str, str]:
+        """{'cliffhanger', 'open_threads'} from the most recently ended session."""
+        for s in reversed((index or self.load())["sessions"]):
+            if s["ends"]:
+                return {"cliffhanger": s["cliffhanger"], "open_threads": s["open_threads"]}
+        return {"cliffhanger": "", "open_threads": ""}
+
+    def tail(self, blocks: int) -> str:
+        """Log text from the start of the line opening the last `blocks` sessions.
+
+        Seeks past everything older instead of reading the whole log.
+        """
+        opened = [s for s in self.load()["sessions"] if s["started"] is not None]
+        offset = opened[-blocks]["start"] if 0 < blocks < len(opened) else 0
+        try:
+            with open(self.log_path, "rb") as f:
+                if offset:
+                    f.seek(max(0, offset - 4096))
+                    lead = f.read(offset - f.tell())
+                    offset -= len(lead) - (lead.rfind(b"\n") + 1)
+                f.seek(offset)
+                return f.read().decode("utf-8", errors="replace")
+        except OSError:
+            return ""
@@ -4,11 +4,12 @@ Session management module for GM tools
 Handles session lifecycle, party movement, and JSON-based saves
 """
 
+import hashlib
 import json
 import os
 import re
 import sys
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -16,9 +17,22 @@ from datetime import datetime, timezone
 sys.path.insert(0, str(Path(__file__).parent))
 
 from entity_manager import EntityManager, npcs_present
+from campaign_context import CampaignContext
+from consequence_archive import ConsequenceArchive
+from campaign_snapshot import CampaignSnapshot
+from context_cache import BriefLedger, ContextCache
+from session_log_index import SessionLogIndex
 from character_schema import to_flat
 from schemas import PLOT_TYPE_SORT
 from world_kit import WorldKit
+import hud
+import profiling
+
+if TYPE_CHECKING:
+    from save_store import SaveIndex
+
+# Seconds `session start` waits for an owed autosave before starting without it.
+AUTOSAVE_START_WAIT = 10.0
 
 
 class SessionManager(EntityManager):
@@ -34,7 +48,8 @@ class SessionManager(EntityManager):
     DEFAULT_PREFERENCES = {"action_menu": True, "player_rolls": False,
                            "beat_length": "adaptive", "rag_inspiration": True}
 
-    SAVE_VERSION = 1
+    # 2 = manifest of content hashes into saves/blobs (SaveStore); 1 = inline snapshot.
+    SAVE_VERSION = 2
     AUTOSAVE_KEEP = 3
 
     # Live campaign files snapshotted when present. character.json is captured
@@ -51,6 +66,7 @@ class SessionManager(EntityManager):
         "ruleset.json",
         "world-bible.json",
         "threat-clocks.json",
+        "time-schedule.json",
         "campaign-memory.json",
         "chronicler.json",
         "world-tick-log.json",
@@ -73,8 +89,8 @@ class SessionManager(EntityManager):
     }
     _AUTOSAVE_FILE = re.compile(r"^\d{8}-\d{6}-autosave(?:-\d+)?\.json$")
 
-    def __init__(self, world_state_dir: str = None):
-        super().__init__(world_state_dir)
+    def __init__(self, world_state_dir: str = None, context: CampaignContext = None):
+        super().__init__(world_state_dir, context)
 
         # Additional paths specific to session management
         self._wsd = world_state_dir  # passed through to sibling managers (CampaignMemory)
@@ -85,6 +101,7 @@ class SessionManager(EntityManager):
         # Core files
         self.campaign_file = "campaign-overview.json"
         self.session_log = self.campaign_dir / "session-log.md"
+        self.log_index = SessionLogIndex(self.campaign_dir)
 
         # Character file (single character per campaign)
         self.character_file = self.campaign_dir / "character.json"
@@ -99,9 +116,9 @@ class SessionManager(EntityManager):
 
     # ==================== Play-Style Preferences ====================
 
-    def get_preferences(self) -> Dict[str, Any]:
+    def get_preferences(self, snap: CampaignSnapshot = None) -> Dict[str, Any]:
         """Return play-style preferences, defaults merged with any saved overrides."""
-        campaign = self.json_ops.load_json(self.campaign_file) or {}
+        campaign = snap.campaign if snap else (self.json_ops.load_json(self.campaign_file) or {})
         prefs = dict(self.DEFAULT_PREFERENCES)
         saved = campaign.get("preferences")
         if isinstance(saved, dict):
@@ -140,8 +157,7 @@ class SessionManager(EntityManager):
         }
 
         # Log session start
-        with open(self.session_log, 'a') as f:
-            f.write(f"## Session Started: {summary['timestamp']}\n\n")
+        self.log_index.append(f"## Session Started: {summary['timestamp']}\n\n")
 
         print(f"[SUCCESS] Session started at {summary['timestamp']}")
         return summary
@@ -163,16 +179,14 @@ class SessionManager(EntityManager):
         location = pos.get('current_location', 'Unknown') if isinstance(pos, dict) else 'Unknown'
         threads_str = '; '.join(open_threads) if open_threads else ''
 
-        with open(self.session_log, 'a') as f:
-            f.write(f"### Session Ended: {timestamp}\n")
-            f.write(f"{summary}\n\n")
-            f.write(f"**Session:** {session_num}\n")
-            f.write(f"**Location:** {location}\n")
-            if cliffhanger:
-                f.write(f"**Cliffhanger:** {cliffhanger}\n")
-            if threads_str:
-                f.write(f"**Open threads:** {threads_str}\n")
-            f.write("\n---\n\n")
+        block = [f"### Session Ended: {timestamp}\n", f"{summary}\n\n",
+                 f"**Session:** {session_num}\n", f"**Location:** {location}\n"]
+        if cliffhanger:
+            block.append(f"**Cliffhanger:** {cliffhanger}\n")
+        if threads_str:
+            block.append(f"**Open threads:** {threads_str}\n")
+        block.append("\n---\n\n")
+        self.log_index.append("".join(block))
 
         print(f"[SUCCESS] Session {session_num} ended and logged")
 
@@ -194,11 +208,13 @@ class SessionManager(EntityManager):
         ponytail: NPC canon-drift is not here yet — the re-grounding pass adds it.
         """
         plots = self.json_ops.load_json("plots.json") or {}
-        clocks = self.json_ops.load_json("threat-clocks.json") or {}
+        from threat_clocks import clocks_at
+        clocks = clocks_at(self.json_ops.load_json("threat-clocks.json") or {},
+                           (self.json_ops.load_json("time-schedule.json") or {}).get("now", 0))
         consequences = self.json_ops.load_json("consequences.json") or {}
         try:
             from npc_manager import NPCManager
-            stale = NPCManager().stale_npcs()
+            stale = NPCManager(self._wsd, context=self.context).stale_npcs()
         except Exception:
             stale = {}
         return self._health_summary(self._get_session_number(), plots, clocks,
@@ -369,6 +385,7 @@ class SessionManager(EntityManager):
             char_data = to_flat(self.json_ops.load_json("character.json"))
             char_data['current_location'] = location
             self.json_ops.save_json("character.json", char_data)
+        hud.refresh(self.campaign_dir)
 
         result = {
             "previous_location": old_location,
@@ -382,7 +399,7 @@ class SessionManager(EntityManager):
 
     def create_save(self, name: str) -> str:
         """
-        Create a named save point (JSON snapshot)
+        Create a named save point (manifest of content-addressed snapshot blobs)
         Returns the save filename
         """
         safe_name = name.lower().replace(' ', '-')
@@ -393,12 +410,12 @@ class SessionManager(EntityManager):
             "name": name,
             "created": datetime.now(timezone.utc).isoformat(),
             "session_number": self._get_session_number(),
-            "snapshot": self._build_snapshot(),
+            "files": self._store_snapshot(),
         }
 
-        save_path = self.saves_dir / filename
-        with open(save_path, 'w', encoding='utf-8') as f:
-            json.dump(save_data, f, indent=2, ensure_ascii=False)
+        raw = json.dumps(save_data, indent=2, ensure_ascii=False).encode('utf-8')
+        (self.saves_dir / filename).write_bytes(raw)
+        self._save_index().add(filename, raw)
 
         if safe_name == "autosave":
             self._rotate_autosaves()
@@ -406,22 +423,39 @@ class SessionManager(EntityManager):
         print(f"[SUCCESS] Save created: {filename}")
         return filename
 
+    def load_save(self, name: str) -> Optional[Dict[str, Any]]:
+        """Load a save with its `snapshot` materialized, whatever its version.
+
+        Version 2 saves reference blobs by digest; version 1 and legacy saves
+        carry the snapshot inline. Raises ValueError/IOError on a damaged save
+        (unreadable manifest or a missing blob); None if no save matches.
+        """
+        save_file = self._find_save(name)
+        if not save_file:
+            return None
+        with open(save_file, 'r', encoding='utf-8') as f:
+            save_data = json.load(f)
+        files = save_data.get("files")
+        if isinstance(files, dict):
+            from save_store import SaveStore
+            store = SaveStore(self.saves_dir)
+            save_data["snapshot"] = {key: store.get(digest) for key, digest in files.items()}
+        save_data["filename"] = save_file.name
+        return save_data
+
     def restore_save(self, name: str) -> bool:
         """
         Restore from a save point
         Name can be full filename or partial match
         """
-        save_file = self._find_save(name)
-        if not save_file:
-            print(f"[ERROR] Save point '{name}' not found")
-            return False
-
         try:
-            with open(save_file, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            save_data = self.load_save(name)
         except (json.JSONDecodeError, IOError) as e:
             print(f"[ERROR] Failed to load save: {e}")
             return False
+        if save_data is None:
+            print(f"[ERROR] Save point '{name}' not found")
+            return False
 
         snapshot = save_data.get('snapshot', {})
         if not isinstance(snapshot, dict):
@@ -434,29 +468,84 @@ class SessionManager(EntityManager):
 
         for key, value in snapshot.items():
             self._restore_snapshot_entry(key, value)
+        hud.refresh(self.campaign_dir)
 
-        print(f"[SUCCESS] Restored from save: {save_file.name}")
+        print(f"[SUCCESS] Restored from save: {save_data['filename']}")
         return True
 
-    def _build_snapshot(self) -> Dict[str, Any]:
-        """Snapshot every live stateful campaign file; omit missing ones."""
-        snapshot = {}
+    def _snapshot_sources(self) -> List[tuple]:
+        """(key, source paths, loader) for every live stateful campaign file.
+
+        Missing files are omitted. The paths are what the save store stats to
+        decide whether a key's last blob can be reused without loading it.
+        """
+        sources = []
         for filename in self.SNAPSHOT_JSON_FILES:
-            if (self.campaign_dir / filename).is_file():
-                snapshot[filename] = self.json_ops.load_json(filename)
+            path = self.campaign_dir / filename
+            if not path.is_file():
+                continue
+            paths = [path]
+            if filename == "consequences.json":
+                archive = ConsequenceArchive(self.campaign_dir)
+                manifest = self.campaign_dir / archive.MANIFEST
+                if manifest.is_file():
+                    paths.append(manifest)
+                # Resolved + provenance live in the append-only archive; a save
+                # carries them inline so a snapshot stays self-contained.
+                sources.append((filename, paths, lambda a=archive, f=filename:
+                                a.expand(self.json_ops.load_json(f))))
+            else:
+                sources.append((filename, paths, lambda f=filename: self.json_ops.load_json(f)))
         for filename in self.SNAPSHOT_TEXT_FILES:
             path = self.campaign_dir / filename
             if path.is_file():
-                snapshot[filename] = path.read_text(encoding="utf-8")
-        characters = self._load_all_characters()
-        if characters:
-            snapshot["characters"] = characters
+                sources.append((filename, [path],
+                                lambda p=path: p.read_text(encoding="utf-8")))
+        if self.character_file.exists():
+            sources.append(("characters", [self.character_file], self._load_all_characters))
         fallen_dir = self.campaign_dir / "fallen"
         if fallen_dir.is_dir():
             for fallen_file in sorted(fallen_dir.glob("*.json")):
                 rel = f"fallen/{fallen_file.name}"
-                snapshot[rel] = self.json_ops.load_json(rel)
-        return snapshot
+                sources.append((rel, [fallen_file], lambda r=rel: self.json_ops.load_json(r)))
+        return sources
+
+    def _build_snapshot(self) -> Dict[str, Any]:
+        """Snapshot every live stateful campaign file; omit missing ones."""
+        return {key: load() for key, _paths, load in self._snapshot_sources()}
+
+    def _store_snapshot(self) -> Dict[str, str]:
+        """Write the snapshot into the blob store; returns {key: digest}.
+
+        A key whose source files still have the (mtime, size) seen last time
+        reuses that digest without being read, so an autosave costs roughly
+        the size of what changed since the previous save.
+        """
+        from save_store import SaveStore
+        store = SaveStore(self.saves_dir)
+        files = {}
+        for key, paths, load in self._snapshot_sources():
+            sig = store.signature(paths)
+            digest = store.cached(key, sig)
+            if digest is None:
+                digest = store.put(load())
+                store.remember(key, sig, digest)
+            files[key] = digest
+        store.flush()
+        return files
+
+    def _save_index(self) -> "SaveIndex":
+        """saves/index.json, rebuilt in autosave rotation order if missing."""
+        from save_store import SaveIndex
+        return SaveIndex(self.saves_dir, order_key=lambda p: (p.stat().st_mtime,
+                                                              self._autosave_seq(p.name)))
+
+    def _drop_save(self, save_file: Path, index: "SaveIndex" = None) -> None:
+        """Unlink a save, unindex it, and delete the blobs only it referenced."""
+        from save_store import SaveStore
+        index = index or self._save_index()
+        save_file.unlink()
+        SaveStore(self.saves_dir).drop(index.discard(save_file.name))
 
     def _restore_snapshot_entry(self, key: str, value: Any) -> None:
         """Restore one snapshot key. Legacy underscored names still apply."""
@@ -465,7 +554,9 @@ class SessionManager(EntityManager):
                 self._restore_characters(value)
             return
         if key in self.LEGACY_SNAPSHOT_KEYS:
-            self.json_ops.save_json(self.LEGACY_SNAPSHOT_KEYS[key], value)
+            key = self.LEGACY_SNAPSHOT_KEYS[key]
+        if key == "consequences.json":
+            self._restore_consequences(value)
             return
         if key in self.SNAPSHOT_TEXT_FILES:
             text = value if isinstance(value, str) else ""
@@ -477,6 +568,15 @@ class SessionManager(EntityManager):
             dest.parent.mkdir(parents=True, exist_ok=True)
             self.json_ops.save_json(key, value)
 
+    def _restore_consequences(self, value: Any) -> None:
+        """Replace consequences.json and its archive with the saved history."""
+        archive = ConsequenceArchive(self.campaign_dir)
+        archive.clear()
+        if isinstance(value, dict):
+            value = dict(value)
+            archive.absorb(value)
+        self.json_ops.save_json("consequences.json", value)
+
     def _uncovered_contract_files(self, snapshot: Dict[str, Any]) -> List[str]:
         """Contract files this snapshot has no key for (legacy partial restores)."""
         covered = set()
@@ -509,38 +609,33 @@ class SessionManager(EntityManager):
             return 0
         return int(match.group(1) or 1)
 
-    def _autosave_files(self) -> List[Path]:
-        """Autosave snapshots, oldest first (mtime, then same-second sequence)."""
-        found = [p for p in self.saves_dir.glob("*.json")
-                 if self._AUTOSAVE_FILE.match(p.name)]
-        found.sort(key=lambda p: (p.stat().st_mtime, self._autosave_seq(p.name)))
-        return found
+    def _autosave_files(self, index: "SaveIndex" = None) -> List[Path]:
+        """Autosave snapshots, oldest first (index order: creation, then same-second sequence)."""
+        index = index or self._save_index()
+        return [self.saves_dir / e["filename"] for e in index.entries()
+                if self._AUTOSAVE_FILE.match(e["filename"])]
 
     def _rotate_autosaves(self) -> None:
         """Keep at most AUTOSAVE_KEEP autosave snapshots; named saves untouched."""
-        autosaves = self._autosave_files()
+        index = self._save_index()
+        autosaves = self._autosave_files(index)
         while len(autosaves) > self.AUTOSAVE_KEEP:
-            oldest = autosaves.pop(0)
-            oldest.unlink()
+            self._drop_save(autosaves.pop(0), index)
 
     def list_saves(self) -> List[Dict[str, Any]]:
         """
-        List all save points
+        List all save points (from saves/index.json; no save file is parsed)
         """
-        import json
-        saves = []
-        for save_file in sorted(self.saves_dir.glob("*.json"), reverse=True):
-            try:
-                with open(save_file, 'r', encoding='utf-8') as f:
-                    save_data = json.load(f)
-                saves.append({
-                    "filename": save_file.name,
-                    "name": save_data.get("name", "Unknown"),
-                    "created": save_data.get("created", "Unknown"),
-                    "session_number": save_data.get("session_number", "?")
-                })
-            except (json.JSONDecodeError, IOError):
-                continue
+        index = self._save_index()
+        index.reconcile()
+        saves = [{
+            "filename": e["filename"],
+            "name": e["name"],
+            "created": e["created"],
+            "session_number": e["session_number"],
+            "bytes": e["bytes"],
+        } for e in index.entries()]
+        saves.sort(key=lambda e: e["filename"], reverse=True)
         return saves
 
     def delete_save(self, name: str) -> bool:
@@ -552,7 +647,7 @@ class SessionManager(EntityManager):
             print(f"[ERROR] Save point '{name}' not found")
             return False
 
-        save_file.unlink()
+        self._drop_save(save_file)
         print(f"[SUCCESS] Deleted save: {save_file.name}")
         return True
 
@@ -563,7 +658,9 @@ class SessionManager(EntityManager):
         if not self.session_log.exists():
             return []
 
-        content = self.session_log.read_text()
+        # Every session block opens with a marker line, so the last 10 entries
+        # all lie within the last 10 blocks: seek there instead of reading it all.
+        content = self.log_index.tail(10)
         lines = content.split('\n')
 
         # Extract session entries
@@ -589,58 +686,258 @@ class SessionManager(EntityManager):
             return None
         return f"+{hidden} more {noun} — {hint}"
 
-    def get_full_context(self, full: bool = False) -> str:
+    # The brief, in print order: (section name, renderer, input files). Every
+    # renderer takes the build's CampaignSnapshot and `full`, and returns its own
+    # lines — including the blank line that separates it from the section before.
+    # The input files are what the render cache (ContextCache) checks: a section
+    # is re-rendered only when one of them changed, so list everything it reads,
+    # including what WorldKit (ruleset.json, overview) and CampaignMemory
+    # (campaign-memory.json, session-log.md, facts.json) read on its behalf.
+    _KIT_FILES = ("ruleset.json", "campaign-overview.json")
+    _MEMORY_FILES = ("campaign-memory.json", "session-log.md", "facts.json",
+                     "npcs.json", "campaign-overview.json")
+    CONTEXT_SECTIONS = (
+        ("header", "_ctx_header", ("campaign-overview.json", "session-log.md")),
+        ("kit", "_ctx_kit", _KIT_FILES),
+        ("primer", "_ctx_primer", ("campaign-overview.json",)),
+        ("play_style", "_ctx_play_style", ("campaign-overview.json", "chronicler.json")),
+        ("narrative_voice", "_ctx_narrative_voice", ("world-bible.json",)),
+        ("world_index", "_ctx_world_index", ("world-bible.json",)),
+        ("previously_on", "_ctx_previously_on", ("session-log.md",)),
+        ("world_remembers", "_ctx_world_remembers", _MEMORY_FILES),
+        ("story_threads", "_ctx_story_threads", ("plots.json",)),
+        ("ready_threads", "_ctx_ready_threads",
+         ("plots.json", "npcs.json", "threat-clocks.json", "time-schedule.json",
+          "campaign-overview.json")),
+        ("key_facts", "_ctx_key_facts", ("facts.json",)),
+        ("threat_clocks", "_ctx_threat_clocks", ("threat-clocks.json", "time-schedule.json")),
+        ("character", "_ctx_character", ("character.json",)),
+        ("party", "_ctx_party", ("npcs.json",)),
+        ("npc_voices", "_ctx_npc_voices", _MEMORY_FILES),
+        ("pending_consequences", "_ctx_pending_consequences", ("consequences.json",)),
+        ("world_rules", "_ctx_world_rules", _KIT_FILES),
+        ("signature_systems", "_ctx_signature_systems", _KIT_FILES),
+    )
+    # `context --budget N`: (weight, item pattern, remainder noun, hint, newest
+    # last) per section — see lib/brief_budget.py. Weight None always prints;
+    # a None pattern makes the whole section one item.
+    CONTEXT_BUDGET = {
+        "header": (None, None, None, None, False),
+        "kit": (4, None, None, None, False),
+        "primer": (6, None, None, None, False),
+        "play_style": (None, None, None, None, False),
+        "narrative_voice": (7, None, None, None, False),
+        "world_index": (3, r"\S", "index groups", "--full", False),
+        "previously_on": (9, r"- ", "sessions", "--full or session-log.md", True),
+        "world_remembers": (6, r"- ", "remembered entries", "--full or gm-recall.sh", False),
+        "story_threads": (7, r"\[", "threads", "gm-plot.sh threads for all", False),
+        "ready_threads": (8, r"\S", "ready threads", "--full", False),
+        "key_facts": (5, r"- ", "facts", "--full or gm-note.sh list", False),
+        "threat_clocks": (8, r"\S", "threat clocks", "--full", False),
+        "character": (None, None, None, None, False),
+        "party": (6, r"\S", "party members", "--full", False),
+        "npc_voices": (7, r"\S", "NPC voices", "--full", False),
+        "pending_consequences": (7, r"\[", "pending consequences",
+                                 "--full or gm-consequence.sh check", False),
+        "world_rules": (4, r"- ", "rules", "--full", False),
+        "signature_systems": (5, r"- ", "signature systems", "--full", False),
+    }
+    # Environment a section reads; its presence is part of the cache key.
+    CONTEXT_ENV = {"play_style": ("OPENAI_API_KEY",)}
+    # Renderer code: an upgrade invalidates every cached section.
+    CONTEXT_CODE = tuple(Path(__file__).parent / f for f in (
+        "session_manager.py", "campaign_snapshot.py", "world_kit.py",
+        "play_pack.py", "campaign_memory.py", "character_schema.py",
+        "session_log_index.py", "mention_index.py", "presence_index.py"))
+
+    def snapshot(self) -> CampaignSnapshot:
+        """A fresh load-once view of this campaign for one read-only build."""
+        return CampaignSnapshot(self.campaign_dir, self.json_ops)
+
+    def _render_sections(self, full: bool = False, use_cache: bool = True,
+                         budget: int = None) -> List[tuple]:
+        """[(section name, lines)] in print order, through the render cache.
+
+        With `budget`, every section is rendered in full and `fit_brief` keeps
+        what fits that many tokens (plus a closing "budget" section).
+        """
+        if budget is not None:
+            from brief_budget import fit_brief
+            return fit_brief(self._render_sections(True, use_cache), budget,
+                             self.CONTEXT_BUDGET)
+        snap = self.snapshot()
+        cache = ContextCache(self.campaign_dir) if use_cache else None
+        mode = 'full' if full else 'compact'
+        # Sign every section's inputs before any is read, so a write landing
+        # mid-build can only cause a miss next time, never a stale hit.
+        sigs = {}
+        with profiling.phase("context.signatures"):
+            for name, _renderer, deps in self.CONTEXT_SECTIONS if cache is not None else ():
+                env = [bool(os.environ.get(v)) for v in self.CONTEXT_ENV.get(name, ())]
+                sigs[name] = cache.signature(
+                    [self.campaign_dir / d for d in deps] + list(self.CONTEXT_CODE),
+                    extra=env or None)
+        sections = []
+        for name, renderer, _deps in self.CONTEXT_SECTIONS:
+            out = cache.get(f"{name}:{mode}", sigs[name]) if cache is not None else None
+            if out is None:
+                with profiling.phase(f"context.{name}"):
+                    out = getattr(self, renderer)(snap, full)
+                if cache is not None:
+                    cache.put(f"{name}:{mode}", sigs[name], out)
+            sections.append((name, out))
+        if cache is not None:
+            with profiling.phase("context.cache_flush"):
+                cache.flush()
+            if os.environ.get('DM_DEBUG_CONTEXT'):
+                hits = sum(1 for v in cache.last_build.values() if v == "hit")
+                print(f"[context] cache: {hits}/{len(cache.last_build)} sections reused",
+                      file=sys.stderr)
+        return sections
+
+    @staticmethod
+    def _debug_context_size(context: str) -> None:
+        # Token observability: soft ~2k-token target is GUIDANCE only, never a hard
+        # cut. Opt in with DM_DEBUG_CONTEXT=1 to watch the budget without altering output.
+        if os.environ.get('DM_DEBUG_CONTEXT'):
+            approx_tokens = len(context) // 4
+            print(f"[context] ~{approx_tokens} tokens ({len(context)} chars)", file=sys.stderr)
+
+    def get_full_context(self, full: bool = False, use_cache: bool = True,
+                         budget: int = None) -> str:
         """
         Aggregate all session state into a single readable output.
         Replaces the 5-step startup checklist with one command.
+
+        Sections whose input files are unchanged since the last build come from
+        the render cache (context-cache.json); `use_cache=False` renders all.
+        `budget` fits the brief to about that many tokens instead of the fixed
+        compact/full cuts.
         """
-        lines = []
+        context = "\n".join(line for _name, out in self._render_sections(full, use_cache, budget)
+                            for line in out)
+        self._debug_context_size(context)
+        return context
 
-        # --- Campaign header ---
-        campaign = self.json_ops.load_json(self.campaign_file) or {}
+    def get_context_delta(self, full: bool = False, since: str = None,
+                          use_cache: bool = True, budget: int = None) -> Dict[str, Any]:
+        """The brief plus a version token; with `since`, only what changed.
+
+        Every call records per-section fingerprints (context-briefs.json) under a
+        new opaque token. Given an earlier token of the same mode, the returned
+        `context` carries only changed sections, then one line naming sections
+        that went empty and one naming those unchanged — the GM already has them.
+        An unknown or expired token yields the full brief. Budgeted briefs are
+        their own mode per budget.
+        """
+        mode = f'budget-{budget}' if budget is not None else 'full' if full else 'compact'
+        sections = self._render_sections(full, use_cache, budget)
+        ledger = BriefLedger(self.campaign_dir)
+        fingerprints = {name: ledger.fingerprint(out) for name, out in sections}
+        previous = ledger.get(since, mode) if since else None
+        token = ledger.record(mode, fingerprints)
+
+        result = {"token": token, "since": since, "delta": previous is not None,
+                  "changed": [], "cleared": [], "unchanged": []}
+        if previous is None:
+            lines = [line for _name, out in sections for line in out]
+            if since:
+                lines.insert(1, f"(context token {since} unknown or expired — full brief)")
+            result["changed"] = [name for name, out in sections if out]
+        else:
+            empty = ledger.fingerprint([])
+            lines = [f"=== SESSION CONTEXT — CHANGES SINCE {since} ==="]
+            for name, out in sections:
+                if fingerprints[name] == previous.get(name, empty):
+                    if out:
+                        result["unchanged"].append(name)
+                elif out:
+                    result["changed"].append(name)
+                    # The header's own banner is replaced by the delta banner above.
+                    lines.extend(out[1:] if name == "header" else out)
+                else:
+                    result["cleared"].append(name)
+            if not result["changed"]:
+                lines.append("No changes.")
+            lines.append("")
+            if result["cleared"]:
+                lines.append("Cleared (nothing to show now): " + ", ".join(
+                    n.replace("_", " ") for n in result["cleared"]))
+            if result["unchanged"]:
+                lines.append("Unchanged (still as last shown): " + ", ".join(
+                    n.replace("_", " ") for n in result["unchanged"]))
+        result["context"] = "\n".join(lines)
+        self._debug_context_size(result["context"])
+        return result
+
+    # ---- shared per-build views (computed once per snapshot) ----
+
+    def _ctx_kit_handle(self, snap: CampaignSnapshot):
+        """The campaign's WorldKit, or None when there is none."""
+        def build():
+            try:
+                kit = WorldKit(context=self.context)
+                return None if kit.campaign_dir is None else kit
+            except Exception:
+                return None
+        return snap.derive("kit", build)
+
+    def _ctx_summaries(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        """The PREVIOUSLY ON summaries actually shown (also the de-dup set below it)."""
+        all_summaries = self._recent_session_summaries(n=None, snap=snap)
+        return all_summaries if full else all_summaries[-3:]
+
+    def _ctx_remembered(self, snap: CampaignSnapshot, full: bool):
+        """(entries, open_debts, held_back) for THE WORLD REMEMBERS, once per build."""
+        return snap.derive(f"remembered:{full}", lambda: self._world_remembers(
+            snap.location, full=full, already_shown=self._ctx_summaries(snap, full),
+            snap=snap))
+
+    # ---- section renderers ----
+
+    def _ctx_header(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        campaign = snap.campaign
         campaign_name = campaign.get('name', campaign.get('campaign_name', 'Unknown Campaign'))
-        session_num = self._get_session_number()
-        location = campaign.get('player_position', {}).get('current_location', 'Unknown')
+        session_num = self._get_session_number(snap=snap)
         time_of_day = campaign.get('time', {}).get('time_of_day', campaign.get('time_of_day', ''))
         current_date = campaign.get('time', {}).get('current_date', campaign.get('current_date', ''))
         time_str = f"{time_of_day}, {current_date}" if time_of_day and current_date else time_of_day or current_date or 'Unknown'
-
-        lines.append("=== SESSION CONTEXT ===")
-        lines.append(f"Campaign: {campaign_name} | Session #{session_num}")
-        lines.append(f"Location: {location} | Time: {time_str}")
-
-        # --- KIT (ambient; skills defer here instead of calling world_kit.py info) ---
-        kit = None
-        try:
-            kit = WorldKit(self._wsd)
-            if kit.campaign_dir is None:
-                kit = None
-        except Exception:
-            kit = None
-        if kit is not None:
-            skills = kit.skills()
-            vitals = kit.vitals()
-            lines.append("")
-            lines.append("--- KIT ---")
-            lines.append(f"kit: {kit.kit()}")
-            lines.append(f"name: {kit.name()}")
-            lines.append(f"resolution: {kit.resolution_model()}")
-            lines.append(f"progression: {kit.progression_model()}")
-            lines.append(f"vitals: {', '.join(vitals) if vitals else '(none)'}")
-            lines.append(f"skills: {', '.join(skills) if skills else '(none)'}")
-
-        # --- PRIMER (play pack: tonight's table, not the gazetteer) ---
+        return ["=== SESSION CONTEXT ===",
+                f"Campaign: {campaign_name} | Session #{session_num}",
+                f"Location: {snap.location} | Time: {time_str}"]
+
+    def _ctx_kit(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        """KIT (ambient; skills defer here instead of calling world_kit.py info)."""
+        kit = self._ctx_kit_handle(snap)
+        if kit is None:
+            return []
+        skills = kit.skills()
+        vitals = kit.vitals()
+        return ["",
+                "--- KIT ---",
+                f"kit: {kit.kit()}",
+                f"name: {kit.name()}",
+                f"resolution: {kit.resolution_model()}",
+                f"progression: {kit.progression_model()}",
+                f"vitals: {', '.join(vitals) if vitals else '(none)'}",
+                f"skills: {', '.join(skills) if skills else '(none)'}"]
+
+    def _ctx_primer(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        """PRIMER (play pack: tonight's table, not the gazetteer)."""
         try:
             from play_pack import render_primer, normalize_pack, pack_is_set
-            pack = normalize_pack(campaign.get("play_pack"))
+            pack = normalize_pack(snap.campaign.get("play_pack"))
             if pack_is_set(pack):
-                lines.append("")
-                lines.append(render_primer(pack))
+                return ["", render_primer(pack)]
         except Exception:
             pass
+        return []
 
-        # --- Play style (honor every beat; player toggles anytime) ---
-        if self.get_preferences().get("beat_length", "adaptive") == "tight":
+    def _ctx_play_style(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        """Play style (honor every beat; player toggles anytime)."""
+        lines = []
+        prefs = self.get_preferences(snap=snap)
+        if prefs.get("beat_length", "adaptive") == "tight":
             lines.append("Pacing: TIGHT — a beat is the player's action, its immediate "
                          "consequence, and AT MOST ONE new world development. Then stop at "
                          "the first moment the player could plausibly act. Scene-state "
@@ -654,7 +951,7 @@ class SessionManager(EntityManager):
             lines.append("Pacing: no tight preference is set. Match prose to the beat, one "
                          "clear beat at a time; don't fast-forward past a choice.")
 
-        if self.get_preferences().get("player_rolls", False):
+        if prefs.get("player_rolls", False):
             lines.append("Dice: PLAYER CHOOSES THE ROLL. When a check is needed, STOP at the "
                          "decision point and present it as a menu:\n"
                          "  1. Roll a <Stat> check with <+X stat / +Y other> bonuses. "
@@ -674,12 +971,12 @@ class SessionManager(EntityManager):
         # Informing, not adjudicating — caps and judgment live in skills / gm-craft.
         lines.append("Failure: failure should cost something; decide the stake before the roll.")
 
-        if self.get_preferences().get("rag_inspiration", False):
+        if prefs.get("rag_inspiration", False):
             lines.append("Inspiration: every beat (or every other beat), run "
                          "`gm-search.sh \"<what's happening now>\" --rag-only` and mine the "
                          "returned passages for a concrete image, phrase, or sensory detail "
                          "from the source. Synthesize — never paste raw passages.")
-        if self.get_preferences().get("action_menu", True):
+        if prefs.get("action_menu", True):
             lines.append("Play style: action menu ON — end each beat with exactly THREE "
                          "numbered options, then a final line \"Or something else...\" to "
                          "signal the player can always choose their own action.")
@@ -701,7 +998,7 @@ class SessionManager(EntityManager):
                          "Run `bash tools/gm-image.sh generate --title \"...\" --prompt \"...\"`, "
                          "then show the file:// link. (See gm-craft → Diegetic Illustration.) "
                          "Skip only truly flat beats and don't re-shoot the same static room.")
-            chronicler = self.json_ops.load_json("chronicler.json") or {}
+            chronicler = snap.json("chronicler.json")
             if chronicler.get("name"):
                 bits = [f"This campaign's chronicler is {chronicler['name']}"]
                 if chronicler.get("persona"):
@@ -719,35 +1016,38 @@ class SessionManager(EntityManager):
         else:
             lines.append("Scene images: DISABLED (no OPENAI_API_KEY) — do NOT call gm-image.sh "
                          "and do NOT mention images; narrate in text only.")
+        return lines
 
-        # --- Narrative Voice (write the prose in the world's authorial voice) ---
-        bible = self.json_ops.load_json("world-bible.json") or {}
-        voice = bible.get("voice") or {}
+    def _ctx_narrative_voice(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        """Narrative Voice (write the prose in the world's authorial voice)."""
+        voice = snap.bible.get("voice") or {}
         style = (voice.get("style") or "").strip()
         passages = [str(p).strip() for p in (voice.get("sample_passages") or []) if str(p).strip()]
         vocab = [str(v).strip() for v in (voice.get("vocab") or []) if str(v).strip()]
-        if style or passages:
-            lines.append("")
-            lines.append("--- NARRATIVE VOICE (narrate in this voice; a prose target, NOT lore) ---")
-            if style:
-                lines.append(f"Style: {style}")
-            if vocab:
-                shown_vocab = vocab if full else vocab[:12]
-                lines.append("In-world terms to favor: " + ", ".join(shown_vocab))
-                rem = None if full else self._remainder(
-                    len(vocab) - len(shown_vocab), "terms", "--full")
-                if rem:
-                    lines.append(rem)
-            shown_passages = passages if full else passages[:3]
-            for p in shown_passages:
-                lines.append(f"  | {p}")
+        if not (style or passages):
+            return []
+        lines = ["", "--- NARRATIVE VOICE (narrate in this voice; a prose target, NOT lore) ---"]
+        if style:
+            lines.append(f"Style: {style}")
+        if vocab:
+            shown_vocab = vocab if full else vocab[:12]
+            lines.append("In-world terms to favor: " + ", ".join(shown_vocab))
             rem = None if full else self._remainder(
-                len(passages) - len(shown_passages), "sample passages", "--full")
+                len(vocab) - len(shown_vocab), "terms", "--full")
             if rem:
                 lines.append(rem)
+        shown_passages = passages if full else passages[:3]
+        for p in shown_passages:
+            lines.append(f"  | {p}")
+        rem = None if full else self._remainder(
+            len(passages) - len(shown_passages), "sample passages", "--full")
+        if rem:
+            lines.append(rem)
+        return lines
 
-        # --- World Index (named things that exist; scan before inventing a name) ---
-        index = bible.get("index") or {}
+    def _ctx_world_index(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        """World Index (named things that exist; scan before inventing a name)."""
+        index = snap.bible.get("index") or {}
         index_labels = (
             ("npcs", "NPCs"), ("locations", "Locations"),
             ("items", "Items"), ("monsters", "Monsters"),
@@ -761,111 +1061,116 @@ class SessionManager(EntityManager):
             for e in entries:
                 note = str(e.get("note") or "").strip()
                 index_lines.append(f"  {e['name']}" + (f" — {note}" if note else ""))
-        if index_lines:
-            lines.append("")
-            lines.append("--- WORLD INDEX (named things that exist; scan before inventing a name) ---")
-            lines.extend(index_lines)
-
-        # --- Previously On (story spine: resume story-aware, not stat-amnesiac) ---
-        # Bounded by item COUNT, never by chopping a single entry. --full shows all.
-        all_summaries = self._recent_session_summaries(n=None)
-        summaries = all_summaries if full else all_summaries[-3:]
-        if summaries:
-            lines.append("")
-            lines.append("--- PREVIOUSLY ON ---")
-            for s in summaries:
-                lines.append(f"- {s}")
-            rem = None if full else self._remainder(
-                len(all_summaries) - len(summaries), "sessions",
-                "--full or session-log.md")
+        if not index_lines:
+            return []
+        return ["", "--- WORLD INDEX (named things that exist; scan before inventing a name) ---",
+                *index_lines]
+
+    def _ctx_previously_on(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        """Previously On (story spine: resume story-aware, not stat-amnesiac).
+
+        Bounded by item COUNT, never by chopping a single entry. --full shows all.
+        """
+        all_summaries = self._recent_session_summaries(n=None, snap=snap)
+        summaries = self._ctx_summaries(snap, full)
+        if not summaries:
+            return []
+        lines = ["", "--- PREVIOUSLY ON ---"]
+        for s in summaries:
+            lines.append(f"- {s}")
+        rem = None if full else self._remainder(
+            len(all_summaries) - len(summaries), "sessions",
+            "--full or session-log.md")
+        if rem:
+            lines.append(rem)
+        meta = self._latest_session_meta(snap=snap)
+        cliff = meta.get('cliffhanger') or self._cliffhanger(summaries[-1])
+        if cliff:
+            lines.append(f"WHERE WE PAUSED: {cliff}")
+        if meta.get('open_threads'):
+            lines.append(f"OPEN THREADS: {meta['open_threads']}")
+        return lines
+
+    def _ctx_world_remembers(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        """The World Remembers (memory volunteered for THIS scene, never waited for)."""
+        remembered, open_debts, held_back = self._ctx_remembered(snap, full)
+        if not (remembered or open_debts):
+            return []
+        lines = ["", "--- THE WORLD REMEMBERS (older history this scene touches — "
+                     "use it or let it lie, but don't contradict it) ---"]
+        for r in remembered:
+            lines.append(f"- {self._truncate(r, 240, full)}")
+        for d in open_debts:
+            lines.append(f"OPEN DEBT: {d}")
+        if held_back:
+            rem = self._remainder(
+                held_back, "remembered entries", "--full or gm-recall.sh")
             if rem:
                 lines.append(rem)
-            meta = self._latest_session_meta()
-            cliff = meta.get('cliffhanger') or self._cliffhanger(summaries[-1])
-            if cliff:
-                lines.append(f"WHERE WE PAUSED: {cliff}")
-            if meta.get('open_threads'):
-                lines.append(f"OPEN THREADS: {meta['open_threads']}")
-
-        # --- The World Remembers (memory volunteered for THIS scene, never waited for) ---
-        remembered, open_debts, held_back = self._world_remembers(
-            location, full=full, already_shown=summaries)
-        if remembered or open_debts:
-            lines.append("")
-            lines.append("--- THE WORLD REMEMBERS (older history this scene touches — "
-                         "use it or let it lie, but don't contradict it) ---")
-            for r in remembered:
-                lines.append(f"- {self._truncate(r, 240, full)}")
-            for d in open_debts:
-                lines.append(f"OPEN DEBT: {d}")
-            if held_back:
-                rem = self._remainder(
-                    held_back, "remembered entries", "--full or gm-recall.sh")
-                if rem:
-                    lines.append(rem)
+        return lines
 
-        # --- Story Threads (active plots, main first, each with its latest beat) ---
-        all_threads = self._active_plot_threads(limit=None)
+    def _ctx_story_threads(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        """Story Threads (active plots, main first, each with its latest beat)."""
+        all_threads = self._active_plot_threads(limit=None, snap=snap)
         threads = all_threads if full else all_threads[:6]
-        if threads:
-            lines.append("")
-            lines.append("--- STORY THREADS ---")
-            lines.extend(threads)
-            rem = None if full else self._remainder(
-                len(all_threads) - len(threads), "threads",
-                "gm-plot.sh threads for all")
-            if rem:
-                lines.append(rem)
+        if not threads:
+            return []
+        lines = ["", "--- STORY THREADS ---", *threads]
+        rem = None if full else self._remainder(
+            len(all_threads) - len(threads), "threads",
+            "gm-plot.sh threads for all")
+        if rem:
+            lines.append(rem)
+        return lines
 
-        # --- Ready Threads (dormant seeded plots that just became relevant) ---
-        ready = self._ready_threads(location, full=full)
-        if ready:
-            lines.append("")
-            lines.append("--- READY THREADS (dormant plots now relevant — wake with "
-                         "gm-plot.sh update) ---")
-            shown = ready if full else ready[:5]
-            lines.extend(shown)
-            rem = None if full else self._remainder(
-                len(ready) - len(shown), "ready threads", "--full")
+    def _ctx_ready_threads(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        """Ready Threads (dormant seeded plots that just became relevant)."""
+        ready = self._ready_threads(snap.location, full=full, snap=snap)
+        if not ready:
+            return []
+        lines = ["", "--- READY THREADS (dormant plots now relevant — wake with "
+                     "gm-plot.sh update) ---"]
+        shown = ready if full else ready[:5]
+        lines.extend(shown)
+        rem = None if full else self._remainder(
+            len(ready) - len(shown), "ready threads", "--full")
+        if rem:
+            lines.append(rem)
+        return lines
+
+    def _ctx_key_facts(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        """Key Facts (established plot facts the GM must keep continuity on)."""
+        key_facts = self._key_facts(per_category=None if full else 3, snap=snap)
+        if not key_facts:
+            return []
+        lines = ["", "--- KEY FACTS ---"]
+        for fact_line in key_facts:
+            lines.append(f"- {fact_line}")
+        if not full:
+            hidden_facts = len(self._key_facts(per_category=None, snap=snap)) - len(key_facts)
+            rem = self._remainder(hidden_facts, "facts",
+                                  "--full or gm-note.sh list")
             if rem:
                 lines.append(rem)
+        return lines
 
-        # --- Key Facts (established plot facts the GM must keep continuity on) ---
-        key_facts = self._key_facts(per_category=None if full else 3)
-        if key_facts:
-            lines.append("")
-            lines.append("--- KEY FACTS ---")
-            for fact_line in key_facts:
-                lines.append(f"- {fact_line}")
-            if not full:
-                hidden_facts = len(self._key_facts(per_category=None)) - len(key_facts)
-                rem = self._remainder(hidden_facts, "facts",
-                                      "--full or gm-note.sh list")
-                if rem:
-                    lines.append(rem)
+    def _ctx_threat_clocks(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        """Threat Clocks (felt, mounting pressure; only when any are declared)."""
+        clocks = snap.clocks
+        if not clocks:
+            return []
+        lines = ["", "--- THREAT CLOCKS ---"]
+        for clock_name, c in clocks.items():
+            cur, mx = int(c.get('current', 0)), int(c.get('max', 1))
+            bar = "●" * cur + "○" * max(0, mx - cur)
+            flag = "  ⚠ FULL — a beat is due" if cur >= mx else ""
+            lines.append(f"{clock_name}: [{bar}] {cur}/{mx}{flag}")
+        return lines
 
-        # --- Threat Clocks (felt, mounting pressure; only when any are declared) ---
-        clocks = self.json_ops.load_json("threat-clocks.json") or {}
-        if clocks:
-            lines.append("")
-            lines.append("--- THREAT CLOCKS ---")
-            for clock_name, c in clocks.items():
-                cur, mx = int(c.get('current', 0)), int(c.get('max', 1))
-                bar = "●" * cur + "○" * max(0, mx - cur)
-                flag = "  ⚠ FULL — a beat is due" if cur >= mx else ""
-                lines.append(f"{clock_name}: [{bar}] {cur}/{mx}{flag}")
-
-        # --- Character ---
-        lines.append("")
-        lines.append("--- CHARACTER ---")
-        char = None
-        if self.character_file.exists():
-            import json as _json
-            try:
-                with open(self.character_file, 'r', encoding='utf-8') as f:
-                    char = to_flat(_json.load(f))
-            except (ValueError, IOError):
-                pass
+    def _ctx_character(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        lines = ["", "--- CHARACTER ---"]
+        raw = snap.json("character.json")
+        char = to_flat(raw) if raw else None
 
         if char:
             name = char.get('name', 'Unknown')
@@ -888,11 +1193,11 @@ class SessionManager(EntityManager):
             lines.append(f"Conditions: {cond_str}")
         else:
             lines.append("No character found.")
+        return lines
 
-        # --- Party Members ---
-        lines.append("")
-        lines.append("--- PARTY MEMBERS ---")
-        npcs = self.json_ops.load_json("npcs.json") or {}
+    def _ctx_party(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        lines = ["", "--- PARTY MEMBERS ---"]
+        npcs = snap.npcs
         party = {n: d for n, d in npcs.items() if isinstance(d, dict) and d.get('is_party_member')}
 
         if party:
@@ -927,60 +1232,71 @@ class SessionManager(EntityManager):
         else:
             lines.append("(none)")
             lines.append("")
+        return lines
 
-        # --- Present NPCs (voices, inner life, and what they remember; never mutate) ---
-        present_npcs = self._present_npcs(npcs, location, full=full)
-        if present_npcs:
-            lines.append("")
-            lines.append("--- NPC VOICES (present NPCs — speak in their own words; "
-                         "they remember what is listed under them) ---")
-            for npc_name, vlines in present_npcs:
-                inner = npcs.get(npc_name, {}) if isinstance(npcs, dict) else {}
-                tags = []
-                if inner.get('current_mood'):
-                    tags.append(f"mood: {inner['current_mood']}")
-                if inner.get('goal'):
-                    tags.append(f"wants: {inner['goal']}")
-                if inner.get('secret'):
-                    tags.append("has a secret")  # existence only — never the secret text
-                header = npc_name + (f" ({'; '.join(tags)})" if tags else "")
-                lines.append(f"{header}:")
-                for vl in vlines:
-                    lines.append(f'  "{vl}"')
+    def _ctx_npc_voices(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        """Present NPCs (voices, inner life, and what they remember; never mutate)."""
+        npcs = snap.npcs
+        present_npcs = self._present_npcs(npcs, snap.location, full=full, index=snap.presence)
+        if not present_npcs:
+            return []
+        remembered = self._ctx_remembered(snap, full)[0]
+        summaries = self._ctx_summaries(snap, full)
+        # One scan of the fact corpus for everyone in the scene, not one per NPC.
+        mentions = self._fact_mentions(
+            {name: npcs.get(name, {}) for name, _v in present_npcs
+             if isinstance(npcs, dict) and not npcs.get(name, {}).get('is_party_member')},
+            snap)
+        lines = ["", "--- NPC VOICES (present NPCs — speak in their own words; "
+                     "they remember what is listed under them) ---"]
+        for npc_name, vlines in present_npcs:
+            inner = npcs.get(npc_name, {}) if isinstance(npcs, dict) else {}
+            tags = []
+            if inner.get('current_mood'):
+                tags.append(f"mood: {inner['current_mood']}")
+            if inner.get('goal'):
+                tags.append(f"wants: {inner['goal']}")
+            if inner.get('secret'):
+                tags.append("has a secret")  # existence only — never the secret text
+            header = npc_name + (f" ({'; '.join(tags)})" if tags else "")
+            lines.append(f"{header}:")
+            for vl in vlines:
+                lines.append(f'  "{vl}"')
+            if not full:
+                ctx_raw = inner.get('context', [])
+                raw_lines = ctx_raw if isinstance(ctx_raw, list) else (
+                    [ctx_raw] if ctx_raw else [])
+                raw_n = len([x for x in raw_lines if x])
+                rem = self._remainder(
+                    raw_n - len(vlines), "voice lines", "--full")
+                if rem:
+                    lines.append(f"  {rem}")
+            # Party members already carry their history in the block above.
+            if not inner.get('is_party_member'):
+                recent = self._recent_events(inner, full=full)
+                if recent:
+                    lines.append(f"  {recent}")
+                # Global facts that NAME this NPC, re-attached at read time
+                # (de-duped against PREVIOUSLY ON, world-remembers, and the
+                # NPC's own events) so per-NPC memory is not lost to the log.
+                anchored = self._npc_anchored_facts(
+                    npc_name, inner,
+                    already_shown=list(summaries) + list(remembered), snap=snap,
+                    mentions=mentions.get(npc_name))
+                shown_anchored = anchored if full else anchored[:3]
+                for fact in shown_anchored:
+                    lines.append(f"  remembers: {self._truncate(fact, 180, full)}")
                 if not full:
-                    ctx_raw = inner.get('context', [])
-                    raw_lines = ctx_raw if isinstance(ctx_raw, list) else (
-                        [ctx_raw] if ctx_raw else [])
-                    raw_n = len([x for x in raw_lines if x])
                     rem = self._remainder(
-                        raw_n - len(vlines), "voice lines", "--full")
+                        len(anchored) - len(shown_anchored),
+                        "remembered facts", "--full or gm-recall.sh")
                     if rem:
                         lines.append(f"  {rem}")
-                # Party members already carry their history in the block above.
-                if not inner.get('is_party_member'):
-                    recent = self._recent_events(inner, full=full)
-                    if recent:
-                        lines.append(f"  {recent}")
-                    # Global facts that NAME this NPC, re-attached at read time
-                    # (de-duped against PREVIOUSLY ON, world-remembers, and the
-                    # NPC's own events) so per-NPC memory is not lost to the log.
-                    anchored = self._npc_anchored_facts(
-                        npc_name, inner,
-                        already_shown=list(summaries) + list(remembered))
-                    shown_anchored = anchored if full else anchored[:3]
-                    for fact in shown_anchored:
-                        lines.append(f"  remembers: {self._truncate(fact, 180, full)}")
-                    if not full:
-                        rem = self._remainder(
-                            len(anchored) - len(shown_anchored),
-                            "remembered facts", "--full or gm-recall.sh")
-                        if rem:
-                            lines.append(f"  {rem}")
-
-        # --- Pending Consequences ---
-        lines.append("")
-        lines.append("--- PENDING CONSEQUENCES ---")
-        consequences = self.json_ops.load_json("consequences.json") or {}
+        return lines
+
+    def _ctx_pending_consequences(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        lines = ["", "--- PENDING CONSEQUENCES ---"]
+        consequences = snap.consequences
         pending = []
         if isinstance(consequences, dict):
             # Not-yet-resolved consequences live in the 'active' (and optional 'pending') lists
@@ -1014,11 +1330,17 @@ class SessionManager(EntityManager):
                     lines.append(rem)
         else:
             lines.append("(none)")
+        return lines
+
+    def _ctx_world_rules(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        """Your World's Rules (bespoke per-campaign systems; NEVER truncated).
 
-        # --- Your World's Rules (bespoke per-campaign systems; NEVER truncated) ---
-        # Prefer kit signature_systems; campaign_rules is the legacy fallback.
-        # These rules ARE the magic that makes each book feel distinct. The GM is
-        # told to follow them exactly, so it must see them in full.
+        Prefer kit signature_systems; campaign_rules is the legacy fallback.
+        These rules ARE the magic that makes each book feel distinct. The GM is
+        told to follow them exactly, so it must see them in full.
+        """
+        kit = self._ctx_kit_handle(snap)
+        lines = []
         systems = kit.signature_systems() if kit is not None else []
         if systems:
             lines.append("")
@@ -1034,7 +1356,7 @@ class SessionManager(EntityManager):
                 if extra and extra != summary:
                     lines.append(f"    {extra}")
         else:
-            rules = campaign.get('campaign_rules', {})
+            rules = snap.campaign.get('campaign_rules', {})
             if rules:
                 import json
                 lines.append("")
@@ -1054,30 +1376,24 @@ class SessionManager(EntityManager):
                                 lines.append(f"  {vline}")
                         else:
                             lines.append(f"- {rule}")
+        return lines
 
-        # --- Signature Systems (executable primitives; the GM ROLLS these, not vibes) ---
+    def _ctx_signature_systems(self, snap: CampaignSnapshot, full: bool) -> List[str]:
+        """Signature Systems (executable primitives; the GM ROLLS these, not vibes)."""
+        kit = self._ctx_kit_handle(snap)
         try:
             sys_list = kit.systems() if kit is not None else []
         except Exception:
             sys_list = []
-        if sys_list:
-            lines.append("")
-            lines.append("--- YOUR WORLD'S SIGNATURE SYSTEMS (executable — ROLL these, "
-                         "do not just narrate them) ---")
-            lines.append("Resolve with lib/game_core primitives "
-                         "(named_track / price_roll / reaction_roll / guarded_payoff).")
-            for s in sys_list:
-                lines.append(f"- {s['name']} ({s['primitive']}): {self._system_summary(s)}")
-
-        context = "\n".join(lines)
-
-        # Token observability: soft ~2k-token target is GUIDANCE only, never a hard
-        # cut. Opt in with DM_DEBUG_CONTEXT=1 to watch the budget without altering output.
-        if os.environ.get('DM_DEBUG_CONTEXT'):
-            approx_tokens = len(context) // 4
-            print(f"[context] ~{approx_tokens} tokens ({len(context)} chars)", file=sys.stderr)
-
-        return context
+        if not sys_list:
+            return []
+        lines = ["", "--- YOUR WORLD'S SIGNATURE SYSTEMS (executable — ROLL these, "
+                     "do not just narrate them) ---",
+                 "Resolve with lib/game_core primitives "
+                 "(named_track / price_roll / reaction_roll / guarded_payoff)."]
+        for s in sys_list:
+            lines.append(f"- {s['name']} ({s['primitive']}): {self._system_summary(s)}")
+        return lines
 
     # ==================== Private Helpers ====================
 
@@ -1100,32 +1416,15 @@ class SessionManager(EntityManager):
             return "roll BEFORE taking marked treasure: clean / guardian wakes / curse attaches"
         return system.get("summary") or prim or ""
 
-    def _recent_session_summaries(self, n=3):
+    def _recent_session_summaries(self, n=3, snap: CampaignSnapshot = None):
         """Return recent completed-session summary paragraphs (oldest -> newest).
 
-        Parses session-log.md blocks; a completed session is one with a
+        Read from the session-log index; a completed session is one with a
         '### Session Ended:' marker. n=None returns all.
         """
-        log_path = self.campaign_dir / "session-log.md"
-        if not log_path.exists():
-            return []
-        try:
-            text = log_path.read_text(encoding='utf-8')
-        except (IOError, ValueError):
-            return []
-        summaries = []
-        for block in text.split("## Session Started:"):
-            if "### Session Ended:" not in block:
-                continue
-            after = block.split("### Session Ended:", 1)[1]
-            body = []
-            for ln in after.splitlines()[1:]:  # skip the 'Session Ended' timestamp line
-                if ln.strip() == "---":
-                    break
-                if ln.strip():
-                    body.append(ln.strip())
-            if body:
-                summaries.append(" ".join(body))
+        snap = snap or self.snapshot()
+        summaries = snap.derive("session_summaries", lambda: [
+            s["recap"] for s in self.log_index.ended_sessions(snap.session_index)])
         return summaries if n is None else summaries[-n:]
 
     def _cliffhanger(self, summary):
@@ -1137,7 +1436,7 @@ class SessionManager(EntityManager):
         parts = [s.strip() for s in normalized.split('.') if s.strip()]
         return ('. '.join(parts[-2:]) + '.') if parts else ''
 
-    def _ready_threads(self, location, full=False):
+    def _ready_threads(self, location, full=False, snap: CampaignSnapshot = None):
         """Dormant seeded plots that just became relevant — a nudge for the GM to wake them.
 
         A dormant plot surfaces here when (a) one of its linked NPCs is present, (b) its
@@ -1147,8 +1446,9 @@ class SessionManager(EntityManager):
         what actively tells the GM a seeded thread is relevant NOW; `gm-plot.sh update`
         wakes it (dormant -> active).
         """
+        snap = snap or self.snapshot()
         try:
-            plots = self.json_ops.load_json("plots.json") or {}
+            plots = snap.plots
         except Exception:
             return []
         dormant = [(n, p) for n, p in plots.items()
@@ -1157,14 +1457,13 @@ class SessionManager(EntityManager):
             return []
 
         try:
-            present = set(npcs_present(
-                self.json_ops.load_json("npcs.json") or {}, location).keys())
+            present = set(npcs_present(snap.npcs, location, snap.presence).keys())
         except Exception:
             present = set()
 
         # plot name -> a clock linked to it that is at least half full
         mature_clock = {}
-        clocks = self.json_ops.load_json("threat-clocks.json") or {}
+        clocks = snap.clocks
         if isinstance(clocks, dict):
             for cname, c in clocks.items():
                 if not isinstance(c, dict):
@@ -1191,9 +1490,9 @@ class SessionManager(EntityManager):
             out.append(f'💤→ "{name}" — {hook} (because {reason})')
         return out
 
-    def _active_plot_threads(self, limit=6):
+    def _active_plot_threads(self, limit=6, snap: CampaignSnapshot = None):
         """Active plots, main-first, each with its latest event beat. limit=None = all."""
-        plots = self.json_ops.load_json("plots.json") or {}
+        plots = (snap or self.snapshot()).plots
         if not isinstance(plots, dict):
             return []
         closed = {'completed', 'resolved', 'failed', 'done', 'abandoned', 'dropped'}
@@ -1230,9 +1529,9 @@ class SessionManager(EntityManager):
     KEY_FACT_CATEGORIES = ('plot_local', 'plot_regional', 'plot_world',
                            'player_choices', 'npc_relations', 'lore')
 
-    def _key_facts(self, per_category=3):
+    def _key_facts(self, per_category=3, snap: CampaignSnapshot = None):
         """Established facts the GM must keep continuity on. per_category=None = all."""
-        facts = self.json_ops.load_json("facts.json") or {}
+        facts = (snap or self.snapshot()).facts
         if not isinstance(facts, dict):
             return []
         out = []
@@ -1247,7 +1546,8 @@ class SessionManager(EntityManager):
                     out.append(txt)
         return out
 
-    def _world_remembers(self, location, full=False, already_shown=()):
+    def _world_remembers(self, location, full=False, already_shown=(),
+                         snap: CampaignSnapshot = None):
         """What the campaign's long-term memory volunteers for THIS scene.
 
         CampaignMemory (arcs, session history, facts — embedded and searchable)
@@ -1260,11 +1560,13 @@ class SessionManager(EntityManager):
         failure — no memory file, no embedding deps, a half-written index — so a
         broken memory costs the brief nothing mid-session.
         """
+        snap = snap or self.snapshot()
         try:
             from campaign_memory import CampaignMemory
-            mem = CampaignMemory(self._wsd)
-            npcs = self.json_ops.load_json("npcs.json") or {}
-            present = [name for name, _ in self._present_npcs(npcs, location)]
+            mem = CampaignMemory(self._wsd, context=self.context)
+            mem.json_ops = snap  # recall/arcs/gather read this build's copies (read-only)
+            present = [name for name, _ in self._present_npcs(snap.npcs, location,
+                                                                 index=snap.presence)]
             query = " ".join([location or ""] + present).strip()
             if not query:
                 return [], [], 0
@@ -1272,7 +1574,7 @@ class SessionManager(EntityManager):
             hits = mem.recall(query, top_k=top_k)
             arcs = mem.arcs()
             debts = [str(d) for d in (arcs[-1].get("open_debts") or [])] if arcs else []
-            total = len((self.json_ops.load_json(mem.memory_file) or {}).get("entries") or [])
+            total = len(snap.json(mem.memory_file).get("entries") or [])
         except Exception:
             return [], [], 0
 
@@ -1314,7 +1616,8 @@ class SessionManager(EntityManager):
                 parts.append(f'"{self._truncate(text, 120, full)}"')
         return f"Recent: {' -> '.join(parts)}" if parts else None
 
-    def _npc_anchored_facts(self, npc_name, npc_data, already_shown=()):
+    def _npc_anchored_facts(self, npc_name, npc_data, already_shown=(),
+                            snap: CampaignSnapshot = None, mentions: List[str] = None):
         """Facts from facts.json whose text NAMES this NPC — surfaced under them.
 
         A fact logged via gm-note.sh lands only in facts.json; if it names an
@@ -1333,33 +1636,16 @@ class SessionManager(EntityManager):
         anything already carried in the NPC's own `events` (so it is not shown
         twice). Returns the full matched list (caller caps + discloses the
         remainder); [] when the NPC is named in no fact, or on any failure.
+
+        `mentions` is this NPC's share of a scene-wide `_fact_mentions` scan;
+        without it the NPC is scanned for on its own.
         """
-        facts = self.json_ops.load_json("facts.json") or {}
-        if not isinstance(facts, dict):
-            return []
-        all_facts = []
-        for items in facts.values():
-            if not isinstance(items, list):
-                continue
-            for it in items:
-                txt = it.get('fact', it.get('text', it.get('event', ''))) if isinstance(it, dict) else str(it)
-                if txt:
-                    all_facts.append(str(txt))
-        if not all_facts:
+        snap = snap or self.snapshot()
+        if mentions is None:
+            mentions = self._fact_mentions({npc_name: npc_data}, snap).get(npc_name, [])
+        if not mentions:
             return []
 
-        # Needles: the full key and any explicit aliases only. No auto-derived
-        # leading-token needle — a common first word ("Old", "Red", "Young")
-        # would match ordinary lowercase prose and attach unrelated facts.
-        needles = [npc_name]
-        aliases = npc_data.get('aliases') if isinstance(npc_data, dict) else None
-        if isinstance(aliases, list):
-            needles.extend(str(a) for a in aliases if a)
-        elif isinstance(aliases, str) and aliases:
-            needles.append(aliases)
-        patterns = [re.compile(r"\b" + re.escape(n) + r"\b", re.IGNORECASE)
-                    for n in needles if n]
-
         def _norm(s):
             return " ".join(str(s).split())
 
@@ -1372,16 +1658,63 @@ class SessionManager(EntityManager):
                     shown.add(_norm(t))
 
         matched, seen = [], set()
-        for txt in all_facts:
+        for txt in mentions:
             norm = _norm(txt)
             if not norm or norm in shown or norm in seen:
                 continue
-            if any(p.search(txt) for p in patterns):
-                seen.add(norm)
-                matched.append(txt)
+            seen.add(norm)
+            matched.append(txt)
         return matched
 
-    def _present_npcs(self, npcs, location, full=False):
+    @staticmethod
+    def _npc_needles(npc_name, npc_data) -> List[str]:
+        """The full key and any explicit aliases only. No auto-derived
+        leading-token needle — a common first word ("Old", "Red", "Young")
+        would match ordinary lowercase prose and attach unrelated facts."""
+        needles = [npc_name]
+        aliases = npc_data.get('aliases') if isinstance(npc_data, dict) else None
+        if isinstance(aliases, list):
+            needles.extend(str(a) for a in aliases if a)
+        elif isinstance(aliases, str) and aliases:
+            needles.append(aliases)
+        return [n for n in needles if n]
+
+    def _fact_mentions(self, npcs: Dict[str, Any],
+                       snap: CampaignSnapshot = None) -> Dict[str, List[str]]:
+        """{npc name: fact texts naming it (word boundary, any case)}, file order.
+
+        One Aho-Corasick pass over the fact corpus for all of `npcs` at once
+        (lib/mention_index.py), cached per facts version and needle set. The
+        version is a digest of the fact texts, so a rewrite is never masked by
+        an unchanged mtime.
+        """
+        snap = snap or self.snapshot()
+        all_facts = snap.derive("fact_texts", lambda: self._all_fact_texts(snap.facts))
+        if not all_facts or not npcs:
+            return {name: [] for name in npcs}
+        version = snap.derive("fact_texts_version", lambda: hashlib.sha1(
+            "\x00".join(all_facts).encode("utf-8")).hexdigest())
+        from mention_index import scan_mentions
+        hits = scan_mentions({name: self._npc_needles(name, data) for name, data in npcs.items()},
+                             all_facts, version)
+        return {name: [all_facts[i] for i in idx] for name, idx in hits.items()}
+
+    @staticmethod
+    def _all_fact_texts(facts) -> List[str]:
+        """Every fact's text across all categories, in file order."""
+        if not isinstance(facts, dict):
+            return []
+        all_facts = []
+        for items in facts.values():
+            if not isinstance(items, list):
+                continue
+            for it in items:
+                txt = it.get('fact', it.get('text', it.get('event', ''))) if isinstance(it, dict) else str(it)
+                if txt:
+                    all_facts.append(str(txt))
+        return all_facts
+
+    def _present_npcs(self, npcs, location, full=False, index=None):
         """NPCs present in the scene, with any canonical voice lines they have.
 
         Presence is `npcs_present` (party OR exact location tag). This method
@@ -1393,7 +1726,7 @@ class SessionManager(EntityManager):
         canonical-voice extraction).
         """
         out = []
-        for name, d in npcs_present(npcs, location).items():
+        for name, d in npcs_present(npcs, location, index).items():
             ctx = d.get('context', [])
             vlines = ctx if isinstance(ctx, list) else ([ctx] if ctx else [])
             vlines = [str(x) for x in vlines if x]
@@ -1422,39 +1755,22 @@ class SessionManager(EntityManager):
         campaign = self.json_ops.load_json(self.campaign_file)
         return campaign.get('current_character')
 
-    def _get_session_number(self) -> int:
+    def _get_session_number(self, snap: CampaignSnapshot = None) -> int:
         """Current session number, derived from matched start/end pairs.
 
         Counting raw 'Session Started:' over-counts orphan/duplicate starts
         (DCC showed ~20 starts for ~13 real sessions). The current number is the
         count of completed (ended) sessions, plus 1 if a session is open now.
+        Both counts live in the session-log index.
         """
-        if not self.session_log.exists():
-            return 0
-        content = self.session_log.read_text()
-        ended = content.count('### Session Ended:')
-        started = content.count('## Session Started:')
-        return ended + (1 if started > ended else 0)
+        return self.log_index.session_number(snap.session_index if snap is not None else None)
 
-    def _latest_session_meta(self) -> Dict[str, str]:
+    def _latest_session_meta(self, snap: CampaignSnapshot = None) -> Dict[str, str]:
         """Parse the most recent ended session's structured footer, if present.
 
         Returns {'cliffhanger': ..., 'open_threads': ...} (empty strings if none).
         """
-        meta = {'cliffhanger': '', 'open_threads': ''}
-        if not self.session_log.exists():
-            return meta
-        blocks = self.session_log.read_text(encoding='utf-8').split("### Session Ended:")
-        if len(blocks) < 2:
-            return meta
-        last = blocks[-1]
-        for line in last.splitlines():
-            s = line.strip()
-            if s.startswith('**Cliffhanger:**'):
-                meta['cliffhanger'] = s.split('**Cliffhanger:**', 1)[1].strip()
-            elif s.startswith('**Open threads:**'):
-                meta['open_threads'] = s.split('**Open threads:**', 1)[1].strip()
-        return meta
+        return self.log_index.latest_meta(snap.session_index if snap is not None else None)
 
     def _get_recent_sessions(self, count: int) -> List[str]:
         """Get recent session entries"""
@@ -1480,27 +1796,33 @@ class SessionManager(EntityManager):
 
         When several files match (notably rotating autosaves), return the newest.
         """
+        from save_store import SaveIndex
+        if Path(name).name == SaveIndex.FILENAME:
+            return None
         exact_match = self.saves_dir / name
-        if exact_match.exists():
+        if exact_match.is_file():
             return exact_match
 
         if not name.endswith('.json'):
             exact_match = self.saves_dir / f"{name}.json"
-            if exact_match.exists():
+            if exact_match.is_file():
                 return exact_match
 
+        index = self._save_index()
         needle = name.lower()
-        if needle in ("autosave", "autosave.json"):
-            autosaves = self._autosave_files()
-            if autosaves:
-                return autosaves[-1]
-
-        matches = [p for p in self.saves_dir.glob("*.json")
-                   if needle in p.name.lower()]
-        if not matches:
-            return None
-        matches.sort(key=lambda p: (p.stat().st_mtime, p.name))
-        return matches[-1]
+        for attempt in range(2):
+            if needle in ("autosave", "autosave.json"):
+                matches = self._autosave_files(index)
+            else:
+                matches = [self.saves_dir / e["filename"] for e in index.entries()
+                           if needle in e["filename"].lower()]
+            if matches and matches[-1].is_file():
+                return matches[-1]
+            # A miss (or a stale hit) may be a save copied or removed by hand:
+            # sync the index with the directory once and look again.
+            if attempt or not index.reconcile():
+                return None
+        return None
 
 
 def main():
@@ -1512,7 +1834,9 @@ def main():
     subparsers = parser.add_subparsers(dest='action', help='Action to perform')
 
     # Start session
-    subparsers.add_parser('start', help='Start new session')
+    start_parser = subparsers.add_parser('start', help='Start new session')
+    start_parser.add_argument('--with-effects', action='store_true',
+                              help='Also print pending consequences and scene context (concurrently)')
 
     # End session
     end_parser = subparsers.add_parser('end', help='End session')
@@ -1527,10 +1851,17 @@ def main():
     # Move party
     move_parser = subparsers.add_parser('move', help='Move party to location')
     move_parser.add_argument('location', nargs='+', help='Location name')
+    move_parser.add_argument('--with-effects', action='store_true',
+                             help='Then run the consequence tick, first-visit lore brief '
+                                  'and scene lookup concurrently')
 
     # Save
     save_parser = subparsers.add_parser('save', help='Create save point')
-    save_parser.add_argument('name', nargs='+', help='Save name')
+    save_parser.add_argument('name', nargs='*', help='Save name')
+    save_parser.add_argument('--async', dest='async_save', action='store_true',
+                             help='Queue an autosave for the background worker and return at once')
+    save_parser.add_argument('--wait', action='store_true',
+                             help='Flush any queued autosave first (alone: just flush)')
 
     # Restore
     restore_parser = subparsers.add_parser('restore', help='Restore from save')
@@ -1548,7 +1879,16 @@ def main():
 
     # Full session context
     context_parser = subparsers.add_parser('context', help='Get full session context (one-command startup)')
-    context_parser.add_argument('--full', action='store_true', help='Show full context with less truncation')
+    context_size = context_parser.add_mutually_exclusive_group()
+    context_size.add_argument('--full', action='store_true', help='Show full context with less truncation')
+    context_size.add_argument('--budget', type=int, metavar='N',
+                              help='Fit the brief to about N tokens, most valuable items first')
+    context_parser.add_argument('--no-cache', action='store_true',
+                                help='Render every section (ignore the render cache)')
+    context_parser.add_argument('--since', metavar='TOKEN',
+                                help='Print only sections changed since the brief that returned TOKEN')
+    context_parser.add_argument('--cache-stats', action='store_true',
+                                help='Print render-cache hit statistics instead of the brief')
 
     choices_parser = subparsers.add_parser('choices', help='Toggle the action-menu play style')
     choices_parser.add_argument('value', nargs='?', default='show',
@@ -1573,16 +1913,46 @@ def main():
     if json_mode and args.action == 'status':
         emit(manager.get_status(), json_mode=True)
         return
+    if args.action == 'context' and args.cache_stats:
+        emit(ContextCache(manager.campaign_dir).stats(), json_mode=True)
+        return
     if json_mode and args.action == 'context':
-        emit({"context": manager.get_full_context(full=getattr(args, 'full', False))}, json_mode=True)
+        emit(manager.get_context_delta(full=args.full, since=args.since,
+                                       use_cache=not args.no_cache, budget=args.budget),
+             json_mode=True)
         return
     if json_mode and args.action == 'move':
-        emit(manager.move_party(' '.join(args.location)), json_mode=True)
+        import contextlib
+        import io
+        location = ' '.join(args.location)
+        with contextlib.redirect_stdout(io.StringIO()):  # keep stdout JSON-only
+            moved = manager.move_party(location)
+            if args.with_effects:
+                from scene_effects import MOVE_EFFECTS, run_effects
+                outcomes = run_effects(MOVE_EFFECTS, manager.context, location)
+                moved = {"move": moved,
+                         "effects": {name: data for name, _t, data in outcomes}}
+        emit(moved, json_mode=True)
         return
 
     if args.action == 'start':
+        # A crash between turns can leave an autosave owed; settle it first, but
+        # best-effort: a failing save or a slow worker must not block the session.
+        try:
+            from autosave_worker import AutosaveQueue
+            if not AutosaveQueue().wait(timeout=AUTOSAVE_START_WAIT):
+                print("[WARNING] Owed autosave still pending; starting anyway",
+                      file=sys.stderr)
+        except Exception as e:
+            print(f"[WARNING] Owed autosave failed ({e}); starting anyway. "
+                  "It is retried on the next save.", file=sys.stderr)
         summary = manager.start_session()
         print(json.dumps(summary, indent=2))
+        if args.with_effects:
+            from scene_effects import START_EFFECTS, print_effects, run_effects
+            overview = manager.json_ops.load_json(manager.campaign_file) or {}
+            location = (overview.get('player_position') or {}).get('current_location') or ''
+            print_effects(run_effects(START_EFFECTS, manager.context, location))
 
     elif args.action == 'end':
         summary_text = ' '.join(args.summary)
@@ -1598,10 +1968,32 @@ def main():
         location = ' '.join(args.location)
         result = manager.move_party(location)
         print(json.dumps(result, indent=2))
+        if args.with_effects:
+            # Each effect reads the move just committed; all run at once.
+            from scene_effects import MOVE_EFFECTS, print_effects, run_effects
+            print_effects(run_effects(MOVE_EFFECTS, manager.context, location))
 
     elif args.action == 'save':
         name = ' '.join(args.name)
-        manager.create_save(name)
+        if args.async_save or args.wait:
+            from autosave_worker import AutosaveQueue
+            queue = AutosaveQueue()
+        if args.async_save:
+            if name != 'autosave':
+                print("[ERROR] --async is for 'save autosave' only; named saves run in the foreground")
+                sys.exit(1)
+            queue.request()
+            print("[SUCCESS] Autosave queued")
+            return
+        if args.wait and not queue.wait():
+            print("[ERROR] Queued autosave still pending after timeout")
+            sys.exit(1)
+        if name:
+            manager.create_save(name)
+        elif args.wait:
+            print("[SUCCESS] Autosave up to date")
+        else:
+            save_parser.error("a save name is required")
 
     elif args.action == 'restore':
         if not manager.restore_save(args.name):
@@ -1624,7 +2016,11 @@ def main():
             print(entry)
 
     elif args.action == 'context':
-        print(manager.get_full_context(full=getattr(args, 'full', False)))
+        brief = manager.get_context_delta(full=args.full, since=args.since,
+                                          use_cache=not args.no_cache, budget=args.budget)
+        print(brief["context"])
+        print("")
+        print(f"Context token: {brief['token']} (next time: context --since {brief['token']})")
 
     elif args.action == 'choices':
         val = getattr(args, 'value', 'show')
@@ -1656,4 +2052,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    profiling.run(main)
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+On-disk cache and offline mirror for the D&D 5e SRD API (dnd5eapi.co).
+
+The feature scripts (features/dnd-api, spells, rules, character-creation)
+used to make an uncached HTTPS call with a 10-second timeout on every lookup.
+The monster-manual, spell-caster and rules agents ask for the same few
+hundred endpoints again and again, so each of those calls paid a TLS
+handshake and a round trip to get back data that never changes.
+
+`fetch(path)` is their one entry point now:
+
+- A response is stored under world-state/srd/responses/ as gzipped JSON,
+  with its ETag and when it was fetched. For `GM_SRD_TTL` seconds (default
+  30 days) it is served without touching the network. After that it is
+  revalidated with If-None-Match, and a 304 only refreshes its timestamp.
+- When the network fails, a stale entry is served rather than an error.
+- Within one process, repeat lookups come from memory. Callers get the
+  cached object itself, so they must treat it as read-only.
+- What does reach the network goes through the shared pooled client in
+  lib/http_client.py (keep-alive, rate limiting, 429/5xx retries).
+
+`srd_cache.py sync` mirrors every SRD resource the features use into the
+same store. With `GM_SRD_OFFLINE=1` nothing is fetched: lookups are served
+from the store only, and a query such as `/classes/wizard/spells?level=3`
+is answered by filtering the mirrored list.
+
+`GM_SRD_ORIGIN` points the cache at another server: a self-hosted API, or
+the stand-in that the tests run.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+SRD_ORIGIN = "https://www.dnd5eapi.co"
+API_PREFIX = "/api/2014"
+DEFAULT_TTL = 30 * 24 * 3600
+TIMEOUT = 10
+
+# What `sync` mirrors: every list the feature scripts read, and each item in it.
+RESOURCES = ("spells", "monsters", "equipment", "equipment-categories", "magic-items",
+             "weapon-properties", "classes", "races", "traits", "conditions", "rules",
+             "rule-sections", "skills", "ability-scores", "damage-types", "magic-schools")
+# Per-item sub-lists that features read too: (resource, suffix).
+SUBRESOURCES = (("classes", "spells"),)
+
+
+def origin() -> str:
+    return os.environ.get("GM_SRD_ORIGIN", SRD_ORIGIN).rstrip("/")
+
+
+def offline() -> bool:
+    return os.environ.get("GM_SRD_OFFLINE") == "1"
+
+
+def ttl() -> float:
+    try:
+        return float(os.environ["GM_SRD_TTL"])
+    except (KeyError, ValueError):
+        return DEFAULT_TTL
+
+
+def normalize(path: str) -> str:
+    """The store key for `path`: always "/api/...", whatever origin a result url carried."""
+    if path.startswith(("http://", "https://")):
+        parts = urlsplit(path)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+    return path if path.startswith("/") else f"/{path}"
+
+
+class SrdStore:
+    """world-state/srd: one gzipped entry per endpoint, plus the mirror manifest."""
+
+    MANIFEST = "mirror.json"
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.responses = self.root / "responses"
+        self._memo: Dict[str, Any] = {}
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.responses / digest[:2] / f"{digest}.json.gz"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The stored entry {"path", "etag", "fetched", "body"} for `key`, or None."""
+        try:
+            return json.loads(gzip.decompress(self._path(key).read_bytes()))
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, body: Any, etag: Optional[str] = None) -> None:
+        entry = {"path": key, "etag": etag, "fetched": time.time(), "body": body}
+        target = self._path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.{id(entry)}.tmp")
+        tmp.write_bytes(gzip.compress(json.dumps(entry, separators=(",", ":")).encode("utf-8"),
+                                      compresslevel=6))
+        os.replace(tmp, target)
+        self._memo[key] = body
+
+    def manifest(self) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads((self.root / self.MANIFEST).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def write_manifest(self, manifest: Dict[str, Any]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f".{self.MANIFEST}.tmp"
+        tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp, self.root / self.MANIFEST)
+
+    def derive(self, key: str) -> Optional[Any]:
+        """Answer `base?field=value` by filtering the stored `base` list, if its items say."""
+        base, _, query = key.partition("?")
+        if not query:
+            return None
+        entry = self.get(base)
+        results = entry["body"].get("results") if entry and isinstance(entry["body"], dict) \
+            else None
+        if not isinstance(results, list):
+            return None
+        wanted = parse_qsl(query)
+        if any(field not in item for item in results for field, _ in wanted):
+            return None  # the list doesn't carry that field: can't answer honestly
+        kept = [item for item in results
+                if all(str(item[field]) in value.split(",") for field, value in wanted)]
+        return {"count": len(kept), "results": kept}
+
+    def stats(self) -> Dict[str, Any]:
+        files = list(self.responses.rglob("*.json.gz")) if self.responses.is_dir() else []
+        return {"entries": len(files), "bytes": sum(p.stat().st_size for p in files),
+                "mirror": self.manifest(), "path": str(self.root)}
+
+
+_stores: Dict[str, SrdStore] = {}
+
+
+def store() -> SrdStore:
+    """The store under the default world-state (GM_WORLD_STATE_BASE moves it)."""
+    from campaign_manager import DEFAULT_WORLD_STATE, resolve_world_state_base
+    root = str(Path(resolve_world_state_base(DEFAULT_WORLD_STATE)) / "srd")
+    if root not in _stores:
+        _stores[root] = SrdStore(Path(root))
+    return _stores[root]
+
+
+def _request(key: str, etag: Optional[str]):
+    """The origin's response for `key`, revalidating `etag` if given.
+
+    Goes through the shared pooled client (lib/http_client.py): keep-alive,
+    rate limiting and 429/5xx retries. Raises OSError when nothing answers.
+    """
+    import http_client
+    headers = {"Accept": "application/json"}
+    if etag:
+        headers["If-None-Match"] = etag
+    return http_client.client().request("GET", f"{origin()}{key}", headers=headers,
+                                        timeout=TIMEOUT)
+
+
+def fetch(path: str, max_age: float = None) -> Any:
+    """The API's JSON for `path` ("/api/2014/spells/fireball"), from the cache when fresh.
+
+    Failures come back in the shape the feature scripts check for:
+    {"error": "HTTP 404", "message": ...} or {"error": "Request failed", ...}.
+    """
+    key = normalize(path)
+    cache = store()
+    if key in cache._memo and max_age is None:
+        return cache._memo[key]
+    entry = cache.get(key)
+    fresh = entry is not None and time.time() - entry["fetched"] < (ttl() if max_age is None
+                                                                     else max_age)
+    if entry is not None and (fresh or offline()):
+        cache._memo[key] = entry["body"]
+        return entry["body"]
+    if offline():
+        derived = cache.derive(key)
+        if derived is not None:
+            cache._memo[key] = derived
+            return derived
+        if cache.manifest() is None:
+            return {"error": "Offline", "message": "No local SRD mirror: run "
+                    "`uv run python lib/srd_cache.py sync` while online"}
+        return {"error": "HTTP 404", "message": "Not in the local SRD mirror"}
+
+    try:
+        response = _request(key, entry and entry.get("etag"))
+    except OSError as e:
+        if entry is not None:
+            return entry["body"]  # stale beats no answer
+        return {"error": "Request failed", "message": str(e)}
+    if response.status == 304 and entry is not None:
+        cache.put(key, entry["body"], response.headers.get("ETag") or entry.get("etag"))
+        return entry["body"]  # revalidated: only the timestamp moves
+    if not response.ok:
+        if entry is not None and (response.status >= 500 or response.status == 429):
+            return entry["body"]  # stale beats a server error or a rate limit
+        return {"error": f"HTTP {response.status}", "message": response.reason}
+    try:
+        body = response.json()
+    except ValueError as e:
+        if entry is not None:
+            return entry["body"]
+        return {"error": "Request failed", "message": f"Invalid JSON: {e}"}
+    cache.put(key, body, response.headers.get("ETag"))
+    return body
+
+
+def sync(resources: Iterable[str] = RESOURCES, workers: int = 8) -> Dict[str, Any]:
+    """Mirror `resources` (each list and every item in it) into the store.
+
+    Every endpoint is revalidated, so a re-sync costs mostly 304s. Returns the
+    manifest it writes: per-resource item counts and any paths that failed.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    resources = list(resources)
+    counts: Dict[str, int] = {}
+    failed: List[str] = []
+    items: List[str] = []
+    for resource in resources:
+        listing = fetch(f"{API_PREFIX}/{resource}", max_age=0)
+        if not isinstance(listing, dict) or "error" in listing:
+            failed.append(f"{API_PREFIX}/{resource}")
+            continue
+        urls = [r["url"] for r in listing.get("results", []) if r.get("url")]
+        counts[resource] = len(urls)
+        items.extend(urls)
+        items.extend(f"{url}/{suffix}" for url in urls
+                     for parent, suffix in SUBRESOURCES if parent == resource)
+
+    def one(path: str) -> Optional[str]:
+        body = fetch(path, max_age=0)
+        return path if isinstance(body, dict) and "error" in body else None
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        failed.extend(p for p in pool.map(one, items) if p)
+
+    manifest = {"synced": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "origin": origin(), "resources": counts, "endpoints": len(items) + len(counts),
+                "failed": failed}
+    store().write_manifest(manifest)
+    return manifest
+
+
+def main():
+    import argparse
+    from cli_output import wants_json, strip_json_flag, emit
+
+    json_mode = wants_json()
+    parser = argparse.ArgumentParser(description="Cache and offline mirror for the D&D 5e SRD API")
+    sub = parser.add_subparsers(dest="action")
+    sync_parser = sub.add_parser("sync", help="mirror every SRD resource the features use")
+    sync_parser.add_argument("--resources", help=f"comma-separated (default: all {len(RESOURCES)})")
+    sync_parser.add_argument("--workers", type=int, default=8, help="concurrent fetches (default 8)")
+    sub.add_parser("status", help="what the store holds")
+    get_parser = sub.add_parser("get", help="print one endpoint through the cache")
+    get_parser.add_argument("path", help='e.g. "/api/2014/spells/fireball"')
+    args = parser.parse_args(strip_json_flag()[1:])
+
+    if args.action == "sync":
+        resources = args.resources.split(",") if args.resources else RESOURCES
+        manifest = sync(resources, workers=args.workers)
+        status = "[SUCCESS]" if not manifest["failed"] else "[ERROR]"
+        lines = [f"{status} Mirrored {manifest['endpoints']} endpoint(s) from {manifest['origin']}"]
+        lines += [f"  {name}: {count}" for name, count in manifest["resources"].items()]
+        lines += [f"  failed: {p}" for p in manifest["failed"][:10]]
+        emit(manifest, "\n".join(lines), json_mode)
+        if manifest["failed"]:
+            sys.exit(1)
+    elif args.action == "status":
+        stats = store().stats()
+        mirror = stats["mirror"]
+        text = (f"{stats['entries']} cached response(s), {stats['bytes'] / 1024:.0f} KB "
+                f"in {stats['path']}\n" +
+                (f"Mirror synced {mirror['synced']} from {mirror['origin']} "
+                 f"({mirror['endpoints']} endpoints)" if mirror else
+                 "No mirror yet: run `srd_cache.py sync` while online")
+                + ("\nOffline mode: ON (GM_SRD_OFFLINE=1)" if offline() else ""))
+        emit(stats, text, json_mode)
+    elif args.action == "get":
+        print(json.dumps(fetch(args.path), indent=2))
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    import profiling
+    profiling.run(main)
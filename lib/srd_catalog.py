@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Local, indexed tables over an SRD resource (spells, monsters).
+
+The SRD list endpoints return only index, name and url. So any filter on a
+real field (spell level, school or class, or monster CR or type) used to
+fetch every item's full record, one serial HTTP call per item, on every
+query. A catalog fetches each record once, through lib/srd_cache (the
+local mirror when there is one, else concurrent fetches on a bounded
+pool). It keeps one flat row per item plus indexes:
+
+- a value index per field: field -> value -> row numbers
+- a trigram index over names, so a substring search only checks rows that
+  share every trigram with the query
+
+The table lives in world-state/srd/catalogs/<name>.json.gz. It is rebuilt
+when the resource's list no longer matches the rows, so a re-synced mirror
+or a newly published item is picked up on the next query. A subclass
+states its resource, how a record becomes a row, and which fields are
+indexed.
+"""
+
+import abc
+import gzip
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import srd_cache
+
+# path -> ((mtime_ns, size), catalog): a long-lived process parses each table once.
+_tables: Dict[str, tuple] = {}
+
+
+def trigrams(text: str) -> Set[str]:
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SrdCatalog(abc.ABC):
+    """One SRD resource as an indexed local table. Subclasses set the class attributes and `row`."""
+
+    NAME = ""                    # catalog file name, e.g. "spells"
+    RESOURCE = ""                # list endpoint under the API prefix, e.g. "/spells"
+    INDEXED: tuple = ()          # row fields with a value index (list values index each item)
+    VERSION = 1                  # bump when row() changes shape
+    WORKERS = 8                  # concurrent detail fetches while building
+
+    def __init__(self, rows: List[Dict[str, Any]], indexes: Dict[str, Dict[str, List[int]]],
+                 grams: Dict[str, List[int]], missing: List[str] = ()):
+        self.rows = rows
+        self.indexes = indexes
+        self.grams = grams
+        self.missing = list(missing)  # items whose record could not be fetched
+
+    # ---------------------------------------------------------------- subclass hooks
+
+    @staticmethod
+    @abc.abstractmethod
+    def row(record: Dict[str, Any]) -> Dict[str, Any]:
+        """The flat row for one full SRD record (needs at least index and name)."""
+
+    # ---------------------------------------------------------------- build / load
+
+    @classmethod
+    def path(cls) -> Path:
+        return srd_cache.store().root / "catalogs" / f"{cls.NAME}.json.gz"
+
+    @classmethod
+    def load(cls, rebuild: bool = False) -> "SrdCatalog":
+        """The catalog, read from disk while it matches the resource's list, else built.
+
+        Raises RuntimeError (with the API's message) when the list itself
+        cannot be fetched and there is no table on disk.
+        """
+        listing = srd_cache.fetch(f"{srd_cache.API_PREFIX}{cls.RESOURCE}")
+        if isinstance(listing, dict) and "error" in listing:
+            stored = None if rebuild else cls._read()
+            if stored is None:
+                raise RuntimeError(listing.get("message") or listing["error"])
+            return stored  # offline without a mirror: the table we have beats nothing
+        keys = [item["index"] for item in listing.get("results", [])]
+        stored = None if rebuild else cls._read()
+        if stored is not None and stored.keys == keys:
+            return stored
+        known = {row["index"]: row for row in stored.rows} if stored is not None else {}
+        return cls.build(listing.get("results", []), known)
+
+    @classmethod
+    def _read(cls) -> Optional["SrdCatalog"]:
+        """The table on disk; parsed once per process while the file is unchanged."""
+        path = cls.path()
+        try:
+            st = path.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+            hit = _tables.get(str(path))
+            if hit is not None and hit[0] == stamp:
+                return hit[1]
+            data = json.loads(gzip.decompress(path.read_bytes()))
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != cls.VERSION:
+            return None
+        catalog = cls(data["rows"], data["indexes"], data["grams"])
+        _tables[str(path)] = (stamp, catalog)
+        return catalog
+
+    @property
+    def keys(self) -> List[str]:
+        return [row["index"] for row in self.rows] + self.missing
+
+    @classmethod
+    def build(cls, items: List[Dict[str, Any]],
+              known: Optional[Dict[str, Dict[str, Any]]] = None) -> "SrdCatalog":
+        """Rows for `items`, index them, persist if complete.
+
+        Rows in `known` (the previous table, by index) are reused, so a list
+        that gained a few items costs a few fetches. The rest are fetched on
+        a bounded pool.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        known = known or {}
+        todo = [item for item in items if item["index"] not in known]
+        with ThreadPoolExecutor(max_workers=max(1, min(cls.WORKERS, len(todo)))) as pool:
+            fetched = dict(zip((item["index"] for item in todo),
+                               pool.map(lambda item: srd_cache.fetch(item["url"]), todo)))
+        rows, missing = [], []
+        for item in items:
+            if item["index"] in known:
+                rows.append(known[item["index"]])
+                continue
+            rec = fetched[item["index"]]
+            if not isinstance(rec, dict) or "error" in rec:
+                missing.append(item["index"])
+                continue
+            rows.append(dict(cls.row(rec), index=item["index"], name=item.get("name"),
+                             url=item.get("url")))
+        catalog = cls(rows, cls._index(rows), cls._grams(rows), missing)
+        if not missing:
+            catalog._write()
+        return catalog
+
+    @classmethod
+    def _index(cls, rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, List[int]]]:
+        indexes: Dict[str, Dict[str, List[int]]] = {field: {} for field in cls.INDEXED}
+        for i, row in enumerate(rows):
+            for field in cls.INDEXED:
+                values = row.get(field)
+                for value in values if isinstance(values, list) else [values]:
+                    indexes[field].setdefault(cls.key(value), []).append(i)
+        return indexes
+
+    @staticmethod
+    def _grams(rows: List[Dict[str, Any]]) -> Dict[str, List[int]]:
+        grams: Dict[str, List[int]] = {}
+        for i, row in enumerate(rows):
+            for gram in sorted(trigrams(row.get("name") or "")):
+                grams.setdefault(gram, []).append(i)
+        return grams
+
+    def _write(self) -> None:
+        target = self.path()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": self.VERSION,
+                "built": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "rows": self.rows, "indexes": self.indexes, "grams": self.grams}
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(gzip.compress(json.dumps(data, separators=(",", ":")).encode("utf-8")))
+        os.replace(tmp, target)
+
+    # ---------------------------------------------------------------- queries
+
+    @staticmethod
+    def key(value: Any) -> str:
+        """Index keys are strings (JSON object keys).
+
+        True -> "true", 3.0 -> "3", "Evocation" -> "evocation".
+        """
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)  # a CR of 2 reads as 2 in the API and 2.0 from argparse
+        return str(value).lower()
+
+    def matching(self, search: str = None, **filters: Any) -> List[Dict[str, Any]]:
+        """Rows whose name contains `search` and whose indexed fields equal every filter.
+
+        A filter value of None is ignored; a list or tuple matches any of its
+        values. Rows come back in the resource's own (alphabetical) order.
+        """
+        selected: Optional[Set[int]] = None
+        for field, wanted in filters.items():
+            if wanted is None:
+                continue
+            values = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+            ids = set()
+            for value in values:
+                ids.update(self.indexes.get(field, {}).get(self.key(value), ()))
+            selected = ids if selected is None else selected & ids
+        if search:
+            needle = search.lower()
+            grams = trigrams(needle)
+            if grams:
+                candidates = None
+                for gram in grams:
+                    ids = set(self.grams.get(gram, ()))
+                    candidates = ids if candidates is None else candidates & ids
+                selected = candidates if selected is None else selected & candidates
+            pool = range(len(self.rows)) if selected is None else selected
+            selected = {i for i in pool if needle in (self.rows[i].get("name") or "").lower()}
+        ids = range(len(self.rows)) if selected is None else sorted(selected)
+        return [self.rows[i] for i in ids]
+
+    def values(self, field: str) -> List[str]:
+        """Every indexed value of `field`, sorted."""
+        return sorted(self.indexes.get(field, {}))
+
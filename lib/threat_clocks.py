@@ -8,6 +8,11 @@ dramatic beat / book-native milestone. Tone-respecting: a kit/campaign that want
 no doom clock simply declares none. Dramatic choices made at inflection points are
 recorded as consequences (via consequence_manager), tying the fork into the
 reactive world.
+
+A time clock is not rewritten as time passes. It stores the `current` it had
+at scheduler tick `since` and gains one segment per tick after that, so its
+value is derived from `TimeScheduler.now()` when read (`clock_current`). The
+only stored state a time advance touches is the clocks whose fill events pop.
 """
 
 import sys
@@ -17,29 +22,72 @@ from typing import Any, Dict, Optional
 sys.path.insert(0, str(Path(__file__).parent))
 
 from entity_manager import EntityManager
+from campaign_context import CampaignContext
+
+
+def clock_current(clock: Dict[str, Any], now: int) -> int:
+    """A clock's segments at tick `now`: stored, plus the ticks since `since` for a time clock."""
+    cur = int(clock.get("current", 0))
+    if clock.get("advance_on", "time") != "time" or "since" not in clock:
+        return cur
+    return min(int(clock.get("max", 1)), cur + max(0, int(now) - int(clock["since"])))
+
+
+def clocks_at(clocks: Dict[str, Any], now: int) -> Dict[str, Any]:
+    """Copy of `clocks` with every time clock's `current` derived at tick `now`."""
+    if not isinstance(clocks, dict):
+        return clocks
+    return {name: {**c, "current": clock_current(c, now)}
+            if isinstance(c, dict) and "since" in c else c
+            for name, c in clocks.items()}
 
 
 class ThreatClockManager(EntityManager):
-    def __init__(self, world_state_dir: str = None):
-        super().__init__(world_state_dir)
+    def __init__(self, world_state_dir: str = None, context: CampaignContext = None):
+        super().__init__(world_state_dir, context)
         self._wsd = world_state_dir
         self.clocks_file = "threat-clocks.json"
+        self.last_due = []
 
     def _load(self) -> Dict[str, Any]:
         return self.json_ops.load_json(self.clocks_file) or {}
 
+    def _scheduler(self):
+        from time_scheduler import TimeScheduler
+        return TimeScheduler(self._wsd, context=self.context)
+
+    def _clocks_now(self) -> Dict[str, Any]:
+        return clocks_at(self._load(), self._scheduler().now())
+
     def add_clock(self, name: str, segments: int, advance_on: str = "time",
                   consequence: str = None, linked_plot: str = None) -> Dict[str, Any]:
         data = self._load()
         entry = {"current": 0, "max": int(segments), "advance_on": advance_on}
+        if advance_on == "time":
+            entry["since"] = self._scheduler().now()
         if consequence:
             entry["consequence"] = consequence
         if linked_plot:
             entry["linked_plot"] = linked_plot
         data[name] = entry
         self.json_ops.save_json(self.clocks_file, data)
+        self._schedule_fill(name, entry)
         return data[name]
 
+    def _schedule_fill(self, name: str, clock: Dict[str, Any]) -> None:
+        """Keep the clock's fill tick in the TimeScheduler in step with its state.
+
+        A time clock gains one segment per tick, so it fills `max - current`
+        ticks from now (`clock` is as of now). Event clocks and full clocks
+        have nothing scheduled.
+        """
+        sched = self._scheduler()
+        cur, mx = int(clock.get("current", 0)), int(clock.get("max", 1))
+        if clock.get("advance_on", "time") == "time" and cur < mx:
+            sched.schedule("clock", name, delay=mx - cur, label=f"{name} fills")
+        else:
+            sched.cancel("clock", name)
+
     def _fire_if_filled(self, name: str, clock: Dict[str, Any], was_full: bool) -> Optional[str]:
         """Write a clock's stored consequence into the world as it FILLS.
 
@@ -64,7 +112,7 @@ class ThreatClockManager(EntityManager):
         # add_consequence announces itself on stdout; this one fires from inside
         # advance/tick-time, whose --json output must stay parseable.
         with contextlib.redirect_stdout(sys.stderr):
-            cid = ConsequenceManager(self._wsd).add_consequence(
+            cid = ConsequenceManager(self._wsd, context=self.context).add_consequence(
                 f"[Clock — {name}] {text}", trigger=f"the {name} clock ran out")
         clock["consequence_fired"] = cid
         return cid
@@ -74,53 +122,89 @@ class ThreatClockManager(EntityManager):
         c = data.get(name)
         if not c:
             return None
-        was_full = int(c.get("current", 0)) >= int(c.get("max", 1))
-        c["current"] = min(c["max"], int(c.get("current", 0)) + int(ticks))
+        now = self._scheduler().now()
+        cur = clock_current(c, now)
+        was_full = cur >= int(c.get("max", 1))
+        c["current"] = min(c["max"], cur + int(ticks))
+        if c.get("advance_on", "time") == "time":
+            c["since"] = now
         self._fire_if_filled(name, c, was_full)
         self.json_ops.save_json(self.clocks_file, data)
+        self._schedule_fill(name, c)
         return c
 
     def tick_time_clocks(self, ticks: int = 1) -> Dict[str, Any]:
-        """Advance every advance_on=='time' clock that isn't already full.
+        """Advance game time: time clocks progress, and the events now due fire.
 
         The automatic pressure wire: gm-time.sh calls this after each time
         update, passing ticks scaled to elapsed magnitude (--ticks / --duration).
         Default ticks=1 (Dawn→Noon stays +1). Event clocks (advance_on != 'time')
         are untouched — the GM advances those by hand.
-        Returns {name: clock} for the clocks that moved.
+
+        Time clocks need no per-tick write: their `current` is derived from the
+        scheduler tick when read. What happens comes from the TimeScheduler:
+        only events due by the new tick are popped, in the order they came due,
+        so a week-long rest fills a 3-tick clock before a 5-day deadline lands.
+        A popped clock fill stores the clock's full value and writes its
+        consequence; `on_elapsed` consequences are marked due for the next
+        consequence tick. `last_due` keeps the popped events for the caller.
+        Returns {name: clock} for the clocks that filled.
         """
+        sched = self._scheduler()
         data = self._load()
-        advanced = {}
-        for name, c in data.items():
-            if c.get("advance_on", "time") != "time":
-                continue
-            cur, mx = int(c.get("current", 0)), int(c.get("max", 1))
-            if cur >= mx:
-                continue
-            c["current"] = min(mx, cur + int(ticks))
-            self._fire_if_filled(name, c, was_full=False)  # full clocks skipped above
-            advanced[name] = c
-        if advanced:
+        start = sched.now()
+        # Clocks written before `since` existed were bumped in place: anchor
+        # them at the current tick once, with a fill event like any other.
+        legacy = [name for name, c in data.items() if isinstance(c, dict)
+                  and c.get("advance_on", "time") == "time" and "since" not in c]
+        for name in legacy:
+            data[name]["since"] = start
+            self._schedule_fill(name, data[name])
+
+        self.last_due = sched.advance(ticks)
+        now = start + max(0, int(ticks))
+        filled = {}
+        due_consequences = {}
+        for event in self.last_due:
+            if event["kind"] == "clock" and isinstance(data.get(event["ref"]), dict):
+                c = data[event["ref"]]
+                c["current"], c["since"] = clock_current(c, now), now
+                if c["current"] >= int(c.get("max", 1)):
+                    self._fire_if_filled(event["ref"], c, was_full=False)
+                    filled[event["ref"]] = c
+            elif event["kind"] == "consequence":
+                due_consequences[event["ref"]] = event["due"]
+        if filled or legacy:
             self.json_ops.save_json(self.clocks_file, data)
-        return advanced
+        if due_consequences:
+            from consequence_manager import ConsequenceManager
+            ConsequenceManager(self._wsd, context=self.context).mark_due(due_consequences)
+        return filled
+
+    def upcoming(self, limit: int = 5) -> Dict[str, Any]:
+        """What fires next in game time: clock fills and timed consequences."""
+        sched = self._scheduler()
+        return {"now": sched.now(), "upcoming": sched.upcoming(limit)}
 
     def remove_clock(self, name: str) -> bool:
         data = self._load()
         if name in data:
             del data[name]
             self.json_ops.save_json(self.clocks_file, data)
+            self._scheduler().cancel("clock", name)
             return True
         return False
 
     def get_clocks(self) -> Dict[str, Any]:
-        return self._load()
+        return self._clocks_now()
 
     def is_full(self, name: str) -> bool:
-        c = self._load().get(name)
+        c = self._clocks_now().get(name)
         return bool(c and c.get("current", 0) >= c.get("max", 1))
 
     def full_clocks(self) -> Dict[str, Any]:
-        return {n: c for n, c in self._load().items() if c.get("current", 0) >= c.get("max", 1)}
+        return {n: c for n, c in self._clocks_now().items()
+                if c.get("current", 0) >= c.get("max", 1)}
 
     def pending_beats(self) -> Dict[str, Any]:
         """Filled clocks = dramatic beats that are due (an inflection point)."""
@@ -135,7 +219,7 @@ class ThreatClockManager(EntityManager):
         off later (optionally with a structured trigger). Returns the consequence id.
         """
         from consequence_manager import ConsequenceManager
-        cm = ConsequenceManager(self._wsd)
+        cm = ConsequenceManager(self._wsd, context=self.context)
         text = f"[Choice — {prompt}] {chosen_fork}"
         return cm.add_consequence(text, trigger, trigger_type=trigger_type, match=match)
 
@@ -167,6 +251,7 @@ def main():
     p = sub.add_parser("remove"); p.add_argument("name")
     sub.add_parser("list")
     sub.add_parser("beats")  # filled clocks = beats due
+    p = sub.add_parser("next"); p.add_argument("--limit", type=int, default=5)
     p = sub.add_parser("choose"); p.add_argument("prompt"); p.add_argument("chosen")
     p.add_argument("--trigger", default="player choice")
     p.add_argument("--trigger-type", dest="trigger_type")
@@ -190,10 +275,22 @@ def main():
                 if c.get("current", 0) >= c.get("max", 1):
                     print(f"⚠ {n} is FULL — a dramatic beat is due"
                           + (f": {c['consequence']}" if c.get("consequence") else ""))
+            for e in m.last_due:
+                if e["kind"] == "consequence":
+                    print(f"⏰ due (tick {e['due']}): [{e['ref']}] {e.get('label', '')}")
     elif args.action == "remove":
         out = {"removed": m.remove_clock(args.name)}
     elif args.action == "beats":
         out = m.pending_beats()
+    elif args.action == "next":
+        out = m.upcoming(args.limit)
+        if not json_mode:
+            if not out["upcoming"]:
+                print("Nothing scheduled")
+            for e in out["upcoming"]:
+                label = e.get('label') or e['ref']
+                print(f"+{e['due'] - out['now']} tick(s) [{e['kind']}] {label}")
+            return
     elif args.action == "choose":
         out = {"consequence_id": m.record_choice(
             args.prompt, args.chosen, trigger=args.trigger,
@@ -210,4 +307,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
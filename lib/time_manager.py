@@ -10,7 +10,9 @@ from typing import Optional
 sys.path.insert(0, str(Path(__file__).parent))
 
 from campaign_manager import CampaignManager
+from campaign_context import CampaignContext
 from json_ops import JsonOperations
+import hud
 
 # Small elapsed-magnitude map for threat-clock ticks. Not a calendar parser:
 # minutes / hours / same-day time-of-day → 1
@@ -51,14 +53,19 @@ def ticks_for_elapsed(ticks: Optional[int] = None, duration: Optional[str] = Non
 class TimeManager:
     """Manage campaign time state."""
 
-    def __init__(self, world_state_dir: str = "world-state"):
-        self.campaign_mgr = CampaignManager(world_state_dir)
-        self.campaign_dir = self.campaign_mgr.get_active_campaign_dir()
+    def __init__(self, world_state_dir: str = "world-state", context: CampaignContext = None):
+        if context is not None:
+            self.campaign_mgr = context.campaign_mgr
+            self.campaign_dir = context.require()
+            self.json_ops = context.json_ops
+        else:
+            self.campaign_mgr = CampaignManager(world_state_dir)
+            self.campaign_dir = self.campaign_mgr.get_active_campaign_dir()
 
-        if self.campaign_dir is None:
-            raise RuntimeError("No active campaign. Run /new-game or /import first.")
+            if self.campaign_dir is None:
+                raise RuntimeError("No active campaign. Run /new-game or /import first.")
 
-        self.json_ops = JsonOperations(str(self.campaign_dir))
+            self.json_ops = JsonOperations(str(self.campaign_dir))
 
     def update_time(self, time_of_day: str, date: str) -> bool:
         """Update the campaign time and date."""
@@ -70,6 +77,7 @@ class TimeManager:
         if not self.json_ops.save_json("campaign-overview.json", data):
             print(f"[ERROR] Failed to update time")
             return False
+        hud.refresh(self.campaign_dir)
 
         print(f"[SUCCESS] Time updated to: {time_of_day}, {date}")
         return True
@@ -154,4 +162,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+In-game time scheduler — what fires next, and in what order.
+
+Campaign time is counted in the same ticks threat clocks use
+(`time_manager.ticks_for_elapsed`: same-day hops are 1, N days are N, N weeks
+are 7*N). Anything that should happen at a point in game time registers a due
+tick here: a time clock's fill, an `on_elapsed` consequence, a world-tick
+development. Advancing time pops only the events that are due, oldest first, so
+a long rest that skips many ticks still fires them in the order they came due.
+
+The queue is a binary heap persisted in time-schedule.json. Events are keyed by
+(kind, ref); rescheduling or cancelling leaves the old heap entry behind as a
+stale tombstone that is skipped on pop and compacted away once they pile up.
+"""
+
+import heapq
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from entity_manager import EntityManager
+from campaign_context import CampaignContext
+
+
+class TimeScheduler(EntityManager):
+    """Priority queue of game-time events, keyed on the campaign tick counter."""
+
+    def __init__(self, world_state_dir: str = None, context: CampaignContext = None):
+        super().__init__(world_state_dir, context)
+        self.schedule_file = "time-schedule.json"
+
+    def _load(self) -> Dict[str, Any]:
+        data = self.json_ops.load_json(self.schedule_file) or {}
+        data.setdefault("now", 0)
+        data.setdefault("seq", 0)
+        data.setdefault("heap", [])
+        data.setdefault("events", {})
+        return data
+
+    def _save(self, data: Dict[str, Any]) -> bool:
+        # Tombstones outnumbering live events: rebuild the heap from the index.
+        if len(data["heap"]) > 2 * len(data["events"]) + 16:
+            data["heap"] = [[e["due"], e["seq"], k] for k, e in data["events"].items()]
+            heapq.heapify(data["heap"])
+        return self.json_ops.save_json(self.schedule_file, data)
+
+    @staticmethod
+    def _key(kind: str, ref: str) -> str:
+        return f"{kind}:{ref}"
+
+    def now(self) -> int:
+        """The campaign's current tick."""
+        return int(self._load()["now"])
+
+    def schedule(self, kind: str, ref: str, due: Optional[int] = None,
+                 delay: Optional[int] = None, **payload) -> Dict[str, Any]:
+        """Register (or move) the (kind, ref) event at an absolute `due` tick or `delay` from now."""
+        data = self._load()
+        if due is None:
+            due = int(data["now"]) + max(0, int(delay or 0))
+        data["seq"] += 1
+        event = {"kind": kind, "ref": ref, "due": int(due), "seq": data["seq"], **payload}
+        key = self._key(kind, ref)
+        data["events"][key] = event
+        heapq.heappush(data["heap"], [event["due"], event["seq"], key])
+        self._save(data)
+        return event
+
+    def cancel(self, kind: str, ref: str) -> bool:
+        """Drop the (kind, ref) event; its heap entry becomes a tombstone."""
+        data = self._load()
+        if data["events"].pop(self._key(kind, ref), None) is None:
+            return False
+        self._save(data)
+        return True
+
+    def get(self, kind: str, ref: str) -> Optional[Dict[str, Any]]:
+        return self._load()["events"].get(self._key(kind, ref))
+
+    def advance(self, ticks: int = 1) -> List[Dict[str, Any]]:
+        """Move time forward and pop every event now due, in (due, registration) order."""
+        data = self._load()
+        data["now"] = int(data["now"]) + max(0, int(ticks))
+        heap, events = data["heap"], data["events"]
+        fired = []
+        while heap and heap[0][0] <= data["now"]:
+            due, seq, key = heapq.heappop(heap)
+            event = events.get(key)
+            if event is None or event["seq"] != seq:
+                continue  # cancelled or rescheduled
+            del events[key]
+            fired.append(event)
+        self._save(data)
+        return fired
+
+    def upcoming(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """The next `limit` live events, soonest first, without popping them."""
+        data = self._load()
+        live = (e for e in data["events"].values())
+        return heapq.nsmallest(limit, live, key=lambda e: (e["due"], e["seq"]))
+
@@ -11,8 +11,7 @@ from pathlib import Path
 # Add lib directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from campaign_manager import CampaignManager
-from json_ops import JsonOperations
+from campaign_context import CampaignContext
 from npc_manager import NPCManager
 from location_manager import LocationManager
 from plot_manager import PlotManager
@@ -45,26 +44,25 @@ class World:
         print(world.current_location)
     """
 
-    def __init__(self, campaign_name: str = None):
+    def __init__(self, campaign_name: str = None, world_state_dir: str = None,
+                 context: CampaignContext = None):
         """Initialize world context.
 
         Args:
             campaign_name: Name of campaign to load. If None, uses active campaign.
+            world_state_dir: Base world state directory. Defaults to "world-state".
+            context: An already resolved CampaignContext to use instead.
 
         Raises:
             RuntimeError: If no active campaign is set and no name provided.
         """
-        self.campaign_mgr = CampaignManager()
-
-        if campaign_name:
-            self.campaign_mgr.set_active(campaign_name)
-
-        self.campaign_dir = self.campaign_mgr.get_active_campaign_dir()
-
-        if self.campaign_dir is None:
-            raise RuntimeError("No active campaign. Run /new-game or /import first.")
-
-        self.json_ops = JsonOperations(str(self.campaign_dir))
+        # The campaign is resolved once here; every manager below shares this
+        # context (and its one JsonOperations) instead of resolving its own.
+        self.context = context or CampaignContext(world_state_dir, campaign_name)
+        self.campaign_mgr = self.context.campaign_mgr
+        self.campaign_dir = self.context.require()
+        self.json_ops = self.context.json_ops
+        self._base = self.context.world_state_dir
 
         # Initialize managers with shared campaign directory
         # Each manager handles its own file operations within this directory
@@ -82,42 +80,42 @@ class World:
     def npcs(self) -> NPCManager:
         """NPC manager for creating and updating NPCs."""
         if self._npcs is None:
-            self._npcs = NPCManager(str(self.campaign_dir.parent.parent))
+            self._npcs = NPCManager(self._base, context=self.context)
         return self._npcs
 
     @property
     def locations(self) -> LocationManager:
         """Location manager for world geography."""
         if self._locations is None:
-            self._locations = LocationManager(str(self.campaign_dir.parent.parent))
+            self._locations = LocationManager(self._base, context=self.context)
         return self._locations
 
     @property
     def plots(self) -> PlotManager:
         """Plot manager for quests and storylines."""
         if self._plots is None:
-            self._plots = PlotManager(str(self.campaign_dir.parent.parent))
+            self._plots = PlotManager(self._base, context=self.context)
         return self._plots
 
     @property
     def session(self) -> SessionManager:
         """Session manager for game state and saves."""
         if self._session is None:
-            self._session = SessionManager(str(self.campaign_dir.parent.parent))
+            self._session = SessionManager(self._base, context=self.context)
         return self._session
 
     @property
     def consequences(self) -> ConsequenceManager:
         """Consequence manager for tracking future events."""
         if self._consequences is None:
-            self._consequences = ConsequenceManager(str(self.campaign_dir.parent.parent))
+            self._consequences = ConsequenceManager(self._base, context=self.context)
         return self._consequences
 
     @property
     def player(self) -> PlayerManager:
         """Player manager for character stats."""
         if self._player is None:
-            self._player = PlayerManager(str(self.campaign_dir.parent.parent))
+            self._player = PlayerManager(self._base, context=self.context)
         return self._player
 
     # Convenience properties for common data
@@ -125,7 +123,7 @@ class World:
     @property
     def campaign_name(self) -> Optional[str]:
         """Get the name of the active campaign."""
-        return self.campaign_mgr.get_active()
+        return self.context.campaign_name
 
     @property
     def current_location(self) -> Optional[str]:
@@ -187,11 +185,12 @@ class World:
         Returns:
             Dict with counts and current state info
         """
+        overview = self.get_overview()
         return {
             "campaign": self.campaign_name,
-            "location": self.current_location,
-            "time": self.time_of_day,
-            "date": self.current_date,
+            "location": overview.get("player_position", {}).get("current_location"),
+            "time": overview.get("time_of_day"),
+            "date": overview.get("current_date"),
             "npcs_count": len(self.json_ops.load_json("npcs.json") or {}),
             "locations_count": len(self.json_ops.load_json("locations.json") or {}),
             "active_consequences": len(
@@ -253,4 +252,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
@@ -33,6 +33,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from json_ops import JsonOperations
 from campaign_manager import CampaignManager
+from campaign_context import CampaignContext
 from game_core import make_progression, opposed_check, resolve_check
 
 
@@ -50,11 +51,16 @@ DEFAULT_RULESET = {
 class WorldKit:
     """Loads a campaign's ruleset.json and drives play through the generic core."""
 
-    def __init__(self, world_state_dir: str = None):
-        base = world_state_dir or "world-state"
-        cm = CampaignManager(base)
-        self.campaign_dir = cm.get_active_campaign_dir()
-        self.json_ops = JsonOperations(str(self.campaign_dir))
+    def __init__(self, world_state_dir: str = None, context: CampaignContext = None):
+        """`context` reads the kit of that context's campaign (pinned ones included)."""
+        if context is not None:
+            self.campaign_dir = context.campaign_dir
+            self.json_ops = context.json_ops
+        else:
+            base = world_state_dir or "world-state"
+            cm = CampaignManager(base)
+            self.campaign_dir = cm.get_active_campaign_dir()
+            self.json_ops = JsonOperations(str(self.campaign_dir))
         self.ruleset = self.json_ops.load_json("ruleset.json") or dict(DEFAULT_RULESET)
         prog = self.ruleset.get("progression", {}) or {}
         if isinstance(prog, str):          # shorthand: "progression": "milestone"
@@ -265,4 +271,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
@@ -14,6 +14,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from json_ops import JsonOperations
 from campaign_manager import CampaignManager
+from consequence_archive import ConsequenceArchive
+from session_log_index import SessionLogIndex
 from schemas import PLOT_TYPES, PLOT_TYPE_SORT
 
 # Canonical plot types in display order — the counter keys are derived, never hand-listed.
@@ -68,7 +70,9 @@ class WorldStats:
         consequences = self.json_ops.load_json("consequences.json")
         if isinstance(consequences, dict):
             counts["consequences_active"] = len(consequences.get("active", []))
-            counts["consequences_resolved"] = len(consequences.get("resolved", []))
+            counts["consequences_resolved"] = (
+                len(consequences.get("resolved", []))
+                + ConsequenceArchive(self.world_state_dir).count("resolved"))
 
         # Plots
         plots = self.json_ops.load_json("plots.json")
@@ -92,10 +96,7 @@ class WorldStats:
             counts["characters"] = 1
 
         # Sessions
-        session_log = self.world_state_dir / "session-log.md"
-        if session_log.exists():
-            content = session_log.read_text()
-            counts["sessions"] = content.count("Session Started:")
+        counts["sessions"] = SessionLogIndex(self.world_state_dir).load(persist=False)["counts"]["started"]
 
         return counts
 
@@ -278,4 +279,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import profiling
+    profiling.run(main)
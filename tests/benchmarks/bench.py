@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Time the hot paths against a synthetic campaign and compare to a baseline.
+
+Each benchmark gets a fresh world from `synth.build()` (same size, same seed),
+is warmed once, then timed `--repeat` times; the report keeps the median,
+which is what `--baseline` compares. The import chain rewrites the files
+it reads, so each of its runs starts from a fresh copy (made untimed).
+
+    python tests/benchmarks/bench.py --size medium --out bench-medium.json
+    python tests/benchmarks/bench.py --size medium --baseline bench-medium.json
+
+With `--baseline`, a benchmark regresses when its median is more than
+`--tolerance` (default 25%) slower than the stored one AND slower by at
+least `--floor-ms`, so sub-millisecond jitter never fails a run. Exit status
+is 1 on any regression.
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+BENCH_DIR = Path(__file__).resolve().parent
+LIB_DIR = BENCH_DIR.parent.parent / "lib"
+sys.path.insert(0, str(LIB_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+import synth
+
+RESOLVE_QUERIES = 200  # names per resolve_entity_name run
+
+
+def _chain(campaign_dir: Path) -> None:
+    """The post-processing `gm-extract.sh` runs on an imported campaign, in order."""
+    from extraction_cap import cap_campaign
+    from minor_stubs import run_stubs
+    from connection_normalize import run_normalize
+    from location_reconcile import run_reconcile
+    from integrity_gate import run_gate
+    cap_campaign(campaign_dir)
+    run_stubs(campaign_dir)
+    run_normalize(campaign_dir)
+    run_reconcile(campaign_dir)
+    run_gate(campaign_dir, strict=False)
+
+
+# Each benchmark is setup(world, campaign_dir) -> the timed callable; setup runs
+# untimed. A callable with a `prepare` attribute gets it called (untimed) before
+# every timed run.
+
+def _full_context(use_cache: bool):
+    def setup(world, camp):
+        from session_manager import SessionManager
+        sm = SessionManager(world)
+        sm.get_full_context(use_cache=use_cache)  # the cached variant starts warm
+        return lambda: sm.get_full_context(use_cache=use_cache)
+    return setup
+
+
+def _tick(world, camp):
+    from consequence_manager import ConsequenceManager
+    over = json.loads((camp / "campaign-overview.json").read_text())
+    state = {"location": over["player_position"]["current_location"],
+             "time": over["time_of_day"], "date": over["current_date"]}
+    cm = ConsequenceManager(world)
+    return lambda: cm.tick(state)
+
+
+def _search_all(world, camp):
+    from search import WorldSearcher
+    ws = WorldSearcher(world)
+    query = sorted(json.loads((camp / "npcs.json").read_text()))[0].split()[0]
+    return lambda: ws.search_all(query)
+
+
+def _recall(world, camp):
+    from campaign_memory import CampaignMemory
+    mem = CampaignMemory(world)
+    mem.refresh()
+    query = json.loads((camp / "facts.json").read_text())["session_events"][0]["fact"]
+    return lambda: mem.recall(query)
+
+
+def _create_save(world, camp):
+    from session_manager import SessionManager
+    sm = SessionManager(world)
+    counter = itertools.count()
+    return lambda: sm.create_save(f"bench-{next(counter)}")
+
+
+def _resolve(world, camp):
+    from entity_aliases import resolve_entity_name
+    npcs = json.loads((camp / "npcs.json").read_text())
+    names = sorted(npcs)
+    step = max(1, len(names) // (RESOLVE_QUERIES // 4))
+    queries = []
+    for name in names[::step][:RESOLVE_QUERIES // 4]:
+        # exact, wrong case, titled, unknown: every resolution tier
+        queries += [name, name.upper(), f"Captain {name}", f"{name} the Lost"]
+    return lambda: [resolve_entity_name(q, npcs) for q in queries]
+
+
+def _import_chain(world, camp):
+    # The chain rewrites the files it reads, so every run gets a fresh copy.
+    copies = itertools.count()
+    current = {}
+
+    def prepare():
+        current["dir"] = Path(world) / "chain" / str(next(copies))
+        shutil.copytree(camp, current["dir"])
+
+    def run():
+        _chain(current["dir"])
+    run.prepare = prepare
+    return run
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    "get_full_context": _full_context(False),
+    "get_full_context[cached]": _full_context(True),
+    "ConsequenceManager.tick": _tick,
+    "WorldSearcher.search_all": _search_all,
+    "CampaignMemory.recall": _recall,
+    "create_save": _create_save,
+    "resolve_entity_name": _resolve,
+    "import_chain": _import_chain,
+}
+
+
+def _time(fn: Callable[[], object], repeat: int) -> List[float]:
+    """Milliseconds per call; stdout from the managers is swallowed."""
+    prepare = getattr(fn, "prepare", lambda: None)
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        prepare()
+        fn()  # warm: lazy imports, OS cache
+        for _ in range(repeat):
+            prepare()
+            start = time.perf_counter()
+            fn()
+            times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def run(size: str = "small", seed: int = 1, repeat: int = 5,
+        only: Optional[List[str]] = None, **counts: int) -> Dict[str, object]:
+    """Build the world, time every selected benchmark, return the JSON report."""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="bench-world-") as tmp:
+        dims = dict(synth.SIZES[size], **counts)
+        for i, (name, setup) in enumerate(BENCHMARKS.items()):
+            if only and name not in only:
+                continue
+            world = str(Path(tmp) / str(i))
+            camp = synth.build(world, size, seed, **counts)
+            with contextlib.redirect_stdout(io.StringIO()):
+                fn = setup(world, camp)
+            times = _time(fn, repeat)
+            shutil.rmtree(world, ignore_errors=True)
+            results[name] = {"median_ms": round(statistics.median(times), 3),
+                             "min_ms": round(min(times), 3), "runs": len(times)}
+    return {
+        "meta": {"size": size, "seed": seed, "repeat": repeat, "counts": dims,
+                 "python": platform.python_version(), "platform": platform.platform(),
+                 "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())},
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, object], baseline: Dict[str, object],
+            tolerance: float = 0.25, floor_ms: float = 1.0) -> List[Dict[str, object]]:
+    """One row per benchmark in both reports, `regressed` set on real slowdowns."""
+    rows = []
+    base = baseline.get("results", {})
+    for name, now in current.get("results", {}).items():
+        if name not in base:
+            continue
+        old, new = base[name]["median_ms"], now["median_ms"]
+        ratio = new / old if old else float("inf") if new else 1.0
+        rows.append({"name": name, "baseline_ms": old, "current_ms": new,
+                     "ratio": round(ratio, 3),
+                     "regressed": ratio > 1 + tolerance and new - old >= floor_ms})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the hot paths on a synthetic campaign")
+    parser.add_argument("--size", choices=sorted(synth.SIZES), default="small")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", action="append", choices=list(BENCHMARKS),
+                        help="run just this benchmark (repeatable)")
+    for axis in synth.SIZES["tiny"]:
+        parser.add_argument(f"--{axis}", type=int, help=f"override the preset's {axis} count")
+    parser.add_argument("--out", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", help="a previous report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--floor-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    counts = {a: getattr(args, a) for a in synth.SIZES["tiny"] if getattr(args, a) is not None}
+    report = run(args.size, args.seed, args.repeat, args.only, **counts)
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n")
+        print(f"[SUCCESS] Wrote {len(report['results'])} benchmark(s) to {args.out}")
+    else:
+        print(text)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        if baseline.get("meta", {}).get("counts") != report["meta"]["counts"]:
+            print("[ERROR] Baseline was measured on a different campaign size", file=sys.stderr)
+            sys.exit(2)
+        rows = compare(report, baseline, args.tolerance, args.floor_ms)
+        for r in rows:
+            flag = "REGRESSED" if r["regressed"] else "ok"
+            print(f"  {r['name']:<28} {r['baseline_ms']:>10.2f} -> {r['current_ms']:>10.2f} ms"
+                  f"  x{r['ratio']:<6} {flag}", file=sys.stderr)
+        if any(r["regressed"] for r in rows):
+            print("[ERROR] Benchmark regression against baseline", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
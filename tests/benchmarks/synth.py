@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Seeded synthetic campaigns for the benchmark suite.
+
+The DCC fixture is 16 NPCs, 22 locations and 20 logged sessions — big enough
+to prove behavior, far too small to show how a hot path scales. `build()`
+writes a complete world-state (active-campaign.txt + one campaign) in the
+same shapes the managers and the extraction chain read: npcs/locations/
+plots/items/facts/consequences JSON, a session log with ended sessions,
+overview, character sheet, and a synthetic book under chunks/ (what
+`gm-extract.sh prepare` leaves behind).
+
+Everything comes from one `random.Random(seed)`, so the same size and seed
+always produce byte-identical files and a timing change means a code change,
+not a different world. Names are unique per type; cross-references (NPC
+locations, plot NPCs/locations, connections, consequence matches) point at
+entities that exist, with a small share of dangling plot references so the
+import chain's stub and reconcile steps have real work to do.
+
+    python tests/benchmarks/synth.py /tmp/bench-world --size medium
+"""
+
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Callable, Dict, List, Set
+
+CAMPAIGN = "bench"
+
+# npcs and locations, logged sessions, facts, book chunks.
+SIZES: Dict[str, Dict[str, int]] = {
+    "tiny":   {"npcs": 20,     "locations": 20,     "sessions": 3,   "facts": 50,     "chunks": 4},
+    "small":  {"npcs": 100,    "locations": 100,    "sessions": 10,  "facts": 1_000,  "chunks": 20},
+    "medium": {"npcs": 1_000,  "locations": 1_000,  "sessions": 100, "facts": 1_000,  "chunks": 100},
+    "large":  {"npcs": 10_000, "locations": 10_000, "sessions": 500, "facts": 20_000, "chunks": 400},
+}
+
+SYLLABLES = ["ka", "ro", "mi", "tha", "ven", "dor", "el", "qua", "ris", "ul", "gan", "mor",
+             "sel", "ith", "bra", "zu", "lin", "ash", "tor", "ne", "fa", "gri", "os", "yel"]
+TITLES = ["Lord", "Lady", "Captain", "Old", "Sister", "Master"]
+ADJECTIVES = ["Sunken", "Gilded", "Ashen", "Hollow", "Crimson", "Silent", "Broken", "Verdant",
+              "Frozen", "Drowned", "Iron", "Whispering", "Forgotten", "Shattered", "Amber"]
+PLACES = ["Hall", "Keep", "Crossing", "Market", "Shrine", "Cellar", "Tower", "Bridge", "Grotto",
+          "Archive", "Gate", "Harbor", "Barracks", "Orchard", "Vault", "Well", "Spire", "Camp"]
+ROLES = ["smuggler", "priest", "guard captain", "alchemist", "bard", "cartographer", "fence",
+         "blacksmith", "innkeeper", "scout", "noble", "healer", "sellsword", "scholar"]
+ATTITUDES = ["friendly", "neutral", "wary", "hostile", "suspicious", "helpful"]
+VERBS = ["bargained with", "betrayed", "rescued", "followed", "questioned", "ambushed",
+         "hid from", "paid off", "dueled", "warned", "recruited", "lost track of"]
+THINGS = ["a sealed letter", "the stolen ledger", "a cursed coin", "the harbor map",
+          "a shard of glass", "the missing key", "a debt marker", "the silver bell"]
+FACT_CATEGORIES = ["session_events", "plot_local", "plot_world", "npc_relations", "combat",
+                   "world_building"]
+PLOT_TYPES = ["main", "side", "mystery", "threat"]
+TIMES = ["Dawn", "Morning", "Midday", "Afternoon", "Dusk", "Night"]
+
+
+def _word(rng: random.Random, parts: int) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(parts)).capitalize()
+
+
+def _unique(make: Callable[[], str], seen: Set[str]) -> str:
+    """`make()` until the name is new; numbered once collisions get frequent."""
+    for _ in range(8):
+        name = make()
+        if name.lower() not in seen:
+            break
+    else:
+        base, n = name, 2
+        while f"{base} {n}".lower() in seen:
+            n += 1
+        name = f"{base} {n}"
+    seen.add(name.lower())
+    return name
+
+
+def _sentence(rng: random.Random, npcs: List[str], locations: List[str]) -> str:
+    return (f"{rng.choice(npcs)} {rng.choice(VERBS)} {rng.choice(npcs)} at "
+            f"{rng.choice(locations)} over {rng.choice(THINGS)}.")
+
+
+def _stamp(day: int, minute: int = 0) -> str:
+    return f"2026-{1 + day // 28 % 12:02d}-{1 + day % 28:02d}T{10 + minute // 60 % 12:02d}:{minute % 60:02d}:00+00:00"
+
+
+def generate(size: str = "small", seed: int = 1, **counts: int) -> Dict[str, object]:
+    """The campaign files as {relative path: JSON value or text}.
+
+    `counts` overrides any axis of the preset (npcs=5000, facts=20000, ...).
+    """
+    dims = dict(SIZES[size], **counts)
+    rng = random.Random(seed)
+
+    seen: Set[str] = set()
+    npc_names = [_unique(lambda: f"{_word(rng, 2)} {_word(rng, 2)}", seen)
+                 for _ in range(dims["npcs"])]
+    loc_names = [_unique(lambda: f"The {rng.choice(ADJECTIVES)} {rng.choice(PLACES)}", seen)
+                 for _ in range(dims["locations"])]
+
+    locations = {}
+    for i, name in enumerate(loc_names):
+        locations[name] = {
+            "position": f"{rng.choice(['north', 'south', 'east', 'west'])} of "
+                        f"{loc_names[i - 1] if i else 'the crossroads'}",
+            "connections": [],
+            "description": f"A {rng.choice(ADJECTIVES).lower()} place where "
+                           + _sentence(rng, npc_names, loc_names),
+            "discovered": _stamp(i % 300),
+        }
+    # A connected graph: a chain for reachability plus random shortcuts.
+    edges = {(i - 1, i) for i in range(1, len(loc_names))}
+    edges |= {tuple(sorted(rng.sample(range(len(loc_names)), 2)))
+              for _ in range(len(loc_names) // 2)} if len(loc_names) > 1 else set()
+    for a, b in sorted(edges):
+        locations[loc_names[a]]["connections"].append({"to": loc_names[b], "path": "traveled"})
+        locations[loc_names[b]]["connections"].append({"to": loc_names[a], "path": "traveled"})
+
+    n_plots = max(5, dims["npcs"] // 20)
+    plot_names = [_unique(lambda: f"The {_word(rng, 2)} {rng.choice(['Debt', 'Heist', 'Plague', 'Succession', 'Vigil'])}", seen)
+                  for _ in range(n_plots)]
+
+    npcs = {}
+    for i, name in enumerate(npc_names):
+        home = rng.choice(loc_names)
+        npc = {
+            "description": f"A {rng.choice(ROLES)} from {home}. " + " ".join(
+                _sentence(rng, npc_names, loc_names) for _ in range(2)),
+            "attitude": rng.choice(ATTITUDES),
+            "created": _stamp(i % 300),
+            "events": [{"event": _sentence(rng, npc_names, loc_names), "timestamp": _stamp(i % 300, k)}
+                       for k in range(rng.randint(0, 3))],
+            "tags": {"locations": [home], "quests": [rng.choice(plot_names)]},
+        }
+        if rng.random() < 0.2:
+            npc["aliases"] = [f"{rng.choice(TITLES)} {name.split()[0]}"]
+        npcs[name] = npc
+    for name in npc_names[:3]:
+        npcs[name]["is_party_member"] = True
+
+    plots = {}
+    for i, name in enumerate(plot_names):
+        refs = rng.sample(npc_names, min(3, len(npc_names)))
+        if rng.random() < 0.1:  # extraction leaves some plot refs dangling
+            refs.append(f"{_word(rng, 2)} the {rng.choice(ROLES).title()}")
+        places = rng.sample(loc_names, min(2, len(loc_names)))
+        if rng.random() < 0.1:
+            places.append(f"The {_word(rng, 3)} Ruins")
+        plots[name] = {
+            "name": name,
+            "description": " ".join(_sentence(rng, npc_names, loc_names) for _ in range(3)),
+            "type": rng.choice(PLOT_TYPES),
+            "npcs": refs,
+            "locations": places,
+            "objectives": [f"Find {rng.choice(THINGS)}", f"Confront {refs[0]}"],
+            "events": [],
+            "status": "active" if rng.random() < 0.7 else "completed",
+        }
+
+    items = {}
+    for _ in range(max(10, dims["npcs"] // 10)):
+        name = _unique(lambda: f"{rng.choice(ADJECTIVES)} {rng.choice(['Blade', 'Ring', 'Cloak', 'Lantern', 'Tome'])}", seen)
+        items[name] = {"name": name, "description": f"Once carried by {rng.choice(npc_names)}.",
+                       "type": rng.choice(["weapon", "armor", "wondrous", "consumable"])}
+
+    facts: Dict[str, list] = {c: [] for c in FACT_CATEGORIES}
+    for i in range(dims["facts"]):
+        facts[FACT_CATEGORIES[i % len(FACT_CATEGORIES)]].append(
+            {"fact": _sentence(rng, npc_names, loc_names), "timestamp": _stamp(i % 300, i % 720)})
+
+    active = []
+    for i in range(max(5, dims["npcs"] // 10)):
+        kind = rng.choice(["on_location", "on_npc", "on_time", None])
+        target = {"on_location": rng.choice(loc_names), "on_npc": rng.choice(npc_names),
+                  "on_time": rng.choice(TIMES).lower(), None: None}[kind]
+        c = {"id": f"{rng.getrandbits(32):08x}",
+             "consequence": _sentence(rng, npc_names, loc_names),
+             "trigger": f"When the party reaches {rng.choice(loc_names)}",
+             "created": _stamp(i % 300)}
+        if kind:
+            c.update(trigger_type=kind, match=target)
+        active.append(c)
+    consequences = {"active": active, "resolved": [], "pending": []}
+
+    party_loc = loc_names[0]
+    log = ["# Session Log - Benchmark Campaign", "", "*A new adventure begins...*", "", "---", ""]
+    for s in range(dims["sessions"]):
+        log += [f"## Session Started: {_stamp(s).replace('T', ' ')[:19]} UTC", "",
+                f"### Session Ended: {_stamp(s, 90).replace('T', ' ')[:19]} UTC",
+                f"Session {s + 1}: " + " ".join(_sentence(rng, npc_names, loc_names) for _ in range(4)),
+                "", "---", ""]
+
+    overview = {
+        "campaign_name": "Benchmark Campaign",
+        "genre": "Fantasy",
+        "tone": {"horror": 30, "comedy": 20, "drama": 50},
+        "current_date": f"Day {dims['sessions'] + 1}",
+        "time_of_day": rng.choice(TIMES),
+        "player_position": {"current_location": party_loc, "previous_location": loc_names[-1]},
+        "current_character": "Bench Hero",
+        "session_count": dims["sessions"],
+    }
+    character = {
+        "id": "bench-hero", "name": "Bench Hero", "race": "Human", "class": "Fighter",
+        "level": 5, "hp": {"current": 40, "max": 44}, "ac": 16,
+        "stats": {k: 10 + rng.randint(0, 6) for k in ("str", "dex", "con", "int", "wis", "cha")},
+        "equipment": sorted(items)[:5], "conditions": [], "gold": 120,
+        "xp": {"current": 6500, "next_level": 14000}, "current_location": party_loc,
+    }
+
+    files: Dict[str, object] = {
+        "npcs.json": npcs, "locations.json": locations, "plots.json": plots, "items.json": items,
+        "facts.json": facts, "consequences.json": consequences,
+        "campaign-overview.json": overview, "character.json": character,
+        "session-log.md": "\n".join(log) + "\n",
+    }
+    for c in range(dims["chunks"]):  # the synthetic book, ~40 sentences a chunk
+        files[f"chunks/chunk_{c:04d}.txt"] = "\n".join(
+            _sentence(rng, npc_names, loc_names) for _ in range(40)) + "\n"
+    return files
+
+
+def build(world_state_dir, size: str = "small", seed: int = 1, **counts: int) -> Path:
+    """Write a world-state with the generated campaign active; returns the campaign dir."""
+    base = Path(world_state_dir)
+    camp = base / "campaigns" / CAMPAIGN
+    for rel, value in generate(size, seed, **counts).items():
+        path = camp / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = value if isinstance(value, str) else json.dumps(value, indent=2)
+        path.write_text(text, encoding="utf-8")
+    (base / "active-campaign.txt").write_text(CAMPAIGN)
+    return camp
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a seeded synthetic campaign")
+    parser.add_argument("world_state_dir")
+    parser.add_argument("--size", choices=sorted(SIZES), default="small")
+    parser.add_argument("--seed", type=int, default=1)
+    for axis in SIZES["tiny"]:
+        parser.add_argument(f"--{axis}", type=int, help=f"override the preset's {axis} count")
+    args = parser.parse_args()
+    counts = {a: getattr(args, a) for a in SIZES["tiny"] if getattr(args, a) is not None}
+    camp = build(args.world_state_dir, args.size, args.seed, **counts)
+    print(f"[SUCCESS] Generated '{args.size}' campaign (seed {args.seed}) at {camp}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Benchmark suite smoke tests: the generator is deterministic and every hot path runs.
+
+The timings themselves are not asserted — CI machines vary too much. The real
+runs are `python tests/benchmarks/bench.py --size ... [--baseline ...]`.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import bench
+import synth
+
+
+def test_generator_is_seeded_and_cross_references_resolve(tmp_path):
+    a = synth.build(tmp_path / "a", "tiny", seed=7)
+    b = synth.build(tmp_path / "b", "tiny", seed=7)
+    c = synth.build(tmp_path / "c", "tiny", seed=8)
+    files = sorted(p.relative_to(a) for p in a.rglob("*") if p.is_file())
+    assert files == sorted(p.relative_to(b) for p in b.rglob("*") if p.is_file())
+    assert all((a / f).read_bytes() == (b / f).read_bytes() for f in files)
+    assert (a / "npcs.json").read_bytes() != (c / "npcs.json").read_bytes()
+
+    npcs = json.loads((a / "npcs.json").read_text())
+    locations = json.loads((a / "locations.json").read_text())
+    assert len(npcs) == synth.SIZES["tiny"]["npcs"]
+    assert all(n["tags"]["locations"][0] in locations for n in npcs.values())
+    assert all(e["to"] in locations for loc in locations.values() for e in loc["connections"])
+    log = (a / "session-log.md").read_text()
+    assert log.count("### Session Ended:") == synth.SIZES["tiny"]["sessions"]
+
+
+def test_every_hot_path_runs_on_a_tiny_campaign():
+    report = bench.run("tiny", repeat=1)
+    assert set(report["results"]) == set(bench.BENCHMARKS)
+    assert all(r["median_ms"] > 0 for r in report["results"].values())
+    assert report["meta"]["counts"]["npcs"] == synth.SIZES["tiny"]["npcs"]
+
+
+def test_compare_flags_only_real_slowdowns():
+    base = {"results": {"fast": {"median_ms": 0.2}, "slow": {"median_ms": 100.0},
+                        "gone": {"median_ms": 5.0}}}
+    now = {"results": {"fast": {"median_ms": 0.9}, "slow": {"median_ms": 140.0},
+                       "new": {"median_ms": 1.0}}}
+    rows = {r["name"]: r for r in bench.compare(now, base, tolerance=0.25, floor_ms=1.0)}
+    assert set(rows) == {"fast", "slow"}
+    assert not rows["fast"]["regressed"]  # 4.5x, but under the 1 ms floor
+    assert rows["slow"]["regressed"] and rows["slow"]["ratio"] == 1.4
@@ -5,7 +5,12 @@ fixture. Each test gets a throwaway copy in a tmp dir so the managers (which can
 write) never touch the checked-in fixture or any live campaign.
 """
 
+import json
 import shutil
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 import pytest
@@ -40,3 +45,86 @@ def dcc_world(tmp_path):
     dest = tmp_path / "world-state"
     shutil.copytree(FIXTURE_WORLD_STATE, dest)
     return str(dest)
+
+
+class SrdStandIn(BaseHTTPRequestHandler):
+    """A local stand-in for dnd5eapi.co: serves `routes` with ETags and counts `hits`.
+
+    HTTP/1.1, so clients can keep connections alive; `connections` counts
+    the sockets opened. `failures` scripts statuses to answer first, per
+    path ({path: [429, 503]}), and `delay` holds a path's answer (seconds).
+    """
+
+    protocol_version = "HTTP/1.1"
+    routes: dict = {}
+    hits: Counter = Counter()
+    failures: dict = {}
+    delay: dict = {}
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        SrdStandIn.connections += 1
+
+    def _empty(self, status, headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        SrdStandIn.hits[self.path] += 1
+        if self.path in SrdStandIn.delay:
+            time.sleep(SrdStandIn.delay[self.path])
+        scripted = SrdStandIn.failures.get(self.path)
+        if scripted:
+            self._empty(scripted.pop(0), [("Retry-After", "0")])
+            return
+        body = SrdStandIn.routes.get(self.path)
+        if body is None:
+            self._empty(404)
+            return
+        etag = f'"{abs(hash(json.dumps(body, sort_keys=True)))}"'
+        if self.headers.get("If-None-Match") == etag:
+            self._empty(304)
+            return
+        raw = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def srd_api(tmp_path, monkeypatch):
+    """The stand-in API on localhost and an empty SRD store under a tmp world-state.
+
+    Tests fill `srd_api.routes` ({"/api/2014/...": json}) and read
+    `srd_api.hits` (path -> requests served).
+    """
+    from lib import srd_cache
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SrdStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    SrdStandIn.routes = {}
+    SrdStandIn.hits = Counter()
+    SrdStandIn.failures = {}
+    SrdStandIn.delay = {}
+    SrdStandIn.connections = 0
+    monkeypatch.setenv("GM_SRD_ORIGIN", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setenv("GM_WORLD_STATE_BASE", str(tmp_path / "world-state"))
+    monkeypatch.delenv("GM_SRD_OFFLINE", raising=False)
+    monkeypatch.delenv("GM_SRD_TTL", raising=False)
+    srd_cache._stores.clear()
+    yield SrdStandIn
+    server.shutdown()
+    server.server_close()
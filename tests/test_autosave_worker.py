@@ -0,0 +1,110 @@
+"""Autosave off the turn path: durable dirty marker, coalescing worker, `save --wait`."""
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from lib.autosave_worker import AutosaveQueue
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+def _autosaves(queue):
+    return sorted(p.name for p in queue.saves_dir.glob("*-autosave*.json"))
+
+
+def test_request_leaves_a_durable_marker_and_no_save(dcc_world):
+    q = AutosaveQueue(dcc_world)
+    assert q.pending() is None
+    q.request(spawn=False)
+    q.request(spawn=False)
+    assert q.pending()["seq"] == 2
+    assert _autosaves(q) == []
+
+
+def test_pending_requests_coalesce_into_one_save(dcc_world):
+    q = AutosaveQueue(dcc_world)
+    for _ in range(5):
+        q.request(spawn=False)
+    assert q.drain() == 1
+    assert q.pending() is None
+    assert len(_autosaves(q)) == 1
+
+
+def test_request_during_a_save_triggers_exactly_one_more(dcc_world):
+    q = AutosaveQueue(dcc_world)
+    real_create = q.session.create_save
+    calls = []
+
+    def create_and_bump(name):
+        calls.append(name)
+        if len(calls) == 1:
+            q.mark_dirty()  # the next turn ended while the first snapshot ran
+        return real_create(name)
+
+    q.session.create_save = create_and_bump
+    q.request(spawn=False)
+    assert q.drain() == 2
+    assert q.pending() is None
+
+
+def test_crash_leaves_marker_and_wait_recovers(dcc_world):
+    q = AutosaveQueue(dcc_world)
+    q.request(spawn=False)
+
+    def crash(name):
+        raise OSError("killed mid-save")
+
+    q.session.create_save = crash
+    try:
+        q.drain()
+    except OSError:
+        pass
+    assert q.pending() is not None
+
+    fresh = AutosaveQueue(dcc_world)
+    assert fresh.wait(timeout=10) is True
+    assert fresh.pending() is None and len(_autosaves(fresh)) == 1
+
+
+def test_async_cli_returns_and_wait_flushes(dcc_world):
+    env = dict(os.environ, GM_WORLD_STATE_BASE=dcc_world)
+    cli = [sys.executable, str(REPO / "lib" / "session_manager.py"), "save"]
+    queued = subprocess.run(cli + ["autosave", "--async"], env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert queued.returncode == 0 and "queued" in queued.stdout
+    flushed = subprocess.run(cli + ["--wait"], env=env, capture_output=True, text=True, timeout=120)
+    assert flushed.returncode == 0, flushed.stdout + flushed.stderr
+    q = AutosaveQueue(dcc_world)
+    assert q.pending() is None
+    deadline = time.monotonic() + 30
+    while q.worker_running() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert len(_autosaves(q)) == 1
+
+
+def test_a_save_that_writes_nothing_keeps_the_marker(dcc_world):
+    q = AutosaveQueue(dcc_world)
+    q.request(spawn=False)
+    q.session.create_save = lambda name: None
+    assert q.drain() == 0
+    assert q.wait(timeout=5) is False
+    assert q.pending() is not None
+
+
+def test_session_start_survives_a_failing_owed_autosave(dcc_world):
+    q = AutosaveQueue(dcc_world)
+    q.request(spawn=False)
+    blobs = q.saves_dir / "blobs"
+    if blobs.is_dir():
+        shutil.rmtree(blobs)
+    blobs.write_text("not a directory")  # the owed save cannot store its snapshot
+    env = dict(os.environ, GM_WORLD_STATE_BASE=dcc_world)
+    started = subprocess.run([sys.executable, str(REPO / "lib" / "session_manager.py"), "start"],
+                             env=env, capture_output=True, text=True, timeout=60)
+    assert started.returncode == 0, started.stdout + started.stderr
+    assert "[WARNING]" in started.stderr and "Traceback" not in started.stderr
+    assert q.pending() is not None
@@ -0,0 +1,91 @@
+"""gm-batch.sh: a beat's operations in one process, committed together or not at all."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from lib.batch_executor import parse_ops, run_batch
+from lib.consequence_archive import ConsequenceArchive
+
+CAMPAIGN = "campaigns/dungeon-crawler-carl"
+
+
+def _snapshot(world):
+    root = Path(world) / CAMPAIGN
+    return {p.relative_to(root): p.read_bytes() for p in root.rglob("*") if p.is_file()}
+
+
+def _committed(world):
+    """Every file outside the archive's segments, plus what the archive reads back.
+
+    Segment appends go straight to disk; the buffered manifest is their commit
+    point, so a rolled-back append is a tail nothing reads.
+    """
+    root = Path(world) / CAMPAIGN
+    files = {k: v for k, v in _snapshot(world).items() if not k.name.endswith(".jsonl")}
+    archive = ConsequenceArchive(root)
+    return files, archive.read("resolved"), archive.read("provenance")
+
+
+def test_a_beat_commits_together_and_later_ops_see_earlier_writes(dcc_world):
+    ops = parse_ops("\n".join([
+        '# a beat',
+        '{"op": "player.hp", "name": "Tandy", "amount": -7}',
+        '{"op": "npc.create", "name": "Zev", "description": "Producer", "attitude": "neutral"}',
+        '{"op": "npc.event", "name": "Zev", "event": "Briefed the crawlers"}',
+        '',
+        '{"op": "note.add", "category": "session_events", "fact": "Zev arrived"}',
+        '{"op": "consequence.add", "description": "Zev returns", "trigger": "Floor 4",'
+        ' "trigger_type": "on_location", "match": "Floor 4"}',
+        '{"op": "time.set", "time_of_day": "Dusk", "date": "Day 5"}',
+    ]))
+    report = run_batch(ops, dcc_world)
+    assert report["committed"] and report["failed"] is None
+    assert all(r["ok"] for r in report["results"])
+    # npc.event found the NPC that npc.create only buffered
+    camp = Path(dcc_world) / CAMPAIGN
+    npcs = json.loads((camp / "npcs.json").read_text())
+    assert npcs["Zev"]["events"][-1]["event"] == "Briefed the crawlers"
+    assert json.loads((camp / "character.json").read_text())["hp"]["current"] == 65
+    overview = json.loads((camp / "campaign-overview.json").read_text())
+    assert overview["time_of_day"] == "Dusk" and overview["current_date"] == "Day 5"
+    assert "Zev returns" in (camp / "consequences.json").read_text()
+    assert "npcs.json" in report["files"] and not list(camp.glob(".*.batch.tmp"))
+
+
+def test_a_failing_op_rolls_the_whole_batch_back(dcc_world):
+    before = _committed(dcc_world)
+    ops = [
+        {"op": "player.hp", "name": "Tandy", "amount": -7},
+        {"op": "consequence.resolve", "consequence_id": "b5aeefab"},
+        {"op": "note.add", "category": "session_events", "fact": "Never written"},
+        {"op": "npc.event", "name": "Nobody In Particular", "event": "x"},
+        {"op": "time.set", "time_of_day": "Dawn", "date": "Day 9"},
+    ]
+    report = run_batch(ops, dcc_world)
+    assert not report["committed"] and report["failed"] == 3
+    assert len(report["results"]) == 4  # nothing after the failure ran
+    assert "Nobody In Particular" in report["error"]
+    # resolve archived a consequence, but its manifest entry never committed
+    assert _committed(dcc_world) == before
+    assert not list((Path(dcc_world) / CAMPAIGN).rglob("*.batch.tmp"))
+
+
+def test_dry_run_reports_files_and_writes_nothing(dcc_world):
+    before = _snapshot(dcc_world)
+    report = run_batch([{"op": "note.add", "category": "session_events", "fact": "Maybe"}],
+                       dcc_world, dry_run=True)
+    assert not report["committed"] and report["files"] == ["facts.json"]
+    assert _snapshot(dcc_world) == before
+
+
+@pytest.mark.parametrize("text, message", [
+    ('{"op": "player.hp", "name": "Tandy"}', "missing amount"),
+    ('{"op": "player.hp", "name": "Tandy", "amount": 1, "why": "x"}', "unknown why"),
+    ('{"op": "player.teleport"}', "unknown op"),
+    ('{"op": "note.add",\n', "line 1"),
+])
+def test_malformed_batches_are_rejected_before_anything_runs(text, message):
+    with pytest.raises(ValueError, match=message):
+        parse_ops(text)
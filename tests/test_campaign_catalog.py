@@ -0,0 +1,93 @@
+"""campaigns/index.json: listings and name resolution without parsing or scanning every campaign."""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+import lib.campaign_manager as campaign_manager
+from lib.campaign_manager import CampaignCatalog, CampaignManager
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Campaign names whose character.json the catalog actually parsed."""
+    seen = []
+    real = campaign_manager.to_flat
+
+    def counting(raw):
+        seen.append(raw.get("name"))
+        return real(raw)
+
+    monkeypatch.setattr(campaign_manager, "to_flat", counting)
+    return seen
+
+
+def _bump_level(camp, level):
+    char = json.loads((camp / "character.json").read_text())
+    char["level"] = level
+    (camp / "character.json").write_text(json.dumps(char))
+
+
+def test_listing_reads_only_what_changed(dcc_world, parses):
+    manager = CampaignManager(dcc_world)
+    camp = Path(dcc_world) / "campaigns" / "dungeon-crawler-carl"
+    first = manager.list_campaigns()
+    assert first[0]["character"]["level"] == 5 and first[0]["session_count"] == 7
+    assert parses == ["Tandy"]
+
+    assert manager.list_campaigns() == first
+    assert parses == ["Tandy"]  # unchanged files: stats only
+
+    _bump_level(camp, 6)
+    assert manager.list_campaigns()[0]["character"]["level"] == 6
+    assert parses == ["Tandy", "Tandy"]
+
+
+def test_folders_added_or_removed_by_hand_self_heal(dcc_world):
+    manager = CampaignManager(dcc_world)
+    campaigns = Path(dcc_world) / "campaigns"
+    assert [c["name"] for c in manager.list_campaigns()] == ["dungeon-crawler-carl"]
+
+    shutil.copytree(campaigns / "dungeon-crawler-carl", campaigns / "copied-in")
+    assert [c["name"] for c in manager.list_campaigns()] == ["copied-in", "dungeon-crawler-carl"]
+    assert manager.get_campaign_path("Copied In") == campaigns / "copied-in"
+
+    shutil.rmtree(campaigns / "copied-in")
+    assert [c["name"] for c in manager.list_campaigns()] == ["dungeon-crawler-carl"]
+
+    (campaigns / CampaignCatalog.FILENAME).write_text("{not json")
+    assert [c["name"] for c in manager.list_campaigns()] == ["dungeon-crawler-carl"]
+
+
+def test_create_and_delete_keep_the_catalog_current(dcc_world):
+    manager = CampaignManager(dcc_world)
+    manager.list_campaigns()
+    manager.create("Keeper", campaign_name="The Keeper's Vault")
+    listed = {c["name"]: c for c in manager.list_campaigns()}
+    assert listed["keeper"]["campaign_name"] == "The Keeper's Vault"
+    assert CampaignCatalog(Path(dcc_world) / "campaigns").folders()["keeper"] == "keeper"
+
+    assert manager.delete("keeper", confirm=True)
+    assert "keeper" not in CampaignCatalog(Path(dcc_world) / "campaigns").folders()
+
+
+def test_info_counts_come_from_the_catalog(dcc_world):
+    manager = CampaignManager(dcc_world)
+    camp = Path(dcc_world) / "campaigns" / "dungeon-crawler-carl"
+    assert manager.get_info()["npcs_count"] == 16
+    npcs = json.loads((camp / "npcs.json").read_text())
+    npcs["Zev"] = {"description": "Producer"}
+    (camp / "npcs.json").write_text(json.dumps(npcs))
+    assert manager.get_info()["npcs_count"] == 17
+
+
+@pytest.mark.parametrize("lookup", ["dungeon-crawler-carl", "Dungeon Crawler Carl"])
+def test_resolving_a_live_campaign_never_scans(dcc_world, monkeypatch, lookup):
+    def scan(*_args, **_kwargs):
+        raise AssertionError("resolution scanned the campaigns directory")
+
+    monkeypatch.setattr(CampaignCatalog, "folders", scan)
+    manager = CampaignManager(dcc_world)
+    assert manager.get_campaign_path(lookup).name == "dungeon-crawler-carl"
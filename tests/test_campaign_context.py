@@ -0,0 +1,47 @@
+"""CampaignContext: the active campaign is resolved once and shared by every manager."""
+
+import sys
+
+from lib.campaign_context import CampaignContext
+from lib.npc_manager import NPCManager
+from lib.world import World
+
+
+def _count_resolutions(monkeypatch):
+    """Count active-campaign.txt reads by the CampaignManager lib code actually uses."""
+    cls = sys.modules["campaign_manager"].CampaignManager
+    calls = []
+    real = cls.get_active
+    monkeypatch.setattr(cls, "get_active", lambda self: calls.append(1) or real(self))
+    return calls
+
+
+def test_world_resolves_once_for_all_six_managers(dcc_world, monkeypatch):
+    calls = _count_resolutions(monkeypatch)
+    world = World(world_state_dir=dcc_world)
+    managers = [world.npcs, world.locations, world.plots, world.session,
+                world.consequences, world.player]
+    status = world.get_status()
+    assert len(calls) == 1
+    assert status["campaign"] == "dungeon-crawler-carl"
+    assert all(m.json_ops is world.json_ops for m in managers)
+    assert all(m.campaign_dir == world.campaign_dir for m in managers)
+
+
+def test_old_constructor_still_resolves_its_own(dcc_world):
+    mgr = NPCManager(dcc_world)
+    shared = NPCManager(context=CampaignContext(dcc_world))
+    assert mgr.campaign_dir == shared.campaign_dir
+    assert mgr.json_ops is not shared.json_ops
+    assert mgr.list_npcs() == shared.list_npcs()
+
+
+def test_no_active_campaign_raises(tmp_path):
+    ctx = CampaignContext(str(tmp_path / "empty-world"))
+    assert ctx.campaign_dir is None
+    try:
+        World(context=ctx)
+    except RuntimeError as e:
+        assert "No active campaign" in str(e)
+    else:
+        raise AssertionError("World() without a campaign should raise")
@@ -0,0 +1,118 @@
+"""campaign_service.py: many tables in one process, each request naming its campaign."""
+
+import io
+import json
+import os
+import shutil
+from pathlib import Path
+
+from lib.campaign_context import CampaignContext
+from lib.campaign_service import CampaignHost
+from lib.json_ops import CachedJsonOperations
+
+
+def _two_tables(world):
+    campaigns = Path(world) / "campaigns"
+    shutil.copytree(campaigns / "dungeon-crawler-carl", campaigns / "second-table")
+    return campaigns / "dungeon-crawler-carl", campaigns / "second-table"
+
+
+def _hp(camp):
+    return json.loads((camp / "character.json").read_text())["hp"]["current"]
+
+
+def test_requests_land_in_their_own_campaign_and_never_touch_the_active_one(dcc_world):
+    first, second = _two_tables(dcc_world)
+    pointer = Path(dcc_world) / "active-campaign.txt"
+    before = pointer.read_bytes()
+    host = CampaignHost(dcc_world)
+
+    hit = host.handle({"id": 1, "campaign": "second-table", "op": "player.hp",
+                       "name": "Tandy", "amount": -7})
+    assert hit["ok"] and hit["id"] == 1 and hit["campaign"] == "second-table"
+    assert _hp(second) == 65 and _hp(first) == 72
+    # the warm table reads its own write back
+    shown = host.handle({"campaign": "second-table", "op": "player.show", "name": "Tandy"})
+    assert shown["result"]["hp"]["current"] == 65
+    assert host.handle({"campaign": "dungeon-crawler-carl", "op": "player.show",
+                        "name": "Tandy"})["result"]["hp"]["current"] == 72
+
+    missing = host.handle({"id": 2, "campaign": "second-table", "op": "npc.event",
+                           "name": "Nobody", "event": "x"})
+    assert not missing["ok"] and "Nobody" in missing["error"]
+    assert "does not exist" in host.handle({"campaign": "nope", "op": "session.status"})["error"]
+    assert "campaign is required" in host.handle({"op": "session.status"})["error"]
+    assert "unknown op" in host.handle({"campaign": "second-table", "op": "x"})["error"]
+    assert pointer.read_bytes() == before
+
+
+def test_pinned_context_leaves_the_active_campaign_alone(dcc_world):
+    _first, second = _two_tables(dcc_world)
+    pointer = Path(dcc_world) / "active-campaign.txt"
+    before = pointer.read_bytes()
+    context = CampaignContext(dcc_world, "second-table", pin=True)
+    assert context.campaign_dir == second
+    assert pointer.read_bytes() == before
+
+
+def test_cache_serves_warm_copies_and_misses_after_an_outside_write(dcc_world):
+    camp = Path(dcc_world) / "campaigns" / "dungeon-crawler-carl"
+    ops = CachedJsonOperations(str(camp))
+    npcs = ops.load_json("npcs.json")
+    assert ops.cached_bytes > 0
+    npcs["Carl"]["mutated"] = True  # callers get copies, never the cached state
+    assert "mutated" not in ops.load_json("npcs.json")["Carl"]
+
+    data = json.loads((camp / "npcs.json").read_text())
+    data["Zev"] = {"description": "written by the CLI"}
+    tmp = camp / "npcs.json.tmp"
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, camp / "npcs.json")  # how every writer saves: a new inode
+    assert ops.load_json("npcs.json")["Zev"]["description"] == "written by the CLI"
+
+
+def test_a_racily_clean_file_is_reparsed_not_cached(dcc_world):
+    camp = Path(dcc_world) / "campaigns" / "dungeon-crawler-carl"
+    ops = CachedJsonOperations(str(camp))
+    path = camp / "facts.json"
+    path.write_text(json.dumps({"turn": ["aaaa"]}))
+    st = path.stat()
+    assert ops.load_json("facts.json") == {"turn": ["aaaa"]}
+    assert ops.cached_bytes == 0
+    path.write_text(json.dumps({"turn": ["bbbb"]}))  # same inode, same size
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))  # within one mtime tick
+    assert ops.load_json("facts.json") == {"turn": ["bbbb"]}
+
+
+def test_idle_tables_are_evicted_oldest_first(dcc_world):
+    _two_tables(dcc_world)
+    host = CampaignHost(dcc_world, max_tables=1)
+    host.handle({"campaign": "dungeon-crawler-carl", "op": "session.status"})
+    host.handle({"campaign": "second-table", "op": "session.status"})
+    stats = host.stats()
+    assert [t["campaign"] for t in stats["tables"]] == ["second-table"]
+    assert stats["evictions"] == 1
+
+    tight = CampaignHost(dcc_world, memory_mb=0)
+    assert tight.handle({"campaign": "second-table", "op": "npc.status", "name": "Carl"})["ok"]
+    assert tight.stats()["tables"] == []  # over budget once idle: nothing stays warm
+
+
+def test_serve_answers_each_line_tagged_with_its_id(dcc_world):
+    first, second = _two_tables(dcc_world)
+    lines = [
+        '{"id": "a", "campaign": "dungeon-crawler-carl", "op": "player.hp",'
+        ' "name": "Tandy", "amount": -2}',
+        '# comments and blank lines are skipped',
+        '',
+        '{"id": "b", "campaign": "second-table", "op": "player.hp", "name": "Tandy", "amount": 3}',
+        'not json',
+    ]
+    out = io.StringIO()
+    CampaignHost(dcc_world).serve(lines, out, workers=2)
+    responses = {r["id"]: r for r in map(json.loads, out.getvalue().splitlines())}
+    assert set(responses) == {"a", "b", None}
+    assert responses["a"]["ok"] and "HP: 70/80" in responses["a"]["output"]
+    assert responses["b"]["ok"] and "75/80" in responses["b"]["output"]
+    assert "bad request" in responses[None]["error"]
+    assert (_hp(first), _hp(second)) == (70, 75)
@@ -0,0 +1,67 @@
+"""CampaignSnapshot: one brief build reads each campaign file at most once."""
+
+from lib.json_ops import JsonOperations
+from lib.session_manager import SessionManager
+from lib.threat_clocks import ThreatClockManager
+
+
+def _counting(sm):
+    """Wrap this manager's JsonOperations.load_json with a per-file call counter."""
+    counts = {}
+    real = sm.json_ops.load_json
+
+    def load_json(filename, *args, **kwargs):
+        counts[filename] = counts.get(filename, 0) + 1
+        return real(filename, *args, **kwargs)
+
+    sm.json_ops.load_json = load_json
+    return counts
+
+
+def test_full_context_loads_each_file_once(dcc_world):
+    for full in (False, True):
+        sm = SessionManager(dcc_world)
+        counts = _counting(sm)
+        sm.get_full_context(full=full)
+        assert counts, "the brief reads through the manager's JsonOperations"
+        assert max(counts.values()) == 1, counts
+
+
+def test_snapshot_is_shared_by_every_section(dcc_world):
+    sm = SessionManager(dcc_world)
+    built = []
+    real = sm.snapshot
+    sm.snapshot = lambda: built.append(real()) or built[-1]
+    sm.get_full_context()
+    assert len(built) == 1
+    snap = built[0]
+    assert all(n == 1 for n in snap.loads.values())
+    assert {"campaign-overview.json", "npcs.json", "plots.json",
+            "facts.json", "session-log.idx.json"} <= set(snap.loads)
+    assert "session-log.md" not in snap.loads  # answered from the sidecar index
+
+
+def test_helpers_still_work_without_a_snapshot(dcc_world):
+    sm = SessionManager(dcc_world)
+    snap = sm.snapshot()
+    assert sm._key_facts() == sm._key_facts(snap=snap)
+    assert sm._recent_session_summaries(n=2) == sm._recent_session_summaries(n=2, snap=snap)
+    assert sm._get_session_number() == sm._get_session_number(snap=snap)
+    assert sm.get_preferences() == sm.get_preferences(snap=snap)
+
+
+def test_renderers_leave_the_snapshot_as_loaded(dcc_world):
+    """Read-only is a convention, not enforced; every section must keep to it."""
+    ThreatClockManager(dcc_world).add_clock("Floor Collapse", segments=4)
+    for full in (False, True):
+        sm = SessionManager(dcc_world)
+        built = []
+        real = sm.snapshot
+        sm.snapshot = lambda: built.append(real()) or built[-1]
+        sm.get_full_context(full=full, use_cache=False)
+        snap = built[0]
+        on_disk = JsonOperations(str(snap.campaign_dir))
+        for filename, value in snap._files.items():
+            if filename.endswith(".json"):
+                assert value == (on_disk.load_json(filename) or {}), filename
+        assert "campaign-memory.json" in snap.loads  # recall read through the snapshot too
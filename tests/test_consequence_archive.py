@@ -0,0 +1,102 @@
+"""Consequence history lives in rotated append-only segments, not the hot file.
+
+consequences.json keeps only `active` and a compact `_undo` inverse delta;
+resolved/expired consequences and the firing provenance log are archived under
+consequences-archive/ and read back across segments.
+"""
+
+import json
+from pathlib import Path
+
+from lib.consequence_manager import ConsequenceManager
+
+
+def _camp(dcc_world):
+    return Path(dcc_world) / "campaigns" / "dungeon-crawler-carl"
+
+
+def _hot(dcc_world):
+    return json.loads((_camp(dcc_world) / "consequences.json").read_text(encoding="utf-8"))
+
+
+def test_legacy_inline_history_is_absorbed_into_the_archive(dcc_world):
+    cm = ConsequenceManager(dcc_world)
+    hot = _hot(dcc_world)
+    assert "resolved" not in hot and "provenance" not in hot
+    assert len(cm.list_resolved()) == 13  # fixture's inline resolved list
+    assert hot.get("pending")  # unrelated sections are left alone
+
+
+def test_hot_file_stays_proportional_to_active(dcc_world):
+    cm = ConsequenceManager(dcc_world)
+    for i in range(40):
+        cid = cm.add_consequence(f"old beat {i}", "whenever")
+        cm.resolve(cid)
+    hot = _hot(dcc_world)
+    assert len(hot["active"]) == 3
+    assert len(json.dumps(hot)) < 4000
+    assert len(cm.list_resolved()) == 53
+
+
+def test_segments_rotate_and_reads_span_them(dcc_world):
+    cm = ConsequenceManager(dcc_world)
+    cm.archive.clear()
+    cm.archive.SEGMENT_RECORDS = 5
+    cm.archive.append("resolved", [{"id": f"r{i}"} for i in range(13)])
+    for i in range(8):
+        cm.tick({"location": f"Floor 4 room {i}", "time": "day", "present_npcs": []}, limit=10)
+    archive = cm.archive
+    manifest = json.loads((archive.dir / "manifest.json").read_text(encoding="utf-8"))
+    segs = manifest["streams"]["provenance"]["segments"]
+    assert len(segs) >= 2 and all(s["count"] <= 5 for s in segs)
+    prov = cm.get_provenance()
+    assert len(prov) == archive.count("provenance") == sum(s["count"] for s in segs)
+    assert len(cm.list_resolved()) == 13  # resolved stream rotated too (13 > 5)
+
+
+def test_torn_append_is_truncated_not_read(dcc_world):
+    cm = ConsequenceManager(dcc_world)
+    archive = cm.archive
+    seg = archive._segments("resolved")[-1]
+    with open(archive.dir / seg["file"], "a", encoding="utf-8") as f:
+        f.write('{"id": "ghost", "consequence": "never committed"}\n')
+    assert all(r["id"] != "ghost" for r in cm.list_resolved())
+    cm.resolve(cm.add_consequence("real", "soon"))
+    ids = [r.get("id") for r in cm.list_resolved()]
+    assert "ghost" not in ids and len(ids) == 14
+
+
+def test_rollback_undoes_expiry_via_inverse_delta(dcc_world):
+    cm = ConsequenceManager(dcc_world)
+    cid = cm.add_consequence("temp ward", "soon", trigger_type="on_location",
+                             match="Cave", expiry="Cave")
+    order_before = [c["id"] for c in _hot(dcc_world)["active"]]
+    cm.tick({"location": "Dark Cave", "time": "day", "present_npcs": []})
+    assert cid not in [c["id"] for c in _hot(dcc_world)["active"]]
+    assert any(r["id"] == cid for r in cm.list_resolved())
+    undo = _hot(dcc_world)["_undo"]
+    assert undo["expired"] == [{"id": cid, "index": len(order_before) - 1}]
+
+    assert cm.rollback_last() is True
+    restored = _hot(dcc_world)["active"]
+    assert [c["id"] for c in restored] == order_before
+    assert "expired" not in restored[-1]
+    assert all(r["id"] != cid for r in cm.list_resolved())
+    assert cm.rollback_last() is False  # one beat only
+
+
+def test_rollback_keeps_resolutions_made_after_the_tick(dcc_world):
+    cm = ConsequenceManager(dcc_world)
+    cm.tick({"location": "Floor 4", "time": "day", "present_npcs": []}, limit=10)
+    cm.resolve("a36a02f6")
+    assert cm.rollback_last() is True
+    assert "a36a02f6" not in [c["id"] for c in _hot(dcc_world)["active"]]
+    assert any(r["id"] == "a36a02f6" for r in cm.list_resolved())
+
+
+def test_expand_folds_streams_back_inline(dcc_world):
+    cm = ConsequenceManager(dcc_world)
+    cm.tick({"location": "Floor 4", "time": "day", "present_npcs": []}, limit=10)
+    full = cm.archive.expand(_hot(dcc_world))
+    assert len(full["resolved"]) == 13
+    assert full["provenance"] and full["active"]
@@ -0,0 +1,87 @@
+"""Budgeted brief: `context --budget N` fills N tokens with the most valuable items."""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from lib.brief_budget import estimate_tokens, fit_brief
+from lib.session_manager import SessionManager
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+def _tokens(text):
+    return estimate_tokens(text.split("\n"))
+
+
+def test_brief_stays_within_budget_and_discloses_what_was_dropped(dcc_world):
+    sm = SessionManager(dcc_world)
+    sessions = len(sm._recent_session_summaries(n=None))
+    for budget in (800, 1500, 3000):
+        ctx = sm.get_full_context(budget=budget)
+        assert _tokens(ctx) <= budget
+        assert "--- CHARACTER ---" in ctx and "=== SESSION CONTEXT ===" in ctx
+        shown = [ln for ln in ctx.split("\n") if ln.startswith("- Session")
+                 or ln.startswith("- Development session")]
+        if "--- PREVIOUSLY ON ---" in ctx:
+            more = [ln for ln in ctx.split("\n") if ln.startswith("+") and "more sessions" in ln]
+            hidden = int(more[0][1:].split()[0]) if more else 0
+            assert len(shown) + hidden == sessions
+
+
+def test_newest_session_and_pause_point_survive_first(dcc_world):
+    sm = SessionManager(dcc_world)
+    latest = sm._recent_session_summaries(n=1)[0]
+    ctx = sm.get_full_context(budget=1500)
+    assert f"- {latest}" in ctx
+    assert "WHERE WE PAUSED:" in ctx
+    assert f"- {sm._recent_session_summaries(n=None)[0]}" not in ctx
+
+
+def test_tiny_budget_keeps_mandatory_sections_and_names_the_rest(dcc_world):
+    ctx = SessionManager(dcc_world).get_full_context(budget=50)
+    assert "--- CHARACTER ---" in ctx
+    assert ctx.rstrip().splitlines()[-1].startswith("Left out for budget: kit")
+
+
+def test_generous_budget_is_the_full_brief(dcc_world):
+    sm = SessionManager(dcc_world)
+    assert sm.get_full_context(budget=100000) == sm.get_full_context(full=True)
+
+
+def test_selector_trades_one_big_item_against_cheap_ones():
+    sections = [("big", ["", "--- BIG ---", "- " + "x" * 200]),
+                ("small", ["", "--- SMALL ---"] + [f"- item {i}" for i in range(8)])]
+    specs = {"big": (9, r"- ", "big things", "--full", False),
+             "small": (1, r"- ", "small things", "--full", False)}
+    kept = dict(fit_brief(sections, 95, specs))
+    assert kept["big"] and kept["big"][-1].startswith("- x")
+    assert kept["small"][-3:] == ["- item 2", "- item 3", "+4 more small things — --full"]
+    assert kept["budget"] == []
+    assert _tokens("\n".join(ln for out in kept.values() for ln in out)) <= 95
+    squeezed = dict(fit_brief(sections, 70, specs))
+    assert squeezed["big"] == [] and "Left out for budget: big" in squeezed["budget"][-1]
+
+
+def test_cli_budget_flag(dcc_world):
+    env = dict(os.environ, GM_WORLD_STATE_BASE=dcc_world)
+    cli = [sys.executable, str(REPO / "lib" / "session_manager.py"), "context"]
+    out = subprocess.run(cli + ["--budget", "1000"], env=env,
+                         capture_output=True, text=True, timeout=120)
+    assert out.returncode == 0 and "Left out for budget:" in out.stdout
+    assert out.stdout.strip().splitlines()[-1].startswith("Context token: b")
+    both = subprocess.run(cli + ["--budget", "1000", "--full"], env=env,
+                          capture_output=True, text=True, timeout=120)
+    assert both.returncode != 0
+
+
+def test_selector_scales_to_a_large_campaigns_facts():
+    """Full mode lists every fact; 20k of them must not make --budget quadratic."""
+    facts = ["", "--- KEY FACTS ---"] + [f"- fact {i} about floor {i % 18}" for i in range(20000)]
+    specs = {"key_facts": (3, r"- ", "facts", "--full", False)}
+    started = time.monotonic()
+    kept = dict(fit_brief([("key_facts", facts)], 4000, specs))
+    assert time.monotonic() - started < 2.0
+    assert kept["key_facts"][-1] == f"+{20000 - (len(kept['key_facts']) - 3)} more facts — --full"
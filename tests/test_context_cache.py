@@ -0,0 +1,77 @@
+"""Sectioned render cache: only sections whose input files changed are re-rendered."""
+
+import json
+import os
+from pathlib import Path
+
+from lib.context_cache import ContextCache
+from lib.session_manager import SessionManager
+
+
+def _camp(dcc_world):
+    return Path(dcc_world) / "campaigns" / "dungeon-crawler-carl"
+
+
+def _misses(dcc_world):
+    return {k: v["misses"] for k, v in ContextCache(_camp(dcc_world)).stats()["sections"].items()}
+
+
+def _rebuilt(dcc_world, before):
+    after = _misses(dcc_world)
+    return {k.split(":")[0] for k, n in after.items() if n > before.get(k, 0)}
+
+
+def test_warm_build_reuses_every_section_verbatim(dcc_world):
+    sm = SessionManager(dcc_world)
+    cold = sm.get_full_context()
+    before = _misses(dcc_world)
+    assert sm.get_full_context() == cold
+    assert _rebuilt(dcc_world, before) == set()
+    stats = ContextCache(_camp(dcc_world)).stats()
+    assert stats["hits"] == len(SessionManager.CONTEXT_SECTIONS)
+    assert cold == sm.get_full_context(use_cache=False)
+
+
+def test_only_dependent_sections_rerender(dcc_world):
+    sm = SessionManager(dcc_world)
+    sm.get_full_context()
+    before = _misses(dcc_world)
+    plots = sm.json_ops.load_json("plots.json")
+    plots["A Fresh Thread"] = {"status": "active", "type": "main", "sequence": 0, "description": "new"}
+    sm.json_ops.save_json("plots.json", plots)
+    ctx = sm.get_full_context()
+    assert "A Fresh Thread" in ctx
+    assert _rebuilt(dcc_world, before) == {"story_threads", "ready_threads"}
+
+
+def test_same_size_same_mtime_rewrite_is_caught_by_hash(dcc_world):
+    sm = SessionManager(dcc_world)
+    path = _camp(dcc_world) / "character.json"
+    text = path.read_text(encoding="utf-8")
+    path.write_text(text, encoding="utf-8")
+    sm.get_full_context()  # character.json was written just now: racily clean
+    st = path.stat()
+    swapped = text.replace('"Tandy', '"Zandy', 1)
+    assert swapped != text and len(swapped) == len(text)
+    path.write_text(swapped, encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert "Zandy" in sm.get_full_context()
+
+
+def test_env_gate_only_rerenders_play_style(dcc_world, monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    sm = SessionManager(dcc_world)
+    sm.get_full_context()
+    before = _misses(dcc_world)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    assert "Scene images: ENABLED" in sm.get_full_context()
+    assert _rebuilt(dcc_world, before) == {"play_style"}
+
+
+def test_cache_file_survives_between_managers(dcc_world):
+    SessionManager(dcc_world).get_full_context(full=True)
+    data = json.loads((_camp(dcc_world) / ContextCache.FILENAME).read_text(encoding="utf-8"))
+    assert "header:full" in data["sections"]
+    before = _misses(dcc_world)
+    SessionManager(dcc_world).get_full_context(full=True)
+    assert _rebuilt(dcc_world, before) == set()
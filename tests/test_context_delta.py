@@ -0,0 +1,68 @@
+"""Delta context: `context --since <token>` prints only the sections that changed."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from lib.session_manager import SessionManager
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+def test_every_brief_returns_a_token_and_identical_briefs_share_it(dcc_world):
+    sm = SessionManager(dcc_world)
+    first = sm.get_context_delta()
+    assert first["context"] == sm.get_full_context()
+    assert first["token"] and not first["delta"]
+    assert sm.get_context_delta()["token"] == first["token"]
+
+
+def test_no_change_prints_only_the_unchanged_list(dcc_world):
+    sm = SessionManager(dcc_world)
+    token = sm.get_context_delta()["token"]
+    delta = sm.get_context_delta(since=token)
+    assert delta["delta"] and delta["changed"] == []
+    assert "No changes." in delta["context"]
+    assert "Unchanged (still as last shown): header, kit" in delta["context"]
+    assert len(delta["context"]) < len(sm.get_full_context()) // 5
+
+
+def test_move_reprints_the_header_not_the_world(dcc_world):
+    sm = SessionManager(dcc_world)
+    token = sm.get_context_delta()["token"]
+    sm.move_party("The Old Mill")
+    delta = sm.get_context_delta(since=token)
+    assert "header" in delta["changed"]
+    assert "Location: The Old Mill" in delta["context"]
+    assert {"kit", "narrative_voice", "key_facts"} <= set(delta["unchanged"])
+    assert "--- KEY FACTS ---" not in delta["context"]
+    assert delta["context"].count("=== SESSION CONTEXT") == 1
+
+
+def test_section_that_empties_is_reported_cleared(dcc_world):
+    sm = SessionManager(dcc_world)
+    sm.json_ops.save_json("threat-clocks.json", {"Doom": {"current": 1, "max": 4}})
+    token = sm.get_context_delta()["token"]
+    sm.json_ops.save_json("threat-clocks.json", {})
+    delta = sm.get_context_delta(since=token)
+    assert delta["cleared"] == ["threat_clocks"]
+    assert "Cleared (nothing to show now): threat clocks" in delta["context"]
+
+
+def test_unknown_or_other_mode_token_falls_back_to_full_brief(dcc_world):
+    sm = SessionManager(dcc_world)
+    compact = sm.get_context_delta()["token"]
+    full = sm.get_context_delta(full=True, since=compact)
+    assert not full["delta"] and "unknown or expired" in full["context"]
+    assert "--- CHARACTER ---" in sm.get_context_delta(since="nope")["context"]
+
+
+def test_cli_prints_token_footer_and_accepts_since(dcc_world):
+    env = dict(os.environ, GM_WORLD_STATE_BASE=dcc_world)
+    cli = [sys.executable, str(REPO / "lib" / "session_manager.py"), "context"]
+    out = subprocess.run(cli, env=env, capture_output=True, text=True, timeout=120).stdout
+    token = out.strip().splitlines()[-1].split()[2]
+    again = subprocess.run(cli + ["--since", token], env=env,
+                           capture_output=True, text=True, timeout=120).stdout
+    assert f"CHANGES SINCE {token}" in again and "No changes." in again
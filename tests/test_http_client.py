@@ -0,0 +1,108 @@
+"""lib/http_client.py against the local stand-in: keep-alive, retries, coalescing, limits."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from lib import srd_cache
+from lib.http_client import HttpClient, HttpClientError
+
+
+def _url(path):
+    return os.environ["GM_SRD_ORIGIN"] + path
+
+
+def _parallel(calls):
+    results = [None] * len(calls)
+
+    def run(i):
+        results[i] = calls[i]()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(calls))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def test_sequential_requests_share_one_kept_alive_connection(srd_api):
+    srd_api.routes.update({f"/api/2014/spells/s{i}": {"index": f"s{i}"} for i in range(10)})
+    client = HttpClient(rate=0)
+    bodies = [client.get_json(_url(f"/api/2014/spells/s{i}")) for i in range(10)]
+    assert [b["index"] for b in bodies] == [f"s{i}" for i in range(10)]
+    assert srd_api.connections == 1
+    assert client.stats["connections"] == 1 and client.stats["reused"] == 9
+    assert client.request("GET", _url("/api/2014/nope")).status == 404
+
+
+def test_429_and_5xx_are_retried_until_retries_run_out(srd_api):
+    srd_api.routes["/api/2014/rules"] = {"count": 0}
+    srd_api.failures["/api/2014/rules"] = [429, 503]
+    client = HttpClient(rate=0, backoff=0.01)
+    assert client.get_json(_url("/api/2014/rules")) == {"count": 0}
+    assert srd_api.hits["/api/2014/rules"] == 3 and client.stats["retries"] == 2
+
+    srd_api.failures["/api/2014/rules"] = [503] * 5
+    assert client.request("GET", _url("/api/2014/rules"), retries=2).status == 503
+    assert srd_api.hits["/api/2014/rules"] == 6
+
+    with pytest.raises(HttpClientError):
+        client.request("GET", "http://127.0.0.1:9/api/2014/rules")  # nothing listens there
+
+
+def test_a_post_is_resent_only_when_refused_and_never_on_a_pooled_socket(srd_api):
+    srd_api.routes["/v1/images"] = {"data": []}
+    client = HttpClient(rate=0, backoff=0.01)
+    client.get_json(_url("/v1/images"))  # leaves a kept-alive socket in the pool
+    srd_api.failures["/v1/images"] = [502]
+    assert client.request("POST", _url("/v1/images"), body=b"{}").status == 502
+    srd_api.failures["/v1/images"] = [429]
+    assert client.request("POST", _url("/v1/images"), body=b"{}").ok
+    assert srd_api.hits["/v1/images"] == 4  # the GET, the 502 alone, the 429 and its retry
+    assert client.stats["reused"] == 0 and client.stats["connections"] == 4
+
+
+def test_only_a_failed_write_or_a_silent_hangup_counts_as_a_stale_socket():
+    import http.client
+    import socket
+    assert HttpClient._stale(BrokenPipeError(), sent=False)
+    assert HttpClient._stale(http.client.RemoteDisconnected("closed"), sent=True)
+    assert not HttpClient._stale(ConnectionResetError(), sent=True)
+    assert not HttpClient._stale(socket.timeout("timed out"), sent=False)
+
+
+def test_identical_requests_in_flight_are_coalesced(srd_api):
+    srd_api.routes["/api/2014/monsters"] = {"count": 334}
+    srd_api.delay["/api/2014/monsters"] = 0.3
+    client = HttpClient(rate=0)
+    answers = _parallel([lambda: client.get_json(_url("/api/2014/monsters"))] * 8)
+    assert answers == [{"count": 334}] * 8
+    assert srd_api.hits["/api/2014/monsters"] == 1 and client.stats["coalesced"] == 7
+
+
+def test_concurrency_and_rate_are_bounded(srd_api):
+    paths = [f"/api/2014/classes/c{i}" for i in range(6)]
+    srd_api.routes.update({p: {} for p in paths})
+    srd_api.delay.update({p: 0.1 for p in paths})
+    client = HttpClient(max_connections=2, rate=0)
+    started = time.monotonic()
+    _parallel([lambda p=p: client.get_json(_url(p)) for p in paths])
+    assert time.monotonic() - started >= 0.3  # three waves of two
+    assert srd_api.connections <= 2
+
+    srd_api.routes["/api/2014/races"] = {}
+    limited = HttpClient(rate=20, burst=1)
+    started = time.monotonic()
+    for _ in range(6):
+        limited.get_json(_url("/api/2014/races"))
+    assert time.monotonic() - started >= 5 / 20  # the first token is free, then 20 per second
+
+
+def test_srd_lookups_ride_out_a_rate_limit(srd_api):
+    srd_api.routes["/api/2014/spells/light"] = {"index": "light", "level": 0}
+    srd_api.failures["/api/2014/spells/light"] = [429]
+    assert srd_cache.fetch("/api/2014/spells/light")["level"] == 0
+    assert srd_api.hits["/api/2014/spells/light"] == 2
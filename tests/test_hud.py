@@ -0,0 +1,94 @@
+"""hud.txt: the writers precompute the status line; gm-statusline.sh just prints it."""
+
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from lib import hud
+from lib.player_manager import PlayerManager
+from lib.session_manager import SessionManager
+from lib.time_manager import TimeManager
+
+REPO = Path(__file__).resolve().parent.parent
+
+pytestmark = pytest.mark.skipif(not (shutil.which("bash") and shutil.which("jq")),
+                                reason="gm-statusline.sh needs bash and jq")
+
+
+def _camp(dcc_world):
+    return Path(dcc_world) / "campaigns" / "dungeon-crawler-carl"
+
+
+def _statusline(dcc_world, tmp_path, with_jq=True):
+    """Run a copy of the script anchored next to the test world (it reads ROOT/world-state)."""
+    script = Path(dcc_world).parent / "tools" / "gm-statusline.sh"
+    if not script.exists():
+        script.parent.mkdir()
+        shutil.copy(REPO / "tools" / "gm-statusline.sh", script)
+    env = dict(os.environ, TERM="dumb")
+    if not with_jq:
+        bin_dir = tmp_path / "nojq-bin"
+        if not bin_dir.exists():
+            bin_dir.mkdir()
+            for tool in ("tr", "dirname", "tput"):
+                if shutil.which(tool):
+                    os.symlink(shutil.which(tool), bin_dir / tool)
+        env["PATH"] = str(bin_dir)
+    out = subprocess.run([shutil.which("bash"), str(script)], input="{}", env=env,
+                         capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0, out.stderr
+    return out.stdout
+
+
+def _fallback(dcc_world, tmp_path):
+    """What the script derives itself: hud.txt out of the way."""
+    path = _camp(dcc_world) / hud.FILENAME
+    kept = path.read_bytes()
+    path.unlink()
+    try:
+        return _statusline(dcc_world, tmp_path)
+    finally:
+        path.write_bytes(kept)
+
+
+def test_precomputed_hud_matches_the_script_through_every_writer(dcc_world, tmp_path):
+    camp = _camp(dcc_world)
+    pm = PlayerManager(dcc_world)
+    name = json.loads((camp / "character.json").read_text())["name"]
+    max_hp = json.loads((camp / "character.json").read_text())["hp"]["max"]
+    steps = [
+        lambda: SessionManager(dcc_world).move_party("The Secret Cellar"),
+        lambda: TimeManager(dcc_world).update_time("Dusk", "Day 3"),
+        lambda: pm.modify_hp(name, -(max_hp // 2 + 1)),       # wounded
+        lambda: pm.modify_condition(name, "add", "Poisoned"),
+        lambda: pm.modify_hp(name, -max_hp),                  # critical
+    ]
+    for step in steps:
+        step()
+        assert (camp / hud.FILENAME).is_file()
+        fast = _statusline(dcc_world, tmp_path, with_jq=False)  # no jq: must be the cached HUD
+        assert fast == _fallback(dcc_world, tmp_path)
+    assert "poisoned" in fast and "The Secret Cellar" in fast and "Day 3" in fast
+
+
+def test_out_of_band_edit_makes_the_hud_stale(dcc_world, tmp_path):
+    camp = _camp(dcc_world)
+    TimeManager(dcc_world).update_time("Dawn", "Day 9")
+    over = json.loads((camp / "campaign-overview.json").read_text())
+    over["time_of_day"] = "Midnight"
+    (camp / "campaign-overview.json").write_text(json.dumps(over))
+    os.utime(camp / hud.FILENAME, ns=(1, 1))
+    assert "Midnight" in _statusline(dcc_world, tmp_path)
+
+
+def test_shapes_the_script_renders_differently_are_left_to_it(dcc_world):
+    camp = _camp(dcc_world)
+    char = json.loads((camp / "character.json").read_text())
+    char["level"] = 2.0  # jq versions disagree on "2" vs "2.0"
+    (camp / "character.json").write_text(json.dumps(char))
+    hud.refresh(camp)
+    assert not (camp / hud.FILENAME).exists()
@@ -0,0 +1,70 @@
+"""Import-time budget for the hot CLI entry points (`python -X importtime`).
+
+A session spawns dozens of these processes, so module import is a real share
+of the GM's latency. Two checks per entry point: heavy or optional modules
+must stay lazy (exact), and total import time must stay under a loose ceiling
+(an eager numpy/torch or urllib.request blows it by multiples; noise does not).
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parent.parent
+LIB = REPO / "lib"
+
+# Loaded only by the commands that use them (saves, budgeted briefs, RAG, images,
+# rolls) — never by a plain status/list/roll.
+LAZY = {"numpy", "sentence_transformers", "chromadb", "torch", "urllib.request",
+        "difflib", "play_pack", "image_gen", "entity_enhancer", "save_store",
+        "brief_budget", "mention_index", "http_client"}
+
+# (argv, modules that must NOT load, ceiling in microseconds of import time).
+ENTRY_POINTS = {
+    "session status": (["session_manager.py", "status"], LAZY | {"dice"}, 150_000),
+    "dice": (["dice.py", "1d20"], LAZY, 80_000),
+    "npc list": (["npc_manager.py", "list"], LAZY | {"dice", "world_kit"}, 120_000),
+}
+
+
+def _import_profile(argv, world):
+    """({module names}, total import µs) of one run, from -X importtime on stderr."""
+    env = dict(os.environ, GM_WORLD_STATE_BASE=world)
+    out = subprocess.run([sys.executable, "-X", "importtime", str(LIB / argv[0])] + argv[1:],
+                         env=env, capture_output=True, text=True, timeout=120)
+    assert out.returncode == 0, out.stderr[-2000:]
+    modules, total = set(), 0
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _self, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # the header row
+        modules.add(name.strip())
+        if name.startswith(" ") and not name.startswith("  "):  # top level
+            total += int(cumulative)
+    return modules, total
+
+
+@pytest.mark.parametrize("entry", sorted(ENTRY_POINTS))
+def test_entry_point_stays_lazy_and_within_budget(entry, dcc_world):
+    argv, forbidden, ceiling = ENTRY_POINTS[entry]
+    runs = [_import_profile(argv, dcc_world) for _ in range(3)]  # 1st also warms .pyc
+    modules = runs[-1][0]
+    assert not (modules & forbidden), sorted(modules & forbidden)
+    best = min(total for _, total in runs)
+    assert best <= ceiling, f"{entry}: {best}µs of imports (budget {ceiling}µs)"
+
+
+def test_rag_package_checks_deps_without_importing_them():
+    code = ("import sys; sys.path.insert(0, %r); import rag.coarse_index, lib.rag as r; "
+            "r.check_rag_available(); "
+            "print(sorted(m for m in ('sentence_transformers', 'chromadb', 'rag.embedder') "
+            "if m in sys.modules))" % str(LIB))
+    out = subprocess.run([sys.executable, "-c", code], cwd=REPO,
+                         capture_output=True, text=True, timeout=120)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == "[]"
@@ -0,0 +1,65 @@
+"""One-pass NPC mention matching: same answers as the per-NPC regexes, one scan."""
+
+import random
+import re
+import sys
+
+from lib import mention_index
+from lib.mention_index import MentionAutomaton, scan_mentions
+from lib.session_manager import SessionManager
+
+
+def _regex_owners(needles, text):
+    return {owner for owner, ns in needles.items()
+            if any(re.search(r"\b" + re.escape(n) + r"\b", text, re.IGNORECASE) for n in ns)}
+
+
+def test_word_boundaries_and_case_match_the_regex_rule():
+    needles = {"Ana": ["Ana"], "Withers": ["Old Man Withers", "Withers"],
+               "Dr. Q": ["Dr. Q"], "Kat": ["Kat", "Katia"]}
+    auto = MentionAutomaton((o, n) for o, ns in needles.items() for n in ns)
+    for text in ("Banana bread", "ana said no", "the old rope", "OLD MAN WITHERS waved",
+                 "Katia's knife", "katz", "Dr. Qua", "ask Dr. Q.", "Ana_", "(Ana)"):
+        assert auto.owners_in(text) == _regex_owners(needles, text), text
+
+
+def test_randomized_agreement_with_regex():
+    rng = random.Random(7)
+    alphabet = "ab _.'"
+    needles = {f"n{i}": ["".join(rng.choice("ab") for _ in range(rng.randint(1, 3)))]
+               for i in range(6)}
+    auto = MentionAutomaton((o, n) for o, ns in needles.items() for n in ns)
+    for _ in range(500):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        assert auto.owners_in(text) == _regex_owners(needles, text), (text, needles)
+
+
+def test_scan_is_cached_per_corpus_version():
+    mention_index._CACHE.clear()
+    facts = ["Carl opened the box", "Donut hissed", "nobody here"]
+    needles = {"Carl": ["Carl"], "Princess Donut": ["Princess Donut", "Donut"]}
+    first = scan_mentions(needles, facts, version="v1")
+    assert first == {"Carl": [0], "Princess Donut": [1]}
+    assert scan_mentions(needles, facts, version="v1") is first
+    assert scan_mentions(needles, facts + ["Carl again"], version="v2")["Carl"] == [0, 3]
+
+
+def test_scene_scans_the_corpus_once_for_every_present_npc(dcc_world, monkeypatch):
+    sm = SessionManager(dcc_world)
+    snap = sm.snapshot()
+    present = {name: data for name, data in snap.npcs.items()}
+    used = sys.modules["mention_index"]  # the bare-name copy lib/ modules import
+    used._CACHE.clear()
+    scans = []
+    real = used.MentionAutomaton.owners_in
+    monkeypatch.setattr(used.MentionAutomaton, "owners_in",
+                        lambda self, text: scans.append(text) or real(self, text))
+    mentions = sm._fact_mentions(present, snap)
+    facts = sm._all_fact_texts(snap.facts)
+    assert len(scans) == len(facts)
+    for name, data in present.items():
+        pats = [re.compile(r"\b" + re.escape(n) + r"\b", re.IGNORECASE)
+                for n in sm._npc_needles(name, data)]
+        assert mentions[name] == [t for t in facts if any(p.search(t) for p in pats)]
+    sm._fact_mentions(present, snap)
+    assert len(scans) == len(facts)  # same facts version: served from the cache
@@ -0,0 +1,93 @@
+"""The local monster catalog and the XP-budget encounter builder on top of it."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+MONSTERS = REPO / "features" / "dnd-api" / "monsters"
+sys.path.insert(0, str(MONSTERS))
+
+import encounter_builder  # noqa: E402
+from encounter_builder import build_encounter, multiplier, party_thresholds  # noqa: E402
+
+
+def _monster(index, name, cr, xp, mtype="humanoid", size="Medium", alignment="neutral evil"):
+    return {"index": index, "name": name, "challenge_rating": cr, "xp": xp, "type": mtype,
+            "size": size, "alignment": alignment, "hit_points": 7 + int(xp / 10),
+            "armor_class": [{"type": "natural", "value": 12}], "url": f"/api/2014/monsters/{index}"}
+
+
+BESTIARY = [
+    _monster("bandit", "Bandit", 0.125, 25),
+    _monster("ghoul", "Ghoul", 1, 200, mtype="undead", alignment="chaotic evil"),
+    _monster("goblin", "Goblin", 0.25, 50, size="Small"),
+    _monster("ogre", "Ogre", 2, 450, size="Large", alignment="chaotic evil"),
+    _monster("skeleton", "Skeleton", 0.25, 50, mtype="undead", alignment="lawful evil"),
+    _monster("wight", "Wight", 3, 700, mtype="undead"),
+    _monster("zombie", "Zombie", 0.25, 50, mtype="undead"),
+]
+
+
+def _rows():
+    return [{"index": m["index"], "name": m["name"], "cr": m["challenge_rating"], "xp": m["xp"],
+             "type": m["type"], "hp": m["hit_points"], "ac": 12} for m in BESTIARY]
+
+
+def _serve(srd_api):
+    srd_api.routes["/api/2014/monsters"] = {"count": len(BESTIARY), "results": [
+        {"index": m["index"], "name": m["name"], "url": m["url"]} for m in BESTIARY]}
+    srd_api.routes.update({m["url"]: m for m in BESTIARY})
+
+
+def _run(script, *args):
+    out = subprocess.run([sys.executable, str(MONSTERS / script), *args], env=dict(os.environ),
+                         capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0, out.stdout + out.stderr
+    return out.stdout
+
+
+def test_multipliers_follow_the_dmg_table():
+    assert [multiplier(n, 4) for n in (1, 2, 3, 6, 7, 10, 11, 14, 15)] == \
+        [1, 1.5, 2, 2, 2.5, 2.5, 3, 3, 4]
+    assert multiplier(1, 2) == 1.5 and multiplier(15, 1) == 5  # small parties: one step up
+    assert multiplier(1, 6) == 0.5 and multiplier(3, 7) == 1.5  # large parties: one step down
+    assert party_thresholds(5, 4) == {"easy": 1000, "medium": 2000, "hard": 3000, "deadly": 4400}
+
+
+def test_encounters_land_in_the_band_and_repeat_under_a_seed():
+    rows = _rows()
+    for difficulty in encounter_builder.DIFFICULTIES:
+        for seed in range(20):
+            built = build_encounter(rows, 3, 4, difficulty, seed=seed)
+            low, high = built["target"]
+            assert low <= built["adjusted_xp"] < high
+            assert built["rating"] == difficulty
+            assert sum(g["count"] for g in built["groups"]) <= 8
+    assert build_encounter(rows, 3, 4, "hard", seed=11) == build_encounter(rows, 3, 4, "hard", seed=11)
+    assert len({json.dumps(build_encounter(rows, 3, 4, "hard", seed=s)) for s in range(20)}) > 1
+    assert build_encounter(rows, 20, 8, "deadly", max_monsters=2) is None
+
+
+def test_scripts_answer_from_the_catalog_without_refetching(srd_api):
+    _serve(srd_api)
+    built = json.loads(_run("dnd_encounter_v2.py", "--party-level", "2", "--party-size", "4",
+                            "--difficulty", "hard", "--type", "undead", "--seed", "3"))
+    assert built["rating"] == "hard"
+    assert {g["index"] for g in built["groups"]} <= {"ghoul", "skeleton", "wight", "zombie"}
+    details = {p: n for p, n in srd_api.hits.items() if p.count("/") == 4}
+    assert len(details) == len(BESTIARY) and set(details.values()) == {1}
+
+    quarter = json.loads(_run("dnd_encounter_v2.py", "--cr", "0.25", "--count", "2", "--seed", "1"))
+    assert quarter["encounter_xp"] == 100 and len(quarter["monsters"]) == 2
+    ogre = json.loads(_run("dnd_encounter_v2.py", "--cr", "2", "--quick"))
+    assert ogre["monsters"] == ["ogre"]
+
+    listed = json.loads(_run("dnd_monsters_api_filter.py", "--json", "--cr", "0.25",
+                             "--type", "undead", "--search", "ske"))
+    assert [m["index"] for m in listed["results"]] == ["skeleton"]
+    evil = json.loads(_run("dnd_monsters_api_filter.py", "--json", "--alignment", "Chaotic Evil"))
+    assert [m["index"] for m in evil["results"]] == ["ghoul", "ogre"]
+    assert {p: n for p, n in srd_api.hits.items() if p.count("/") == 4} == details
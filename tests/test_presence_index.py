@@ -0,0 +1,108 @@
+"""npcs.presence.json: who-is-here is a lookup, kept current by the tag writers."""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from lib.entity_manager import npcs_present
+from lib.npc_manager import NPCManager
+from lib import presence_index
+from lib.presence_index import PresenceIndex
+
+
+def _camp(dcc_world):
+    return Path(dcc_world) / "campaigns" / "dungeon-crawler-carl"
+
+
+def _npcs(dcc_world):
+    return json.loads((_camp(dcc_world) / "npcs.json").read_text(encoding="utf-8"))
+
+
+def _index_file(dcc_world):
+    return json.loads((_camp(dcc_world) / PresenceIndex.FILENAME).read_text(encoding="utf-8"))
+
+
+def test_lookup_matches_the_scan_for_every_tagged_location(dcc_world):
+    npcs = _npcs(dcc_world)
+    index = PresenceIndex(_camp(dcc_world)).load()
+    locations = {loc for d in npcs.values() if isinstance(d, dict)
+                 for loc in (d.get("tags") or {}).get("locations", [])}
+    assert locations
+    for loc in list(locations) + ["Nowhere", "", None]:
+        for probe in {loc, (loc or "").upper()}:
+            assert list(npcs_present(npcs, probe, index)) == list(npcs_present(npcs, probe))
+
+
+def test_tag_writes_update_the_index_in_place(dcc_world, monkeypatch):
+    mgr = NPCManager(dcc_world)
+    name = next(iter(_npcs(dcc_world)))
+    PresenceIndex(mgr.campaign_dir).load()
+    used = sys.modules["presence_index"].PresenceIndex  # the bare-name copy npc_manager imports
+    assert used is not PresenceIndex
+    monkeypatch.setattr(used, "build", staticmethod(
+        lambda npcs: (_ for _ in ()).throw(AssertionError("rebuilt"))))
+    assert mgr.tag_location(name, "The Secret Cellar")
+    monkeypatch.undo()
+    assert name in [n for _pos, n in _index_file(dcc_world)["locations"]["the secret cellar"]]
+    index = PresenceIndex(mgr.campaign_dir).load()
+    assert name in npcs_present(_npcs(dcc_world), "the secret cellar", index)
+    assert mgr.untag_location(name, "The Secret Cellar")
+    assert "the secret cellar" not in PresenceIndex(mgr.campaign_dir).load()["locations"]
+
+
+def test_promote_and_demote_move_npcs_in_and_out_of_the_party(dcc_world):
+    mgr = NPCManager(dcc_world)
+    npcs = _npcs(dcc_world)
+    name = next(n for n, d in npcs.items() if not d.get("is_party_member"))
+    assert mgr.promote_to_party_member(name)
+    assert name in [n for _pos, n in PresenceIndex(mgr.campaign_dir).load()["party"]]
+    assert name in npcs_present(_npcs(dcc_world), "Nowhere",
+                                PresenceIndex(mgr.campaign_dir).load())
+    assert mgr.demote_from_party_member(name)
+    assert name not in [n for _pos, n in PresenceIndex(mgr.campaign_dir).load()["party"]]
+
+
+def test_out_of_band_write_is_caught_by_the_stamp(dcc_world):
+    camp = _camp(dcc_world)
+    PresenceIndex(camp).load()
+    npcs = _npcs(dcc_world)
+    npcs["Zev the Stray"] = {"tags": {"locations": ["Back Alley"]}}
+    (camp / "npcs.json").write_text(json.dumps(npcs), encoding="utf-8")
+    index = PresenceIndex(camp).load()
+    assert list(npcs_present(npcs, "back alley", index)) == list(npcs_present(npcs, "back alley"))
+    assert "Zev the Stray" in npcs_present(npcs, "Back Alley", index)
+
+
+def test_lookups_on_a_big_cast_cost_less_than_the_scan(tmp_path):
+    """The caller has npcs.json parsed already. A one-shot reader (scene
+    context, the consequence tick) loading the index must not pay more than a
+    scan, and the repeat checks of one turn must cost next to nothing."""
+    npcs = {f"NPC {i}": {"description": "x" * 200, "attitude": "neutral", "events": [],
+                         "tags": {"locations": [f"Room {i % 300}", f"Floor {i % 9}"]},
+                         "is_party_member": i < 3}
+            for i in range(3000)}
+    (tmp_path / "npcs.json").write_text(json.dumps(npcs), encoding="utf-8")
+    past = time.time_ns() - 60 * 10**9  # out of the racy window, as between turns
+    os.utime(tmp_path / "npcs.json", ns=(past, past))
+    PresenceIndex(tmp_path).load()  # the first reader builds it
+
+    def best(fn, setup=lambda: None):
+        runs = []
+        for _ in range(7):
+            setup()
+            started = time.perf_counter()
+            fn()
+            runs.append(time.perf_counter() - started)
+        return min(runs)
+
+    def lookup():
+        return npcs_present(npcs, "Room 7", PresenceIndex(tmp_path).load())
+
+    scan = best(lambda: npcs_present(npcs, "Room 7"))
+    cold = best(lookup, setup=presence_index._loaded.clear)
+    warm = best(lookup)
+    assert list(lookup()) == list(npcs_present(npcs, "Room 7"))
+    assert cold < 1.5 * scan, (cold, scan)
+    assert warm < scan / 10, (warm, scan)
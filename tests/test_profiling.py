@@ -0,0 +1,68 @@
+"""GM_PROFILE=1: every lib main() appends one JSONL record; `report` summarizes them."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from lib import profiling
+from lib.session_manager import SessionManager
+
+REPO = Path(__file__).resolve().parent.parent
+LIB = REPO / "lib"
+
+
+def _cli(world, *argv, profile=True):
+    env = dict(os.environ, GM_WORLD_STATE_BASE=world)
+    env.pop("GM_PROFILE", None)
+    if profile:
+        env["GM_PROFILE"] = "1"
+    out = subprocess.run([sys.executable, str(LIB / argv[0])] + list(argv[1:]), env=env,
+                         capture_output=True, text=True, timeout=120)
+    return out
+
+
+def test_profiled_commands_record_phases_and_io(dcc_world):
+    log = Path(dcc_world) / "usage" / profiling.FILENAME
+    assert _cli(dcc_world, "session_manager.py", "context", profile=False).returncode == 0
+    assert not log.exists()  # off by default: nothing recorded
+
+    (Path(dcc_world) / "campaigns" / "dungeon-crawler-carl" / "context-cache.json").unlink(
+        missing_ok=True)
+    assert _cli(dcc_world, "session_manager.py", "context", "--json").returncode == 0
+    assert _cli(dcc_world, "npc_manager.py", "status", "Nobody In Particular").returncode == 1
+
+    context, failed = [json.loads(line) for line in log.read_text().splitlines()]
+    assert context["command"] == "session_manager context"
+    assert context["campaign"] == "dungeon-crawler-carl" and context["exit"] == 0
+    sections = {f"context.{name}" for name, _r, _d in SessionManager.CONTEXT_SECTIONS}
+    assert sections <= set(context["phases"])  # cache removed: every section rendered
+    assert context["counters"]["json.read"]["calls"] > 0
+    assert context["counters"]["json.read"]["bytes"] > 0
+    assert context["counters"]["json.write"]["calls"] > 0  # the render cache
+    assert failed["command"] == "npc_manager status" and failed["exit"] == 1
+
+
+def test_report_gives_percentiles_per_command(dcc_world):
+    for _ in range(3):
+        assert _cli(dcc_world, "npc_manager.py", "list").returncode == 0
+    out = _cli(dcc_world, "profiling.py", "report", "--json", profile=False)
+    assert out.returncode == 0, out.stderr
+    data = json.loads(out.stdout)["data"]
+    assert list(data) == ["npc_manager list"]
+    s = data["npc_manager list"]
+    assert s["runs"] == 3 and s["failed"] == 0
+    assert 0 < s["wall_ms"]["p50"] <= s["wall_ms"]["p95"]
+    assert s["counters"]["json.read"]["calls"]["p50"] >= 1
+
+
+def test_summary_treats_a_missing_phase_as_zero_and_names_group():
+    runs = [{"command": "x", "wall_ms": w, "phases": {"a": {"ms": w}} if w > 15 else {}}
+            for w in (10, 20, 30, 40)]
+    s = profiling.summarize(runs)["x"]
+    assert s["wall_ms"] == {"p50": 20, "p95": 40}
+    assert s["phases"]["a"] == {"p50": 20, "p95": 40}
+    assert profiling.command_name(["lib/dice.py", "1d20+3"]) == "dice"
+    assert profiling.command_name(["lib/npc_manager.py", "--json", "status", "Carl"]) == \
+        "npc_manager status"
@@ -66,5 +66,5 @@ def test_expired_consequence_is_archived_not_fired(dcc_world):
     fired = cm.check_pending({"location": "Dark Cave", "time": "day", "present_npcs": []}, limit=10)
     assert all(c["consequence"] != "temp ward" for c in fired), "expired must not fire"
     data = json.loads(_consq_path(dcc_world).read_text(encoding="utf-8"))
-    assert any(c.get("consequence") == "temp ward" for c in data["resolved"]), "expired must be archived"
+    assert any(c.get("consequence") == "temp ward" for c in cm.list_resolved()), "expired must be archived"
     assert all(c.get("consequence") != "temp ward" for c in data["active"]), "expired removed from active"
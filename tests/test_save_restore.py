@@ -3,6 +3,7 @@
 import json
 from pathlib import Path
 
+from lib.consequence_archive import ConsequenceArchive
 from lib.session_manager import SessionManager
 
 CAMPAIGN = "dungeon-crawler-carl"
@@ -37,12 +38,14 @@ def _seed_extra_state(camp: Path) -> None:
 
 
 def _snapshot_from_save(sm: SessionManager, filename: str) -> dict:
-    return _load(sm.saves_dir / filename)["snapshot"]
+    return sm.load_save(filename)["snapshot"]
 
 
 def _disk_value(camp: Path, key: str):
     if key == "characters":
         return _load(camp / "character.json")
+    if key == "consequences.json":
+        return ConsequenceArchive(camp).expand(_load(camp / key))
     path = camp / key
     if key.endswith(".md"):
         return path.read_text(encoding="utf-8")
@@ -55,7 +58,7 @@ def test_round_trip_restores_every_snapshotted_file(dcc_world):
     sm = SessionManager(dcc_world)
 
     filename = sm.create_save("checkpoint")
-    save = _load(sm.saves_dir / filename)
+    save = sm.load_save(filename)
     assert save["save_version"] == SessionManager.SAVE_VERSION
     snapshot = save["snapshot"]
 
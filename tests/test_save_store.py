@@ -0,0 +1,133 @@
+"""Saves are manifests into a content-addressed, compressed, garbage-collected blob store."""
+
+import gzip
+import json
+import os
+from pathlib import Path
+
+from lib.session_manager import SessionManager
+
+
+def _camp(dcc_world):
+    return Path(dcc_world) / "campaigns" / "dungeon-crawler-carl"
+
+
+def _blobs(sm):
+    return sorted(p.name for p in (sm.saves_dir / "blobs").glob("*/*.json.gz"))
+
+
+def test_save_is_a_manifest_of_digests(dcc_world):
+    sm = SessionManager(dcc_world)
+    filename = sm.create_save("checkpoint")
+    save = json.loads((sm.saves_dir / filename).read_text(encoding="utf-8"))
+    assert save["save_version"] == 2
+    assert "snapshot" not in save
+    assert set(save["files"]) >= {"npcs.json", "facts.json", "characters"}
+    assert all(len(d) == 64 for d in save["files"].values())
+
+
+def test_unchanged_autosave_writes_no_new_blobs(dcc_world):
+    sm = SessionManager(dcc_world)
+    sm.create_save("autosave")
+    before = _blobs(sm)
+    sm.create_save("autosave")
+    assert _blobs(sm) == before
+
+    sm.json_ops.update_json("facts.json", {"brand_new": ["a fact"]})
+    sm.create_save("autosave")
+    assert len(_blobs(sm)) == len(before) + 1
+
+
+def test_a_just_written_file_is_reread_even_with_the_same_stat(dcc_world):
+    sm = SessionManager(dcc_world)
+    facts = _camp(dcc_world) / "facts.json"
+    sm.json_ops.save_json("facts.json", {"turn": ["aaaa"]})
+    first = json.loads((sm.saves_dir / sm.create_save("one")).read_text(encoding="utf-8"))
+    st = facts.stat()
+    sm.json_ops.save_json("facts.json", {"turn": ["bbbb"]})  # same size, same clock tick
+    os.utime(facts, ns=(st.st_atime_ns, st.st_mtime_ns))
+    second = json.loads((sm.saves_dir / sm.create_save("two")).read_text(encoding="utf-8"))
+    assert first["files"]["facts.json"] != second["files"]["facts.json"]
+
+    stat_cache = sm.saves_dir / "blobs" / "stat-cache.json"
+    stat_cache = json.loads(stat_cache.read_text(encoding="utf-8"))
+    assert "facts.json" not in stat_cache and "npcs.json" in stat_cache
+
+
+def test_rotation_collects_unreferenced_blobs(dcc_world):
+    sm = SessionManager(dcc_world)
+    for i in range(SessionManager.AUTOSAVE_KEEP + 2):
+        sm.json_ops.update_json("facts.json", {"turn": [str(i)]})
+        sm.create_save("autosave")
+    live = set()
+    for save_file in sm.saves_dir.glob("*-autosave*.json"):
+        live.update(json.loads(save_file.read_text(encoding="utf-8"))["files"].values())
+    assert {n[:-len(".json.gz")] for n in _blobs(sm)} == live
+
+
+def test_delete_save_collects_its_blobs(dcc_world):
+    sm = SessionManager(dcc_world)
+    filename = sm.create_save("lonely")
+    assert _blobs(sm)
+    assert sm.delete_save(filename) is True
+    assert _blobs(sm) == []
+
+
+def test_inline_v1_save_still_restores(dcc_world):
+    sm = SessionManager(dcc_world)
+    legacy = {"save_version": 1, "name": "old", "created": "2025-01-01T00:00:00+00:00",
+              "session_number": 1, "snapshot": {"facts.json": {"lore": ["from v1"]}}}
+    (sm.saves_dir / "20250101-000000-old.json").write_text(json.dumps(legacy), encoding="utf-8")
+    assert sm.restore_save("old") is True
+    facts = json.loads((_camp(dcc_world) / "facts.json").read_text(encoding="utf-8"))
+    assert facts == {"lore": ["from v1"]}
+
+
+def test_blobs_are_compressed_and_round_trip(dcc_world):
+    sm = SessionManager(dcc_world)
+    filename = sm.create_save("checkpoint")
+    save = json.loads((sm.saves_dir / filename).read_text(encoding="utf-8"))
+    digest = save["files"]["npcs.json"]
+    blob = next((sm.saves_dir / "blobs").glob(f"*/{digest}.json.gz"))
+    raw = gzip.decompress(blob.read_bytes())
+    assert blob.stat().st_size < len(raw)
+    npcs = json.loads((_camp(dcc_world) / "npcs.json").read_text(encoding="utf-8"))
+    assert json.loads(raw) == npcs
+
+
+def test_list_saves_reads_the_index_not_the_saves(dcc_world, monkeypatch):
+    sm = SessionManager(dcc_world)
+    names = [sm.create_save(f"chapter {i}") for i in range(4)]
+    index = json.loads((sm.saves_dir / "index.json").read_text(encoding="utf-8"))
+    assert set(index["saves"]) == set(names)
+    assert all(len(e["sha256"]) == 64 and e["bytes"] > 0 for e in index["saves"].values())
+
+    opened = []
+    real_read = Path.read_bytes
+    monkeypatch.setattr(Path, "read_bytes", lambda p: opened.append(p.name) or real_read(p))
+    listed = sm.list_saves()
+    assert [s["filename"] for s in listed] == sorted(names, reverse=True)
+    assert not any(n in names for n in opened)
+
+
+def test_missing_index_is_rebuilt_in_rotation_order(dcc_world):
+    sm = SessionManager(dcc_world)
+    sm.get_iso_timestamp = lambda: "20260814-153000"
+    for _ in range(3):
+        sm.create_save("autosave")
+    before = sm._autosave_files()
+    (sm.saves_dir / "index.json").unlink()
+    assert sm._autosave_files() == before
+    assert {s["filename"] for s in sm.list_saves()} == {p.name for p in before}
+
+
+def test_hand_copied_and_hand_removed_saves_are_reconciled(dcc_world):
+    sm = SessionManager(dcc_world)
+    kept = sm.create_save("kept")
+    gone = sm.create_save("gone")
+    (sm.saves_dir / gone).unlink()
+    copied = sm.saves_dir / "20200101-000000-imported.json"
+    copied.write_bytes((sm.saves_dir / kept).read_bytes())
+    assert sm._find_save("imported") == copied
+    assert {s["filename"] for s in sm.list_saves()} == {kept, copied.name}
+    assert sm._find_save("gone") is None
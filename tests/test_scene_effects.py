@@ -0,0 +1,66 @@
+"""move/start --with-effects: arrival effects run concurrently, printed in the old order."""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from lib.campaign_context import CampaignContext
+from lib.scene_effects import run_effects
+
+LIB = Path(__file__).resolve().parent.parent / "lib"
+
+
+def test_effects_overlap_and_keep_their_order(dcc_world):
+    started = threading.Barrier(3, timeout=5)  # deadlocks (fails) unless all run at once
+
+    def effect(tag, delay):
+        def run(context, location):
+            started.wait()
+            time.sleep(delay)
+            print(f"{tag} at {location}")
+            return tag
+        return run
+
+    def broken(context, location):
+        started.wait()
+        raise ValueError("no index")
+
+    effects = [("slow", effect("slow", 0.2), False), ("fast", effect("fast", 0.0), False),
+               ("broken", broken, True)]
+    start = time.perf_counter()
+    outcomes = run_effects(effects, CampaignContext(dcc_world), "Safe Room")
+    assert time.perf_counter() - start < 0.4 + 0.2  # one slow effect, not the sum
+    assert [(n, t, d) for n, t, d in outcomes] == [
+        ("slow", "slow at Safe Room\n", "slow"),
+        ("fast", "fast at Safe Room\n", "fast"),
+        ("broken", "", None),  # quiet: dropped, as `2>/dev/null || true` did
+    ]
+
+
+def test_move_with_effects_ticks_and_briefs_the_first_visit_only(dcc_world):
+    camp = Path(dcc_world) / "campaigns" / "dungeon-crawler-carl"
+    (camp / "book-text.txt").write_text(
+        "Chapter One\n\nThe Safe Room was quiet. Mordecai waited in the Safe Room.\n")
+    env = dict(os.environ, GM_WORLD_STATE_BASE=dcc_world)
+
+    def move(*extra):
+        return subprocess.run([sys.executable, str(LIB / "session_manager.py"), "move",
+                               "Safe Room", "--with-effects", *extra],
+                              env=env, capture_output=True, text=True, timeout=120)
+
+    first = move()
+    assert first.returncode == 0, first.stderr
+    moved, rest = first.stdout.split("[REACTIVITY]", 1)
+    assert '"current_location": "Safe Room"' in moved
+    assert rest.index("First visit") > 0
+    assert "Safe Room" in json.loads((camp / "loremaster-cache.json").read_text())
+
+    again = move("--json")
+    data = json.loads(again.stdout)["data"]
+    assert data["move"]["current_location"] == "Safe Room"
+    assert set(data["effects"]) == {"tick", "lore", "scene"}
+    assert data["effects"]["lore"] is None and data["effects"]["scene"] is None
@@ -0,0 +1,81 @@
+"""session-log.idx.json: readers answer from the sidecar, not by re-splitting the log."""
+
+import json
+import os
+from pathlib import Path
+
+from lib.campaign_memory import CampaignMemory
+from lib.session_log_index import SessionLogIndex, parse_log
+from lib.session_manager import SessionManager
+from lib.world_stats import WorldStats
+
+
+def _camp(dcc_world):
+    return Path(dcc_world) / "campaigns" / "dungeon-crawler-carl"
+
+
+def _old_history(text):
+    """What `get_history` returned when it scanned the whole log."""
+    return [ln.strip() for ln in text.split("\n")
+            if "Session Started:" in ln or "Session Ended:" in ln][-10:]
+
+
+def test_start_and_end_update_the_index_incrementally(dcc_world):
+    sm = SessionManager(dcc_world)
+    started = sm.log_index.load()["counts"]["started"]
+    sm.start_session()
+    assert sm.log_index.load()["counts"]["started"] == started + 1
+    sm.end_session("Carl found the stairs.", cliffhanger="The door creaks.",
+                   open_threads=["the key", "Mordecai's warning"])
+    index = SessionLogIndex(_camp(dcc_world))
+    data = json.loads((_camp(dcc_world) / SessionLogIndex.FILENAME).read_text(encoding="utf-8"))
+    assert data["sessions"] == parse_log(sm.session_log.read_bytes())
+    last = data["sessions"][-1]
+    assert last["summary"] == "Carl found the stairs."
+    assert last["cliffhanger"] == "The door creaks."
+    assert sm._latest_session_meta() == {"cliffhanger": "The door creaks.",
+                                         "open_threads": "the key; Mordecai's warning"}
+    counts = data["counts"]
+    assert index.session_number() == counts["ended"] + (counts["started"] > counts["ended"])
+    with open(sm.session_log, "rb") as f:
+        f.seek(last["start"])
+        assert f.read(len("## Session Started:")) == b"## Session Started:"
+
+
+def test_out_of_band_edit_rebuilds(dcc_world):
+    sm = SessionManager(dcc_world)
+    number = sm._get_session_number()
+    with open(sm.session_log, "a", encoding="utf-8") as f:
+        f.write("## Session Started: hand-edited\n\n### Session Ended: later\nA quiet night.\n\n---\n")
+    assert sm._get_session_number() == number + 1
+    assert sm._recent_session_summaries(n=1) == ["A quiet night."]
+
+
+def test_same_size_rewrite_inside_mtime_granularity_is_caught(dcc_world):
+    sm = SessionManager(dcc_world)
+    sm.start_session()
+    sm.end_session("Donut won the duel.")
+    st = sm.session_log.stat()
+    text = sm.session_log.read_text(encoding="utf-8")
+    sm.session_log.write_text(text.replace("Donut won", "Carl won"), encoding="utf-8")
+    os.utime(sm.session_log, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert sm._recent_session_summaries(n=1)[0].startswith("Carl won the duel.")
+
+
+def test_history_seeks_to_the_tail(dcc_world):
+    sm = SessionManager(dcc_world)
+    for i in range(3):
+        sm.start_session()
+        sm.end_session(f"Session Ended: mentioned in prose {i}")
+    text = sm.session_log.read_text(encoding="utf-8")
+    assert sm.get_history() == _old_history(text)
+    assert len(sm.log_index.tail(10)) < len(text)
+
+
+def test_memory_and_stats_read_the_index(dcc_world):
+    index = SessionLogIndex(_camp(dcc_world)).load()
+    counts = WorldStats(dcc_world).get_counts()
+    assert counts["sessions"] == index["counts"]["started"] > 0
+    recent = [e for e in CampaignMemory(dcc_world).gather() if e["source"] == "session-log"]
+    assert recent and not any("**Session:**" in e["text"] for e in recent)
+    assert len(recent) == len([s for s in index["sessions"] if s["summary"]])
@@ -50,7 +50,7 @@ def test_all_three_slug_paths_land_in_one_directory(name, expected, tmp_path):
 
     assert slugify_cli(name, cwd=tmp_path) == expected
 
-    campaigns = sorted(p.name for p in (world_state / "campaigns").iterdir())
+    campaigns = sorted(p.name for p in (world_state / "campaigns").iterdir() if p.is_dir())
     assert campaigns == [expected], "the name must land in exactly one directory"
 
     # The Step 2 switch resolves the DISPLAY name to that same directory.
@@ -150,7 +150,8 @@ def test_legacy_slug_directories_still_resolve(legacy_dir, display_name, tmp_pat
     assert manager.get_active() == legacy_dir
     assert manager.get_campaign_path(display_name) == world_state / "campaigns" / legacy_dir
     # Resolution must not create or rename directories.
-    assert sorted(p.name for p in (world_state / "campaigns").iterdir()) == [legacy_dir]
+    assert sorted(p.name for p in (world_state / "campaigns").iterdir()
+                  if p.is_dir()) == [legacy_dir]
 
 
 def test_new_slug_directory_wins_over_a_legacy_sibling(tmp_path):
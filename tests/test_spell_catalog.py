@@ -0,0 +1,127 @@
+"""The local spell catalog: list_spells filters answered from indexes, not per-spell fetches."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from lib.srd_catalog import SrdCatalog
+
+REPO = Path(__file__).resolve().parent.parent
+LIST_SPELLS = REPO / "features" / "spells" / "list_spells.py"
+
+
+def _spell(index, name, level, school, classes, ritual=False, concentration=False, damage=None):
+    record = {"index": index, "name": name, "level": level,
+              "school": {"index": school, "name": school.title()},
+              "classes": [{"index": c, "name": c.title()} for c in classes],
+              "ritual": ritual, "concentration": concentration,
+              "url": f"/api/2014/spells/{index}"}
+    if damage:
+        record["damage"] = {"damage_type": {"index": damage, "name": damage.title()}}
+    return record
+
+
+SPELLS = [
+    _spell("alarm", "Alarm", 1, "abjuration", ["ranger", "wizard"], ritual=True),
+    _spell("detect-magic", "Detect Magic", 1, "divination", ["cleric", "wizard"],
+           ritual=True, concentration=True),
+    _spell("fire-bolt", "Fire Bolt", 0, "evocation", ["sorcerer", "wizard"], damage="fire"),
+    _spell("fireball", "Fireball", 3, "evocation", ["sorcerer", "wizard"], damage="fire"),
+    _spell("shield", "Shield", 1, "abjuration", ["sorcerer", "wizard"]),
+]
+
+
+def _serve(srd_api, spells):
+    srd_api.routes["/api/2014/spells"] = {"count": len(spells), "results": [
+        {"index": s["index"], "name": s["name"], "url": s["url"]} for s in spells]}
+    srd_api.routes.update({s["url"]: s for s in spells})
+
+
+def _list(*args, **env):
+    out = subprocess.run([sys.executable, str(LIST_SPELLS), *args], env={**os.environ, **env},
+                         capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0, out.stdout + out.stderr
+    return json.loads(out.stdout)
+
+
+def _detail_hits(srd_api):
+    return {path: n for path, n in srd_api.hits.items() if path.count("/") == 4}
+
+
+def test_filters_fetch_each_spell_once_then_never_again(srd_api):
+    _serve(srd_api, SPELLS)
+    by_level = _list("--class", "wizard", "--level", "1")
+    assert by_level["total"] == 3
+    assert by_level["results"] == [{"level": "Level 1", "spells": [
+        {"index": "alarm", "name": "Alarm", "url": "/api/2014/spells/alarm",
+         "level": 1, "school": "Abjuration"},
+        {"index": "detect-magic", "name": "Detect Magic", "url": "/api/2014/spells/detect-magic",
+         "level": 1, "school": "Divination"},
+        {"index": "shield", "name": "Shield", "url": "/api/2014/spells/shield",
+         "level": 1, "school": "Abjuration"}]}]
+    assert set(_detail_hits(srd_api).values()) == {1} and len(_detail_hits(srd_api)) == 5
+
+    rituals = _list("--ritual", "--concentration")
+    assert [s["index"] for s in rituals["results"][0]["spells"]] == ["detect-magic"]
+    assert rituals["results"][0]["spells"][0]["ritual"] is True
+    fire = _list("--damage-type", "fire", "--search", "ball")
+    assert [s["name"] for g in fire["results"] for s in g["spells"]] == ["Fireball"]
+    assert set(_detail_hits(srd_api).values()) == {1}  # answered from the catalog
+
+
+def test_search_alone_reads_only_the_list(srd_api):
+    _serve(srd_api, SPELLS)
+    found = _list("--search", "FIRE")
+    assert found["results"] == [
+        {"index": "fire-bolt", "name": "Fire Bolt", "url": "/api/2014/spells/fire-bolt"},
+        {"index": "fireball", "name": "Fireball", "url": "/api/2014/spells/fireball"}]
+    assert _detail_hits(srd_api) == {}
+
+
+def test_a_changed_spell_list_rebuilds_the_catalog(srd_api):
+    _serve(srd_api, SPELLS[:3])
+    assert _list("--school", "evocation")["total"] == 1
+    _serve(srd_api, SPELLS)
+    assert _list("--school", "evocation", GM_SRD_TTL="0")["total"] == 2  # the list revalidates
+    assert srd_api.hits["/api/2014/spells/fire-bolt"] == 1  # known spells aren't refetched
+
+
+class _Toy(SrdCatalog):
+    INDEXED = ("kind", "tags")
+
+    @staticmethod
+    def row(record):
+        return dict(record)
+
+
+def test_a_catalog_without_a_row_cannot_be_built():
+    class Rowless(SrdCatalog):
+        NAME = "rowless"
+
+    with pytest.raises(TypeError):
+        Rowless([], {}, {})
+
+
+def _toy(rows):
+    return _Toy(rows, _Toy._index(rows), _Toy._grams(rows))
+
+
+def test_matching_intersects_indexes_and_name_trigrams():
+    catalog = _toy([
+        {"index": "a", "name": "Goblin Boss", "kind": "humanoid", "tags": ["goblinoid"]},
+        {"index": "b", "name": "Goblin", "kind": "humanoid", "tags": ["goblinoid"]},
+        {"index": "c", "name": "Hobgoblin", "kind": "humanoid", "tags": []},
+        {"index": "d", "name": "Bone Naga", "kind": "undead", "tags": []},
+    ])
+    assert [r["index"] for r in catalog.matching(search="GOBLIN")] == ["a", "b", "c"]
+    assert [r["index"] for r in catalog.matching(search="blin b")] == ["a"]
+    assert [r["index"] for r in catalog.matching(search="bo")] == ["a", "d"]  # too short for trigrams
+    assert [r["index"] for r in catalog.matching(kind="Humanoid", tags="goblinoid")] == ["a", "b"]
+    assert [r["index"] for r in catalog.matching(kind=["undead", "humanoid"], search="o")] == \
+        ["a", "b", "c", "d"]
+    assert catalog.matching(kind="dragon") == []
+    assert catalog.matching(kind=None) == catalog.rows
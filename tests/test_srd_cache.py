@@ -0,0 +1,93 @@
+"""lib/srd_cache.py against a local stand-in for dnd5eapi.co: TTL, ETags, sync, offline."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from lib import srd_cache
+
+REPO = Path(__file__).resolve().parent.parent
+
+FIREBALL = {"index": "fireball", "name": "Fireball", "level": 3, "school": {"name": "Evocation"},
+            "desc": ["A bright streak flashes..."], "range": "150 feet",
+            "components": ["V", "S", "M"], "casting_time": "1 action", "duration": "Instantaneous",
+            "url": "/api/2014/spells/fireball"}
+SHIELD = {"index": "shield", "name": "Shield", "level": 1, "school": {"name": "Abjuration"},
+          "url": "/api/2014/spells/shield"}
+API = {
+    "/api/2014/spells": {"count": 2, "results": [
+        {"index": "fireball", "name": "Fireball", "level": 3, "url": "/api/2014/spells/fireball"},
+        {"index": "shield", "name": "Shield", "level": 1, "url": "/api/2014/spells/shield"}]},
+    "/api/2014/spells/fireball": FIREBALL,
+    "/api/2014/spells/shield": SHIELD,
+    "/api/2014/classes": {"count": 1, "results": [
+        {"index": "wizard", "name": "Wizard", "url": "/api/2014/classes/wizard"}]},
+    "/api/2014/classes/wizard": {"index": "wizard", "name": "Wizard", "spellcasting": {}},
+    "/api/2014/classes/wizard/spells": {"count": 2, "results": [
+        {"index": "fireball", "name": "Fireball", "level": 3, "url": "/api/2014/spells/fireball"},
+        {"index": "shield", "name": "Shield", "level": 1, "url": "/api/2014/spells/shield"}]},
+}
+
+
+@pytest.fixture
+def srd(srd_api):
+    srd_api.routes.update(API)
+    return srd_api.hits
+
+
+def _new_process():
+    """Forget the in-memory layer, as the next CLI process would."""
+    srd_cache._stores.clear()
+
+
+def test_repeat_lookups_never_reach_the_network(srd):
+    assert srd_cache.fetch("/api/2014/spells/fireball")["name"] == "Fireball"
+    assert srd_cache.fetch("/api/2014/spells/fireball") is srd_cache.fetch(
+        "http://elsewhere/api/2014/spells/fireball")  # result urls normalize to one key
+    _new_process()
+    assert srd_cache.fetch("/api/2014/spells/fireball")["level"] == 3
+    assert srd["/api/2014/spells/fireball"] == 1
+    assert srd_cache.fetch("/api/2014/spells/nope") == {"error": "HTTP 404", "message": "Not Found"}
+
+
+def test_stale_entries_revalidate_and_outages_serve_stale(srd, monkeypatch):
+    srd_cache.fetch("/api/2014/spells/shield")
+    monkeypatch.setenv("GM_SRD_TTL", "0")
+    _new_process()
+    assert srd_cache.fetch("/api/2014/spells/shield")["name"] == "Shield"  # a 304
+    assert srd["/api/2014/spells/shield"] == 2
+
+    monkeypatch.setenv("GM_SRD_ORIGIN", "http://127.0.0.1:9")  # nothing listens there
+    _new_process()
+    assert srd_cache.fetch("/api/2014/spells/shield")["name"] == "Shield"
+    assert srd_cache.fetch("/api/2014/spells/fireball")["error"] == "Request failed"
+
+
+def test_sync_mirrors_everything_and_offline_serves_only_the_mirror(srd, monkeypatch):
+    monkeypatch.setenv("GM_SRD_OFFLINE", "1")
+    assert srd_cache.fetch("/api/2014/spells")["error"] == "Offline"
+    monkeypatch.delenv("GM_SRD_OFFLINE")
+
+    manifest = srd_cache.sync(["spells", "classes"], workers=4)
+    assert manifest["resources"] == {"spells": 2, "classes": 1} and not manifest["failed"]
+    assert srd["/api/2014/classes/wizard/spells"] == 1
+
+    monkeypatch.setenv("GM_SRD_OFFLINE", "1")
+    monkeypatch.setenv("GM_SRD_ORIGIN", "http://127.0.0.1:9")
+    _new_process()
+    assert srd_cache.fetch("/api/2014/spells/fireball")["range"] == "150 feet"
+    third = srd_cache.fetch("/api/2014/classes/wizard/spells?level=3")  # filtered locally
+    assert [s["index"] for s in third["results"]] == ["fireball"]
+    assert srd_cache.fetch("/api/2014/spells/wish")["error"] == "HTTP 404"
+
+
+def test_feature_scripts_run_offline_from_the_mirror(srd, tmp_path):
+    srd_cache.sync(["spells"], workers=2)
+    env = dict(os.environ, GM_SRD_OFFLINE="1", GM_SRD_ORIGIN="http://127.0.0.1:9")
+    out = subprocess.run([sys.executable, str(REPO / "features/spells/get_spell.py"), "fireball"],
+                         env=env, capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0, out.stdout + out.stderr
+    assert "Fireball" in out.stdout
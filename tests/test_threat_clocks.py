@@ -82,8 +82,7 @@ def test_tick_time_advances_only_time_clocks(dcc_world):
     m = ThreatClockManager(dcc_world)
     m.add_clock("Collapse", segments=3, advance_on="time")
     m.add_clock("Ritual", segments=3, advance_on="event")
-    advanced = m.tick_time_clocks()
-    assert "Collapse" in advanced and "Ritual" not in advanced
+    assert m.tick_time_clocks() == {}  # nothing filled
     assert m.get_clocks()["Collapse"]["current"] == 1
     assert m.get_clocks()["Ritual"]["current"] == 0
 
@@ -91,9 +90,10 @@ def test_tick_time_advances_only_time_clocks(dcc_world):
 def test_tick_time_scales_with_ticks(dcc_world):
     m = ThreatClockManager(dcc_world)
     m.add_clock("Siege", segments=10, advance_on="time")
-    advanced = m.tick_time_clocks(3)
-    assert "Siege" in advanced
+    m.tick_time_clocks(3)
     assert m.get_clocks()["Siege"]["current"] == 3
+    assert "Siege" in m.tick_time_clocks(7)  # the return is what filled
+    assert m.is_full("Siege")
 
 
 def test_duration_days_and_weeks_scale():
@@ -141,3 +141,30 @@ def test_tick_time_stops_at_full(dcc_world):
     assert m.is_full("Doom")
     # A full clock is a pending beat, not a re-ticking counter.
     assert "Doom" not in m.tick_time_clocks()
+
+
+def test_time_advance_rewrites_only_the_clocks_that_fill(dcc_world):
+    m = ThreatClockManager(dcc_world)
+    for i in range(20):
+        m.add_clock(f"Slow {i}", segments=50, advance_on="time")
+    m.add_clock("Fuse", segments=2, advance_on="time")
+    stored = Path(dcc_world) / "campaigns" / "dungeon-crawler-carl" / "threat-clocks.json"
+    before = stored.read_text(encoding="utf-8")
+    m.tick_time_clocks()
+    assert stored.read_text(encoding="utf-8") == before
+    assert m.get_clocks()["Slow 3"]["current"] == 1
+    assert list(m.tick_time_clocks()) == ["Fuse"]
+    after = json.loads(stored.read_text(encoding="utf-8"))
+    assert after["Fuse"]["current"] == 2
+    assert after["Slow 3"] == json.loads(before)["Slow 3"]  # still derived, not rewritten
+    m.advance("Slow 3", 5)
+    assert m.get_clocks()["Slow 3"]["current"] == 7
+    assert "7/50" in SessionManager(dcc_world).get_full_context()
+
+
+def test_clocks_written_before_since_keep_ticking(dcc_world):
+    m = ThreatClockManager(dcc_world)
+    m.json_ops.save_json(m.clocks_file, {"Old": {"current": 1, "max": 3, "advance_on": "time"}})
+    assert m.tick_time_clocks() == {}
+    assert m.get_clocks()["Old"]["current"] == 2
+    assert "Old" in m.tick_time_clocks()
@@ -0,0 +1,93 @@
+"""In-game time scheduler: clocks and timed consequences fire by due tick, in order."""
+
+import json
+from pathlib import Path
+
+from lib.consequence_manager import ConsequenceManager
+from lib.threat_clocks import ThreatClockManager
+from lib.time_scheduler import TimeScheduler
+from lib.world_tick import WorldTick
+
+
+def _schedule_file(dcc_world):
+    return Path(dcc_world) / "campaigns" / "dungeon-crawler-carl" / "time-schedule.json"
+
+
+def test_advance_pops_only_due_events_in_order(dcc_world):
+    s = TimeScheduler(dcc_world)
+    s.schedule("consequence", "late", delay=5)
+    s.schedule("consequence", "early", delay=2)
+    s.schedule("consequence", "tie-a", delay=3)
+    s.schedule("consequence", "tie-b", delay=3)
+    assert s.advance(1) == []
+    popped = s.advance(2)
+    assert [e["ref"] for e in popped] == ["early", "tie-a", "tie-b"]
+    assert s.now() == 3
+    assert [e["ref"] for e in s.upcoming()] == ["late"]
+
+
+def test_schedule_persists_and_reschedule_leaves_one_live_event(dcc_world):
+    TimeScheduler(dcc_world).schedule("clock", "Doom", delay=4)
+    TimeScheduler(dcc_world).schedule("clock", "Doom", delay=1)  # moved
+    data = json.loads(_schedule_file(dcc_world).read_text(encoding="utf-8"))
+    assert list(data["events"]) == ["clock:Doom"]
+    popped = TimeScheduler(dcc_world).advance(10)
+    assert [(e["ref"], e["due"]) for e in popped] == [("Doom", 1)]
+
+
+def test_cancelled_events_never_fire(dcc_world):
+    s = TimeScheduler(dcc_world)
+    s.schedule("clock", "Doom", delay=1)
+    assert s.cancel("clock", "Doom") is True
+    assert s.advance(3) == []
+    assert s.cancel("clock", "Doom") is False
+
+
+def test_long_rest_fires_clock_fill_before_later_deadline(dcc_world):
+    m = ThreatClockManager(dcc_world)
+    cm = ConsequenceManager(dcc_world)
+    cid = cm.add_consequence("The bounty hunters arrive", "in five days",
+                             trigger_type="on_elapsed", match="5 days")
+    m.add_clock("Collapse", 3, advance_on="time", consequence="the ceiling comes down")
+    m.tick_time_clocks(7)
+    assert [(e["kind"], e["due"]) for e in m.last_due] == [("clock", 3), ("consequence", 5)]
+    active = {c["id"]: c for c in cm.check_pending()}
+    assert active[cid]["due_reached"] == 5
+    assert m.get_clocks()["Collapse"]["consequence_fired"]
+
+
+def test_on_elapsed_consequence_fires_once_due(dcc_world):
+    cm = ConsequenceManager(dcc_world)
+    cid = cm.add_consequence("Rent comes due", "two days on", trigger_type="on_elapsed", match="2")
+    ws = {"location": "Nowhere", "time": "noon", "present_npcs": []}
+    assert cid not in {c["id"] for c in cm.tick(ws)["fired"]}
+    ThreatClockManager(dcc_world).tick_time_clocks(2)
+    fired = ConsequenceManager(dcc_world).tick(ws)["fired"]
+    assert cid in {c["id"] for c in fired}
+
+
+def test_resolving_and_removing_cancel_their_events(dcc_world):
+    cm = ConsequenceManager(dcc_world)
+    cid = cm.add_consequence("Deadline", "soon", trigger_type="on_elapsed", match="3 days")
+    m = ThreatClockManager(dcc_world)
+    m.add_clock("Doom", 4)
+    assert {e["ref"] for e in m.upcoming()["upcoming"]} == {cid, "Doom"}
+    cm.resolve(cid)
+    m.remove_clock("Doom")
+    assert m.upcoming()["upcoming"] == []
+
+
+def test_manual_advance_and_event_clocks_keep_schedule_in_step(dcc_world):
+    m = ThreatClockManager(dcc_world)
+    m.add_clock("Siege", 6)
+    m.add_clock("Ritual", 3, advance_on="event")
+    m.advance("Siege", 2)
+    events = m.upcoming()["upcoming"]
+    assert [(e["ref"], e["due"]) for e in events] == [("Siege", 4)]
+
+
+def test_world_tick_development_can_register_a_due_time(dcc_world):
+    applied = WorldTick(dcc_world).apply(
+        [{"text": "The caravan reaches the gate", "trigger_type": "on_elapsed", "match": "1 week"}])
+    nxt = ThreatClockManager(dcc_world).upcoming()["upcoming"]
+    assert [(e["ref"], e["due"]) for e in nxt] == [(applied[0]["id"], 7)]
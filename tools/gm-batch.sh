@@ -0,0 +1,23 @@
+#!/bin/bash
+# gm-batch.sh - Persist a whole beat in one process and one transaction
+#
+#   gm-batch.sh <<'OPS'                        # JSON lines on stdin (or a file argument)
+#   {"op": "player.hp", "name": "Tandy", "amount": -7}
+#   {"op": "npc.event", "name": "Mordecai", "event": "Patched Tandy up"}
+#   {"op": "note.add", "category": "session_events", "fact": "The stairwell opened"}
+#   {"op": "time.set", "time_of_day": "Dusk", "date": "Day 5"}
+#   OPS
+#   gm-batch.sh beat.jsonl --dry-run           # run everything, write nothing
+#   gm-batch.sh --list-ops                     # every op and its fields
+#
+# All operations succeed and commit together, or the first failure rolls the
+# whole batch back (exit 1). Add --json for the per-op results envelope.
+
+source "$(dirname "$0")/common.sh"
+
+case "$1" in
+    --list-ops|-h|--help) ;;
+    *) require_active_campaign ;;
+esac
+
+$PYTHON_CMD "$LIB_DIR/batch_executor.py" "$@"
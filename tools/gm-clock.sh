@@ -6,8 +6,9 @@
 #                                             New clock with N segments; the
 #                                             consequence fires into the world when it fills
 #   gm-clock.sh advance "Name" [--ticks 2]    Advance one clock by hand
-#   gm-clock.sh tick-time                     Advance all time-clocks (auto-run by gm-time.sh)
+#   gm-clock.sh tick-time                     Advance game time; fills time-clocks now due (auto-run by gm-time.sh)
 #   gm-clock.sh beats                         Filled clocks = dramatic beats due
+#   gm-clock.sh next [--limit 5]              What fires next in game time (clock fills, timed consequences)
 #   gm-clock.sh remove "Name"                 Remove a clock
 #   gm-clock.sh choose "prompt" "fork" [--trigger ...]  Record a dramatic-choice fork
 #
@@ -30,7 +30,7 @@ case "$ACTION" in
         if [ "$#" -lt 2 ]; then
             echo "Usage: gm-consequence.sh add <description> <trigger> [--trigger-type T --match M --expiry E]"
             echo "Triggers: immediate, next visit, 2 days, next session, etc."
-            echo "Structured: --trigger-type on_location|on_npc|on_time|on_event --match <value> [--expiry <date|cond>]"
+            echo "Structured: --trigger-type on_location|on_npc|on_time|on_event|on_elapsed --match <value> [--expiry <date|cond>]"
             exit 1
         fi
         DESC="$1"; TRIG="$2"; shift 2
@@ -0,0 +1,14 @@
+#!/bin/bash
+# gm-profile.sh - Where a slow turn spent its time (opt-in profiling)
+#
+#   GM_PROFILE=1 bash tools/gm-session.sh context    # any wrapper: records one line to
+#                                                     # world-state/usage/profile.jsonl
+#   gm-profile.sh report                             # p50/p95 wall time per command, with
+#                                                     # its slowest phases and I/O counters
+#   gm-profile.sh report --command session_manager   # only matching commands
+#   gm-profile.sh report --last 50 --json            # most recent 50 records, JSON envelope
+#   gm-profile.sh clear                              # delete the profile log
+
+source "$(dirname "$0")/common.sh"
+
+$PYTHON_CMD "$LIB_DIR/profiling.py" "$@"
@@ -47,10 +47,13 @@ STORY_FILES=(
     campaign-memory.json
     combat_state.json
     threat-clocks.json
+    time-schedule.json
     world-tick-log.json
     loremaster-cache.json
+    context-cache.json
+    context-briefs.json
 )
-STORY_DIRS=(saves fallen characters)
+STORY_DIRS=(saves fallen characters consequences-archive)
 
 show_usage() {
     echo "Usage: gm-reset.sh <action> [--yes]"
@@ -0,0 +1,16 @@
+#!/bin/bash
+# gm-service.sh - Serve many campaigns from one process, each request naming its own
+#
+#   gm-service.sh serve [--memory-mb 256] [--max-tables N] [--workers 4]
+#       JSON lines on stdin, one JSON line per request on stdout:
+#       {"id": 1, "campaign": "table-7", "op": "player.hp", "name": "Tandy", "amount": -7}
+#       {"id": 2, "campaign": "conan", "op": "session.context"}
+#       {"id": 3, "op": "service.stats"}
+#   gm-service.sh ops                          # every op and its fields
+#
+# Never reads or changes active-campaign.txt; the other gm-*.sh tools keep
+# using the active campaign as before.
+
+source "$(dirname "$0")/common.sh"
+
+$PYTHON_CMD "$LIB_DIR/campaign_service.py" "$@"
@@ -12,6 +12,8 @@ show_usage() {
     echo "  status                   - Show current campaign status"
     echo "  move <location>          - Move party to new location"
     echo "  context                  - Full session context (character, party, consequences, rules)"
+    echo "  context --since <token>  - Only the sections changed since the brief that printed <token>"
+    echo "  context --budget <N>     - Fit the brief to ~N tokens, most valuable items first"
     echo "  choices [on|off|toggle]  - Toggle the [A]-[E] action menu (no arg: show state)"
     echo "  dice [on|off|toggle]     - Toggle player rolling their own dice (no arg: show state)"
     echo "  world-tick '<json>'      - Persist off-screen developments (warns if >3, rollback-able)"
@@ -20,6 +22,8 @@ show_usage() {
     echo ""
     echo "Save System (JSON snapshots):"
     echo "  save <name>              - Create named save point"
+    echo "  save autosave --async    - Queue an autosave for the background worker (Stop hook)"
+    echo "  save --wait              - Block until any queued autosave has been written"
     echo "  restore <save-name>      - Restore from save point"
     echo "  list-saves               - List all save points"
     echo "  delete-save <name>       - Delete a save point"
@@ -86,27 +90,9 @@ case "$ACTION" in
         echo "$BANNER"
         printf '%*s\n' "${#BANNER}" '' | tr ' ' '='
         echo ""
-        $PYTHON_CMD "$LIB_DIR/session_manager.py" start
-        RESULT=$?
-        if [ $RESULT -ne 0 ]; then exit $RESULT; fi
-        echo ""
-        echo "Pending Consequences:"
-        bash "$TOOLS_DIR/gm-consequence.sh" check
-
-        # Auto-query RAG for current location context (GM-internal, minimal output)
-        CAMPAIGN_DIR=$(bash "$TOOLS_DIR/gm-campaign.sh" path 2>/dev/null)
-        if [ -d "$CAMPAIGN_DIR/vectors" ]; then
-            LOCATION=$($PYTHON_CMD "$LIB_DIR/session_manager.py" status 2>/dev/null | grep -o '"current_location": "[^"]*"' | cut -d'"' -f4)
-            if [ -n "$LOCATION" ] && [ "$LOCATION" != "null" ]; then
-                echo ""
-                # Minimal GM context - silently queries/auto-enhances
-                # Note: scene command is quiet when no RAG exists; real errors will show
-                CONTEXT=$(bash "$TOOLS_DIR/gm-enhance.sh" scene "$LOCATION")
-                if [ -n "$CONTEXT" ]; then
-                    echo "$CONTEXT"
-                fi
-            fi
-        fi
+        # Pending consequences and the RAG scene lookup run in the same process,
+        # concurrently, printed in this order (lib/scene_effects.py).
+        $PYTHON_CMD "$LIB_DIR/session_manager.py" start --with-effects
         ;;
 
     end)
@@ -161,37 +147,11 @@ case "$ACTION" in
         echo "Moving Party"
         echo "============"
         echo ""
-        $PYTHON_CMD "$LIB_DIR/session_manager.py" move "$@"
-        RESULT=$?
-        if [ $RESULT -ne 0 ]; then exit $RESULT; fi
-
-        echo ""
-        # Reactivity: fire any consequences whose triggers match the new scene.
-        bash "$TOOLS_DIR/gm-consequence.sh" tick
-
-        # Grounded lore brief on FIRST visit to a place with retained book text.
-        # The loremaster cache gates this: revisits are silent, so the deep read
-        # fires once per location. (--full is the GM's explicit follow-up.)
-        CAMPAIGN_DIR=$(bash "$TOOLS_DIR/gm-campaign.sh" path 2>/dev/null)
-        if [ -f "$CAMPAIGN_DIR/source/current-document.txt" ] || [ -f "$CAMPAIGN_DIR/current-document.txt" ] || [ -f "$CAMPAIGN_DIR/book-text.txt" ]; then
-            # ponytail: grep-for-key on the JSON cache, jq-free; a false hit just skips one auto-brief
-            if ! grep -qF "\"$1\":" "$CAMPAIGN_DIR/loremaster-cache.json" 2>/dev/null; then
-                echo ""
-                echo "First visit — grounding in the source (gm-lore.sh \"$1\" --full for the whole chapter):"
-                $PYTHON_CMD "$LIB_DIR/loremaster.py" "$1" 2>/dev/null || true
-            fi
-        fi
-
-        # Auto-query RAG for new location context (GM-internal, minimal output)
-        if [ -d "$CAMPAIGN_DIR/vectors" ]; then
-            echo ""
-            # Minimal GM context - silently queries/auto-enhances
-            # Note: scene command is quiet when no RAG exists; real errors will show
-            CONTEXT=$(bash "$TOOLS_DIR/gm-enhance.sh" scene "$@")
-            if [ -n "$CONTEXT" ]; then
-                echo "$CONTEXT"
-            fi
-        fi
+        # The move commits first; then the consequence tick, the first-visit lore
+        # brief (gated by the loremaster cache, so revisits are silent; --full is
+        # the GM's explicit follow-up) and the RAG scene lookup run concurrently
+        # in the same process, printed in that order (lib/scene_effects.py).
+        $PYTHON_CMD "$LIB_DIR/session_manager.py" move --with-effects "$@"
         ;;
 
     context)
@@ -202,8 +162,16 @@ case "$ACTION" in
         CONTEXT_CHARS=${#CONTEXT_OUTPUT}
         CONTEXT_TOKENS=$(estimate_tokens_from_chars "$CONTEXT_CHARS")
         FULL_FLAG=false
-        for arg in "$@"; do [ "$arg" = "--full" ] && FULL_FLAG=true; done
-        log_token_usage "gm-session-context" "full=$FULL_FLAG" "output_chars=$CONTEXT_CHARS" "output_tokens_est=$CONTEXT_TOKENS"
+        DELTA_FLAG=false
+        BUDGET=none
+        PREV_ARG=""
+        for arg in "$@"; do
+            [ "$arg" = "--full" ] && FULL_FLAG=true
+            [ "$arg" = "--since" ] && DELTA_FLAG=true
+            [ "$PREV_ARG" = "--budget" ] && BUDGET="$arg"
+            PREV_ARG="$arg"
+        done
+        log_token_usage "gm-session-context" "full=$FULL_FLAG" "delta=$DELTA_FLAG" "budget=$BUDGET" "output_chars=$CONTEXT_CHARS" "output_tokens_est=$CONTEXT_TOKENS"
         exit $CONTEXT_STATUS
         ;;
 
@@ -215,12 +183,25 @@ case "$ACTION" in
             $PYTHON_CMD "$LIB_DIR/session_manager.py" list-saves
             exit 1
         fi
+        # --async hands snapshot + memory refresh to the background worker
+        # (lib/autosave_worker.py); a bare --wait only flushes that queue.
+        FOREGROUND=true
+        NAMED=false
+        for arg in "$@"; do
+            case "$arg" in
+                --async) FOREGROUND=false ;;
+                --wait) ;;
+                *) NAMED=true ;;
+            esac
+        done
         echo "Creating Save Point"
         echo "==================="
         echo ""
-        $PYTHON_CMD "$LIB_DIR/session_manager.py" save "$@"
-        # Refresh long-term campaign memory on save (best-effort; never blocks).
-        $PYTHON_CMD "$LIB_DIR/campaign_memory.py" refresh >/dev/null 2>&1 || true
+        $PYTHON_CMD "$LIB_DIR/session_manager.py" save "$@" || exit $?
+        if $FOREGROUND && $NAMED; then
+            # Refresh long-term campaign memory on save (best-effort; never blocks).
+            $PYTHON_CMD "$LIB_DIR/campaign_memory.py" refresh >/dev/null 2>&1 || true
+        fi
         ;;
 
     restore)
@@ -0,0 +1,16 @@
+#!/bin/bash
+# gm-srd.sh - Local cache and offline mirror of the D&D 5e SRD API
+#
+#   gm-srd.sh sync                       # mirror spells, monsters, equipment, classes,
+#                                        # races, conditions, rules... (needs network once)
+#   gm-srd.sh sync --resources spells,monsters
+#   gm-srd.sh status                     # entries, size, when the mirror was synced
+#   gm-srd.sh get /api/2014/spells/fireball
+#
+# Every features/ lookup goes through this cache. GM_SRD_OFFLINE=1 serves from the
+# mirror only; GM_SRD_ORIGIN points at a self-hosted API; GM_SRD_TTL (seconds) sets
+# how long a response is trusted before it is revalidated.
+
+source "$(dirname "$0")/common.sh"
+
+$PYTHON_CMD "$LIB_DIR/srd_cache.py" "$@"
@@ -69,6 +69,23 @@ if [ ! -f "$CHAR" ]; then
     exit 0
 fi
 
+# --- Fast path: the HUD the Python writers precomputed (lib/hud.py) ---------
+# hud.txt is the frame level, then the rendered lines. Trusted only while it is
+# newer than both files it was rendered from; otherwise derive below as usual.
+HUD="$CAMP/hud.txt"
+if [ -f "$HUD" ] && [ "$HUD" -nt "$CHAR" ] && { [ ! -f "$OVER" ] || [ "$HUD" -nt "$OVER" ]; }; then
+    { IFS= read -r LEVEL; mapfile -t HUD_LINES; } < "$HUD"
+    case "$LEVEL" in
+        wounded)  RULEC="$AMBER";        ORNC="$AMBER" ;;
+        critical) RULEC="${BOLD}${RED}"; ORNC="${BOLD}${RED}" ;;
+        *)        RULEC="$FAINT";        ORNC="$TEAL" ;;
+    esac
+    divider "$RULEC" "$ORNC"
+    printf '%s\n' "${HUD_LINES[@]}"
+    divider "$RULEC" "$ORNC"
+    exit 0
+fi
+
 # --- Character fields -------------------------------------------------------
 IFS=$'\t' read -r NAME RACE CLASS LEVEL AC GP HP_CUR HP_MAX XP_CUR XP_NEXT LOC < <(
     jq -r '
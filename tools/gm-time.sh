@@ -53,7 +53,8 @@ RESULT=$?
 if [ $RESULT -ne 0 ]; then exit $RESULT; fi
 
 # Pressure: time passing advances every advance_on=time threat clock,
-# scaled to how much time actually passed (default 1).
+# scaled to how much time actually passed (default 1), and pops whatever the
+# time scheduler has due by the new tick (clock fills, on_elapsed consequences).
 RESOLVE_ARGS=(ticks)
 if [ -n "$TICKS_FLAG" ]; then
     RESOLVE_ARGS+=(--ticks "$TICKS_FLAG")